@@ -38,6 +38,9 @@ from src.store.api import (
     updates_router,
     search_router,
     ai_router,  # AI services (provider detection, parameter extraction)
+    reset_store,
+    resume_downloads,
+    start_update_checker,
 )
 from src.avatar.routes import avatar_router, try_mount_avatar_engine
 from .core.config import settings
@@ -121,6 +124,20 @@ async def lifespan(app: FastAPI):
                 avatar_mgr.ws_bridge.set_loop(asyncio.get_running_loop())
             avatar_task = asyncio.create_task(_start_avatar_engine(avatar_mgr))
 
+        # Pick up downloads interrupted by the last shutdown
+        try:
+            resumed = resume_downloads()
+            if resumed:
+                logger.info("  Resuming %d queued download(s)", resumed)
+        except Exception as e:
+            logger.warning("Download queue not restored: %s", e)
+
+        # Keep stored update plans fresh in the background
+        try:
+            start_update_checker()
+        except Exception as e:
+            logger.warning("Update checker not started: %s", e)
+
         yield
     finally:
         if avatar_task:
@@ -138,6 +155,8 @@ async def lifespan(app: FastAPI):
                 logger.warning("Avatar Engine shutdown error: %s", exc)
         await app.state.image_proxy_client.aclose()
         await app.state.http_client.aclose()
+        # Close pooled store connections and database handles
+        reset_store()
 
 
 # Create FastAPI app
@@ -7,6 +7,7 @@ Search and browse Civitai models with enhanced search:
 - Standard search as fallback
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel, ConfigDict
@@ -14,7 +15,9 @@ from typing import List, Optional, Literal, Dict, Any
 from pathlib import Path
 import re
 
-from src.clients.civitai_client import CivitaiClient
+from src.clients.async_civitai_client import AsyncCivitaiClient
+from src.clients.rate_limit import TokenBucket
+from src.store.layout import StoreLayout
 from src.utils.media_detection import detect_media_type, get_video_thumbnail_url
 from config.settings import get_config
 
@@ -25,6 +28,26 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# One Civitai rate limit for every browse request of this process
+_civitai_limiter = TokenBucket(rate_per_minute=30, burst=5)
+
+def _civitai_client(request: Request, config) -> AsyncCivitaiClient:
+    """
+    Async Civitai client on the app's shared httpx client.
+
+    Shares the process-wide rate limit and the store's response cache
+    (data/cache/civitai).
+    """
+    root = getattr(config.store, "root", None)
+    cache_dir = StoreLayout(root).civitai_cache_path if isinstance(root, (str, Path)) else None
+    return AsyncCivitaiClient(
+        request.app.state.http_client,
+        api_key=config.api.civitai_token,
+        limiter=_civitai_limiter,
+        cache_dir=cache_dir,
+    )
+
+
 class ModelPreview(BaseModel):
     """Model preview media (image or video)."""
     model_config = ConfigDict(protected_namespaces=())
@@ -192,6 +215,7 @@ def _parse_search_query(query: str) -> tuple[Optional[str], Optional[str], Optio
 
 @router.get("/search", response_model=SearchResult)
 async def search_models(
+    request: Request,
     query: Optional[str] = Query(None, description="Search query (supports tag: and url: prefixes)"),
     tag: Optional[str] = Query(None, description="Filter by tag"),
     username: Optional[str] = Query(None, description="Filter by username"),
@@ -212,7 +236,7 @@ async def search_models(
     logger.debug(f"[SEARCH] query={query}, tag={tag}, types={types}, nsfw={nsfw}, cursor={cursor}")
     
     config = get_config()
-    client = CivitaiClient(api_key=config.api.civitai_token)
+    client = _civitai_client(request, config)
     
     # Parse query for special prefixes
     clean_query, tag_from_query, model_id = _parse_search_query(query)
@@ -222,7 +246,7 @@ async def search_models(
     if model_id:
         try:
             logger.debug(f"[SEARCH] Fetching single model by ID: {model_id}")
-            model_data = client.get_model(model_id)
+            model_data = await client.get_model(model_id)
             if not model_data:
                 logger.warning(f"[SEARCH] Model {model_id} not found")
                 return SearchResult(items=[], total=0, page=1, page_size=limit)
@@ -253,7 +277,7 @@ async def search_models(
         sort = "Newest"
     
     try:
-        results = client.search_models(
+        results = await client.search_models(
             query=clean_query,
             tag=tag,
             username=username,
@@ -346,13 +370,13 @@ def _convert_model_to_result(model_data: Dict[str, Any]) -> Optional[CivitaiMode
 
 
 @router.get("/model/{model_id}", response_model=ModelDetail)
-async def get_model(model_id: int, version_id: Optional[int] = None):
+async def get_model(model_id: int, request: Request, version_id: Optional[int] = None):
     """Get full model details for modal view."""
     config = get_config()
-    client = CivitaiClient(api_key=config.api.civitai_token)
+    client = _civitai_client(request, config)
     
     try:
-        model_data = client.get_model(model_id)
+        model_data = await client.get_model(model_id)
         
         if not model_data:
             raise HTTPException(status_code=404, detail=f"Model not found: {model_id}")
@@ -452,13 +476,13 @@ async def get_model(model_id: int, version_id: Optional[int] = None):
 
 
 @router.get("/model/{model_id}/version/{version_id}")
-async def get_model_version(model_id: int, version_id: int):
+async def get_model_version(model_id: int, version_id: int, request: Request):
     """Get specific model version details."""
     config = get_config()
-    client = CivitaiClient(api_key=config.api.civitai_token)
+    client = _civitai_client(request, config)
     
     try:
-        version_data = client.get_model_version(version_id)
+        version_data = await client.get_model_version(version_id)
         
         if not version_data:
             raise HTTPException(status_code=404, detail=f"Version not found: {version_id}")
@@ -1221,8 +1245,10 @@ async def search_base_models(
     
     config = get_config()
     
+    # Both searches use blocking requests; run them off the event loop
     if source == "civitai":
-        return _search_civitai_checkpoints(
+        return await asyncio.to_thread(
+            _search_civitai_checkpoints,
             query=query,
             prefer_name=prefer_name,
             limit=limit,
@@ -1231,7 +1257,8 @@ async def search_base_models(
         )
     
     elif source == "huggingface":
-        return _search_huggingface_checkpoints(
+        return await asyncio.to_thread(
+            _search_huggingface_checkpoints,
             query=query,
             prefer_name=prefer_name,
             limit=limit,
@@ -1424,7 +1451,7 @@ def _extract_civitai_id_from_civarchive(civarchive_url: str) -> Optional[int]:
     return None
 
 
-def _fetch_civitai_model_for_civarchive(model_id: int, civarchive_url: str, client: CivitaiClient) -> Optional[CivArchiveResult]:
+async def _fetch_civitai_model_for_civarchive(model_id: int, civarchive_url: str, client: AsyncCivitaiClient) -> Optional[CivArchiveResult]:
     """
     Fetch model data from Civitai API for CivArchive result.
     
@@ -1432,7 +1459,7 @@ def _fetch_civitai_model_for_civarchive(model_id: int, civarchive_url: str, clie
     This ensures consistency with normal Civitai search results.
     """
     try:
-        model_data = client.get_model(model_id)
+        model_data = await client.get_model(model_id)
         if not model_data:
             return None
         
@@ -1490,8 +1517,27 @@ def _fetch_civitai_model_for_civarchive(model_id: int, civarchive_url: str, clie
         return None
 
 
+def _extract_civitai_ids(civarchive_urls: List[str]) -> Dict[str, Optional[int]]:
+    """Extract Civitai model IDs from CivArchive pages (blocking, 5 pages at a time)."""
+    import concurrent.futures
+    
+    url_to_id: Dict[str, Optional[int]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        future_to_url = {executor.submit(_extract_civitai_id_from_civarchive, url): url for url in civarchive_urls}
+        for future in concurrent.futures.as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                model_id = future.result()
+                url_to_id[url] = model_id
+            except Exception as e:
+                logger.warning(f"[civarchive] Failed to extract ID from {url}: {e}")
+                url_to_id[url] = None
+    return url_to_id
+
+
 @router.get("/search-civarchive", response_model=CivArchiveSearchResponse)
 async def search_via_civarchive(
+    request: Request,
     query: str = Query(..., min_length=2, description="Search query"),
     limit: int = Query(10, ge=1, le=30, description="Max results"),
     page: int = Query(1, ge=1, le=50, description="Page number for pagination"),
@@ -1509,15 +1555,14 @@ async def search_via_civarchive(
 
     Returns results with full preview information including video detection.
     """
-    import concurrent.futures
-    
     logger.debug(f"[civarchive] Starting search for: {query}")
     
     config = get_config()
-    client = CivitaiClient(api_key=config.api.civitai_token)
+    client = _civitai_client(request, config)
     
-    # Step 1: Search CivArchive - ONE page per request
-    civarchive_urls, has_more = _search_civarchive(
+    # Step 1: Search CivArchive - ONE page per request (blocking scrape, off the event loop)
+    civarchive_urls, has_more = await asyncio.to_thread(
+        _search_civarchive,
         query,
         limit=limit * 3,
         page=page,
@@ -1533,17 +1578,7 @@ async def search_via_civarchive(
         )
     
     # Step 2: Extract Civitai IDs in parallel
-    url_to_id: Dict[str, Optional[int]] = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_url = {executor.submit(_extract_civitai_id_from_civarchive, url): url for url in civarchive_urls}
-        for future in concurrent.futures.as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                model_id = future.result()
-                url_to_id[url] = model_id
-            except Exception as e:
-                logger.warning(f"[civarchive] Failed to extract ID from {url}: {e}")
-                url_to_id[url] = None
+    url_to_id = await asyncio.to_thread(_extract_civitai_ids, civarchive_urls)
     
     # Filter valid IDs
     valid_items = [(url, mid) for url, mid in url_to_id.items() if mid is not None]
@@ -1556,21 +1591,12 @@ async def search_via_civarchive(
     
     unique_items = unique_items[:limit]
     
-    # Step 3: Fetch model data from Civitai in parallel
-    results: List[CivArchiveResult] = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_item = {
-            executor.submit(_fetch_civitai_model_for_civarchive, mid, url, client): (url, mid) 
-            for url, mid in unique_items
-        }
-        for future in concurrent.futures.as_completed(future_to_item):
-            url, mid = future_to_item[future]
-            try:
-                result = future.result()
-                if result:
-                    results.append(result)
-            except Exception as e:
-                logger.warning(f"[civarchive] Failed to fetch model {mid}: {e}")
+    # Step 3: Fetch model data from Civitai concurrently (paced by the shared rate limit)
+    fetched = await asyncio.gather(*(
+        _fetch_civitai_model_for_civarchive(mid, url, client)
+        for url, mid in unique_items
+    ))
+    results: List[CivArchiveResult] = [result for result in fetched if result]
     
     # Sort by download count
     results.sort(key=lambda x: x.download_count or 0, reverse=True)
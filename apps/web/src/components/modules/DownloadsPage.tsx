@@ -7,6 +7,7 @@ import { Button } from '@/components/ui/Button'
 import { ProgressBar } from '@/components/ui/ProgressBar'
 import { formatBytes, formatSpeed, formatEta } from '@/lib/utils/format'
 import { clsx } from 'clsx'
+import { useProgressStream } from '@/hooks/useProgressStream'
 
 interface DownloadInfo {
   download_id: string
@@ -255,6 +256,7 @@ function DownloadGroup({
 
 export function DownloadsPage() {
   const { t } = useTranslation()
+  const streaming = useProgressStream()
   const { data: downloads, isLoading, refetch } = useQuery<DownloadInfo[]>({
     queryKey: ['downloads-active'],
     queryFn: async () => {
@@ -265,9 +267,10 @@ export function DownloadsPage() {
       }
       return res.json()
     },
-    // Fast poll (2s) when active downloads, slow poll (10s) otherwise
-    // to detect new downloads that start after the page loads
+    // Progress is pushed while the event stream is connected. Otherwise fast
+    // poll (2s) when active downloads, slow poll (10s) to detect new downloads
     refetchInterval: (query) => {
+      if (streaming) return false
       const data = query.state.data as DownloadInfo[] | undefined
       const hasActive = data?.some((d: DownloadInfo) => d.status === 'downloading' || d.status === 'pending')
       return hasActive ? 2000 : 10000
@@ -1,5 +1,5 @@
-import { useState } from 'react'
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
+import { useEffect, useState } from 'react'
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { Link, useNavigate } from 'react-router-dom'
 import { useTranslation } from 'react-i18next'
 import {
@@ -40,6 +40,15 @@ interface PackSummary {
   is_nsfw_hidden?: boolean
 }
 
+interface PackListPage {
+  packs: PackSummary[]
+  total: number
+  next_cursor: string | null
+}
+
+// Packs per request; further pages load on demand
+const PACKS_PAGE_SIZE = 100
+
 // Special tags with distinct colors
 const SPECIAL_TAGS: Record<string, { bg: string; text: string }> = {
   'nsfw-pack': { bg: 'bg-red-500/60', text: 'text-red-100' },
@@ -91,18 +100,37 @@ export function PacksPage() {
     }
   }
 
-  // Fetch packs
-  const { data: packs = [], isLoading, error } = useQuery<PackSummary[]>({
-    queryKey: ['packs'],
-    queryFn: async () => {
-      const res = await fetch('/api/packs/')
+  // Fetch packs, a page at a time (keyed under 'packs' so pack writes invalidate it)
+  const {
+    data,
+    isLoading,
+    error,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = useInfiniteQuery({
+    queryKey: ['packs', 'pages'],
+    initialPageParam: null as string | null,
+    queryFn: async ({ pageParam }): Promise<PackListPage> => {
+      const params = new URLSearchParams({ limit: String(PACKS_PAGE_SIZE) })
+      if (pageParam) params.set('cursor', pageParam)
+      const res = await fetch(`/api/packs/?${params}`)
       if (!res.ok) {
         throw new Error(`Failed to fetch packs: ${res.status}`)
       }
-      const data = await res.json()
-      return data.packs || data || []
+      return res.json()
     },
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
   })
+  const packs = data?.pages.flatMap(page => page.packs) ?? []
+  const totalPacks = data?.pages[0]?.total ?? 0
+
+  // Search and tag filters run on the loaded cards, so load them all first
+  useEffect(() => {
+    if ((searchQuery || selectedTag) && hasNextPage && !isFetchingNextPage) {
+      fetchNextPage()
+    }
+  }, [searchQuery, selectedTag, hasNextPage, isFetchingNextPage, fetchNextPage])
 
   // Create pack mutation
   const createPackMutation = useMutation({
@@ -198,7 +226,7 @@ export function PacksPage() {
             {t('packs.title')}
           </h1>
           <p className="text-text-muted mt-1">
-            {t('packs.subtitle', { count: packs.length })}
+            {t('packs.subtitle', { count: totalPacks })}
           </p>
         </div>
 
@@ -435,8 +463,22 @@ export function PacksPage() {
         })}
       </div>
 
+      {/* Next page */}
+      {hasNextPage && (
+        <div className="flex justify-center">
+          <Button
+            variant="secondary"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+          >
+            {isFetchingNextPage && <Loader2 className="w-4 h-4 animate-spin" />}
+            {t('packs.loadMore', { loaded: packs.length, total: totalPacks })}
+          </Button>
+        </div>
+      )}
+
       {/* Empty state */}
-      {!isLoading && filteredPacks.length === 0 && (
+      {!isLoading && !hasNextPage && filteredPacks.length === 0 && (
         <div className="text-center py-12">
           <Package className="w-16 h-16 text-slate-mid mx-auto mb-4" />
           <p className="text-text-muted mb-4">
@@ -19,6 +19,7 @@ import { Button } from '../../ui/Button'
 import { Card } from '../../ui/Card'
 import { ProgressBar } from '../../ui/ProgressBar'
 import { formatBytes } from './utils'
+import { useProgressItem } from '../../../hooks/useProgressStream'
 
 export interface VerifyResult {
   total: number
@@ -48,6 +49,8 @@ export function VerifyProgressDialog({
   const [result, setResult] = useState<VerifyResult | null>(null)
   const [error, setError] = useState<string | null>(null)
   const [progress, setProgress] = useState(0)
+  // Live counts pushed by the server while verification runs
+  const live = useProgressItem('verify', 'inventory')
 
   // Reset state when dialog opens
   useEffect(() => {
@@ -205,6 +208,14 @@ export function VerifyProgressDialog({
               </p>
               <div className="max-w-xs mx-auto">
                 <ProgressBar progress={progress} size="md" />
+                {live?.status === 'running' && (
+                  <p className="text-xs text-text-muted mt-2">
+                    {t('inventory.verify.liveProgress', {
+                      count: Number(live.blobs_seen ?? 0),
+                      size: formatBytes(Number(live.hashed_bytes ?? 0)),
+                    })}
+                  </p>
+                )}
               </div>
             </div>
           )}
@@ -8,6 +8,7 @@
 import { useState, useEffect, useCallback } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { toast } from '@/stores/toastStore'
+import { useProgressStream } from '@/hooks/useProgressStream'
 import type { DownloadProgress, AssetInfo } from '../types'
 import { QUERY_KEYS } from '../constants'
 
@@ -82,6 +83,7 @@ export function usePackDownloads({
   packName,
 }: UsePackDownloadsOptions): UsePackDownloadsReturn {
   const queryClient = useQueryClient()
+  const streaming = useProgressStream()
 
   // Track assets we've started downloading (for immediate UI feedback)
   const [downloadingAssets, setDownloadingAssets] = useState<Set<string>>(new Set())
@@ -107,8 +109,9 @@ export function usePackDownloads({
     // Always fetch fresh data when component mounts
     refetchOnMount: 'always',
     staleTime: 0,
-    // Poll when there are active downloads for THIS pack
+    // Poll when there are active downloads for THIS pack (unless progress is pushed)
     refetchInterval: (query) => {
+      if (streaming) return false
       const downloads = query.state.data as DownloadProgress[] | undefined
       const hasActiveForPack = downloads?.some(
         d => d.pack_name === packName && (d.status === 'downloading' || d.status === 'pending')
@@ -37,6 +37,8 @@ import { ProgressBar } from '@/components/ui/ProgressBar'
 import { useUpdatesStore, type UpdatePlanEntry } from '@/stores/updatesStore'
 import { toast } from '@/stores/toastStore'
 import { formatBytes, formatSpeed, formatEta } from '@/lib/utils/format'
+import { formatRelativeTime } from '@/components/modules/inventory/utils'
+import { useProgressStream } from '@/hooks/useProgressStream'
 
 interface UpdatesPanelProps {
   open: boolean
@@ -57,12 +59,14 @@ interface DownloadInfo {
 function UpdateItem({
   packName,
   plan,
+  checkedAt,
   selected,
   applying,
   onToggle,
 }: {
   packName: string
   plan: UpdatePlanEntry
+  checkedAt?: string
   selected: boolean
   applying: boolean
   onToggle: () => void
@@ -114,6 +118,9 @@ function UpdateItem({
             ) : (
               t('updates.panel.changesCount', { count: changesCount + ambiguousCount })
             )}
+            {checkedAt && (
+              <span className="text-xs"> • {t('updates.panel.checkedAt', { time: formatRelativeTime(checkedAt) })}</span>
+            )}
           </p>
         </div>
 
@@ -228,6 +235,7 @@ function UpdateItem({
 
 function GroupDownloadProgress({ groupId, onCancel }: { groupId: string; onCancel: () => void }) {
   const { t } = useTranslation()
+  const streaming = useProgressStream()
 
   const { data: downloads } = useQuery<DownloadInfo[]>({
     queryKey: ['downloads-active'],
@@ -238,6 +246,7 @@ function GroupDownloadProgress({ groupId, onCancel }: { groupId: string; onCance
     },
     select: (data) => data.filter((d: DownloadInfo) => d.group_id === groupId),
     refetchInterval: (query) => {
+      if (streaming) return false
       const data = query.state.data as DownloadInfo[] | undefined
       const hasActive = data?.some(d => d.status === 'downloading' || d.status === 'pending')
       return hasActive ? 1500 : false
@@ -311,6 +320,8 @@ export function UpdatesPanel({ open, onClose }: UpdatesPanelProps) {
     isChecking,
     checkProgress,
     availableUpdates,
+    planCheckedAt,
+    outdatedPacks,
     selectedPacks,
     applyingPacks,
     updatesCount,
@@ -365,8 +376,8 @@ export function UpdatesPanel({ open, onClose }: UpdatesPanelProps) {
     }
   }
 
-  const handleCheckAll = async () => {
-    await checkAll()
+  const handleCheckAll = async (refresh = false) => {
+    await checkAll({ refresh })
     const state = useUpdatesStore.getState()
     if (state.updatesCount > 0) {
       toast.info(t('updates.panel.updatesFound', { count: state.updatesCount }))
@@ -422,7 +433,7 @@ export function UpdatesPanel({ open, onClose }: UpdatesPanelProps) {
             <div className="text-center py-8">
               <RefreshCw className="w-12 h-12 text-slate-mid mx-auto mb-3" />
               <p className="text-text-muted mb-4">{t('updates.panel.checkPrompt')}</p>
-              <Button variant="primary" onClick={handleCheckAll}>
+              <Button variant="primary" onClick={() => handleCheckAll()}>
                 <RefreshCw className="w-4 h-4" />
                 {t('updates.panel.checkAll')}
               </Button>
@@ -473,7 +484,7 @@ export function UpdatesPanel({ open, onClose }: UpdatesPanelProps) {
               <Button
                 variant="secondary"
                 size="sm"
-                onClick={handleCheckAll}
+                onClick={() => handleCheckAll(true)}
                 disabled={isChecking}
               >
                 <RefreshCw className={clsx('w-3.5 h-3.5', isChecking && 'animate-spin')} />
@@ -482,12 +493,26 @@ export function UpdatesPanel({ open, onClose }: UpdatesPanelProps) {
             </div>
           )}
 
+          {/* Packs the background checker has yet to (re)check */}
+          {outdatedPacks.length > 0 && !isChecking && (
+            <div className="flex items-center justify-between gap-2 text-xs text-text-muted">
+              <span>{t('updates.panel.outdatedPacks', { count: outdatedPacks.length })}</span>
+              <button
+                onClick={() => handleCheckAll(true)}
+                className="text-synapse hover:underline shrink-0"
+              >
+                {t('updates.panel.recheck')}
+              </button>
+            </div>
+          )}
+
           {/* Update items */}
           {packNames.map((packName) => (
             <UpdateItem
               key={packName}
               packName={packName}
               plan={availableUpdates[packName]}
+              checkedAt={planCheckedAt[packName]}
               selected={selectedPacks.includes(packName)}
               applying={applyingPacks.includes(packName)}
               onToggle={() => togglePack(packName)}
@@ -0,0 +1,127 @@
+import { useEffect, useSyncExternalStore } from 'react'
+import { useQueryClient, type QueryClient } from '@tanstack/react-query'
+
+/**
+ * Push-based progress from GET /api/store/events (Server-Sent Events).
+ *
+ * One EventSource is shared by every component using these hooks. Download
+ * deltas are merged straight into the ['downloads-active'] query cache, so
+ * components keep reading downloads through useQuery and only disable their
+ * refetchInterval while the stream is connected. Backup sync and verify
+ * progress are exposed through useProgressItem().
+ */
+
+type ProgressData = Record<string, unknown>
+
+interface ProgressEvent {
+  channel: string
+  key: string
+  data: ProgressData | null
+}
+
+const DOWNLOADS_KEY = ['downloads-active']
+
+let source: EventSource | null = null
+let subscribers = 0
+let connected = false
+let activeClient: QueryClient | null = null
+const items = new Map<string, ProgressData>()
+const listeners = new Set<() => void>()
+
+function notify() {
+  listeners.forEach((listener) => listener())
+}
+
+function itemId(channel: string, key: string) {
+  return `${channel}:${key}`
+}
+
+function applyDownloads(events: ProgressEvent[], replace: boolean) {
+  if (!activeClient) return
+  activeClient.setQueryData<ProgressData[]>(DOWNLOADS_KEY, (current) => {
+    const byId = new Map<string, ProgressData>()
+    if (!replace) {
+      for (const d of current ?? []) byId.set(d.download_id as string, d)
+    }
+    for (const e of events) {
+      if (e.data === null) byId.delete(e.key)
+      else byId.set(e.key, { ...byId.get(e.key), ...e.data })
+    }
+    return Array.from(byId.values())
+  })
+}
+
+function apply(events: ProgressEvent[], replace: boolean) {
+  if (replace) items.clear()
+  for (const e of events) {
+    if (e.channel === 'download') continue
+    const id = itemId(e.channel, e.key)
+    if (e.data === null) items.delete(id)
+    else items.set(id, { ...items.get(id), ...e.data })
+  }
+  applyDownloads(events.filter((e) => e.channel === 'download'), replace)
+  notify()
+}
+
+function open() {
+  source = new EventSource('/api/store/events')
+  source.addEventListener('snapshot', (msg) => {
+    connected = true
+    apply(JSON.parse((msg as MessageEvent).data), true)
+  })
+  source.addEventListener('progress', (msg) => {
+    apply(JSON.parse((msg as MessageEvent).data), false)
+  })
+  source.onerror = () => {
+    // EventSource reconnects by itself; poll until the next snapshot arrives
+    if (connected) {
+      connected = false
+      notify()
+    }
+  }
+}
+
+function close() {
+  source?.close()
+  source = null
+  connected = false
+  items.clear()
+  notify()
+}
+
+function subscribe(listener: () => void) {
+  listeners.add(listener)
+  return () => {
+    listeners.delete(listener)
+  }
+}
+
+/**
+ * Keep the shared progress stream open while the calling component is mounted.
+ *
+ * @returns true while the stream is connected (callers can stop polling)
+ */
+export function useProgressStream(): boolean {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    activeClient = queryClient
+    if (subscribers++ === 0 && typeof EventSource !== 'undefined') open()
+    return () => {
+      if (--subscribers === 0) close()
+    }
+  }, [queryClient])
+
+  return useSyncExternalStore(subscribe, () => connected)
+}
+
+/**
+ * Latest pushed state of a non-download progress item.
+ *
+ * @param channel - 'backup_sync' or 'verify'
+ * @param key - Operation key (sync direction, or 'inventory' for verify)
+ */
+export function useProgressItem(channel: string, key: string): ProgressData | undefined {
+  useProgressStream()
+  return useSyncExternalStore(subscribe, () => items.get(itemId(channel, key)))
+}
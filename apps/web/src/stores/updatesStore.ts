@@ -70,6 +70,32 @@ interface CheckProgress {
   currentPack: string
 }
 
+/** GET /api/updates/check-all: plans stored by the background update checker */
+interface CheckAllResponse {
+  packs_checked: number
+  packs_with_updates: number
+  total_changes: number
+  plans: Record<string, Omit<UpdatePlanEntry, 'pack'>>
+  checked_at: string | null
+  plan_checked_at: Record<string, string>
+  outdated_packs: string[]
+  checker_running: boolean
+}
+
+/** "plan" event of GET /api/updates/check-all?stream=true */
+interface CheckStreamPlanEvent {
+  pack: string
+  has_updates: boolean
+  plan: Omit<UpdatePlanEntry, 'pack'> | null
+  checked_at: string
+  error: string | null
+}
+
+export interface CheckAllOptions {
+  // Check every pack now instead of reading the stored plans
+  refresh?: boolean
+}
+
 interface UpdatesState {
   // Check state
   isChecking: boolean
@@ -80,6 +106,11 @@ interface UpdatesState {
   // Results - only packs with actual updates
   availableUpdates: Record<string, UpdatePlanEntry>
 
+  // Freshness of the results (ISO 8601)
+  planCheckedAt: Record<string, string>
+  checkedAt: string | null  // Oldest check behind the results
+  outdatedPacks: string[]  // Awaiting a (re)check by the background checker
+
   // Selection for bulk operations (arrays for reliable React re-renders)
   selectedPacks: string[]
 
@@ -96,7 +127,7 @@ interface UpdatesState {
   updatesCount: number
 
   // Actions
-  checkAll: () => Promise<void>
+  checkAll: (options?: CheckAllOptions) => Promise<void>
   selectPack: (name: string) => void
   deselectPack: (name: string) => void
   selectAll: () => void
@@ -141,21 +172,41 @@ async function queueDownloadsForPack(
   }
 }
 
-/** Run async tasks with limited concurrency */
-async function asyncPool<T>(
-  concurrency: number,
-  items: T[],
-  fn: (item: T) => Promise<void>,
+/** Stored plans, answered without waiting on the network (wakes the background checker) */
+async function fetchStoredPlans(): Promise<CheckAllResponse> {
+  const res = await fetch('/api/updates/check-all')
+  if (!res.ok) throw new Error('Failed to load update status')
+  return res.json()
+}
+
+/**
+ * Check every pack now. The server groups packs sharing a model lookup and
+ * paces requests to Civitai; each pack's plan arrives as its check completes.
+ */
+function streamCheckAll(
+  onStart: (total: number) => void,
+  onPlan: (event: CheckStreamPlanEvent) => void,
 ): Promise<void> {
-  const executing = new Set<Promise<void>>()
-  for (const item of items) {
-    const p = fn(item).then(() => { executing.delete(p) })
-    executing.add(p)
-    if (executing.size >= concurrency) {
-      await Promise.race(executing)
-    }
-  }
-  await Promise.all(executing)
+  return new Promise((resolve, reject) => {
+    const source = new EventSource('/api/updates/check-all?stream=true')
+    source.addEventListener('start', (msg) => {
+      onStart(JSON.parse((msg as MessageEvent).data).total)
+    })
+    source.addEventListener('plan', (msg) => {
+      onPlan(JSON.parse((msg as MessageEvent).data))
+    })
+    source.addEventListener('done', () => {
+      source.close()
+      resolve()
+    })
+    source.addEventListener('error', (msg) => {
+      // Server-sent error, or a dropped connection: don't let EventSource
+      // reconnect, which would start the whole check over
+      source.close()
+      const data = (msg as MessageEvent).data
+      reject(new Error(data ? JSON.parse(data).detail : 'Update check interrupted'))
+    })
+  })
 }
 
 export const useUpdatesStore = create<UpdatesState>((set, get) => ({
@@ -164,55 +215,58 @@ export const useUpdatesStore = create<UpdatesState>((set, get) => ({
   checkError: null,
   checkProgress: null,
   availableUpdates: {},
+  planCheckedAt: {},
+  checkedAt: null,
+  outdatedPacks: [],
   selectedPacks: [],
   applyingPacks: [],
   activeGroupId: null,
   dismissedVersions: loadDismissed(),
   updatesCount: 0,
 
-  checkAll: async () => {
+  checkAll: async (options?: CheckAllOptions) => {
     set(() => ({ isChecking: true, checkError: null, checkProgress: null }))
     try {
-      // Step 1: Fetch pack names
-      const packsRes = await fetch('/api/packs/')
-      if (!packsRes.ok) throw new Error('Failed to fetch packs')
-      const packsData = await packsRes.json()
-      const packNames: string[] = (packsData.packs || []).map((p: { name: string }) => p.name)
-
-      if (packNames.length === 0) {
-        set(() => ({
-          isChecking: false,
-          lastChecked: Date.now(),
-          checkProgress: null,
-          availableUpdates: {},
-          updatesCount: 0,
-          selectedPacks: [],
-        }))
-        return
-      }
-
-      // Step 2: Check each pack with concurrency of 3
-      set(() => ({ checkProgress: { current: 0, total: packNames.length, currentPack: '' } }))
-
       const plans: Record<string, UpdatePlanEntry> = {}
-      let current = 0
+      let planCheckedAt: Record<string, string> = {}
+      let checkedAt: string | null = null
+      let outdatedPacks: string[] = []
 
-      await asyncPool(3, packNames, async (packName: string) => {
-        set(() => ({ checkProgress: { current, total: packNames.length, currentPack: packName } }))
-        try {
-          const res = await fetch(`/api/updates/check/${encodeURIComponent(packName)}`)
-          if (res.ok) {
-            const data = await res.json()
-            if (data.has_updates && data.plan) {
-              plans[packName] = { pack: packName, ...data.plan }
-            }
-          }
-        } catch {
-          // Skip failed individual pack checks
+      // Step 1: Stored plans, unless asked to re-check
+      const stored = options?.refresh ? null : await fetchStoredPlans()
+      const nothingStored = stored !== null && stored.packs_checked === 0 && stored.outdated_packs.length > 0
+
+      if (stored && !nothingStored) {
+        for (const [name, plan] of Object.entries(stored.plans)) {
+          plans[name] = { pack: name, ...plan }
         }
-        current++
-        set(() => ({ checkProgress: { current, total: packNames.length, currentPack: '' } }))
-      })
+        planCheckedAt = stored.plan_checked_at
+        checkedAt = stored.checked_at
+        outdatedPacks = stored.outdated_packs
+      } else {
+        // Step 2: Explicit re-check (or no plans yet): stream per-pack results
+        const startedAt = new Date().toISOString()
+        let current = 0
+        let total = 0
+        await streamCheckAll(
+          (count) => {
+            total = count
+            set(() => ({ checkProgress: { current: 0, total, currentPack: '' } }))
+          },
+          (event) => {
+            current++
+            if (event.has_updates && event.plan) {
+              plans[event.pack] = { pack: event.pack, ...event.plan }
+              planCheckedAt[event.pack] = event.checked_at
+            } else if (event.error) {
+              // Left for the background checker to retry
+              outdatedPacks.push(event.pack)
+            }
+            set(() => ({ checkProgress: { current, total, currentPack: event.pack } }))
+          },
+        )
+        checkedAt = startedAt
+      }
 
       // Step 3: Filter dismissed updates
       const dismissed = { ...get().dismissedVersions }
@@ -248,6 +302,9 @@ export const useUpdatesStore = create<UpdatesState>((set, get) => ({
         lastChecked: Date.now(),
         checkProgress: null,
         availableUpdates: filtered,
+        planCheckedAt,
+        checkedAt,
+        outdatedPacks,
         updatesCount: filteredNames.length,
         selectedPacks: [...filteredNames],
         dismissedVersions: dismissed,
@@ -584,6 +641,9 @@ export const useUpdatesStore = create<UpdatesState>((set, get) => ({
 
   clearAll: () => set(() => ({
     availableUpdates: {},
+    planCheckedAt: {},
+    checkedAt: null,
+    outdatedPacks: [],
     selectedPacks: [],
     applyingPacks: [],
     activeGroupId: null,
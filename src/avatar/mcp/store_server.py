@@ -1225,7 +1225,11 @@ if MCP_AVAILABLE:
 
     @mcp.tool()
     def search_packs(query: str) -> str:
-        """Search packs by name or dependency ID."""
+        """Search packs by name, description, tags, trigger words, base model or files.
+
+        Terms are prefix-matched; use field:value to narrow (tag:anime, base:SDXL,
+        trigger:word, file:name, type:lora).
+        """
         _log_tool_call("search_packs", query=query)
         return _search_packs_impl(query=query)
 
@@ -0,0 +1,228 @@
+"""
+Async Civitai API Client
+
+Non-blocking counterpart of CivitaiClient for code running on an event loop
+(the API's browse endpoints). Requests go through a caller-owned
+httpx.AsyncClient, so they share its connection pool, and wait for rate
+limit tokens with asyncio.sleep instead of blocking the loop.
+
+Covers the lookups the browse endpoints need; downloads and pack imports
+stay on the synchronous client. Cached responses use the same policies and
+directory layout as CivitaiClient, so both clients share one cache.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from .civitai_client import CivitaiClient, CivitaiModelVersion
+from .rate_limit import TokenBucket
+from .response_cache import (
+    DEFAULT_MAX_BYTES, FRESH, STALE, CachedResponse, ResponseCache, shared_cache,
+    lookup, policy_for, request_headers, store_response,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCivitaiClient:
+    """
+    Async client for Civitai API lookups and search.
+
+    Features:
+    - Model, version and hash lookup, model search
+    - Requests on a shared httpx.AsyncClient
+    - Rate limiting (token bucket awaited with asyncio, honoring
+      Retry-After / X-RateLimit-* from the server); pass one limiter to
+      every client of a process so they share the budget
+    - On-disk response cache shared with CivitaiClient, enabled by cache_dir
+    """
+
+    BASE_URL = CivitaiClient.BASE_URL
+    MAX_RATE_LIMIT_RETRIES = CivitaiClient.MAX_RATE_LIMIT_RETRIES
+    CACHE_POLICIES = CivitaiClient.CACHE_POLICIES
+
+    # Background revalidations in flight, as (cache dir, endpoint); class-wide
+    # because clients are usually created per request
+    _revalidating: Set[Tuple[str, str]] = set()
+    _background: Set["asyncio.Task[None]"] = set()
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        api_key: Optional[str] = None,
+        requests_per_minute: int = 30,
+        timeout: float = 30,
+        burst: int = 5,
+        limiter: Optional[TokenBucket] = None,
+        cache_dir: Optional[Path] = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Initialize async Civitai client.
+
+        Args:
+            http_client: Shared async HTTP client (not closed by this client)
+            api_key: Civitai API key (default: CIVITAI_API_KEY env var)
+            requests_per_minute: Rate limit, if no limiter is given
+            timeout: Request timeout in seconds
+            burst: Requests that may go out back to back, if no limiter is given
+            limiter: Token bucket shared with other clients
+            cache_dir: Directory for cached API responses (None disables caching)
+            cache_max_bytes: Size the response cache is kept under
+            response_cache: Response cache shared with other clients
+                (takes precedence over cache_dir)
+        """
+        self.http_client = http_client
+        self.api_key = api_key or os.environ.get("CIVITAI_API_KEY")
+        self.timeout = timeout
+        self._limiter = limiter or TokenBucket(requests_per_minute, burst=burst)
+        if response_cache is None and cache_dir is not None:
+            response_cache = shared_cache(cache_dir, max_bytes=cache_max_bytes)
+        self.response_cache = response_cache
+
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (compatible; Synapse/1.0)",
+            "Accept": "application/json",
+        }
+        if self.api_key:
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Make a rate-limited API request.
+
+        A 429 response pauses the limiter for the server's Retry-After and
+        is retried up to MAX_RATE_LIMIT_RETRIES times. 304 Not Modified is
+        returned as is (conditional requests).
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        request_headers = {**self.headers, **(headers or {})}
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            await self._limiter.acquire_async()
+            response = await self.http_client.request(
+                method,
+                url,
+                params=params,
+                headers=request_headers,
+                timeout=self.timeout,
+            )
+            delay = self._limiter.observe(response.status_code, response.headers)
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                break
+            logger.warning(
+                "[AsyncCivitaiClient] Rate limited on %s, retrying in %.1fs (attempt %d/%d)",
+                endpoint, delay or 0.0, attempt + 1, self.MAX_RATE_LIMIT_RETRIES,
+            )
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    # =========================================================================
+    # Response Cache
+    # =========================================================================
+
+    async def _get_json(self, endpoint: str) -> Any:
+        """
+        GET an endpoint's JSON body, through the response cache if it has a policy.
+
+        Same rules as CivitaiClient._get_json; cache files are read and
+        written on a worker thread.
+        """
+        policy = policy_for(self.CACHE_POLICIES, endpoint) if self.response_cache is not None else None
+        if policy is None:
+            return (await self._request("GET", endpoint)).json()
+
+        entry, state = await asyncio.to_thread(lookup, self.response_cache, endpoint, policy)
+        if state == FRESH:
+            return entry.body
+        if state == STALE:
+            self._revalidate_in_background(endpoint, entry)
+            return entry.body
+        try:
+            return (await self._fetch_to_cache(endpoint, entry)).body
+        except httpx.TransportError as e:
+            if entry is None:
+                raise
+            logger.warning(
+                "[AsyncCivitaiClient] Serving cached %s, server unreachable: %s", endpoint, e,
+            )
+            return entry.body
+
+    async def _fetch_to_cache(self, endpoint: str, entry: Optional[CachedResponse]) -> CachedResponse:
+        """Request an endpoint (conditionally if entry is given) and store the result."""
+        response = await self._request("GET", endpoint, headers=request_headers(entry))
+        return await asyncio.to_thread(
+            store_response, self.response_cache, endpoint, entry,
+            response.status_code, response.headers, response.json,
+        )
+
+    def _revalidate_in_background(self, endpoint: str, entry: CachedResponse) -> None:
+        key = (str(self.response_cache.root), endpoint)
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+
+        async def revalidate():
+            try:
+                await self._fetch_to_cache(endpoint, entry)
+            except Exception as e:
+                logger.debug("[AsyncCivitaiClient] Background revalidation of %s failed: %s", endpoint, e)
+            finally:
+                self._revalidating.discard(key)
+
+        task = asyncio.get_running_loop().create_task(revalidate())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    # =========================================================================
+    # API
+    # =========================================================================
+
+    async def get_model(self, model_id: int) -> Dict[str, Any]:
+        """Fetch model details by ID. Returns raw API response dict."""
+        return await self._get_json(f"models/{model_id}")
+
+    async def get_model_version(self, version_id: int) -> Dict[str, Any]:
+        """Fetch model version details by ID. Returns raw API response dict."""
+        return await self._get_json(f"model-versions/{version_id}")
+
+    async def get_model_by_hash(self, hash_value: str) -> Optional[CivitaiModelVersion]:
+        """Find model version by file hash (SHA256 or AutoV2)."""
+        try:
+            data = await self._get_json(f"model-versions/by-hash/{hash_value}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+        return CivitaiModelVersion.from_api_response(data, data.get("modelId", 0))
+
+    async def search_models(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        username: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        nsfw: Optional[bool] = None,
+        sort: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Search for models. Returns raw API response dict."""
+        params = CivitaiClient.build_search_params(
+            query=query, tag=tag, username=username, types=types,
+            nsfw=nsfw, sort=sort, limit=limit, cursor=cursor,
+        )
+        response = await self._request("GET", "models", params=params)
+        return response.json()
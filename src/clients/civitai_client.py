@@ -11,9 +11,9 @@ Handles all communication with Civitai API including:
 
 import os
 import re
-import time
 import hashlib
 import logging
+import threading
 import requests
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple, Callable
@@ -23,6 +23,11 @@ import json
 
 logger = logging.getLogger(__name__)
 
+from .rate_limit import TokenBucket
+from .response_cache import (
+    DEFAULT_MAX_BYTES, FRESH, STALE, CachePolicy, CachedResponse, shared_cache,
+    lookup, policy_for, request_headers, store_response,
+)
 from ..core.models import (
     AssetDependency, AssetType, AssetSource, AssetHash,
     CivitaiSource, PreviewImage, ASSET_TYPE_FOLDERS
@@ -98,11 +103,25 @@ class CivitaiClient:
     - File download with resume support
     - Hash verification (SHA256, AutoV2)
     - Preview image downloads
-    - Rate limiting
+    - Rate limiting (token bucket shared by all threads, honoring
+      Retry-After / X-RateLimit-* from the server)
+    - On-disk response cache for model, version and hash lookups
+      (see response_cache.py), enabled by cache_dir
     - Progress callbacks
     """
     
     BASE_URL = "https://civitai.com/api/v1"
+
+    # Times a request rejected with 429 is retried after the server's delay
+    MAX_RATE_LIMIT_RETRIES = 3
+
+    # Cache policy per endpoint. Model pages change when versions are
+    # published; a version's files and hashes practically never change.
+    CACHE_POLICIES: Tuple[Tuple["re.Pattern[str]", CachePolicy], ...] = (
+        (re.compile(r"models/\d+$"), CachePolicy(ttl=600, stale=3600)),
+        (re.compile(r"model-versions/\d+$"), CachePolicy(ttl=86400, stale=7 * 86400)),
+        (re.compile(r"model-versions/by-hash/[^/]+$"), CachePolicy(ttl=7 * 86400, stale=30 * 86400)),
+    )
     
     # Mapping Civitai model types to our AssetType
     MODEL_TYPE_MAP = {
@@ -124,12 +143,33 @@ class CivitaiClient:
         api_key: Optional[str] = None,
         requests_per_minute: int = 30,
         timeout: int = 30,
+        http_pool=None,
+        burst: int = 5,
+        cache_dir: Optional[Path] = None,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
     ):
+        """
+        Initialize Civitai client.
+
+        Args:
+            api_key: Civitai API key (default: CIVITAI_API_KEY env var)
+            requests_per_minute: Rate limit for API requests
+            timeout: Request timeout in seconds
+            http_pool: Optional store HttpPool whose keep-alive connections
+                this client's session reuses
+            burst: Requests that may go out back to back after an idle period
+            cache_dir: Directory for cached API responses (None disables caching)
+            cache_max_bytes: Size the response cache is kept under
+        """
         self.api_key = api_key or os.environ.get("CIVITAI_API_KEY")
         self.requests_per_minute = requests_per_minute
         self.timeout = timeout
-        self._last_request_time = 0.0
-        self._request_interval = 60.0 / requests_per_minute
+        self._limiter = TokenBucket(requests_per_minute, burst=burst)
+        self.response_cache = (
+            shared_cache(cache_dir, max_bytes=cache_max_bytes) if cache_dir is not None else None
+        )
+        self._revalidating: set = set()
+        self._revalidating_lock = threading.Lock()
         
         self.session = requests.Session()
         self.session.headers.update({
@@ -138,13 +178,12 @@ class CivitaiClient:
         })
         if self.api_key:
             self.session.headers["Authorization"] = f"Bearer {self.api_key}"
+        if http_pool is not None:
+            http_pool.mount(self.session)
     
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._request_interval:
-            time.sleep(self._request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Wait for a request token (shared across threads)."""
+        self._limiter.acquire()
     
     def _request(
         self,
@@ -153,24 +192,104 @@ class CivitaiClient:
         params: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> requests.Response:
-        """Make a rate-limited API request."""
-        self._rate_limit()
-        
+        """
+        Make a rate-limited API request.
+
+        A 429 response pauses the limiter for the server's Retry-After and
+        is retried up to MAX_RATE_LIMIT_RETRIES times.
+        """
         url = f"{self.BASE_URL}/{endpoint}"
-        response = self.session.request(
-            method,
-            url,
-            params=params,
-            timeout=self.timeout,
-            **kwargs
-        )
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            self._rate_limit()
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                timeout=self.timeout,
+                **kwargs
+            )
+            delay = self._limiter.observe(response.status_code, response.headers)
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                break
+            logger.warning(
+                "[CivitaiClient] Rate limited on %s, retrying in %.1fs (attempt %d/%d)",
+                endpoint, delay or 0.0, attempt + 1, self.MAX_RATE_LIMIT_RETRIES,
+            )
         response.raise_for_status()
         return response
     
+    # =========================================================================
+    # Response Cache
+    # =========================================================================
+
+    def _get_json(self, endpoint: str) -> Any:
+        """
+        GET an endpoint's JSON body, through the response cache if it has a policy.
+
+        Fresh entries are served as is; stale ones are served while a
+        background request revalidates them; expired ones are revalidated
+        first. If revalidation fails to reach the server, the cached body is
+        served regardless of age.
+        """
+        policy = policy_for(self.CACHE_POLICIES, endpoint) if self.response_cache is not None else None
+        if policy is None:
+            return self._request("GET", endpoint).json()
+
+        entry, state = lookup(self.response_cache, endpoint, policy)
+        if state == FRESH:
+            return entry.body
+        if state == STALE:
+            self._revalidate_in_background(endpoint, entry)
+            return entry.body
+        try:
+            return self._fetch_to_cache(endpoint, entry).body
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if entry is None:
+                raise
+            logger.warning(
+                "[CivitaiClient] Serving cached %s, server unreachable: %s", endpoint, e,
+            )
+            return entry.body
+
+    def _fetch_to_cache(self, endpoint: str, entry: Optional[CachedResponse]) -> CachedResponse:
+        """Request an endpoint (conditionally if entry is given) and store the result."""
+        response = self._request("GET", endpoint, headers=request_headers(entry))
+        return store_response(
+            self.response_cache, endpoint, entry,
+            response.status_code, response.headers, response.json,
+        )
+
+    def _revalidate_in_background(self, endpoint: str, entry: CachedResponse) -> None:
+        with self._revalidating_lock:
+            if endpoint in self._revalidating:
+                return
+            self._revalidating.add(endpoint)
+
+        def revalidate():
+            try:
+                self._fetch_to_cache(endpoint, entry)
+            except Exception as e:
+                logger.debug("[CivitaiClient] Background revalidation of %s failed: %s", endpoint, e)
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(endpoint)
+
+        threading.Thread(
+            target=revalidate, name=f"civitai-revalidate-{endpoint}", daemon=True,
+        ).start()
+
+    def expire_cached_models(self) -> None:
+        """Make the next model lookups confirm cached model pages with the server."""
+        if self.response_cache is not None:
+            self.response_cache.expire("models/")
+
+    # =========================================================================
+    # API
+    # =========================================================================
+
     def get_model(self, model_id: int) -> Dict[str, Any]:
         """Fetch model details by ID. Returns raw API response dict."""
-        response = self._request("GET", f"models/{model_id}")
-        return response.json()
+        return self._get_json(f"models/{model_id}")
     
     def get_model_as_object(self, model_id: int) -> CivitaiModel:
         """Fetch model details by ID as CivitaiModel object."""
@@ -179,8 +298,7 @@ class CivitaiClient:
     
     def get_model_version(self, version_id: int) -> Dict[str, Any]:
         """Fetch model version details by ID. Returns raw API response dict."""
-        response = self._request("GET", f"model-versions/{version_id}")
-        return response.json()
+        return self._get_json(f"model-versions/{version_id}")
     
     def get_model_version_as_object(self, version_id: int) -> CivitaiModelVersion:
         """Fetch model version details by ID as object."""
@@ -191,8 +309,7 @@ class CivitaiClient:
     def get_model_by_hash(self, hash_value: str) -> Optional[CivitaiModelVersion]:
         """Find model version by file hash (SHA256 or AutoV2)."""
         try:
-            response = self._request("GET", f"model-versions/by-hash/{hash_value}")
-            data = response.json()
+            data = self._get_json(f"model-versions/by-hash/{hash_value}")
             model_id = data.get("modelId", 0)
             return CivitaiModelVersion.from_api_response(data, model_id)
         except requests.HTTPError as e:
@@ -212,6 +329,32 @@ class CivitaiClient:
         cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Search for models. Returns raw API response dict."""
+        params = self.build_search_params(
+            query=query, tag=tag, username=username, types=types,
+            nsfw=nsfw, sort=sort, limit=limit, cursor=cursor,
+        )
+        
+        # Use authenticated session to include API key (needed for some models/settings)
+        # and standard rate limiting
+        response = self._request(
+            "GET",
+            "models",
+            params=params
+        )
+        return response.json()
+    
+    @staticmethod
+    def build_search_params(
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        username: Optional[str] = None,
+        types: Optional[List[str]] = None,
+        nsfw: Optional[bool] = None,
+        sort: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Query parameters of a model search (GET models)."""
         params: Dict[str, Any] = {
             "limit": limit,
         }
@@ -229,15 +372,7 @@ class CivitaiClient:
             params["sort"] = sort
         if cursor:
             params["cursor"] = cursor
-        
-        # Use authenticated session to include API key (needed for some models/settings)
-        # and standard rate limiting
-        response = self._request(
-            "GET",
-            "models",
-            params=params
-        )
-        return response.json()
+        return params
     
     def parse_civitai_url(self, url: str) -> Tuple[int, Optional[int]]:
         """
@@ -0,0 +1,182 @@
+"""
+Rate limiting for API clients.
+
+TokenBucket spaces requests at a steady rate while allowing a small burst,
+and is shared by every thread using a client, so concurrent callers queue
+for tokens instead of each sleeping on its own clock. Coroutines wait with
+acquire_async(), which sleeps on the event loop instead of blocking it.
+
+The server has the last word: a 429 with Retry-After, or rate-limit headers
+reporting no remaining requests, pause the whole bucket until the server's
+deadline (see observe()).
+"""
+
+import asyncio
+import email.utils
+import threading
+import time
+from typing import Any, Mapping, Optional
+
+
+# Upper bound on a server-requested pause, so a bogus header can't stall us for hours
+MAX_PAUSE_SECONDS = 300.0
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def parse_retry_after(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta seconds or HTTP date).
+
+    Returns:
+        Seconds to wait, or None if the value is missing or unparseable
+    """
+    seconds = _number(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    if not isinstance(value, str):
+        return None
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (now if now is not None else time.time()))
+
+
+def parse_rate_limit_reset(value: Any, now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse an X-RateLimit-Reset header.
+
+    Servers send either seconds until reset or a Unix timestamp; values
+    larger than a day are taken as timestamps.
+
+    Returns:
+        Seconds until the window resets, or None if unparseable
+    """
+    seconds = _number(value)
+    if seconds is None:
+        return None
+    if seconds > 86400:
+        seconds -= now if now is not None else time.time()
+    return max(0.0, seconds)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at rate_per_minute up to burst; acquire()
+    takes one, sleeping until one is available.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        """
+        Args:
+            rate_per_minute: Sustained request rate
+            burst: Requests allowed back to back after an idle period
+        """
+        self.rate = max(rate_per_minute, 1e-6) / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while paused
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def reserve(self) -> float:
+        """
+        Take a token, possibly from the future.
+
+        Token debt is paid after any pause, so callers queued during a
+        pause leave it spaced at the steady rate rather than all at once.
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(now, self._paused_until) - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Wait until a request may be sent, without blocking the event loop.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold every caller for seconds (server asked us to back off).
+
+        The burst is dropped: one request may go when the pause ends, the
+        rest follow at the steady rate.
+        """
+        seconds = min(max(0.0, seconds), MAX_PAUSE_SECONDS)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = min(self._tokens, 0.0) + 1.0
+
+    def observe(self, status_code: Any, headers: Mapping[str, Any]) -> Optional[float]:
+        """
+        Apply a response's rate-limit signals.
+
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers
+
+        Returns:
+            Seconds the bucket was paused for, or None
+        """
+        delay = None
+        if status_code == 429:
+            delay = parse_retry_after(headers.get("Retry-After"))
+            if delay is None:
+                delay = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+            if delay is None:
+                delay = 1.0 / self.rate
+        elif _number(headers.get("X-RateLimit-Remaining")) == 0:
+            delay = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+        if delay is not None:
+            self.pause(delay)
+        return delay
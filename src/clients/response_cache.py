@@ -0,0 +1,365 @@
+"""
+On-disk cache of JSON API responses.
+
+Each response is one JSON file under the cache directory, named by a hash of
+its key (the request path), holding the decoded body together with the
+validators the server sent (ETag, Last-Modified) and when it was stored:
+
+    <root>/<sha1(key)>.json
+
+How long an entry may be used is decided per endpoint by a CachePolicy:
+
+    age < ttl            fresh    served without asking the server
+    age < ttl + stale    stale    served, and revalidated in the background
+    otherwise            expired  revalidated before use (If-None-Match /
+                                  If-Modified-Since, so an unchanged resource
+                                  costs a 304 instead of a full download)
+
+The directory is bounded by max_bytes: when a write pushes it over, the least
+recently used files (by mtime, bumped on every hit) are removed until it is
+back under LOW_WATER of the limit. Several processes or clients may share a
+directory; every write is atomic and eviction rescans the directory. Within
+one process, clients get the directory's single instance from shared_cache(),
+so they share its size bookkeeping and expire() calls.
+
+policy_for(), lookup(), request_headers() and store_response() are the
+cache decisions around one GET, independent of the HTTP transport; the
+sync and async Civitai clients only add the request itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Eviction trims the directory to this fraction of max_bytes
+LOW_WATER = 0.8
+
+# Entry states
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long responses of one endpoint may be reused."""
+    ttl: float  # Seconds served without asking the server
+    stale: float = 0.0  # Further seconds served while revalidating in the background
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and its validators."""
+    key: str
+    body: Any
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers asking the server to confirm this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Directory of cached JSON responses, bounded in size.
+
+    Thread-safe. Entries are returned freshly decoded, so callers may
+    modify them.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            root: Cache directory (created on first write)
+            max_bytes: Size the directory is kept under
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None  # Approximate directory size, scanned lazily
+        self._expired: Dict[str, float] = {}  # key prefix -> entries stored before must revalidate
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Load an entry, marking it recently used.
+
+        Returns:
+            The entry, or None if missing or unreadable
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("[ResponseCache] Ignoring unreadable entry %s: %s", path, e)
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or data.get("key") != key:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return CachedResponse(
+            key=key,
+            body=data.get("body"),
+            stored_at=float(data.get("stored_at", 0)),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+
+    def state(self, entry: CachedResponse, policy: CachePolicy, now: Optional[float] = None) -> str:
+        """Classify an entry as FRESH, STALE or EXPIRED under policy."""
+        with self._lock:
+            for prefix, before in self._expired.items():
+                if entry.key.startswith(prefix) and entry.stored_at <= before:
+                    return EXPIRED
+        age = (now if now is not None else time.time()) - entry.stored_at
+        if age < policy.ttl:
+            return FRESH
+        if age < policy.ttl + policy.stale:
+            return STALE
+        return EXPIRED
+
+    def expire(self, prefix: str = "") -> None:
+        """Require entries under prefix stored until now to be revalidated before use."""
+        with self._lock:
+            self._expired[prefix] = time.time()
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def put(
+        self,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedResponse:
+        """
+        Store a response body (replacing any previous entry).
+
+        Returns:
+            The stored entry
+        """
+        entry = CachedResponse(
+            key=key, body=body, stored_at=time.time(), etag=etag, last_modified=last_modified,
+        )
+        data = json.dumps({
+            "version": CACHE_VERSION,
+            "key": key,
+            "stored_at": entry.stored_at,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }).encode("utf-8")
+
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            try:
+                old_size = path.stat().st_size
+            except OSError:
+                old_size = 0
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("[ResponseCache] Failed to store %s: %s", key, e)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return entry
+
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_size()
+            else:
+                self._total += len(data) - old_size
+            if self._total > self.max_bytes:
+                self._evict()
+        return entry
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        with self._lock:
+            for _, _, path in self._list_files():
+                try:
+                    os.unlink(path)
+                    removed += 1
+                except OSError:
+                    pass
+            self._total = 0
+        return removed
+
+    # =========================================================================
+    # Eviction
+    # =========================================================================
+
+    def _list_files(self):
+        """(mtime_ns, size, path) of every entry file."""
+        files = []
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            pass
+        return files
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._list_files())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under LOW_WATER (lock held)."""
+        files = sorted(self._list_files())
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * LOW_WATER
+        removed = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._total = total
+        logger.debug("[ResponseCache] Evicted %d entries from %s", removed, self.root)
+
+
+# One instance per directory in this process (see shared_cache)
+_shared_caches: Dict[str, ResponseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def shared_cache(root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> ResponseCache:
+    """
+    The process-wide ResponseCache for a directory.
+
+    Args:
+        root: Cache directory
+        max_bytes: Size limit, if this call creates the instance
+
+    Returns:
+        The same instance for every call with the same directory
+    """
+    key = os.path.abspath(root)
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = ResponseCache(Path(key), max_bytes=max_bytes)
+        return cache
+
+
+# =============================================================================
+# Client Helpers
+# =============================================================================
+
+def policy_for(
+    policies: Iterable[Tuple[Pattern[str], CachePolicy]], key: str,
+) -> Optional[CachePolicy]:
+    """First policy whose pattern matches the whole key, or None (not cached)."""
+    for pattern, policy in policies:
+        if pattern.fullmatch(key):
+            return policy
+    return None
+
+
+def lookup(cache: ResponseCache, key: str, policy: CachePolicy) -> Tuple[Optional[CachedResponse], str]:
+    """
+    Load an entry and classify it under policy.
+
+    Returns:
+        (entry, state); a missing entry is (None, EXPIRED)
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None, EXPIRED
+    return entry, cache.state(entry, policy)
+
+
+def request_headers(entry: Optional[CachedResponse]) -> Optional[Dict[str, str]]:
+    """Extra headers for fetching a key: conditional if an entry is cached."""
+    if entry is None:
+        return None
+    return entry.conditional_headers() or None
+
+
+def store_response(
+    cache: ResponseCache,
+    key: str,
+    entry: Optional[CachedResponse],
+    status_code: int,
+    headers: Mapping[str, str],
+    read_json: Callable[[], Any],
+) -> CachedResponse:
+    """
+    Store the response to a request sent with request_headers(entry).
+
+    Args:
+        cache: Cache to store into
+        key: Entry key
+        entry: Entry the request was conditional on, if any
+        status_code: Response status (304 keeps entry's body)
+        headers: Response headers (ETag / Last-Modified are kept)
+        read_json: Decodes the response body; not called on a 304
+
+    Returns:
+        The stored entry
+    """
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if status_code == 304 and entry is not None:
+        body = entry.body
+        etag = etag or entry.etag
+        last_modified = last_modified or entry.last_modified
+    else:
+        body = read_json()
+    return cache.put(key, body, etag=etag, last_modified=last_modified)
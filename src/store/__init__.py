@@ -26,13 +26,23 @@ Usage:
 
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-from .blob_store import BlobStore, BlobStoreError, DownloadError, HashMismatchError
+from .blob_store import BlobStore, BlobStoreError, DownloadError, HashMismatchError, VerifyReport
 from .download_auth import CivitaiAuthProvider
-from .download_service import DownloadService
+from .download_queue import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    DownloadJob,
+    DownloadQueueError,
+    DownloadScheduler,
+)
+from .download_service import BandwidthLimiter, DownloadService
+from .hash_ledger import HashLedger
+from .http_pool import HttpPool
+from .index_db import IndexStats, StoreIndex, StoreIndexError
 from .layout import (
     PackNotFoundError,
     ProfileNotFoundError,
@@ -59,6 +69,7 @@ from .models import (
     DeleteResult,
     DependencySelector,
     DoctorReport,
+    DownloadConfig,
     ExposeConfig,
     HuggingFaceSelector,
     ImpactAnalysis,
@@ -89,6 +100,7 @@ from .models import (
     UISets,
     UnresolvedDependency,
     UnresolvedReport,
+    UpdateCheckConfig,
     UpdatePolicy,
     UpdatePlan,
     UpdatePolicyMode,
@@ -101,8 +113,9 @@ from .inventory_service import InventoryService
 from .pack_service import PackService
 from .profile_service import ProfileService
 from .update_provider import UpdateCheckResult, UpdateProvider
+from .update_checker import CheckedPlan, UpdateChecker
 from .update_service import UpdateService
-from .view_builder import BuildReport, ViewBuilder, ViewBuildError
+from .view_builder import BuildReport, MultiViewBuildError, ViewBuilder, ViewBuildError
 
 
 __all__ = [
@@ -111,6 +124,10 @@ __all__ = [
     
     # Layout
     "StoreLayout",
+    "StoreIndex",
+    "IndexStats",
+    "HashLedger",
+    "HttpPool",
     
     # Services
     "BlobStore",
@@ -124,6 +141,11 @@ __all__ = [
     "UpdateProvider",
     "UpdateCheckResult",
     "CivitaiUpdateProvider",
+
+    # Background update checks
+    "UpdateChecker",
+    "CheckedPlan",
+    "UpdateCheckConfig",
     
     # Models
     "Pack",
@@ -147,6 +169,7 @@ __all__ = [
     "DoctorReport",
     "SearchResult",
     "BuildReport",
+    "VerifyReport",
     "APIResponse",
 
     # Inventory
@@ -170,6 +193,15 @@ __all__ = [
     "BackupNotEnabledError",
     "BackupNotConnectedError",
 
+    # Downloads
+    "BandwidthLimiter",
+    "DownloadScheduler",
+    "DownloadJob",
+    "DownloadConfig",
+    "DownloadQueueError",
+    "PRIORITY_USER",
+    "PRIORITY_BACKGROUND",
+
     # Errors
     "StoreError",
     "StoreLockError",
@@ -180,6 +212,8 @@ __all__ = [
     "DownloadError",
     "HashMismatchError",
     "ViewBuildError",
+    "MultiViewBuildError",
+    "StoreIndexError",
 ]
 
 
@@ -209,6 +243,10 @@ class Store:
         """
         self.layout = StoreLayout(root)
 
+        # SQLite index over state/, kept current by layout write events
+        self.index = StoreIndex(self.layout)
+        self.layout.add_listener(self.index)
+
         # Centralized download service with auth providers
         logger.info(
             "[Store] Creating DownloadService: civitai_api_key present=%s, length=%d",
@@ -216,20 +254,43 @@ class Store:
             len(civitai_api_key) if civitai_api_key else 0,
         )
         auth_providers = [CivitaiAuthProvider(civitai_api_key)]
-        self.download_service = DownloadService(auth_providers=auth_providers)
+        # Shared record of already-hashed files (skips redundant SHA256 passes)
+        self.hash_ledger = HashLedger(self.layout)
+        # Keep-alive connections shared by all downloads and the Civitai API
+        self.http_pool = HttpPool()
+        # Global bandwidth ceiling, adjusted by the download scheduler
+        self.bandwidth_limiter = BandwidthLimiter()
+        self.download_service = DownloadService(
+            auth_providers=auth_providers,
+            hash_ledger=self.hash_ledger,
+            segments=DownloadService.DEFAULT_SEGMENTS,
+            http_pool=self.http_pool,
+            bandwidth_limiter=self.bandwidth_limiter,
+        )
 
         self.blob_store = BlobStore(
             self.layout,
             api_key=civitai_api_key,
             download_service=self.download_service,
+            hash_ledger=self.hash_ledger,
         )
         self.view_builder = ViewBuilder(self.layout, self.blob_store)
+        # Persistent download queue (started on demand, e.g. by the API)
+        self.download_scheduler = DownloadScheduler(
+            self.layout, self.blob_store, bandwidth=self.bandwidth_limiter,
+        )
 
-        # Create authenticated CivitaiClient when API key is provided
-        # but no explicit client was given (e.g. from get_store() in API)
-        if civitai_client is None and civitai_api_key:
+        # Create the CivitaiClient shared by imports, resolvers and update
+        # checks when no explicit client was given (e.g. from get_store() in
+        # API), authenticated when an API key is provided. Its response cache
+        # lives in data/cache/civitai, shared with the browse API.
+        if civitai_client is None:
             from src.clients.civitai_client import CivitaiClient
-            civitai_client = CivitaiClient(api_key=civitai_api_key)
+            civitai_client = CivitaiClient(
+                api_key=civitai_api_key,
+                http_pool=self.http_pool,
+                cache_dir=self.layout.civitai_cache_path,
+            )
 
         self.pack_service = PackService(
             self.layout,
@@ -251,17 +312,24 @@ class Store:
             providers={
                 SelectorStrategy.CIVITAI_MODEL_LATEST: civitai_provider,
             },
+            index=self.index,
         )
+        # Stored update plans refreshed in the background (started on demand, e.g. by the API)
+        self.update_checker = UpdateChecker(self.layout, self.update_service)
+        self.layout.add_listener(self.update_checker)
         # BackupService initialized with default config, updated when store loads
         self.backup_service = BackupService(
             self.layout,
             BackupConfig(),
+            hash_ledger=self.hash_ledger,
+            blob_store=self.blob_store,
         )
         # InventoryService with backup support
         self.inventory_service = InventoryService(
             self.layout,
             self.blob_store,
             self.backup_service,
+            index=self.index,
         )
         # Set backup service on profile service for auto-restore
         self.profile_service.set_backup_service(self.backup_service)
@@ -282,6 +350,15 @@ class Store:
             force: If True, reinitialize even if already initialized.
         """
         self.layout.init_store(force)
+
+    def close(self) -> None:
+        """Stop background work and release HTTP connections and database handles."""
+        self.download_scheduler.shutdown()
+        self.update_checker.shutdown()
+        self.http_pool.close()
+        self.hash_ledger.close()
+        self.backup_service.journal.close()
+        self.index.close()
     
     # =========================================================================
     # Config
@@ -339,69 +416,105 @@ class Store:
             List of model details
         """
         models = []
-        for pack_name in self.list_packs():
-            try:
-                pack = self.get_pack(pack_name)
-                lock = self.get_pack_lock(pack_name)
-                if not lock:
-                    continue
-                
-                for dep in pack.dependencies:
-                    # Filter by kind if specified
-                    dep_kind = dep.kind.value if hasattr(dep.kind, 'value') else str(dep.kind)
-                    if kind and kind.lower() != dep_kind.lower():
-                        continue
-                    
-                    resolved = lock.get_resolved(dep.id)
-                    if resolved and resolved.artifact.sha256:
-                        if self.blob_store.blob_exists(resolved.artifact.sha256):
-                            # Get preview image if available
-                            preview_url = None
-                            previews_dir = self.layout.pack_previews_path(pack_name)
-                            if previews_dir.exists():
-                                for ext in ['.png', '.jpg', '.jpeg', '.webp']:
-                                    matches = list(previews_dir.glob(f'*{ext}'))
-                                    if matches:
-                                        preview_url = f"/previews/{pack_name}/resources/previews/{matches[0].name}"
-                                        break
-                            
-                            models.append({
-                                "id": f"{pack_name}:{dep.id}",
-                                "name": resolved.artifact.provider.filename,
-                                "kind": dep_kind,
-                                "pack": pack_name,
-                                "base_model": pack.base_model,
-                                "image": preview_url,
-                                "filename": resolved.artifact.provider.filename, # v1 compat
-                                "size": resolved.artifact.size_bytes,
-                            })
-            except Exception:
-                pass
+        self.index.refresh()
+        image_exts = ['.png', '.jpg', '.jpeg', '.webp']
+        preview_cache: Dict[str, Optional[str]] = {}
+
+        rows = list(self.index.iter_model_rows(kind))
+        installed = self.blob_store.existing_blobs(row["sha256"] for row in rows)
+
+        for row in rows:
+            pack_name = row["pack"]
+            if row["sha256"] not in installed:
+                continue
+
+            # Get preview image if available
+            if pack_name not in preview_cache:
+                preview_cache[pack_name] = self._find_preview_url(pack_name, image_exts)
+
+            models.append({
+                "id": f"{pack_name}:{row['dependency_id']}",
+                "name": row["filename"],
+                "kind": row["kind"],
+                "pack": pack_name,
+                "base_model": row["base_model"],
+                "image": preview_cache[pack_name],
+                "filename": row["filename"], # v1 compat
+                "size": row["size_bytes"],
+            })
         return models
+
+    def _find_preview_url(self, pack_name: str, extensions: List[str]) -> Optional[str]:
+        """First preview image URL for a pack: indexed previews, then disk scan."""
+        previews_dir = self.layout.pack_previews_path(pack_name)
+        filename = self.index.first_preview_with_ext(pack_name, extensions)
+        if filename and (previews_dir / filename).exists():
+            return f"/previews/{pack_name}/resources/previews/{filename}"
+
+        if previews_dir.exists():
+            for ext in extensions:
+                matches = list(previews_dir.glob(f'*{ext}'))
+                if matches:
+                    return f"/previews/{pack_name}/resources/previews/{matches[0].name}"
+        return None
     
-    def search(self, query: str) -> SearchResult:
+    def search(self, query: str, limit: Optional[int] = None) -> SearchResult:
         """
         Search packs by name or metadata.
         
-        Uses simple substring matching. In the future, could use SQLite FTS.
+        Uses the SQLite FTS5 index (ranked, prefix matching, `field:value`
+        filters - see StoreIndex.search). Falls back to a substring scan over
+        pack names and dependency ids if the index is unavailable.
         
         Args:
             query: Search query string
+            limit: Optional maximum number of results
         
         Returns:
             SearchResult with matching packs
         """
         from .models import SearchResult, SearchResultItem
+
+        try:
+            self.index.refresh()
+            rows = self.index.search(query, limit=limit)
+        except Exception as e:
+            logger.warning("[Store] Index search failed, falling back to scan: %s", e)
+            return self._search_scan(query, limit)
+
+        items = [
+            SearchResultItem(
+                pack_name=row["name"],
+                pack_type=row["pack_type"],
+                provider=row["source_provider"],
+                source_model_id=row["source_model_id"],
+                source_url=row["source_url"],
+                score=-row["score"] if row["score"] is not None else None,
+            )
+            for row in rows
+        ]
+
+        return SearchResult(
+            query=query,
+            used_db=True,
+            items=items,
+        )
+
+    def _search_scan(self, query: str, limit: Optional[int] = None) -> SearchResult:
+        """Substring search over pack names and dependency ids (no index)."""
+        from .models import SearchResult, SearchResultItem
         
         query_lower = query.lower().strip()
         items = []
         
         for pack_name in self.list_packs():
             try:
-                pack = self.layout.load_pack(pack_name)
+                pack = self.layout.load_pack(pack_name, readonly=True)
                 
-                # Check if query matches pack name
-                if query_lower in pack_name.lower():
+                matched = query_lower in pack_name.lower() or any(
+                    query_lower in dep.id.lower() for dep in pack.dependencies
+                )
+                if matched:
                     items.append(SearchResultItem(
                         pack_name=pack_name,
                         pack_type=pack.pack_type.value if hasattr(pack.pack_type, 'value') else str(pack.pack_type),
@@ -409,23 +522,13 @@ class Store:
                         source_model_id=pack.source.model_id if pack.source else None,
                         source_url=pack.source.url if pack.source else None,
                     ))
-                    continue
-                
-                # Check dependencies
-                for dep in pack.dependencies:
-                    if query_lower in dep.id.lower():
-                        items.append(SearchResultItem(
-                            pack_name=pack_name,
-                            pack_type=pack.pack_type.value if hasattr(pack.pack_type, 'value') else str(pack.pack_type),
-                            provider=pack.source.provider.value if pack.source else None,
-                            source_model_id=pack.source.model_id if pack.source else None,
-                            source_url=pack.source.url if pack.source else None,
-                        ))
-                        break
                         
             except Exception:
                 # Skip packs that can't be loaded
                 continue
+
+        if limit:
+            items = items[:limit]
         
         return SearchResult(
             query=query,
@@ -809,6 +912,15 @@ class Store:
             Dict mapping pack_name -> UpdatePlan
         """
         return self.update_service.check_all_updates()
+
+    def iter_check_all_updates(self) -> Iterator[Tuple[str, UpdatePlan]]:
+        """
+        Check for updates on all packs, yielding plans as they complete.
+        
+        Returns:
+            Iterator of (pack_name, UpdatePlan)
+        """
+        return self.update_service.iter_check_all_updates()
     
     def update(
         self,
@@ -919,14 +1031,17 @@ class Store:
             
             for pack_entry in profile.packs:
                 try:
-                    pack = self.layout.load_pack(pack_entry.name)
-                    lock = self.layout.load_pack_lock(pack_entry.name)
+                    pack = self.layout.load_pack(pack_entry.name, readonly=True)
+                    lock = self.layout.load_pack_lock(pack_entry.name, readonly=True)
                     
                     if lock:
                         # Check resolved
+                        present = self.blob_store.existing_blobs(
+                            r.artifact.sha256 for r in lock.resolved if r.artifact.sha256
+                        )
                         for resolved in lock.resolved:
                             sha256 = resolved.artifact.sha256
-                            if sha256 and not self.blob_store.blob_exists(sha256):
+                            if sha256 and sha256 not in present:
                                 dep = pack.get_dependency(resolved.dependency_id)
                                 missing_blobs.append(MissingBlob(
                                     pack=pack_entry.name,
@@ -1012,25 +1127,36 @@ class Store:
                 packs_data = {}
                 for p in profile.packs:
                     try:
-                        pack = self.layout.load_pack(p.name)
-                        lock = self.layout.load_pack_lock(p.name)
+                        pack = self.layout.load_pack(p.name, readonly=True)
+                        lock = self.layout.load_pack_lock(p.name, readonly=True)
                         packs_data[p.name] = (pack, lock)
                     except Exception:
                         pass
                 
-                # Build for each UI
-                for ui in ui_targets:
-                    self.view_builder.build(ui, profile, packs_data)
-                    self.view_builder.activate(ui, profile_name)
+                # Blobs may have changed outside BlobStore: replan from scratch
+                self.view_builder.invalidate_plans()
+                
+                # Build and activate for all UIs concurrently
+                self.view_builder.build_many(ui_targets, profile, packs_data, activate=True)
                 
                 actions.views_rebuilt = True
             except Exception as e:
                 notes.append(f"Failed to rebuild views: {e}")
         
-        # DB rebuild (placeholder - SQLite not implemented yet)
+        # Rebuild SQLite index
         if rebuild_db:
-            actions.db_rebuilt = rebuild_db
-            notes.append("SQLite DB not implemented yet")
+            try:
+                stats = self.index.rebuild(rebuild_db)
+                actions.db_rebuilt = rebuild_db
+                notes.append(
+                    f"Index rebuilt ({rebuild_db}): {stats.packs_indexed} packs, "
+                    f"{stats.locks_indexed} locks, {stats.profiles_indexed} profiles "
+                    f"in {stats.duration_ms}ms"
+                )
+                if stats.errors:
+                    notes.append(f"Index rebuild skipped {stats.errors} unreadable files")
+            except Exception as e:
+                notes.append(f"Failed to rebuild index: {e}")
         
         # Get current status
         status = self.status(ui_targets)
@@ -1257,6 +1383,7 @@ class Store:
         kind_filter: Optional[AssetKind] = None,
         status_filter: Optional["BlobStatus"] = None,
         include_verification: bool = False,
+        rescan: bool = False,
     ) -> "InventoryResponse":
         """
         Get blob inventory with optional filtering.
@@ -1265,6 +1392,7 @@ class Store:
             kind_filter: Filter by asset kind
             status_filter: Filter by blob status
             include_verification: If True, verify blob hashes (slow!)
+            rescan: If True, rescan blobs and packs instead of revalidating
 
         Returns:
             Complete inventory response with summary and items
@@ -1273,6 +1401,7 @@ class Store:
             kind_filter=kind_filter,
             status_filter=status_filter,
             include_verification=include_verification,
+            rescan=rescan,
         )
 
     def get_inventory_summary(self) -> "InventorySummary":
@@ -1300,6 +1429,18 @@ class Store:
         """
         return self.inventory_service.cleanup_orphans(dry_run=dry_run, max_items=max_items)
 
+    def get_blob_item(self, sha256: str) -> Optional["InventoryItem"]:
+        """
+        Get the inventory item for a single blob.
+
+        Args:
+            sha256: SHA256 hash of the blob
+
+        Returns:
+            Inventory item, or None if the blob is neither present nor referenced
+        """
+        return self.inventory_service.get_item(sha256)
+
     def get_blob_impacts(self, sha256: str) -> "ImpactAnalysis":
         """
         Analyze what would break if a blob is deleted.
@@ -1335,6 +1476,8 @@ class Store:
         self,
         sha256_list: Optional[List[str]] = None,
         all_blobs: bool = False,
+        force: bool = False,
+        progress: Optional[Callable[[str, int, int], None]] = None,
     ) -> Dict:
         """
         Verify blob integrity.
@@ -1342,11 +1485,15 @@ class Store:
         Args:
             sha256_list: Specific blobs to verify
             all_blobs: If True, verify all blobs
+            force: Rehash blobs even if unchanged since their last verification
+            progress: Per-blob progress callback (sha256, hashed_bytes, total_bytes)
 
         Returns:
             Verification result
         """
-        return self.inventory_service.verify_blobs(sha256_list=sha256_list, all_blobs=all_blobs)
+        return self.inventory_service.verify_blobs(
+            sha256_list=sha256_list, all_blobs=all_blobs, force=force, progress=progress,
+        )
 
     # =========================================================================
     # Backup Storage Operations
@@ -1421,6 +1568,8 @@ class Store:
         direction: str = "to_backup",
         only_missing: bool = True,
         dry_run: bool = True,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        bytes_callback: Optional[Callable[[int, int], None]] = None,
     ) -> "SyncResult":
         """
         Sync blobs between local and backup storage.
@@ -1429,6 +1578,9 @@ class Store:
             direction: "to_backup" or "from_backup"
             only_missing: Only sync blobs missing from target
             dry_run: If True, only preview without syncing
+            progress_callback: Optional callback (sha256, bytes_done, total_bytes),
+                called once per finished blob
+            bytes_callback: Optional callback (bytes_done, total_bytes) as data is copied
 
         Returns:
             SyncResult with sync details
@@ -1437,6 +1589,8 @@ class Store:
             direction=direction,
             only_missing=only_missing,
             dry_run=dry_run,
+            progress_callback=progress_callback,
+            bytes_callback=bytes_callback,
         )
 
     def configure_backup(self, config: "BackupConfig") -> None:
@@ -1503,6 +1657,9 @@ class Store:
         # Collect blobs that need to be restored
         items_to_restore: List[SyncItem] = []
         errors: List[str] = []
+        local = self.blob_store.existing_blobs(
+            r.artifact.sha256 for r in lock.resolved if r.artifact.sha256
+        )
 
         for resolved in lock.resolved:
             sha256 = resolved.artifact.sha256
@@ -1510,7 +1667,7 @@ class Store:
                 continue
 
             # Skip if already local
-            if self.blob_store.blob_exists(sha256):
+            if sha256 in local:
                 continue
 
             # Check if on backup
@@ -1542,34 +1699,21 @@ class Store:
                 dep_name = dep.id if dep else resolved.dependency_id
                 errors.append(f"Blob {sha256[:12]} ({dep_name}) not found on backup")
 
-        bytes_to_sync = sum(item.size_bytes for item in items_to_restore)
-        blobs_synced = 0
-        bytes_synced = 0
-
-        # Execute restore if not dry run
-        if not dry_run:
-            for item in items_to_restore:
-                try:
-                    result = self.backup_service.restore_blob(item.sha256)
-                    if result.success:
-                        blobs_synced += 1
-                        bytes_synced += item.size_bytes
-                    else:
-                        errors.append(f"Restore failed for {item.sha256[:12]}: {result.error}")
-                except Exception as e:
-                    errors.append(f"Restore error for {item.sha256[:12]}: {e}")
-
-        return SyncResult(
+        result = SyncResult(
             dry_run=dry_run,
             direction="from_backup",
             blobs_to_sync=len(items_to_restore),
-            bytes_to_sync=bytes_to_sync,
-            blobs_synced=blobs_synced,
-            bytes_synced=bytes_synced,
+            bytes_to_sync=sum(item.size_bytes for item in items_to_restore),
             items=items_to_restore,
             errors=errors,
         )
 
+        # Execute restore if not dry run (resumes an interrupted pull of this pack)
+        if not dry_run and self.backup_service.is_connected():
+            self.backup_service.run_sync_session(f"pull:{pack_name}", result)
+
+        return result
+
     def push_pack(
         self,
         pack_name: str,
@@ -1621,13 +1765,16 @@ class Store:
                 errors=["Backup not connected"],
             )
 
+        local = self.blob_store.existing_blobs(
+            r.artifact.sha256 for r in lock.resolved if r.artifact.sha256
+        )
         for resolved in lock.resolved:
             sha256 = resolved.artifact.sha256
             if not sha256:
                 continue
 
             # Skip if not local
-            if not self.blob_store.blob_exists(sha256):
+            if sha256 not in local:
                 continue
 
             # Skip if already on backup
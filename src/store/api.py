@@ -16,12 +16,18 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import threading
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Body, File, UploadFile, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, File, UploadFile, Form, BackgroundTasks, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 # Setup logger
@@ -47,7 +53,16 @@ from .models import (
     WorkflowInfo,
 )
 from .layout import PackNotFoundError
+from .download_queue import (
+    COMPLETED,
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    TERMINAL_STATUSES,
+    DownloadJob,
+    DownloadScheduler,
+)
 from .backup_service import BackupNotEnabledError, BackupNotConnectedError
+from .progress_events import BACKUP_SYNC, DOWNLOAD, VERIFY, ProgressHub
 
 
 # =============================================================================
@@ -155,6 +170,11 @@ class BulkUpdateCheckResponse(BaseModel):
     packs_with_updates: int
     total_changes: int
     plans: Dict[str, Dict[str, Any]]
+    # Freshness of stored results (see UpdateChecker)
+    checked_at: Optional[str] = None  # Oldest check among packs_checked (ISO 8601)
+    plan_checked_at: Dict[str, str] = Field(default_factory=dict)  # Per pack in plans
+    outdated_packs: List[str] = Field(default_factory=list)  # Awaiting a (re)check
+    checker_running: bool = False
 
 
 class AdditionalPreview(BaseModel):
@@ -350,6 +370,8 @@ def get_store():
 def reset_store():
     """Reset Store singleton (useful for config changes)."""
     global _store_instance
+    if _store_instance is not None:
+        _store_instance.close()
     _store_instance = None
 
 
@@ -499,6 +521,7 @@ class VerifyRequest(BaseModel):
     """Request for blob verification."""
     sha256: Optional[List[str]] = None
     all: bool = False
+    force: bool = False  # Rehash even blobs unchanged since their last verify
 
 
 class BackupBlobRequest(BaseModel):
@@ -533,12 +556,15 @@ class ConfigureBackupRequest(BaseModel):
 
 @store_router.get("/inventory", response_model=Dict[str, Any])
 def get_inventory(
+    request: Request,
+    response: Response,
     kind: Optional[str] = Query(None, description="Filter by asset kind"),
     status: Optional[str] = Query(None, description="Filter by blob status"),
     include_verification: bool = Query(False, description="Verify blob hashes (slow!)"),
     sort_by: str = Query("size_desc", description="Sort by: size_desc, size_asc, name_asc, kind"),
     limit: int = Query(1000, description="Maximum items to return"),
     offset: int = Query(0, description="Pagination offset"),
+    rescan: bool = Query(False, description="Rescan blobs and packs from disk"),
     store=Depends(require_initialized),
 ):
     """
@@ -546,15 +572,19 @@ def get_inventory(
 
     Returns all blobs with their status (REFERENCED, ORPHAN, MISSING),
     usage information, and disk statistics.
+
+    Unverified responses carry an ETag derived from the inventory version
+    and query; a matching If-None-Match gets 304 Not Modified.
     """
     from .models import AssetKind, BlobStatus
 
     logger.info(
-        "[API] GET /inventory (kind=%s, status=%s, verify=%s, limit=%d)",
+        "[API] GET /inventory (kind=%s, status=%s, verify=%s, limit=%d, rescan=%s)",
         kind,
         status,
         include_verification,
         limit,
+        rescan,
     )
 
     kind_filter = None
@@ -578,11 +608,20 @@ def get_inventory(
             kind_filter=kind_filter,
             status_filter=status_filter,
             include_verification=include_verification,
+            rescan=rescan,
         )
     except Exception as e:
         logger.error("[API] Failed to get inventory: %s", e, exc_info=True)
         raise HTTPException(500, f"Failed to get inventory: {str(e)}")
 
+    # Verification results are not part of the version, so only plain listings get an ETag
+    if inventory.version and not include_verification:
+        etag = f'W/"{inventory.version}-{kind}-{status}-{sort_by}-{limit}-{offset}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+
     # Sort items
     if sort_by == "size_desc":
         inventory.items.sort(key=lambda x: x.size_bytes, reverse=True)
@@ -601,6 +640,7 @@ def get_inventory(
 
     return {
         "generated_at": inventory.generated_at,
+        "version": inventory.version,
         "summary": inventory.summary.model_dump(),
         "items": [item.model_dump() for item in inventory.items],
         "pagination": {
@@ -653,9 +693,7 @@ def get_blob_detail(
 
     Returns blob info plus impact analysis for deletion.
     """
-    inventory = store.get_inventory()
-
-    item = next((i for i in inventory.items if i.sha256 == sha256.lower()), None)
+    item = store.get_blob_item(sha256)
     if not item:
         raise HTTPException(404, f"Blob not found: {sha256}")
 
@@ -759,19 +797,46 @@ def verify_blobs(
         len(request.sha256 or []),
     )
 
+    # Per-blob byte counts, summed into one "verify" progress item
+    hashed: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def on_progress(sha256: str, done: int, total: int) -> None:
+        with lock:
+            hashed[sha256] = done
+            state = {
+                "status": "running",
+                "current": sha256,
+                "blobs_seen": len(hashed),
+                "hashed_bytes": sum(hashed.values()),
+            }
+        _progress_hub.publish(VERIFY, "inventory", state)
+
+    _progress_hub.publish(VERIFY, "inventory", {
+        "status": "running", "current": None, "blobs_seen": 0, "hashed_bytes": 0, "error": None,
+    })
     try:
         result = store.verify_blobs(
             sha256_list=request.sha256,
             all_blobs=request.all,
+            force=request.force,
+            progress=on_progress,
         )
         logger.info(
             "[API] Verify result: %d verified, %d invalid",
             result.get("verified", 0),
             len(result.get("invalid", [])),
         )
+        _progress_hub.publish(VERIFY, "inventory", {
+            "status": "completed",
+            "current": None,
+            "verified": result.get("verified", 0),
+            "invalid": len(result.get("invalid", [])),
+        })
         return result
     except Exception as e:
         logger.error("[API] Verify failed: %s", e, exc_info=True)
+        _progress_hub.publish(VERIFY, "inventory", {"status": "failed", "error": str(e)})
         raise HTTPException(500, f"Verification failed: {str(e)}")
 
 
@@ -784,11 +849,11 @@ def redownload_blob(
     Re-download a blob from its original source.
 
     Resolves pack_name + dependency_id + download URL from inventory/lock files,
-    then delegates to the main download-asset system (_active_downloads + daemon thread)
-    so the download appears in the Downloads tab with full progress tracking.
+    then queues it in the main download system (the store's DownloadScheduler,
+    mirrored into _active_downloads) so the download appears in the Downloads
+    tab with full progress tracking.
     """
     import uuid
-    import threading
 
     sha256 = sha256.lower()
     logger.info("[API] POST /inventory/%s/redownload", sha256[:12])
@@ -806,7 +871,7 @@ def redownload_blob(
     dep = None
     for pack_name in item.used_by_packs:
         try:
-            lock = store.layout.load_pack_lock(pack_name)
+            lock = store.layout.load_pack_lock(pack_name, readonly=True)
             if not lock:
                 continue
             for resolved in lock.resolved:
@@ -831,124 +896,31 @@ def redownload_blob(
             "The pack lock file may need to be re-resolved.",
         )
 
-    # Create download tracking entry in the MAIN download system
+    # Queue in the MAIN download system so it shows in the Downloads tab
     filename = item.display_name or f"{sha256[:12]}.safetensors"
     download_id = str(uuid.uuid4())[:8]
-    _active_downloads[download_id] = {
-        "download_id": download_id,
+    meta = {
         "pack_name": source_pack,
         "asset_name": dep_id or sha256[:12],
         "filename": filename,
-        "status": "pending",
-        "progress": 0.0,
-        "downloaded_bytes": 0,
-        "total_bytes": 0,
-        "speed_bps": 0,
-        "speed_mbps": 0,
-        "eta_seconds": 0,
-        "error": None,
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "completed_at": None,
-        "target_path": None,
+        "asset_type": (dep.kind.value if dep else item.kind.value).lower(),
         "group_id": f"redownload-{sha256[:8]}",
         "group_label": "Inventory Re-download",
     }
-
-    def do_download():
-        """Background download — same pattern as download-asset."""
-        import time
-
-        entry = _active_downloads[download_id]
-        entry["status"] = "downloading"
-        start_time = time.time()
-        last_update_time = start_time
-        last_downloaded = 0
-
-        try:
-            def progress_callback(downloaded: int, total: int):
-                nonlocal last_update_time, last_downloaded
-
-                current_time = time.time()
-                time_delta = current_time - last_update_time
-
-                entry["downloaded_bytes"] = downloaded
-                entry["total_bytes"] = total
-                if total > 0:
-                    entry["progress"] = (downloaded / total) * 100
-
-                if time_delta > 0.5:
-                    bytes_delta = downloaded - last_downloaded
-                    speed_bps = bytes_delta / time_delta if time_delta > 0 else 0
-                    entry["speed_bps"] = speed_bps
-                    entry["speed_mbps"] = speed_bps / (1024 * 1024)
-
-                    remaining_bytes = total - downloaded
-                    if speed_bps > 0:
-                        entry["eta_seconds"] = int(remaining_bytes / speed_bps)
-                    else:
-                        entry["eta_seconds"] = 0
-
-                    last_update_time = current_time
-                    last_downloaded = downloaded
-
-            actual_sha = store.blob_store.download(
-                download_url,
-                expected_sha256=sha256,
-                force=True,
-                progress_callback=progress_callback,
-            )
-
-            # Create symlink to ComfyUI models folder
-            type_map = {
-                'checkpoint': 'checkpoints',
-                'base_model': 'checkpoints',
-                'base_checkpoint': 'checkpoints',
-                'lora': 'loras',
-                'vae': 'vae',
-                'controlnet': 'controlnet',
-                'upscaler': 'upscale_models',
-                'embedding': 'embeddings',
-                'clip': 'clip',
-                'text_encoder': 'text_encoders',
-                'diffusion_model': 'diffusion_models',
-            }
-            asset_type = (dep.kind.value if dep else item.kind.value).lower()
-            model_dir = type_map.get(asset_type, 'checkpoints')
-
-            try:
-                from config.settings import get_config
-                config = get_config()
-                target_dir = config.comfyui.base_path / "models" / model_dir
-                target_dir.mkdir(parents=True, exist_ok=True)
-                target_path = target_dir / filename
-
-                blob_path = store.blob_store.blob_path(actual_sha)
-                if target_path.exists() or target_path.is_symlink():
-                    target_path.unlink()
-                target_path.symlink_to(blob_path)
-                entry["target_path"] = str(target_path)
-            except Exception as e:
-                logger.warning("[redownload] Symlink creation failed: %s", e)
-
-            entry["status"] = "completed"
-            entry["progress"] = 100.0
-            entry["sha256"] = actual_sha
-            entry["completed_at"] = datetime.now(timezone.utc).isoformat()
-            logger.info(
-                "[API] Re-downloaded blob %s from %s (pack=%s)",
-                sha256[:12], download_url[:60], source_pack,
-            )
-
-        except Exception as e:
-            entry["status"] = "failed"
-            entry["error"] = str(e)
-            logger.error("[API] Re-download failed for %s: %s", sha256[:12], e, exc_info=True)
-
-    thread = threading.Thread(target=do_download, daemon=True)
-    thread.start()
+    scheduler = get_download_scheduler(store)
+    # The scheduler listener adds the Downloads tab entry; a blob already
+    # being downloaded keeps its existing job and entry
+    job = scheduler.submit(
+        download_url,
+        expected_sha256=sha256,
+        force=True,
+        kind="redownload",
+        meta=meta,
+        job_id=download_id,
+    )
 
     return {
-        "download_id": download_id,
+        "download_id": job.job_id,
         "pack_name": source_pack,
         "asset_name": dep_id or sha256[:12],
         "status": "started",
@@ -1067,11 +1039,56 @@ def sync_backup(
     Direction can be "to_backup" or "from_backup".
     Use dry_run=true to preview without actually syncing.
     """
-    result = store.sync_backup(
-        direction=request.direction,
-        only_missing=request.only_missing,
-        dry_run=request.dry_run,
-    )
+    if request.dry_run:
+        return store.sync_backup(
+            direction=request.direction,
+            only_missing=request.only_missing,
+            dry_run=True,
+        ).model_dump()
+
+    synced = 0
+
+    def on_progress(sha256: str, bytes_done: int, bytes_total: int) -> None:
+        nonlocal synced
+        synced += 1
+        _progress_hub.publish(BACKUP_SYNC, request.direction, {
+            "status": "running",
+            "current": sha256,
+            "blobs_done": synced,
+        })
+
+    def on_bytes(bytes_done: int, bytes_total: int) -> None:
+        # Totals across all copy workers; the hub coalesces bursts
+        _progress_hub.publish(BACKUP_SYNC, request.direction, {
+            "status": "running",
+            "bytes_synced": bytes_done,
+            "bytes_to_sync": bytes_total,
+        })
+
+    _progress_hub.publish(BACKUP_SYNC, request.direction, {
+        "status": "running", "current": None, "blobs_done": 0,
+        "bytes_synced": 0, "bytes_to_sync": 0, "errors": 0,
+    })
+    try:
+        result = store.sync_backup(
+            direction=request.direction,
+            only_missing=request.only_missing,
+            dry_run=False,
+            progress_callback=on_progress,
+            bytes_callback=on_bytes,
+        )
+    except Exception:
+        _progress_hub.publish(BACKUP_SYNC, request.direction, {"status": "failed", "errors": 1})
+        raise
+    _progress_hub.publish(BACKUP_SYNC, request.direction, {
+        "status": "failed" if result.errors and not result.blobs_synced else "completed",
+        "current": None,
+        "blobs_total": result.blobs_to_sync,
+        "blobs_done": result.blobs_synced,
+        "bytes_synced": result.bytes_synced,
+        "bytes_to_sync": result.bytes_to_sync,
+        "errors": len(result.errors),
+    })
     return result.model_dump()
 
 
@@ -1342,14 +1359,18 @@ class StateSyncRequest(BaseModel):
 
 
 @store_router.get("/state/sync-status", response_model=Dict[str, Any])
-def get_state_sync_status(store=Depends(require_initialized)):
+def get_state_sync_status(
+    rescan: bool = Query(False, description="Rebuild the backup state manifest by walking the backup"),
+    store=Depends(require_initialized),
+):
     """
     Get the sync status of the state/ directory.
 
-    Returns summary and list of files with their sync status.
+    Returns summary and list of files with their sync status. Compares
+    content-hash manifests, so the backup tree is only walked on rescan.
     """
     try:
-        result = store.backup_service.get_state_sync_status()
+        result = store.backup_service.get_state_sync_status(rescan=rescan)
         return {
             "enabled": store.backup_service.config.enabled,
             "connected": store.backup_service.is_connected(),
@@ -1464,6 +1485,60 @@ def sync_state(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# =============================================================================
+# Progress Events
+# =============================================================================
+
+# Push channel for download, backup sync and verify progress
+_progress_hub = ProgressHub()
+
+_EVENT_HEARTBEAT_SECONDS = 15.0
+
+
+def _sse(event: str, payload: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+@store_router.get("/events")
+async def stream_progress_events(
+    request: Request,
+    channels: Annotated[
+        Optional[str],
+        Query(description="Comma-separated channels: download, download_group, backup_sync, verify"),
+    ] = None,
+    interval: Annotated[float, Query(ge=0.1, le=5.0, description="Minimum seconds between updates")] = 0.25,
+):
+    """
+    Server-Sent Events stream of progress for downloads, backup sync and verify.
+
+    The first message ("snapshot") lists every live item in full; after that
+    each "progress" message carries only changed fields per item, coalesced
+    to at most one message per interval. An item with "data": null was removed.
+    """
+    wanted = [c.strip() for c in channels.split(",") if c.strip()] if channels else None
+    subscription = _progress_hub.subscribe(channels=wanted, interval=interval)
+
+    async def stream():
+        yield _sse("snapshot", [e.to_dict() for e in subscription.snapshot()])
+        idle = 0.0
+        while not await request.is_disconnected():
+            events = subscription.drain()
+            if events:
+                idle = 0.0
+                yield _sse("progress", [e.to_dict() for e in events])
+            elif idle >= _EVENT_HEARTBEAT_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(interval)
+            idle += interval
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # =============================================================================
 # Packs Router
 # =============================================================================
@@ -1471,17 +1546,177 @@ def sync_state(
 v2_packs_router = APIRouter(tags=["packs"])
 
 
+# Thumbnail resolution cache: previews dir -> (fingerprint, (thumbnail, thumbnail_type)).
+# The fingerprint covers the previews dir mtime (files added/removed) and the
+# pack fields the lookup reads, so entries go stale exactly when those change.
+# Least recently used entries are evicted past THUMBNAIL_CACHE_SIZE; deleting
+# a pack drops its entry.
+THUMBNAIL_CACHE_SIZE = 4096
+_thumbnail_cache: "OrderedDict[str, Tuple[Any, Tuple[Optional[str], str]]]" = OrderedDict()
+_thumbnail_cache_lock = threading.Lock()
+
+
+def _resolve_thumbnail(previews_dir: Path, name: str, pack) -> Tuple[Optional[str], str]:
+    """
+    Find the card thumbnail for a pack.
+
+    Priority: 1. User-selected cover_url, 2. First preview in pack.previews,
+    3. First file on disk (images before videos).
+
+    Returns:
+        Tuple of (thumbnail URL or None, thumbnail_type)
+    """
+    # 1. Check for user-selected cover_url
+    if pack.cover_url:
+        # Normalize cover_url: strip proxy wrapper if present
+        cover_cmp = pack.cover_url
+        if '/api/browse/image-proxy' in cover_cmp:
+            from urllib.parse import urlparse as _urlparse, parse_qs as _parse_qs
+            _qs = _parse_qs(_urlparse(cover_cmp).query)
+            if 'url' in _qs:
+                cover_cmp = _qs['url'][0]
+
+        # Find the matching preview by URL and use its filename
+        for preview in pack.previews:
+            if preview.url == cover_cmp and preview.filename:
+                local_path = previews_dir / preview.filename
+                if local_path.exists():
+                    return (
+                        f"/previews/{name}/resources/previews/{preview.filename}",
+                        preview.media_type or ("video" if preview.filename.endswith(('.mp4', '.webm')) else "image"),
+                    )
+
+    # 2. Fallback to first preview from pack.previews with existing local file
+    if pack.previews:
+        for preview in pack.previews:
+            if preview.filename:
+                local_path = previews_dir / preview.filename
+                if local_path.exists():
+                    return (
+                        f"/previews/{name}/resources/previews/{preview.filename}",
+                        preview.media_type or ("video" if preview.filename.endswith(('.mp4', '.webm')) else "image"),
+                    )
+
+    # 3. Final fallback: scan filesystem
+    if previews_dir.exists():
+        # First look for images, then videos
+        for exts, thumbnail_type in (
+            (['.png', '.jpg', '.jpeg', '.webp'], "image"),
+            (['.mp4', '.webm'], "video"),
+        ):
+            for ext in exts:
+                for f in previews_dir.glob(f'*{ext}'):
+                    return f"/previews/{name}/resources/previews/{f.name}", thumbnail_type
+
+    return None, "image"
+
+
+def _pack_thumbnail(store, name: str, pack) -> Tuple[Optional[str], str]:
+    """Cached _resolve_thumbnail; costs one stat of the previews dir on a hit."""
+    previews_dir = store.layout.pack_previews_path(name)
+    try:
+        dir_mtime = previews_dir.stat().st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    fingerprint = (
+        dir_mtime,
+        pack.cover_url,
+        tuple((p.url, p.filename, p.media_type) for p in pack.previews),
+    )
+
+    key = str(previews_dir)
+    with _thumbnail_cache_lock:
+        cached = _thumbnail_cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            _thumbnail_cache.move_to_end(key)
+            return cached[1]
+
+    result = _resolve_thumbnail(previews_dir, name, pack)
+    with _thumbnail_cache_lock:
+        _thumbnail_cache[key] = (fingerprint, result)
+        _thumbnail_cache.move_to_end(key)
+        while len(_thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            _thumbnail_cache.popitem(last=False)
+    return result
+
+
+def _pack_card(store, name: str, pack, has_unresolved: bool) -> Dict[str, Any]:
+    """Build the pack grid card for one pack."""
+    thumbnail, thumbnail_type = _pack_thumbnail(store, name, pack)
+    return {
+        "name": pack.name,
+        "version": pack.version or "1.0.0",
+        "description": pack.description or "",
+        "pack_type": pack.pack_type.value if hasattr(pack.pack_type, 'value') else str(pack.pack_type),
+        "base_model": pack.base_model,
+        "dependencies_count": len(pack.dependencies),
+        "has_unresolved": has_unresolved,
+        "thumbnail": thumbnail,
+        "thumbnail_type": thumbnail_type,  # NEW: video support
+        "source_url": pack.source.url if pack.source else None,
+        "tags": pack.tags or [],
+        "user_tags": pack.user_tags or [],
+        "is_nsfw": pack.is_nsfw if hasattr(pack, 'is_nsfw') else "nsfw-pack" in (pack.user_tags or []),
+        "is_nsfw_hidden": pack.is_nsfw_hidden if hasattr(pack, 'is_nsfw_hidden') else "nsfw-pack-hide" in (pack.user_tags or []),
+        "created_at": pack.created_at.isoformat() if pack.created_at else None,
+    }
+
+
+def _error_card(name: str, error: Any) -> Dict[str, Any]:
+    """Card for a pack that could not be loaded (still listed so it can be fixed)."""
+    return {
+        "name": name,
+        "version": "1.0.0",
+        "description": f"Error loading: {error}",
+        "pack_type": "unknown",
+        "dependencies_count": 0,
+        "has_unresolved": True,
+        "thumbnail": None,
+        "thumbnail_type": "image",  # Default for error case
+        "is_nsfw": False,
+        "is_nsfw_hidden": False,
+    }
+
+
 @v2_packs_router.get("/", response_model=Dict[str, Any])
 def list_packs(
     show_nsfw: bool = Query(True, description="Include NSFW hidden packs"),
-    store=Depends(require_initialized)
+    store=Depends(require_initialized),
+    limit: Annotated[Optional[int], Query(ge=1, le=500, description="Page size (enables pagination)")] = None,
+    cursor: Annotated[Optional[str], Query(description="next_cursor from the previous page")] = None,
+    pack_type: Annotated[Optional[str], Query(description="Filter by pack type")] = None,
+    base_model: Annotated[Optional[str], Query(description="Filter by base model")] = None,
+    tag: Annotated[Optional[str], Query(description="Filter by tag or user tag")] = None,
+    nsfw: Annotated[Optional[bool], Query(description="Filter by NSFW flag")] = None,
+    has_unresolved: Annotated[Optional[bool], Query(description="Filter by unresolved dependencies")] = None,
+    sort: Annotated[Optional[str], Query(description="Sort key: name, created_at, pack_type, base_model, dependencies_count")] = None,
+    order: Annotated[str, Query(pattern="^(asc|desc)$", description="Sort order")] = "asc",
 ):
     """List all packs with UI-friendly details.
     
     NSFW handling:
     - nsfw-pack tag: Pack previews are blurred in UI
     - nsfw-pack-hide tag: Pack is completely hidden when show_nsfw=False
+
+    Without query parameters every pack is returned. Any of limit, cursor,
+    filters or sort switches to the indexed listing, which also returns
+    `total` and `next_cursor` for keyset pagination.
     """
+    if any(v is not None for v in (limit, cursor, pack_type, base_model, tag, nsfw, has_unresolved, sort)):
+        return _list_packs_page(
+            store,
+            show_nsfw=show_nsfw,
+            limit=limit,
+            cursor=cursor,
+            pack_type=pack_type,
+            base_model=base_model,
+            tag=tag,
+            nsfw=nsfw,
+            has_unresolved=has_unresolved,
+            sort=sort or "name",
+            descending=order == "desc",
+        )
+
     pack_names = store.list_packs()
     packs_list = []
     
@@ -1490,70 +1725,11 @@ def list_packs(
             pack = store.get_pack(name)
             lock = store.get_pack_lock(name)
             
-            # Check NSFW flags
-            is_nsfw = pack.is_nsfw if hasattr(pack, 'is_nsfw') else "nsfw-pack" in (pack.user_tags or [])
-            is_nsfw_hidden = pack.is_nsfw_hidden if hasattr(pack, 'is_nsfw_hidden') else "nsfw-pack-hide" in (pack.user_tags or [])
-            
             # Filter out hidden packs when NSFW mode is off
+            is_nsfw_hidden = pack.is_nsfw_hidden if hasattr(pack, 'is_nsfw_hidden') else "nsfw-pack-hide" in (pack.user_tags or [])
             if not show_nsfw and is_nsfw_hidden:
                 continue
             
-            # Get preview thumbnail with video support
-            # Priority: 1. User-selected cover_url, 2. First preview in pack.previews, 3. First file on disk
-            thumbnail = None
-            thumbnail_type = "image"  # Default type
-            previews_dir = store.layout.pack_previews_path(name)
-
-            # 1. Check for user-selected cover_url
-            if pack.cover_url:
-                # Normalize cover_url: strip proxy wrapper if present
-                cover_cmp = pack.cover_url
-                if '/api/browse/image-proxy' in cover_cmp:
-                    from urllib.parse import urlparse as _urlparse, parse_qs as _parse_qs
-                    _qs = _parse_qs(_urlparse(cover_cmp).query)
-                    if 'url' in _qs:
-                        cover_cmp = _qs['url'][0]
-
-                # Find the matching preview by URL and use its filename
-                for preview in pack.previews:
-                    if preview.url == cover_cmp and preview.filename:
-                        local_path = previews_dir / preview.filename
-                        if local_path.exists():
-                            thumbnail = f"/previews/{name}/resources/previews/{preview.filename}"
-                            thumbnail_type = preview.media_type or ("video" if preview.filename.endswith(('.mp4', '.webm')) else "image")
-                            break
-
-            # 2. Fallback to first preview from pack.previews with existing local file
-            if not thumbnail and pack.previews:
-                for preview in pack.previews:
-                    if preview.filename:
-                        local_path = previews_dir / preview.filename
-                        if local_path.exists():
-                            thumbnail = f"/previews/{name}/resources/previews/{preview.filename}"
-                            thumbnail_type = preview.media_type or ("video" if preview.filename.endswith(('.mp4', '.webm')) else "image")
-                            break
-
-            # 3. Final fallback: scan filesystem
-            if not thumbnail and previews_dir.exists():
-                # First look for images
-                for ext in ['.png', '.jpg', '.jpeg', '.webp']:
-                    for f in previews_dir.glob(f'*{ext}'):
-                        thumbnail = f"/previews/{name}/resources/previews/{f.name}"
-                        thumbnail_type = "image"
-                        break
-                    if thumbnail:
-                        break
-
-                # If no image found, look for videos
-                if not thumbnail:
-                    for ext in ['.mp4', '.webm']:
-                        for f in previews_dir.glob(f'*{ext}'):
-                            thumbnail = f"/previews/{name}/resources/previews/{f.name}"
-                            thumbnail_type = "video"
-                            break
-                        if thumbnail:
-                            break
-            
             # Check for unresolved dependencies
             has_unresolved = False
             if lock:
@@ -1564,41 +1740,45 @@ def list_packs(
             else:
                 has_unresolved = len(pack.dependencies) > 0
             
-            packs_list.append({
-                "name": pack.name,
-                "version": pack.version or "1.0.0",
-                "description": pack.description or "",
-                "pack_type": pack.pack_type.value if hasattr(pack.pack_type, 'value') else str(pack.pack_type),
-                "base_model": pack.base_model,
-                "dependencies_count": len(pack.dependencies),
-                "has_unresolved": has_unresolved,
-                "thumbnail": thumbnail,
-                "thumbnail_type": thumbnail_type,  # NEW: video support
-                "source_url": pack.source.url if pack.source else None,
-                "tags": pack.tags or [],
-                "user_tags": pack.user_tags or [],
-                "is_nsfw": is_nsfw,
-                "is_nsfw_hidden": is_nsfw_hidden,
-                "created_at": pack.created_at.isoformat() if pack.created_at else None,
-            })
+            packs_list.append(_pack_card(store, name, pack, has_unresolved))
         except Exception as e:
             # Include pack even if there's an error
-            packs_list.append({
-                "name": name,
-                "version": "1.0.0",
-                "description": f"Error loading: {e}",
-                "pack_type": "unknown",
-                "dependencies_count": 0,
-                "has_unresolved": True,
-                "thumbnail": None,
-                "thumbnail_type": "image",  # Default for error case
-                "is_nsfw": False,
-                "is_nsfw_hidden": False,
-            })
+            packs_list.append(_error_card(name, e))
     
     return {"packs": packs_list}
 
 
+def _list_packs_page(store, show_nsfw: bool, sort: str, descending: bool, **filters) -> Dict[str, Any]:
+    """Filtered/sorted/paginated pack listing served from the store index."""
+    from .index_db import StoreIndexError
+
+    # Layout writes are indexed immediately; only out-of-band edits wait
+    store.index.refresh(max_age=2.0)
+    try:
+        page = store.index.list_packs(
+            include_hidden=show_nsfw,
+            sort=sort,
+            descending=descending,
+            **filters,
+        )
+    except StoreIndexError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    packs_list = []
+    for row in page.rows:
+        name = row["name"]
+        if row["load_error"]:
+            packs_list.append(_error_card(name, row["load_error"]))
+            continue
+        try:
+            pack = store.layout.load_pack(name, readonly=True)
+            packs_list.append(_pack_card(store, name, pack, bool(row["has_unresolved"])))
+        except Exception as e:
+            packs_list.append(_error_card(name, e))
+
+    return {"packs": packs_list, "total": page.total, "next_cursor": page.next_cursor}
+
+
 @v2_packs_router.get("/{pack_name}", response_model=Dict[str, Any])
 def get_pack(pack_name: str, store=Depends(require_initialized)):
     """Get pack details in UI-friendly format."""
@@ -2135,6 +2315,8 @@ def delete_pack(pack_name: str, store=Depends(require_initialized)):
     """Delete a pack and clean up associated resources."""
     result = store.delete_pack(pack_name)
     if result.deleted:
+        with _thumbnail_cache_lock:
+            _thumbnail_cache.pop(str(store.layout.pack_previews_path(pack_name)), None)
         return {
             "deleted": pack_name,
             "cleanup": {
@@ -2343,8 +2525,7 @@ def resolve_base_model(
             sha256 = None
             size_bytes = 0
             if local_path.exists():
-                from .blob_store import compute_sha256
-                sha256 = compute_sha256(local_path)
+                sha256 = store.blob_store.hash_ledger.sha256(local_path)
                 size_bytes = local_path.stat().st_size
             
             resolved = ResolvedDependency(
@@ -2476,9 +2657,210 @@ def resolve_base_model(
 # Download Endpoints (v2 implementation)
 # =============================================================================
 
-# In-memory download tracking
+# In-memory view of the download queue, as shown in the Downloads tab
 _active_downloads: Dict[str, dict] = {}
 
+# download_id -> scheduler that owns the job (for pause/resume/cancel)
+_download_owners: Dict[str, DownloadScheduler] = {}
+_wired_schedulers: "weakref.WeakSet[DownloadScheduler]" = weakref.WeakSet()
+
+# Download job status -> Downloads tab status
+_ENTRY_STATUS = {
+    "queued": "pending",
+    "running": "downloading",
+    "paused": "paused",
+    "completed": "completed",
+    "failed": "failed",
+    "cancelled": "cancelled",
+}
+
+# Asset type -> ComfyUI models/ subdirectory
+_ASSET_TYPE_DIRS = {
+    'checkpoint': 'checkpoints',
+    'base_model': 'checkpoints',
+    'base_checkpoint': 'checkpoints',
+    'lora': 'loras',
+    'vae': 'vae',
+    'controlnet': 'controlnet',
+    'upscaler': 'upscale_models',
+    'embedding': 'embeddings',
+    'clip': 'clip',
+    'text_encoder': 'text_encoders',
+    'diffusion_model': 'diffusion_models',
+}
+
+
+def _new_download_entry(download_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a Downloads tab entry for a queued job."""
+    return {
+        "download_id": download_id,
+        "pack_name": meta.get("pack_name"),
+        "asset_name": meta.get("asset_name"),
+        "filename": meta.get("filename"),
+        "status": "pending",
+        "progress": 0.0,
+        "downloaded_bytes": 0,
+        "total_bytes": 0,
+        "speed_bps": 0,
+        "speed_mbps": 0,
+        "eta_seconds": 0,
+        "error": None,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "completed_at": None,
+        "target_path": None,
+        "group_id": meta.get("group_id"),
+        "group_label": meta.get("group_label"),
+    }
+
+
+def _mirror_download_job(scheduler: DownloadScheduler, job: DownloadJob) -> None:
+    """Scheduler listener: reflect a job's state in _active_downloads."""
+    entry = _active_downloads.get(job.job_id)
+    if entry is None:
+        # Cleared or cancelled from the UI; only jobs still in flight
+        # (e.g. restored after a restart) get a new entry
+        if job.status in TERMINAL_STATUSES:
+            return
+        entry = _active_downloads[job.job_id] = _new_download_entry(job.job_id, job.meta)
+        entry["started_at"] = job.created_at
+    _download_owners[job.job_id] = scheduler
+
+    entry["status"] = _ENTRY_STATUS.get(job.status, job.status)
+    entry["error"] = job.error
+    if job.total_bytes > 0:
+        entry["downloaded_bytes"] = job.downloaded_bytes
+        entry["total_bytes"] = job.total_bytes
+    entry["progress"] = job.progress
+    entry["speed_bps"] = job.speed_bps
+    entry["speed_mbps"] = job.speed_bps / (1024 * 1024)
+    entry["eta_seconds"] = job.eta_seconds
+    if job.status == COMPLETED:
+        entry["sha256"] = job.sha256
+        entry["target_path"] = job.meta.get("target_path")
+        entry["completed_at"] = datetime.now(timezone.utc).isoformat()
+    _publish_download(entry)
+
+
+def _publish_download(entry: Dict[str, Any]) -> None:
+    """Push a Downloads tab entry's current state to event subscribers."""
+    _progress_hub.publish(DOWNLOAD, entry["download_id"], entry)
+
+
+def _link_into_comfyui(store, sha256: str, asset_type: str, filename: str) -> Path:
+    """Symlink a blob into the ComfyUI models folder for its asset type."""
+    from config.settings import get_config
+
+    config = get_config()
+    target_dir = config.comfyui.base_path / "models" / _ASSET_TYPE_DIRS.get(asset_type, 'checkpoints')
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target_path = target_dir / filename
+
+    blob_path = store.blob_store.blob_path(sha256)
+    if target_path.exists() or target_path.is_symlink():
+        target_path.unlink()  # Remove existing
+    target_path.symlink_to(blob_path)
+    return target_path
+
+
+def _finish_asset_download(store, job: DownloadJob) -> None:
+    """Completion handler for download-asset jobs."""
+    sha256 = job.sha256
+    pack_name = job.meta["pack_name"]
+    asset_name = job.meta["asset_name"]
+    filename = job.meta["filename"]
+
+    # Validate downloaded file is not HTML/error page
+    blob_path = store.blob_store.blob_path(sha256)
+    blob_size = blob_path.stat().st_size
+
+    # Check if file is suspiciously small (likely error page)
+    MIN_MODEL_SIZE = 100_000  # 100KB minimum for models
+    if blob_size < MIN_MODEL_SIZE:
+        # Read first bytes to check if HTML
+        with open(blob_path, 'rb') as f:
+            header = f.read(100)
+        if b'<!DOCTYPE' in header or b'<html' in header.lower():
+            # Delete the corrupt blob
+            store.blob_store.remove_blob(sha256)
+            raise RuntimeError(
+                f"Download failed: received HTML error page instead of model file. "
+                f"Size: {blob_size} bytes. This usually means Civitai returned an error. "
+                f"Try again later or check if the model is still available."
+            )
+        else:
+            logger.warning(f"[download-asset] Downloaded file is small ({blob_size} bytes), but not HTML. Proceeding.")
+
+    # Create symlink from blob to ComfyUI
+    target_path = _link_into_comfyui(store, sha256, job.meta.get("asset_type", "checkpoint"), filename)
+    job.meta["target_path"] = str(target_path)
+
+    # Update lock file with SHA256
+    lock = store.get_pack_lock(pack_name)
+    if lock:
+        resolved = lock.get_resolved(asset_name)
+        if resolved:
+            resolved.artifact.sha256 = sha256
+            resolved.artifact.integrity.sha256_verified = True
+            store.layout.save_pack_lock(lock)
+
+    logger.info(f"[download-asset] Completed: {filename}, SHA256: {sha256[:16]}...")
+
+
+def _finish_redownload(store, job: DownloadJob) -> None:
+    """Completion handler for inventory re-download jobs."""
+    try:
+        target_path = _link_into_comfyui(
+            store, job.sha256, job.meta.get("asset_type", "checkpoint"), job.meta["filename"],
+        )
+        job.meta["target_path"] = str(target_path)
+    except Exception as e:
+        logger.warning("[redownload] Symlink creation failed: %s", e)
+
+    logger.info(
+        "[API] Re-downloaded blob %s from %s (pack=%s)",
+        job.sha256[:12], job.url[:60], job.meta.get("pack_name"),
+    )
+
+
+def get_download_scheduler(store) -> DownloadScheduler:
+    """
+    Get the store's download scheduler, wired to the Downloads tab and started.
+
+    The first call per store applies the configured limits, registers the
+    completion handlers and restores downloads interrupted by a restart.
+    """
+    scheduler = store.download_scheduler
+    if scheduler not in _wired_schedulers:
+        _wired_schedulers.add(scheduler)
+        try:
+            limits = store.get_config().downloads
+            scheduler.set_limits(
+                max_concurrent=limits.max_concurrent,
+                max_per_host=limits.max_per_host,
+                bandwidth_bps=int(limits.max_bandwidth_mb_per_s * 1024 * 1024),
+            )
+        except Exception as e:
+            logger.warning("[downloads] Using default download limits: %s", e)
+        scheduler.register_handler("asset", lambda job: _finish_asset_download(store, job))
+        scheduler.register_handler("redownload", lambda job: _finish_redownload(store, job))
+        scheduler.add_listener(lambda job: _mirror_download_job(scheduler, job))
+    scheduler.start()
+    return scheduler
+
+
+def resume_downloads() -> int:
+    """
+    Restore downloads interrupted by the last shutdown (API startup hook).
+
+    Returns:
+        Number of unfinished downloads in the queue
+    """
+    store = get_store()
+    if not store.is_initialized():
+        return 0
+    scheduler = get_download_scheduler(store)
+    return sum(1 for job in scheduler.jobs() if job.status not in TERMINAL_STATUSES)
+
 
 class DownloadAssetRequest(BaseModel):
     """Request to download a specific asset."""
@@ -2488,6 +2870,7 @@ class DownloadAssetRequest(BaseModel):
     filename: Optional[str] = None
     group_id: Optional[str] = None  # Group downloads together (e.g. update batch)
     group_label: Optional[str] = None  # Human-readable group label
+    background: bool = False  # Queue behind user-initiated downloads
 
 
 class DownloadProgress(BaseModel):
@@ -2496,7 +2879,7 @@ class DownloadProgress(BaseModel):
     pack_name: str
     asset_name: str
     filename: str
-    status: str  # pending, downloading, completed, failed
+    status: str  # pending, downloading, paused, completed, failed
     progress: float  # 0-100
     downloaded_bytes: int = 0
     total_bytes: int = 0
@@ -2517,8 +2900,6 @@ async def download_asset(
     Uses v2 blob store for content-addressable storage.
     """
     import uuid
-    import requests
-    import threading
     
     logger.info(f"[download-asset] Pack: {pack_name}, Asset: {request.asset_name}, URL: {request.url}")
     
@@ -2583,155 +2964,27 @@ async def download_asset(
     if store.blob_store.api_key:
         logger.debug(f"[download-asset] Using Civitai API key: {store.blob_store.api_key[:8]}...")
     
-    # Create download tracking entry
+    # Queue the download; the scheduler mirrors its progress into _active_downloads
     download_id = str(uuid.uuid4())[:8]
-    _active_downloads[download_id] = {
-        "download_id": download_id,
+    meta = {
         "pack_name": pack_name,
         "asset_name": request.asset_name,
         "filename": filename,
-        "status": "pending",
-        "progress": 0.0,
-        "downloaded_bytes": 0,
-        "total_bytes": 0,
-        "speed_bps": 0,
-        "speed_mbps": 0,
-        "eta_seconds": 0,
-        "error": None,
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "completed_at": None,
-        "target_path": None,
+        "asset_type": (request.asset_type or dep.kind.value).lower(),
         "group_id": request.group_id,
         "group_label": request.group_label,
     }
-    
-    def do_download():
-        """Background download task."""
-        import time
-        
-        entry = _active_downloads[download_id]
-        entry["status"] = "downloading"
-        start_time = time.time()
-        last_update_time = start_time
-        last_downloaded = 0
-        
-        try:
-            # Use blob store for download
-            def progress_callback(downloaded: int, total: int):
-                nonlocal last_update_time, last_downloaded
-                
-                current_time = time.time()
-                elapsed = current_time - start_time
-                time_delta = current_time - last_update_time
-                
-                entry["downloaded_bytes"] = downloaded
-                entry["total_bytes"] = total
-                if total > 0:
-                    entry["progress"] = (downloaded / total) * 100
-                
-                # Calculate speed (bytes per second)
-                if time_delta > 0.5:  # Update speed every 0.5 seconds
-                    bytes_delta = downloaded - last_downloaded
-                    speed_bps = bytes_delta / time_delta if time_delta > 0 else 0
-                    entry["speed_bps"] = speed_bps
-                    entry["speed_mbps"] = speed_bps / (1024 * 1024)  # MB/s
-                    
-                    # Calculate ETA
-                    remaining_bytes = total - downloaded
-                    if speed_bps > 0:
-                        entry["eta_seconds"] = int(remaining_bytes / speed_bps)
-                    else:
-                        entry["eta_seconds"] = 0
-                    
-                    last_update_time = current_time
-                    last_downloaded = downloaded
-            
-            # Download via blob store
-            sha256 = store.blob_store.download(
-                download_url,
-                expected_sha256=None,
-                progress_callback=progress_callback,
-            )
+    scheduler = get_download_scheduler(store)
+    _active_downloads[download_id] = _new_download_entry(download_id, meta)
+    _publish_download(_active_downloads[download_id])
+    scheduler.submit(
+        download_url,
+        priority=PRIORITY_BACKGROUND if request.background else PRIORITY_USER,
+        kind="asset",
+        meta=meta,
+        job_id=download_id,
+    )
 
-            # Validate downloaded file is not HTML/error page
-            blob_path = store.blob_store.blob_path(sha256)
-            blob_size = blob_path.stat().st_size
-
-            # Check if file is suspiciously small (likely error page)
-            MIN_MODEL_SIZE = 100_000  # 100KB minimum for models
-            if blob_size < MIN_MODEL_SIZE:
-                # Read first bytes to check if HTML
-                with open(blob_path, 'rb') as f:
-                    header = f.read(100)
-                if b'<!DOCTYPE' in header or b'<html' in header.lower():
-                    # Delete the corrupt blob
-                    store.blob_store.remove_blob(sha256)
-                    raise RuntimeError(
-                        f"Download failed: received HTML error page instead of model file. "
-                        f"Size: {blob_size} bytes. This usually means Civitai returned an error. "
-                        f"Try again later or check if the model is still available."
-                    )
-                else:
-                    logger.warning(f"[download-asset] Downloaded file is small ({blob_size} bytes), but not HTML. Proceeding.")
-
-            # Create symlink to ComfyUI models folder
-            # Map asset type to directory
-            type_map = {
-                'checkpoint': 'checkpoints',
-                'base_model': 'checkpoints', 
-                'base_checkpoint': 'checkpoints',
-                'lora': 'loras',
-                'vae': 'vae',
-                'controlnet': 'controlnet',
-                'upscaler': 'upscale_models',
-                'embedding': 'embeddings',
-                'clip': 'clip',
-                'text_encoder': 'text_encoders',
-                'diffusion_model': 'diffusion_models',
-            }
-            asset_type = (request.asset_type or (dep.kind.value if dep else "checkpoint")).lower()
-            model_dir = type_map.get(asset_type, 'checkpoints')
-            
-            # Get ComfyUI path from config
-            from config.settings import get_config
-            config = get_config()
-            target_dir = config.comfyui.base_path / "models" / model_dir
-            target_dir.mkdir(parents=True, exist_ok=True)
-            target_path = target_dir / filename
-            
-            # Create symlink from blob to ComfyUI
-            blob_path = store.blob_store.blob_path(sha256)
-            if target_path.exists() or target_path.is_symlink():
-                target_path.unlink()  # Remove existing
-            target_path.symlink_to(blob_path)
-            
-            # Update lock file with SHA256
-            lock = store.get_pack_lock(pack_name)
-            if lock:
-                resolved = lock.get_resolved(request.asset_name)
-                if resolved:
-                    resolved.artifact.sha256 = sha256
-                    resolved.artifact.integrity.sha256_verified = True
-                    store.layout.save_pack_lock(lock)
-            
-            entry["status"] = "completed"
-            entry["progress"] = 100.0
-            entry["sha256"] = sha256
-            entry["completed_at"] = datetime.now(timezone.utc).isoformat()
-            entry["target_path"] = str(target_path) if target_path else None
-            logger.info(f"[download-asset] Completed: {filename}, SHA256: {sha256[:16]}...")
-            
-        except Exception as e:
-            entry["status"] = "failed"
-            entry["error"] = str(e)
-            logger.error(f"[download-asset] Failed: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Start download in background thread
-    thread = threading.Thread(target=do_download, daemon=True)
-    thread.start()
-    
     return {
         "download_id": download_id,
         "pack_name": pack_name,
@@ -2765,6 +3018,10 @@ def clear_completed_downloads():
     logger.warning("[downloads] clear_completed called, removing %d entries. Caller:\n%s", len(to_remove), "".join(traceback.format_stack()[-4:-1]))
     for k in to_remove:
         del _active_downloads[k]
+        _progress_hub.remove(DOWNLOAD, k)
+        owner = _download_owners.pop(k, None)
+        if owner is not None:
+            owner.forget(k)
     return {"cleared": len(to_remove)}
 
 
@@ -2782,6 +3039,8 @@ def cancel_download_group(group_id: str):
         _active_downloads[k]["status"] = "cancelled"
         cancelled.append(k)
         del _active_downloads[k]
+        _progress_hub.remove(DOWNLOAD, k)
+        _cancel_queued_download(k)
     return {"cancelled": cancelled, "count": len(cancelled)}
 
 
@@ -2793,9 +3052,36 @@ def cancel_download(download_id: str):
     if download_id in _active_downloads:
         _active_downloads[download_id]["status"] = "cancelled"
         del _active_downloads[download_id]
+    _progress_hub.remove(DOWNLOAD, download_id)
+    _cancel_queued_download(download_id)
     return {"cancelled": download_id}
 
 
+def _cancel_queued_download(download_id: str) -> None:
+    """Cancel the queue job behind a Downloads tab entry, if any."""
+    owner = _download_owners.pop(download_id, None)
+    if owner is not None:
+        owner.cancel(download_id)
+
+
+@v2_packs_router.post("/downloads/{download_id}/pause", response_model=Dict[str, Any])
+def pause_download(download_id: str):
+    """Pause a queued or running download, keeping its partial file."""
+    owner = _download_owners.get(download_id)
+    if owner is None or not owner.pause(download_id):
+        raise HTTPException(status_code=404, detail=f"No pausable download: {download_id}")
+    return {"paused": download_id}
+
+
+@v2_packs_router.post("/downloads/{download_id}/resume", response_model=Dict[str, Any])
+def resume_download(download_id: str):
+    """Resume a paused or failed download from its partial file."""
+    owner = _download_owners.get(download_id)
+    if owner is None or not owner.resume(download_id):
+        raise HTTPException(status_code=404, detail=f"No resumable download: {download_id}")
+    return {"resumed": download_id}
+
+
 @v2_packs_router.post("/{pack_name}/download-all", response_model=Dict[str, Any])
 def download_all_assets(
     pack_name: str,
@@ -2982,7 +3268,7 @@ def get_pack_dependencies_status(
                     if d.expose and d.expose.trigger_words:
                         trigger_words.extend(d.expose.trigger_words)
                 # Check resolution status
-                dep_lock = store.layout.load_pack_lock(dep_pack.name)
+                dep_lock = store.layout.load_pack_lock(dep_pack.name, readonly=True)
                 has_unresolved = bool(dep_lock and dep_lock.unresolved)
                 # Check if all blobs exist locally
                 all_installed = True
@@ -5113,6 +5399,10 @@ def sync_profile(
                 "shadowed_count": len(r.shadowed),
                 "missing_count": len(r.missing_blobs),
                 "errors": r.errors,
+                "incremental": r.incremental,
+                "duration_ms": r.duration_ms,
+                "plan_ms": r.plan_ms,
+                "plan_cached": r.plan_cached,
             } for ui, r in reports.items()}
         )
     except Exception as e:
@@ -5197,9 +5487,9 @@ def check_pack_updates(
     pack_name: str,
     store=Depends(require_initialized),
 ):
-    """Check if a specific pack has updates available."""
+    """Check if a specific pack has updates available (the plan is stored for /check-all)."""
     try:
-        plan = store.check_updates(pack_name)
+        plan = store.update_checker.check_pack(pack_name)
         plan_dict = plan.model_dump()
         changes_count = len(plan_dict.get("changes", []))
         ambiguous_count = len(plan_dict.get("ambiguous", []))
@@ -5216,35 +5506,140 @@ def check_pack_updates(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _update_plan_counts(plan_dict: Dict[str, Any]) -> Tuple[int, bool]:
+    """Return (changes + ambiguous, has_updates) for a dumped UpdatePlan."""
+    changes = len(plan_dict.get("changes", []))
+    ambiguous = len(plan_dict.get("ambiguous", []))
+    pending = len(plan_dict.get("pending_downloads", []))
+    return changes + ambiguous, changes > 0 or ambiguous > 0 or pending > 0
+
+
+def _checked_at_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def start_update_checker() -> bool:
+    """
+    Start refreshing stored update plans in the background (API startup hook).
+
+    Returns:
+        True if the checker is running
+    """
+    store = get_store()
+    if not store.is_initialized():
+        return False
+    store.update_checker.start()
+    return True
+
+
+def _stream_update_checks(store):
+    """SSE events for /check-all?stream=true (see check_all_updates)."""
+    packs_checked = 0
+    packs_with_updates = 0
+    total_changes = 0
+    try:
+        pack_names = store.update_checker.updatable_packs()
+        yield _sse("start", {"total": len(pack_names)})
+        for result in store.update_checker.iter_check(pack_names):
+            event = {
+                "pack": result.pack,
+                "has_updates": False,
+                "plan": None,
+                "checked_at": _checked_at_iso(result.checked_at),
+                "error": result.error,
+            }
+            if result.plan is not None:
+                plan_dict = result.plan.model_dump()
+                changes, has_updates = _update_plan_counts(plan_dict)
+                packs_checked += 1
+                if has_updates:
+                    packs_with_updates += 1
+                    total_changes += changes
+                event.update(has_updates=has_updates, plan=plan_dict)
+            yield _sse("plan", event)
+    except Exception as e:
+        logger.error("[API] Update check stream failed: %s", e, exc_info=True)
+        yield _sse("error", {"detail": str(e)})
+        return
+
+    # Cache the count for profiles status endpoint
+    store._cached_updates_count = packs_with_updates
+    yield _sse("done", {
+        "packs_checked": packs_checked,
+        "packs_with_updates": packs_with_updates,
+        "total_changes": total_changes,
+    })
+
+
 @updates_router.get("/check-all", response_model=BulkUpdateCheckResponse)
-def check_all_updates(store=Depends(require_initialized)):
-    """Check all packs for available updates."""
+def check_all_updates(
+    refresh: bool = Query(False, description="Check every pack now instead of using stored results"),
+    stream: bool = Query(False, description="Stream per-pack plans as Server-Sent Events"),
+    store=Depends(require_initialized),
+):
+    """
+    Report available updates for all packs.
+
+    Answers from the plans stored by the background update checker, with
+    when each was checked, without waiting on the network. Packs whose plan
+    is old or invalidated by a pack/lock write are returned with their last
+    plan; packs never checked have none yet. Both are listed in
+    outdated_packs and the checker is woken to refresh them.
+    refresh=true checks every pack first (concurrently, blocking until done).
+
+    With stream=true every pack is checked and the response is an event
+    stream instead: a "start" event ({total}), a "plan" event ({pack,
+    has_updates, plan, checked_at, error}) per pack as its check completes
+    (plan is null if the check failed), then a "done" event with the
+    summary counts (or "error"). Checks are grouped by provider lookup and
+    paced by the provider client's rate limit (see
+    UpdateService.iter_check_all_updates).
+    """
+    if stream:
+        return StreamingResponse(
+            _stream_update_checks(store),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    checker = store.update_checker
     try:
-        plans = store.check_all_updates()
-        
+        if refresh:
+            checker.check()
+        results, outdated = checker.status()
+        if outdated:
+            checker.wake()
+
         packs_with_updates = 0
         total_changes = 0
         plans_dict = {}
-        
-        for name, plan in plans.items():
-            plan_dict = plan.model_dump()
-            changes = len(plan_dict.get("changes", []))
-            ambiguous = len(plan_dict.get("ambiguous", []))
-            pending = len(plan_dict.get("pending_downloads", []))
+        plan_checked_at = {}
+
+        for name, result in sorted(results.items()):
+            if result.plan is None:
+                continue
+            plan_dict = result.plan.model_dump()
+            changes, has_updates = _update_plan_counts(plan_dict)
 
-            if changes > 0 or ambiguous > 0 or pending > 0:
+            if has_updates:
                 packs_with_updates += 1
-                total_changes += changes + ambiguous
+                total_changes += changes
                 plans_dict[name] = plan_dict
-        
+                plan_checked_at[name] = _checked_at_iso(result.checked_at)
+
         # Cache the count for profiles status endpoint
         store._cached_updates_count = packs_with_updates
-        
+
+        oldest = min((r.checked_at for r in results.values()), default=None)
         return BulkUpdateCheckResponse(
-            packs_checked=len(plans),
+            packs_checked=len(results),
             packs_with_updates=packs_with_updates,
             total_changes=total_changes,
             plans=plans_dict,
+            checked_at=_checked_at_iso(oldest) if oldest is not None else None,
+            plan_checked_at=plan_checked_at,
+            outdated_packs=outdated,
+            checker_running=checker.running,
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -5317,11 +5712,12 @@ search_router = APIRouter(tags=["search"])
 
 @search_router.get("/", response_model=Dict[str, Any])
 def search_packs(
-    q: str = Query(..., description="Search query"),
+    q: str = Query(..., description="Search query (supports prefixes and field:value filters)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of results"),
     store=Depends(require_initialized),
 ):
-    """Search packs by name or metadata."""
-    result = store.search(q)
+    """Search packs by name or metadata (ranked full-text search)."""
+    result = store.search(q, limit=limit)
     return result.model_dump()
 
 
@@ -6,8 +6,9 @@ Provides backup storage operations:
 - Backup blob (local -> backup)
 - Restore blob (backup -> local)
 - Delete from backup
-- Sync operations (bulk backup/restore)
-- Verification
+- Sync operations (bulk backup/restore, parallel, one space check up front)
+- Resumable sync sessions (journaled, copies land via <hash>.sync.part + rename)
+- Verification (hashed while copying, no second read)
 
 Backup storage mirrors the local blob structure:
 <backup_path>/.synapse/store/data/blobs/sha256/<prefix>/<hash>
@@ -15,17 +16,22 @@ Backup storage mirrors the local blob structure:
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import os
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
-from .blob_store import compute_sha256
+from .blob_snapshot import BLOB, SCAN_MAX_AGE, SYNC_PART_SUFFIX, BlobEntry, BlobScan, scan_blobs
+from .file_copy import copy_file, copy_file_hashed
+from .hash_ledger import HashLedger
 from .layout import StoreLayout
+from .state_manifest import StateFileEntry, StateManifest
+from .sync_journal import COPYING, DONE, FAILED, SyncJournal
 
 logger = logging.getLogger(__name__)
 from .models import (
@@ -39,8 +45,12 @@ from .models import (
     StateSyncSummary,
     SyncItem,
     SyncResult,
+    SyncSession,
 )
 
+if TYPE_CHECKING:
+    from .blob_store import BlobStore
+
 
 class BackupError(Exception):
     """Base exception for backup errors."""
@@ -71,6 +81,23 @@ class InsufficientSpaceError(BackupError):
 ProgressCallback = Callable[[int, int], None]
 
 
+def _file_key(path: Optional[Path]) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it does not exist."""
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _iso_mtime(entry: Optional[StateFileEntry]) -> Optional[str]:
+    if entry is None:
+        return None
+    return datetime.fromtimestamp(entry.mtime_ns / 1e9).isoformat()
+
+
 class BackupService:
     """
     Service for backup storage operations.
@@ -83,19 +110,42 @@ class BackupService:
     - Guard rails for safe operations
     """
 
-    CHUNK_SIZE = 1024 * 1024  # 1MB chunks for copying
+    DEFAULT_SYNC_WORKERS = 4  # Concurrent blob copies during sync
+    PART_SUFFIX = SYNC_PART_SUFFIX  # In-progress copy next to its final path
 
-    def __init__(self, layout: StoreLayout, config: BackupConfig):
+    def __init__(
+        self,
+        layout: StoreLayout,
+        config: BackupConfig,
+        hash_ledger: Optional[HashLedger] = None,
+        journal: Optional[SyncJournal] = None,
+        blob_store: Optional["BlobStore"] = None,
+    ):
         """
         Initialize backup service.
 
         Args:
             layout: Store layout manager
             config: Backup configuration
+            hash_ledger: Optional shared HashLedger instance
+            journal: Optional SyncJournal for resumable sync sessions
+            blob_store: Optional BlobStore; shares its local blob listing and
+                is told about restored blobs
         """
         self.layout = layout
         self.config = config
+        self.blob_store = blob_store
+        self._backup_scan = BlobScan()
+        self.hash_ledger = hash_ledger if hash_ledger is not None else HashLedger(layout)
+        self.journal = journal if journal is not None else SyncJournal(layout)
+        self._state_lock = threading.Lock()
+        self._local_state_manifest: Optional[StateManifest] = None
+        # (manifest file key, manifest) - reloaded when the file changes
+        self._backup_state_manifest: Optional[Tuple[Optional[Tuple[int, int]], StateManifest]] = None
         self._last_sync: Optional[str] = None
+        # (scope, direction) of sessions being run by this process
+        self._running_sessions: set = set()
+        self._sessions_lock = threading.Lock()
 
     # =========================================================================
     # Configuration
@@ -158,66 +208,26 @@ class BackupService:
                 warn_before_delete_last_copy=self.config.warn_before_delete_last_copy,
             )
 
-        if not self.config.path:
-            # Log only once when path is missing (error condition)
-            return BackupStatus(
-                enabled=True,
-                connected=False,
-                path=None,
-                error="Backup path not configured",
-                auto_backup_new=self.config.auto_backup_new,
-                warn_before_delete_last_copy=self.config.warn_before_delete_last_copy,
-            )
-
-        backup_path = self.backup_root
-        if not backup_path or not backup_path.exists():
-            # Path not accessible - don't log (called frequently)
+        error = self._connection_error()
+        if error is not None:
             return BackupStatus(
                 enabled=True,
                 connected=False,
                 path=self.config.path,
-                error="Backup path not accessible",
+                error=error,
                 auto_backup_new=self.config.auto_backup_new,
                 warn_before_delete_last_copy=self.config.warn_before_delete_last_copy,
             )
 
-        # Check if we can write to the backup
-        blobs_path = self.backup_blobs_path
-        try:
-            if blobs_path:
-                blobs_path.mkdir(parents=True, exist_ok=True)
-        except PermissionError:
-            logger.error("[Backup] No write permission to backup path: %s", self.config.path)
-            return BackupStatus(
-                enabled=True,
-                connected=False,
-                path=self.config.path,
-                error="No write permission to backup path",
-                auto_backup_new=self.config.auto_backup_new,
-                warn_before_delete_last_copy=self.config.warn_before_delete_last_copy,
-            )
-        except Exception as e:
-            logger.error("[Backup] Error accessing backup path: %s", e, exc_info=True)
-            return BackupStatus(
-                enabled=True,
-                connected=False,
-                path=self.config.path,
-                error=str(e),
-                auto_backup_new=self.config.auto_backup_new,
-                warn_before_delete_last_copy=self.config.warn_before_delete_last_copy,
-            )
+        backup_path = self.backup_root
 
-        # Count blobs and calculate size
+        # Count blobs and calculate size (polled: a listing a moment old will do)
         total_blobs = 0
         total_bytes = 0
-        if blobs_path and blobs_path.exists():
-            for prefix_dir in blobs_path.iterdir():
-                if not prefix_dir.is_dir():
-                    continue
-                for blob_file in prefix_dir.iterdir():
-                    if blob_file.is_file():
-                        total_blobs += 1
-                        total_bytes += blob_file.stat().st_size
+        for entry in self._backup_entries(SCAN_MAX_AGE):
+            if entry.kind == BLOB:
+                total_blobs += 1
+                total_bytes += entry.size
 
         # Get disk space
         free_space = None
@@ -240,16 +250,70 @@ class BackupService:
             last_sync=self._last_sync,
             auto_backup_new=self.config.auto_backup_new,
             warn_before_delete_last_copy=self.config.warn_before_delete_last_copy,
+            sessions=self.get_sync_sessions(),
         )
 
+    def get_sync_sessions(self) -> List[SyncSession]:
+        """
+        Get unfinished sync sessions with per-blob status.
+
+        Blobs being copied, or whose copy was interrupted, report the size of
+        their .part file as bytes_done.
+        """
+        sessions = self.journal.open_sessions()
+        for session in sessions:
+            for item in session.items:
+                if item.status not in (COPYING, FAILED):
+                    continue
+                target = (
+                    self.backup_blob_path(item.sha256)
+                    if session.direction == "to_backup"
+                    else self.layout.blob_path(item.sha256)
+                )
+                if target is None:
+                    continue
+                try:
+                    item.bytes_done = self._part_path(target).stat().st_size
+                except OSError:
+                    continue
+                session.bytes_done += item.bytes_done
+        return sessions
+
     def is_enabled(self) -> bool:
         """Quick check if backup is enabled in config."""
         return self.config.enabled
 
     def is_connected(self) -> bool:
-        """Quick check if backup is connected."""
-        status = self.get_status()
-        return status.enabled and status.connected
+        """Quick check if backup is connected (no blob counting)."""
+        return self.config.enabled and self._connection_error() is None
+
+    def _connection_error(self) -> Optional[str]:
+        """
+        Check that the backup path is reachable and writable.
+
+        Returns:
+            None if connected, otherwise the reason it is not
+        """
+        if not self.config.path:
+            return "Backup path not configured"
+
+        backup_path = self.backup_root
+        if not backup_path or not backup_path.exists():
+            # Path not accessible - don't log (called frequently)
+            return "Backup path not accessible"
+
+        # Check if we can write to the backup
+        blobs_path = self.backup_blobs_path
+        try:
+            if blobs_path:
+                blobs_path.mkdir(parents=True, exist_ok=True)
+        except PermissionError:
+            logger.error("[Backup] No write permission to backup path: %s", self.config.path)
+            return "No write permission to backup path"
+        except Exception as e:
+            logger.error("[Backup] Error accessing backup path: %s", e, exc_info=True)
+            return str(e)
+        return None
 
     def _require_connected(self) -> None:
         """Raise if backup is not connected."""
@@ -271,21 +335,18 @@ class BackupService:
         blob_path = self.backup_blob_path(sha256)
         return blob_path is not None and blob_path.exists()
 
-    def list_backup_blobs(self) -> List[str]:
-        """List all blob hashes on backup storage."""
-        blobs = []
-        blobs_path = self.backup_blobs_path
-        if not blobs_path or not blobs_path.exists():
-            return blobs
+    def list_backup_blobs(self, max_age: float = 0.0) -> List[str]:
+        """
+        List all blob hashes on backup storage.
 
-        for prefix_dir in blobs_path.iterdir():
-            if not prefix_dir.is_dir():
-                continue
-            for blob_file in prefix_dir.iterdir():
-                if blob_file.is_file():
-                    blobs.append(blob_file.name)
+        Args:
+            max_age: Accept a listing up to this many seconds old (0 = walk)
+        """
+        return [entry.sha256 for entry in self._backup_entries(max_age) if entry.kind == BLOB]
 
-        return blobs
+    def _backup_entries(self, max_age: float = 0.0) -> List[BlobEntry]:
+        """Enumerate the backup blob tree (see blob_snapshot.scan_blobs)."""
+        return self._backup_scan.entries(self.backup_blobs_path, max_age)
 
     def get_backup_blob_size(self, sha256: str) -> Optional[int]:
         """Get size of a blob on backup storage."""
@@ -303,14 +364,16 @@ class BackupService:
         sha256: str,
         verify_after: bool = True,
         progress_callback: Optional[ProgressCallback] = None,
+        check_space: bool = True,
     ) -> BackupOperationResult:
         """
         Backup a blob from local to backup storage.
 
         Args:
             sha256: SHA256 hash of the blob
-            verify_after: If True, verify the copy after backup
+            verify_after: If True, verify the copy (hashed while copying)
             progress_callback: Optional progress callback
+            check_space: Probe free space first (sync checks once up front)
 
         Returns:
             BackupOperationResult with operation details
@@ -343,16 +406,8 @@ class BackupService:
             logger.debug("[Backup] Blob %s size: %.2f MB", sha256_lower[:12], blob_size / 1024 / 1024)
 
             # Check free space on backup
-            status = self.get_status()
-            if status.free_space is not None and status.free_space < blob_size:
-                logger.error(
-                    "[Backup] Insufficient space: need %.2f MB, have %.2f MB",
-                    blob_size / 1024 / 1024,
-                    status.free_space / 1024 / 1024,
-                )
-                raise InsufficientSpaceError(
-                    f"Not enough space on backup: need {blob_size}, have {status.free_space}"
-                )
+            if check_space:
+                self._check_free_space(self.backup_root, blob_size, "backup")
 
             # Get backup path and create parent dirs
             backup_path = self.backup_blob_path(sha256_lower)
@@ -361,28 +416,16 @@ class BackupService:
                 raise BackupError("Cannot determine backup path")
             backup_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy with progress
+            # Copy with progress (and verify in the same pass if requested)
             logger.debug("[Backup] Copying to %s", backup_path)
             bytes_copied = self._copy_file(
-                local_path, backup_path, progress_callback
+                local_path,
+                backup_path,
+                progress_callback,
+                expected_sha256=sha256_lower if verify_after else None,
             )
-
-            # Verify if requested
-            verified = None
-            if verify_after:
-                logger.debug("[Backup] Verifying backup copy")
-                actual_hash = compute_sha256(backup_path)
-                verified = actual_hash == sha256_lower
-                if not verified:
-                    backup_path.unlink(missing_ok=True)
-                    logger.error(
-                        "[Backup] Verification failed: expected %s, got %s",
-                        sha256_lower[:12],
-                        actual_hash[:12],
-                    )
-                    raise BackupError(
-                        f"Verification failed: expected {sha256_lower}, got {actual_hash}"
-                    )
+            self._backup_scan.invalidate()
+            verified = True if verify_after else None
 
             duration_ms = int((time.time() - start_time) * 1000)
             logger.info(
@@ -416,14 +459,16 @@ class BackupService:
         sha256: str,
         verify_after: bool = True,
         progress_callback: Optional[ProgressCallback] = None,
+        check_space: bool = True,
     ) -> BackupOperationResult:
         """
         Restore a blob from backup to local storage.
 
         Args:
             sha256: SHA256 hash of the blob
-            verify_after: If True, verify the copy after restore
+            verify_after: If True, verify the copy (hashed while copying)
             progress_callback: Optional progress callback
+            check_space: Probe free space first (sync checks once up front)
 
         Returns:
             BackupOperationResult with operation details
@@ -457,47 +502,23 @@ class BackupService:
             logger.debug("[Backup] Blob %s size: %.2f MB", sha256_lower[:12], blob_size / 1024 / 1024)
 
             # Check free space locally
-            try:
-                usage = shutil.disk_usage(self.layout.blobs_path)
-                if usage.free < blob_size:
-                    logger.error(
-                        "[Backup] Insufficient local space: need %.2f MB, have %.2f MB",
-                        blob_size / 1024 / 1024,
-                        usage.free / 1024 / 1024,
-                    )
-                    raise InsufficientSpaceError(
-                        f"Not enough local space: need {blob_size}, have {usage.free}"
-                    )
-            except InsufficientSpaceError:
-                raise
-            except Exception as e:
-                logger.debug("[Backup] Could not check local disk space: %s", e)
+            if check_space:
+                self._check_free_space(self.layout.blobs_path, blob_size, "local")
 
             # Create parent dirs
             local_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Copy with progress
+            # Copy with progress (and verify in the same pass if requested)
             logger.debug("[Backup] Restoring to %s", local_path)
             bytes_copied = self._copy_file(
-                backup_path, local_path, progress_callback
+                backup_path,
+                local_path,
+                progress_callback,
+                expected_sha256=sha256_lower if verify_after else None,
             )
-
-            # Verify if requested
-            verified = None
-            if verify_after:
-                logger.debug("[Backup] Verifying restored copy")
-                actual_hash = compute_sha256(local_path)
-                verified = actual_hash == sha256_lower
-                if not verified:
-                    local_path.unlink(missing_ok=True)
-                    logger.error(
-                        "[Backup] Restore verification failed: expected %s, got %s",
-                        sha256_lower[:12],
-                        actual_hash[:12],
-                    )
-                    raise BackupError(
-                        f"Verification failed: expected {sha256_lower}, got {actual_hash}"
-                    )
+            if self.blob_store is not None:
+                self.blob_store.notify_changed(sha256_lower)
+            verified = True if verify_after else None
 
             duration_ms = int((time.time() - start_time) * 1000)
             logger.info(
@@ -569,6 +590,7 @@ class BackupService:
 
             # Delete from backup
             backup_path.unlink()
+            self._backup_scan.invalidate()
 
             # Try to clean up empty parent directory
             try:
@@ -600,15 +622,26 @@ class BackupService:
         only_missing: bool = True,
         dry_run: bool = True,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        bytes_callback: Optional[Callable[[int, int], None]] = None,
+        workers: Optional[int] = None,
     ) -> SyncResult:
         """
         Sync blobs between local and backup storage.
 
+        Runs as a journaled session (see run_sync_session), so an interrupted
+        sync picks up where it stopped. Free space on the target is checked
+        once for the whole batch; blobs are then copied by a worker pool, each
+        verified while it is copied.
+
         Args:
             direction: "to_backup" or "from_backup"
             only_missing: Only sync blobs missing from target
             dry_run: If True, don't actually copy anything
-            progress_callback: Optional callback (sha256, bytes_done, total_bytes)
+            progress_callback: Optional callback (sha256, bytes_done, total_bytes),
+                called once per finished blob with totals across all workers
+            bytes_callback: Optional callback (bytes_done, total_bytes), called
+                as data is copied, with totals across all workers
+            workers: Concurrent copies (default DEFAULT_SYNC_WORKERS)
 
         Returns:
             SyncResult with sync details
@@ -624,29 +657,26 @@ class BackupService:
             result.errors.append(str(e))
             return result
 
-        # Get blob sets
-        local_blobs = set(self._list_local_blobs())
-        backup_blobs = set(self.list_backup_blobs())
+        # Get blob sets with sizes; a dry run followed by the sync walks once
+        local_blobs = {
+            entry.sha256: entry.size
+            for entry in self._local_entries(SCAN_MAX_AGE) if entry.kind == BLOB
+        }
+        backup_blobs = {
+            entry.sha256: entry.size
+            for entry in self._backup_entries(SCAN_MAX_AGE) if entry.kind == BLOB
+        }
 
         # Determine what to sync
-        if direction == "to_backup":
-            if only_missing:
-                to_sync = local_blobs - backup_blobs
-            else:
-                to_sync = local_blobs
-        else:  # from_backup
-            if only_missing:
-                to_sync = backup_blobs - local_blobs
-            else:
-                to_sync = backup_blobs
+        source, target = (local_blobs, backup_blobs) if direction == "to_backup" else (backup_blobs, local_blobs)
+        if only_missing:
+            to_sync = set(source) - set(target)
+        else:
+            to_sync = set(source)
 
         # Build items list
         for sha256 in to_sync:
-            if direction == "to_backup":
-                size = self._get_local_blob_size(sha256) or 0
-            else:
-                size = self.get_backup_blob_size(sha256) or 0
-
+            size = source[sha256]
             result.items.append(SyncItem(sha256=sha256, size_bytes=size))
             result.bytes_to_sync += size
 
@@ -656,41 +686,181 @@ class BackupService:
         if dry_run:
             return result
 
-        # Actually sync
-        for item in result.items:
-            try:
-                if direction == "to_backup":
-                    op_result = self.backup_blob(item.sha256, verify_after=True)
-                else:
-                    op_result = self.restore_blob(item.sha256, verify_after=True)
+        self.run_sync_session(
+            "sync",
+            result,
+            progress_callback=progress_callback,
+            bytes_callback=bytes_callback,
+            workers=workers,
+        )
 
-                if op_result.success:
-                    result.blobs_synced += 1
-                    result.bytes_synced += op_result.bytes_copied
-                else:
-                    result.errors.append(f"{item.sha256}: {op_result.error}")
+        # Update last sync time (not for a refused run)
+        if result.items and result.session_id:
+            self._last_sync = datetime.now().isoformat()
 
-                if progress_callback:
-                    progress_callback(item.sha256, result.bytes_synced, result.bytes_to_sync)
+        return result
 
-            except Exception as e:
-                result.errors.append(f"{item.sha256}: {str(e)}")
+    def run_sync_session(
+        self,
+        scope: str,
+        result: SyncResult,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        bytes_callback: Optional[Callable[[int, int], None]] = None,
+        workers: Optional[int] = None,
+    ) -> SyncResult:
+        """
+        Copy result.items in result.direction as a journaled session.
 
-        # Update last sync time
-        self._last_sync = datetime.now().isoformat()
+        If a previous session for the same scope and direction did not
+        finish, it is continued: blobs it already copied are skipped and a
+        blob that was mid-copy resumes from its .part file. A run while the
+        same scope and direction is still running is refused, with the
+        reason in result.errors.
+
+        Args:
+            scope: Session scope ("sync", "pull:<pack>")
+            result: Planned transfer; updated in place with the outcome
+            progress_callback: Optional callback (sha256, bytes_done, total_bytes),
+                called once per finished blob with totals across all workers
+            bytes_callback: Optional callback (bytes_done, total_bytes), called
+                as data is copied, with totals across all workers
+            workers: Concurrent copies (default DEFAULT_SYNC_WORKERS)
+
+        Returns:
+            The updated result
+        """
+        direction = result.direction
+        if not result.items and not self.journal.has_open_session(scope, direction):
+            return result
+
+        # Two runs of one session would copy into the same .part files
+        with self._sessions_lock:
+            if (scope, direction) in self._running_sessions:
+                result.errors.append(f"A {scope} session ({direction}) is already running")
+                return result
+            self._running_sessions.add((scope, direction))
+        try:
+            return self._run_sync_session(
+                scope, result, progress_callback, bytes_callback, workers,
+            )
+        finally:
+            with self._sessions_lock:
+                self._running_sessions.discard((scope, direction))
+
+    def _run_sync_session(
+        self,
+        scope: str,
+        result: SyncResult,
+        progress_callback: Optional[Callable[[str, int, int], None]],
+        bytes_callback: Optional[Callable[[int, int], None]],
+        workers: Optional[int],
+    ) -> SyncResult:
+        """run_sync_session, once the session is claimed by this run."""
+        direction = result.direction
+        session_id, resumed = self.journal.open_session(
+            scope, direction, [(item.sha256, item.size_bytes) for item in result.items],
+            discard=lambda sha256: self._discard_part(sha256, direction),
+        )
+        result.session_id = session_id
+        result.resumed = resumed
+        if resumed:
+            logger.info("[Backup] Resuming %s session %s (%s)", scope, session_id[:8], direction)
+
+        # Continue in journal order; blobs finished by the earlier run count as synced
+        journal_items = self.journal.items(session_id)
+        order = {sha256: position for position, sha256 in enumerate(journal_items)}
+        done = {sha256 for sha256, entry in journal_items.items() if entry.status == DONE}
+        pending: List[SyncItem] = []
+        for item in sorted(result.items, key=lambda i: order.get(i.sha256.lower(), len(order))):
+            if item.sha256.lower() in done:
+                result.blobs_synced += 1
+                result.bytes_synced += item.size_bytes
+            else:
+                pending.append(item)
+
+        # Reserve space for the whole batch once
+        target_root = self.backup_root if direction == "to_backup" else self.layout.blobs_path
+        try:
+            self._check_free_space(
+                target_root,
+                sum(item.size_bytes for item in pending),
+                "backup" if direction == "to_backup" else "local",
+            )
+        except InsufficientSpaceError as e:
+            result.errors.append(str(e))
+            self.journal.finish(session_id)
+            return result
 
+        lock = threading.Lock()
+        bytes_copied = result.bytes_synced  # Includes partial progress of in-flight blobs
+
+        def copy_one(item: SyncItem) -> BackupOperationResult:
+            nonlocal bytes_copied
+            reported = 0
+
+            def on_bytes(done: int, total: int) -> None:
+                nonlocal reported, bytes_copied
+                with lock:
+                    bytes_copied += done - reported
+                    reported = done
+                    if bytes_callback:
+                        bytes_callback(bytes_copied, result.bytes_to_sync)
+
+            self.journal.set_item(session_id, item.sha256, COPYING)
+            transfer = self.backup_blob if direction == "to_backup" else self.restore_blob
+            op_result = transfer(
+                item.sha256,
+                verify_after=True,
+                progress_callback=on_bytes if bytes_callback else None,
+                check_space=False,
+            )
+            if op_result.success:
+                self.journal.set_item(session_id, item.sha256, DONE)
+            else:
+                self.journal.set_item(session_id, item.sha256, FAILED, op_result.error)
+                if reported:
+                    with lock:
+                        bytes_copied -= reported  # Copy was discarded or is left as .part
+            return op_result
+
+        if pending:
+            max_workers = max(1, min(workers or self.DEFAULT_SYNC_WORKERS, len(pending)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="backup-sync") as pool:
+                futures = {pool.submit(copy_one, item): item for item in pending}
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        op_result = future.result()
+                        if op_result.success:
+                            result.blobs_synced += 1
+                            result.bytes_synced += op_result.bytes_copied
+                        else:
+                            result.errors.append(f"{item.sha256}: {op_result.error}")
+                    except Exception as e:
+                        self.journal.set_item(session_id, item.sha256, FAILED, str(e))
+                        result.errors.append(f"{item.sha256}: {str(e)}")
+
+                    if progress_callback:
+                        progress_callback(item.sha256, result.bytes_synced, result.bytes_to_sync)
+
+        status = self.journal.finish(session_id)
+        logger.info(
+            "[Backup] %s session %s %s: %d/%d blobs",
+            scope, session_id[:8], status, result.blobs_synced, result.blobs_to_sync,
+        )
         return result
 
     # =========================================================================
     # Verification
     # =========================================================================
 
-    def verify_backup_blob(self, sha256: str) -> bool:
+    def verify_backup_blob(self, sha256: str, force: bool = False) -> bool:
         """
         Verify a blob's integrity on backup storage.
 
         Args:
             sha256: SHA256 hash to verify
+            force: Rehash even if the file is unchanged since its last verification
 
         Returns:
             True if blob exists and hash matches
@@ -699,13 +869,16 @@ class BackupService:
         if not backup_path or not backup_path.exists():
             return False
 
-        actual_hash = compute_sha256(backup_path)
+        actual_hash = self.hash_ledger.sha256(backup_path, force=force)
         return actual_hash == sha256.lower()
 
-    def verify_all_backup_blobs(self) -> Tuple[List[str], List[str]]:
+    def verify_all_backup_blobs(self, force: bool = False) -> Tuple[List[str], List[str]]:
         """
         Verify all blobs on backup storage.
 
+        Args:
+            force: Rehash even blobs unchanged since their last verification
+
         Returns:
             Tuple of (valid_hashes, invalid_hashes)
         """
@@ -713,7 +886,7 @@ class BackupService:
         invalid = []
 
         for sha256 in self.list_backup_blobs():
-            if self.verify_backup_blob(sha256):
+            if self.verify_backup_blob(sha256, force=force):
                 valid.append(sha256)
             else:
                 invalid.append(sha256)
@@ -775,77 +948,150 @@ class BackupService:
     # Helper Methods
     # =========================================================================
 
+    def _part_path(self, dst: Path) -> Path:
+        """Path an in-progress copy to dst is written to."""
+        return dst.with_name(dst.name + self.PART_SUFFIX)
+
+    def _discard_part(self, sha256: str, direction: str) -> None:
+        """Delete the .part of a copy a session no longer wants."""
+        target = (
+            self.backup_blob_path(sha256)
+            if direction == "to_backup"
+            else self.layout.blob_path(sha256)
+        )
+        if target is not None:
+            self._part_path(target).unlink(missing_ok=True)
+
     def _copy_file(
         self,
         src: Path,
         dst: Path,
         progress_callback: Optional[ProgressCallback] = None,
+        expected_sha256: Optional[str] = None,
     ) -> int:
-        """Copy a file with optional progress callback."""
-        total_size = src.stat().st_size
-        bytes_copied = 0
-
-        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
-            while True:
-                chunk = fsrc.read(self.CHUNK_SIZE)
-                if not chunk:
-                    break
-                fdst.write(chunk)
-                bytes_copied += len(chunk)
-                if progress_callback:
-                    progress_callback(bytes_copied, total_size)
+        """
+        Copy a file with optional progress callback.
 
+        The copy is written to dst's .part path and renamed into place once
+        complete, so dst never exists half-written.
+
+        Without expected_sha256 the copy is done by the kernel, and any .part
+        left behind is overwritten: nothing would catch a stale prefix. With
+        it, a .part left by an interrupted copy is extended rather than
+        started over, and the bytes are hashed as they are copied; on
+        mismatch the copy is removed and BackupError raised, on match both
+        files are recorded as verified in the hash ledger.
+        """
+        total_size = src.stat().st_size
+        on_bytes = None
+        if progress_callback:
+            on_bytes = lambda done: progress_callback(done, total_size)
+
+        part_path = self._part_path(dst)
+        if expected_sha256 is None:
+            bytes_copied = copy_file(src, part_path, on_bytes)
+            os.replace(part_path, dst)
+            return bytes_copied
+
+        resumed = part_path.exists()
+        bytes_copied, actual_hash = copy_file_hashed(src, part_path, on_bytes, resume=True)
+        if actual_hash != expected_sha256 and resumed:
+            # The kept prefix may be stale (source changed, torn write): start over
+            logger.warning("[Backup] Resumed copy of %s failed verification, recopying", dst.name)
+            bytes_copied, actual_hash = copy_file_hashed(src, part_path, on_bytes)
+        if actual_hash != expected_sha256:
+            part_path.unlink(missing_ok=True)
+            logger.error(
+                "[Backup] Verification failed: expected %s, got %s",
+                expected_sha256[:12],
+                actual_hash[:12],
+            )
+            raise BackupError(
+                f"Verification failed: expected {expected_sha256}, got {actual_hash}"
+            )
+        os.replace(part_path, dst)
+        self.hash_ledger.record(dst, actual_hash)
+        self.hash_ledger.record(src, actual_hash)
         return bytes_copied
 
-    def _list_local_blobs(self) -> List[str]:
-        """List all blob hashes in local storage."""
-        blobs = []
-        blobs_path = self.layout.blobs_path
-        if not blobs_path.exists():
-            return blobs
-
-        for prefix_dir in blobs_path.iterdir():
-            if not prefix_dir.is_dir():
-                continue
-            for blob_file in prefix_dir.iterdir():
-                if blob_file.is_file() and not blob_file.name.endswith(".part"):
-                    blobs.append(blob_file.name)
-
-        return blobs
-
-    def _get_local_blob_size(self, sha256: str) -> Optional[int]:
-        """Get size of a local blob."""
-        blob_path = self.layout.blob_path(sha256)
-        if blob_path.exists():
-            return blob_path.stat().st_size
-        return None
+    def _check_free_space(self, path: Optional[Path], needed: int, label: str) -> None:
+        """
+        Raise InsufficientSpaceError if the filesystem holding path lacks room.
+
+        Args:
+            path: Any path on the target filesystem (skipped if None or unreadable)
+            needed: Bytes about to be written
+            label: "backup" or "local", for the message
+        """
+        if path is None:
+            return
+        try:
+            free = shutil.disk_usage(path).free
+        except OSError as e:
+            logger.debug("[Backup] Could not check %s disk space: %s", label, e)
+            return
+        if free < needed:
+            logger.error(
+                "[Backup] Insufficient %s space: need %.2f MB, have %.2f MB",
+                label,
+                needed / 1024 / 1024,
+                free / 1024 / 1024,
+            )
+            raise InsufficientSpaceError(
+                f"Not enough {label} space: need {needed}, have {free}"
+            )
+
+    def _local_entries(self, max_age: float = 0.0) -> List[BlobEntry]:
+        """Enumerate the local blob tree, through the BlobStore's listing if shared."""
+        if self.blob_store is not None:
+            return self.blob_store.scan_blobs(max_age)
+        return scan_blobs(self.layout.blobs_path)
 
     # =========================================================================
     # State Sync Operations
     # =========================================================================
 
-    def get_state_sync_status(self) -> StateSyncResult:
+    @property
+    def backup_state_manifest_path(self) -> Optional[Path]:
+        """Get the path of the backup's state manifest (outside state/)."""
+        root = self.backup_root
+        if not root:
+            return None
+        return root / ".synapse" / "store" / "state_manifest.json"
+
+    def get_state_sync_status(self, rescan: bool = False) -> StateSyncResult:
         """
         Get the current sync status of the state/ directory.
 
+        Args:
+            rescan: Rebuild the backup manifest by walking the backup state/
+                    (needed only if it was changed outside Synapse)
+
         Returns:
             StateSyncResult with dry_run=True showing what would be synced
         """
-        return self.sync_state(dry_run=True)
+        return self.sync_state(dry_run=True, rescan=rescan)
 
     def sync_state(
         self,
         direction: str = "to_backup",
         dry_run: bool = True,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        rescan: bool = False,
     ) -> StateSyncResult:
         """
         Sync the state/ directory between local and backup.
 
+        Files are compared by content hash from the two state manifests, so
+        the backup tree is not walked. A file changed on both sides since
+        they last agreed is a conflict; directional syncs overwrite it,
+        bidirectional sync leaves it alone and reports it.
+
         Args:
             direction: "to_backup", "from_backup", or "bidirectional"
             dry_run: If True, don't actually copy files
             progress_callback: Optional callback (file_path, done, total)
+            rescan: Rebuild the backup manifest by walking the backup state/
 
         Returns:
             StateSyncResult with sync details
@@ -862,63 +1108,71 @@ class BackupService:
             result.errors.append(str(e))
             return result
 
-        state_path = self.layout.state_path
-        backup_state = self.backup_state_path
-
-        if not backup_state:
+        if not self.backup_state_path:
             result.errors.append("Cannot determine backup state path")
             return result
 
-        # Collect all files from both sides
-        local_files = self._collect_state_files(state_path, state_path)
-        backup_files = self._collect_state_files(backup_state, backup_state)
-
-        all_paths = set(local_files.keys()) | set(backup_files.keys())
-        result.summary.total_files = len(all_paths)
-
-        # Analyze each file
-        for rel_path in sorted(all_paths):
-            local_info = local_files.get(rel_path)
-            backup_info = backup_files.get(rel_path)
-
-            item = self._analyze_state_file(rel_path, local_info, backup_info)
-            result.items.append(item)
-
-            # Update summary
-            if item.status == StateSyncStatus.SYNCED:
-                result.summary.synced += 1
-            elif item.status == StateSyncStatus.LOCAL_ONLY:
-                result.summary.local_only += 1
-            elif item.status == StateSyncStatus.BACKUP_ONLY:
-                result.summary.backup_only += 1
-            elif item.status == StateSyncStatus.MODIFIED:
-                result.summary.modified += 1
-            elif item.status == StateSyncStatus.CONFLICT:
-                result.summary.conflicts += 1
-
-        # If dry run, we're done
-        if dry_run:
-            return result
-
-        # Actually sync files
-        done = 0
-        total = len([i for i in result.items if i.status != StateSyncStatus.SYNCED])
+        with self._state_lock:
+            local = self._load_local_state_manifest()
+            backup = self._load_backup_state_manifest(rescan)
+
+            all_paths = set(local.entries) | set(backup.entries)
+            result.summary.total_files = len(all_paths)
+
+            # Agreements on paths gone from both sides are no longer needed
+            for rel_path in set(local.synced) - all_paths:
+                del local.synced[rel_path]
+                local.dirty = True
+
+            # Analyze each file
+            for rel_path in sorted(all_paths):
+                item = self._analyze_state_file(
+                    rel_path,
+                    local.entries.get(rel_path),
+                    backup.entries.get(rel_path),
+                    local.synced.get(rel_path),
+                )
+                result.items.append(item)
+
+                # Update summary
+                if item.status == StateSyncStatus.SYNCED:
+                    result.summary.synced += 1
+                    local.mark_synced(rel_path, local.entries[rel_path].sha256)
+                elif item.status == StateSyncStatus.LOCAL_ONLY:
+                    result.summary.local_only += 1
+                elif item.status == StateSyncStatus.BACKUP_ONLY:
+                    result.summary.backup_only += 1
+                elif item.status == StateSyncStatus.MODIFIED:
+                    result.summary.modified += 1
+                elif item.status == StateSyncStatus.CONFLICT:
+                    result.summary.conflicts += 1
+
+            # If dry run, we're done
+            if dry_run:
+                self._save_state_manifests(local, backup)
+                return result
+
+            # Actually sync files
+            done = 0
+            total = len([i for i in result.items if i.status != StateSyncStatus.SYNCED])
+
+            for item in result.items:
+                if item.status == StateSyncStatus.SYNCED:
+                    continue
 
-        for item in result.items:
-            if item.status == StateSyncStatus.SYNCED:
-                continue
+                try:
+                    synced = self._sync_state_file(item, direction, local, backup)
+                    if synced:
+                        result.synced_files += 1
 
-            try:
-                synced = self._sync_state_file(item, direction, state_path, backup_state)
-                if synced:
-                    result.synced_files += 1
+                    done += 1
+                    if progress_callback:
+                        progress_callback(item.relative_path, done, total)
 
-                done += 1
-                if progress_callback:
-                    progress_callback(item.relative_path, done, total)
+                except Exception as e:
+                    result.errors.append(f"{item.relative_path}: {str(e)}")
 
-            except Exception as e:
-                result.errors.append(f"{item.relative_path}: {str(e)}")
+            self._save_state_manifests(local, backup)
 
         # Update last sync time
         self._last_sync = datetime.now().isoformat()
@@ -926,97 +1180,109 @@ class BackupService:
 
         return result
 
-    def _collect_state_files(
-        self, root: Path, base: Path
-    ) -> Dict[str, Tuple[datetime, int]]:
-        """
-        Collect all files in a state directory.
+    def _load_local_state_manifest(self) -> StateManifest:
+        """Return the local state manifest, refreshed against state/ (caller holds _state_lock)."""
+        if self._local_state_manifest is None:
+            path = self.layout.state_manifest_path
+            self._local_state_manifest = StateManifest.load(path) or StateManifest(path)
+        self._local_state_manifest.refresh(self.layout.state_path)
+        return self._local_state_manifest
 
-        Returns:
-            Dict mapping relative paths to (mtime, size)
+    def _load_backup_state_manifest(self, rescan: bool = False) -> StateManifest:
         """
-        files = {}
-        if not root.exists():
-            return files
-
-        for path in root.rglob("*"):
-            if path.is_file():
-                # Skip hidden files and temp files
-                if path.name.startswith(".") or path.name.endswith(".tmp"):
-                    continue
-                rel_path = str(path.relative_to(base))
-                stat = path.stat()
-                files[rel_path] = (
-                    datetime.fromtimestamp(stat.st_mtime),
-                    stat.st_size,
-                )
+        Return the backup state manifest (caller holds _state_lock).
 
-        return files
+        Re-read only when the manifest file changed; built by walking the
+        backup state/ when missing or when rescan is set.
+        """
+        path = self.backup_state_manifest_path
+        key = _file_key(path)
+        cached = self._backup_state_manifest
+        if not rescan and cached is not None and cached[0] == key:
+            return cached[1]
+
+        manifest = None if rescan else StateManifest.load(path)
+        if manifest is None:
+            logger.info("[Backup] Building backup state manifest from %s", self.backup_state_path)
+            manifest = StateManifest(path)
+            manifest.refresh(self.backup_state_path)
+            manifest.dirty = True
+            manifest.save(self.layout.write_json)
+            key = _file_key(path)
+        self._backup_state_manifest = (key, manifest)
+        return manifest
+
+    def _save_state_manifests(self, local: StateManifest, backup: StateManifest) -> None:
+        """Persist changed manifests (caller holds _state_lock)."""
+        local.save(self.layout.write_json)
+        if backup.dirty:
+            backup.save(self.layout.write_json)
+            self._backup_state_manifest = (_file_key(backup.path), backup)
 
     def _analyze_state_file(
         self,
         rel_path: str,
-        local_info: Optional[Tuple[datetime, int]],
-        backup_info: Optional[Tuple[datetime, int]],
+        local_entry: Optional[StateFileEntry],
+        backup_entry: Optional[StateFileEntry],
+        base_sha256: Optional[str],
     ) -> StateSyncItem:
-        """Analyze a single state file and determine its sync status."""
-        if local_info is None and backup_info is None:
+        """
+        Analyze a single state file and determine its sync status.
+
+        base_sha256 is the content both sides last agreed on; when both
+        differ from it, both were modified and the file is a conflict.
+        """
+        if local_entry is None and backup_entry is None:
             # Should not happen
             return StateSyncItem(
                 relative_path=rel_path,
                 status=StateSyncStatus.SYNCED,
             )
 
-        if local_info is None:
+        local_mtime = _iso_mtime(local_entry)
+        backup_mtime = _iso_mtime(backup_entry)
+
+        if local_entry is None:
             # Only on backup
             return StateSyncItem(
                 relative_path=rel_path,
                 status=StateSyncStatus.BACKUP_ONLY,
-                backup_mtime=backup_info[0].isoformat() if backup_info else None,
-                backup_size=backup_info[1] if backup_info else None,
+                backup_mtime=backup_mtime,
+                backup_size=backup_entry.size,
             )
 
-        if backup_info is None:
+        if backup_entry is None:
             # Only on local
             return StateSyncItem(
                 relative_path=rel_path,
                 status=StateSyncStatus.LOCAL_ONLY,
-                local_mtime=local_info[0].isoformat(),
-                local_size=local_info[1],
+                local_mtime=local_mtime,
+                local_size=local_entry.size,
             )
 
-        # Both exist - compare
-        local_mtime, local_size = local_info
-        backup_mtime, backup_size = backup_info
+        # Both exist - compare content
+        if local_entry.sha256 == backup_entry.sha256:
+            status = StateSyncStatus.SYNCED
+        elif base_sha256 is not None and base_sha256 not in (local_entry.sha256, backup_entry.sha256):
+            status = StateSyncStatus.CONFLICT
+        else:
+            status = StateSyncStatus.MODIFIED
 
-        # If same size and mtime within 1 second, consider synced
-        time_diff = abs((local_mtime - backup_mtime).total_seconds())
-        if local_size == backup_size and time_diff < 2:
-            return StateSyncItem(
-                relative_path=rel_path,
-                status=StateSyncStatus.SYNCED,
-                local_mtime=local_mtime.isoformat(),
-                backup_mtime=backup_mtime.isoformat(),
-                local_size=local_size,
-                backup_size=backup_size,
-            )
-
-        # Files differ - determine which is newer
         return StateSyncItem(
             relative_path=rel_path,
-            status=StateSyncStatus.MODIFIED,
-            local_mtime=local_mtime.isoformat(),
-            backup_mtime=backup_mtime.isoformat(),
-            local_size=local_size,
-            backup_size=backup_size,
+            status=status,
+            local_mtime=local_mtime,
+            backup_mtime=backup_mtime,
+            local_size=local_entry.size,
+            backup_size=backup_entry.size,
         )
 
     def _sync_state_file(
         self,
         item: StateSyncItem,
         direction: str,
-        state_path: Path,
-        backup_state: Path,
+        local: StateManifest,
+        backup: StateManifest,
     ) -> bool:
         """
         Sync a single state file.
@@ -1024,44 +1290,60 @@ class BackupService:
         Returns:
             True if file was synced
         """
-        local_path = state_path / item.relative_path
-        backup_path = backup_state / item.relative_path
+        changed = (StateSyncStatus.MODIFIED, StateSyncStatus.CONFLICT)
+        to_backup = None
 
         if direction == "to_backup":
-            if item.status in (StateSyncStatus.LOCAL_ONLY, StateSyncStatus.MODIFIED):
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(local_path, backup_path)
-                return True
+            if item.status == StateSyncStatus.LOCAL_ONLY or item.status in changed:
+                to_backup = True
 
         elif direction == "from_backup":
-            if item.status in (StateSyncStatus.BACKUP_ONLY, StateSyncStatus.MODIFIED):
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(backup_path, local_path)
-                return True
+            if item.status == StateSyncStatus.BACKUP_ONLY or item.status in changed:
+                to_backup = False
 
         elif direction == "bidirectional":
-            # For bidirectional, newer file wins
             if item.status == StateSyncStatus.LOCAL_ONLY:
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(local_path, backup_path)
-                return True
+                to_backup = True
             elif item.status == StateSyncStatus.BACKUP_ONLY:
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(backup_path, local_path)
-                return True
+                to_backup = False
+            elif item.status == StateSyncStatus.CONFLICT:
+                raise BackupError("Modified on both sides since last sync; sync with a direction to resolve")
             elif item.status == StateSyncStatus.MODIFIED:
-                # Compare mtimes - newer wins
-                local_mtime = datetime.fromisoformat(item.local_mtime) if item.local_mtime else datetime.min
-                backup_mtime = datetime.fromisoformat(item.backup_mtime) if item.backup_mtime else datetime.min
-                if local_mtime >= backup_mtime:
-                    backup_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(local_path, backup_path)
+                base = local.synced.get(item.relative_path)
+                if base is not None:
+                    # Copy from the side that changed
+                    to_backup = base == backup.entries[item.relative_path].sha256
                 else:
-                    local_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(backup_path, local_path)
-                return True
+                    # Never synced: newer wins
+                    to_backup = (
+                        local.entries[item.relative_path].mtime_ns
+                        >= backup.entries[item.relative_path].mtime_ns
+                    )
+
+        if to_backup is None:
+            return False
+        self._copy_state_file(item.relative_path, to_backup, local, backup)
+        return True
 
-        return False
+    def _copy_state_file(
+        self,
+        relative_path: str,
+        to_backup: bool,
+        local: StateManifest,
+        backup: StateManifest,
+    ) -> None:
+        """Copy one state file and record the result in both manifests."""
+        local_path = self.layout.state_path / relative_path
+        backup_path = self.backup_state_path / relative_path
+        src, dst = (local_path, backup_path) if to_backup else (backup_path, local_path)
+        target = backup if to_backup else local
+
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dst)
+        # The local manifest was just refreshed; a backup entry may be stale
+        known = local.entries.get(relative_path) if to_backup else None
+        entry = target.record(relative_path, dst, known.sha256 if known else None)
+        local.mark_synced(relative_path, entry.sha256)
 
     def backup_state_file(self, relative_path: str) -> bool:
         """
@@ -1085,13 +1367,15 @@ class BackupService:
             return False
 
         local_path = state_path / relative_path
-        backup_path = backup_state / relative_path
 
         if not local_path.exists():
             return False
 
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(local_path, backup_path)
+        with self._state_lock:
+            local = self._load_local_state_manifest()
+            backup = self._load_backup_state_manifest()
+            self._copy_state_file(relative_path, True, local, backup)
+            self._save_state_manifests(local, backup)
         return True
 
     def restore_state_file(self, relative_path: str) -> bool:
@@ -1109,18 +1393,19 @@ class BackupService:
         except (BackupNotEnabledError, BackupNotConnectedError):
             return False
 
-        state_path = self.layout.state_path
         backup_state = self.backup_state_path
 
         if not backup_state:
             return False
 
-        local_path = state_path / relative_path
         backup_path = backup_state / relative_path
 
         if not backup_path.exists():
             return False
 
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(backup_path, local_path)
+        with self._state_lock:
+            local = self._load_local_state_manifest()
+            backup = self._load_backup_state_manifest()
+            self._copy_state_file(relative_path, False, local, backup)
+            self._save_state_manifests(local, backup)
         return True
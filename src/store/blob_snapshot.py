@@ -0,0 +1,328 @@
+"""
+Synapse Store v2 - Blob Snapshot
+
+Directory-level views of a data/blobs/sha256/<xx>/<file> tree.
+
+scan_blobs() enumerates a tree in one os.scandir pass, classifying every
+file as a blob (<sha256>), partial copy (<sha256>.part, <sha256>.sync.part),
+segmented download state (<sha256>.part.segments) or manifest
+(<sha256>.meta) and keeping the size and mtime from its stat.
+It is the single walk behind BlobStore.list_blobs, get_total_size,
+clean_partial and BackupService's listings; BlobScan keeps a listing for a
+few seconds so a request that needs it several times walks the tree once.
+
+BlobSnapshot answers "which of these blobs exist, and how large are they?"
+so callers checking many artifacts (status, view plans, pulls) don't stat
+every blob path. Each shard (<xx>/ directory) is listed once and kept as
+
+    32-byte digest -> size
+
+A shard is reused while its directory mtime is unchanged and no BlobStore
+write marked it dirty (see BlobStore._notify). A shard modified within
+RACY_WINDOW_NS of its listing is listed again on next use, since a coarse
+directory mtime could hide a change made right after the listing.
+
+Only shards holding a queried hash are validated: a lookup costs one
+directory stat per distinct prefix, plus a listing for shards that changed.
+The shard bookkeeping lives in ShardCache, which InventoryModel's
+BlobDirectory builds on as well.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# Shards modified this recently are not trusted to be fully captured by a listing
+RACY_WINDOW_NS = 2_000_000_000
+
+# Listing age read-only callers accept from BlobScan (seconds)
+SCAN_MAX_AGE = 2.0
+
+# File kinds in a blob shard
+BLOB = "blob"
+PART = "part"  # Interrupted download or copy
+SEGMENTS = "segments"  # Segment progress of an interrupted download
+META = "meta"  # Blob manifest
+
+# Suffix of a journaled backup copy in progress (a PART the sync journal resumes)
+SYNC_PART_SUFFIX = ".sync.part"
+
+
+@dataclass(frozen=True)
+class BlobEntry:
+    """One file of a blob tree, as seen by a single scandir pass."""
+    sha256: str
+    size: int
+    mtime_ns: int
+    kind: str
+    path: str
+
+
+def _kind(name: str) -> Optional[str]:
+    if "." not in name:
+        return BLOB
+    if name.endswith(".part"):
+        return PART
+    if name.endswith(".segments"):
+        return SEGMENTS
+    if name.endswith(".meta"):
+        return META
+    return None
+
+
+def iter_shard(path: str) -> Iterator[BlobEntry]:
+    """
+    Yield the blob, .part and .meta files of one <xx>/ directory.
+
+    Raises:
+        OSError: If the directory can't be listed
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            kind = _kind(entry.name)
+            if kind is None:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue  # Removed while scanning
+            yield BlobEntry(
+                sha256=entry.name.split(".", 1)[0],
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+                kind=kind,
+                path=entry.path,
+            )
+
+
+def scan_blobs(root: Optional[Path]) -> List[BlobEntry]:
+    """
+    Enumerate a blob tree in one pass.
+
+    Args:
+        root: Blob tree root (None or missing means empty)
+
+    Returns:
+        Entries of every shard, in directory order
+    """
+    entries: List[BlobEntry] = []
+    if root is None:
+        return entries
+    try:
+        with os.scandir(root) as it:
+            shards = [entry.path for entry in it if entry.is_dir()]
+    except OSError:
+        return entries
+    for shard in shards:
+        try:
+            entries.extend(iter_shard(shard))
+        except OSError as e:
+            logger.warning("[BlobSnapshot] Failed to scan %s: %s", shard, e)
+    return entries
+
+
+class BlobScan:
+    """
+    scan_blobs() result kept for reuse.
+
+    Callers say how old a listing they accept; invalidate() (on writes)
+    forces the next call to walk again. Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[Optional[Path], float, List[BlobEntry]]] = None
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cached = None
+            self._generation += 1
+
+    def entries(self, root: Optional[Path], max_age: float = 0.0) -> List[BlobEntry]:
+        """
+        List a blob tree, reusing a listing up to max_age seconds old.
+
+        Returns:
+            Entries (shared with other callers; treat as read-only)
+        """
+        with self._lock:
+            cached = self._cached
+            if (
+                max_age > 0
+                and cached is not None
+                and cached[0] == root
+                and time.monotonic() - cached[1] < max_age
+            ):
+                return cached[2]
+            generation = self._generation
+
+        started = time.monotonic()
+        entries = scan_blobs(root)
+        with self._lock:
+            if generation == self._generation:  # No write raced the walk
+                self._cached = (root, started, entries)
+        return entries
+
+
+@dataclass
+class _Shard(Generic[T]):
+    """Listing of one <xx>/ blob directory."""
+    mtime_ns: int
+    scanned_ns: int
+    listing: T
+
+    @property
+    def racy(self) -> bool:
+        return self.mtime_ns >= self.scanned_ns - RACY_WINDOW_NS
+
+
+class ShardCache(ABC, Generic[T]):
+    """
+    Per-shard listings of a blob tree, validated by shard directory mtime.
+
+    Subclasses say what a listing holds by implementing _scan_shard().
+    Not thread-safe; subclasses serialize access.
+    """
+
+    def __init__(self):
+        self._shards: Dict[str, _Shard[T]] = {}
+        self._dirty: Set[str] = set()
+
+    def mark_dirty(self, sha256: str) -> None:
+        """A blob was written or removed; relist its shard on next use."""
+        self._dirty.add(sha256[:2].lower())
+
+    def clear(self) -> None:
+        """Drop every shard listing."""
+        self._shards.clear()
+        self._dirty.clear()
+
+    def _listing(self, prefix: str, path: str, mtime_ns: int) -> T:
+        """
+        Return a shard's listing, relisting it if it may have changed.
+
+        Args:
+            prefix: Shard name (<xx>)
+            path: Shard directory
+            mtime_ns: Current mtime of the shard directory
+        """
+        shard = self._shards.get(prefix)
+        if (
+            shard is not None
+            and shard.mtime_ns == mtime_ns
+            and not shard.racy
+            and prefix not in self._dirty
+        ):
+            return shard.listing
+
+        scanned_ns = time.time_ns()
+        listing = self._scan_shard(path)
+        self._shards[prefix] = _Shard(mtime_ns=mtime_ns, scanned_ns=scanned_ns, listing=listing)
+        self._dirty.discard(prefix)
+        return listing
+
+    def _drop(self, prefix: str) -> bool:
+        """Forget a shard whose directory is gone. Returns True if it was cached."""
+        self._dirty.discard(prefix)
+        return self._shards.pop(prefix, None) is not None
+
+    @abstractmethod
+    def _scan_shard(self, path: str) -> T:
+        """List one shard directory."""
+
+
+def _digest(sha256: str) -> Optional[bytes]:
+    """32-byte digest of a hex sha256, or None if it isn't one."""
+    if len(sha256) != 64:
+        return None
+    try:
+        return bytes.fromhex(sha256)
+    except ValueError:
+        return None
+
+
+class BlobSnapshot(ShardCache[Dict[bytes, int]]):
+    """
+    Shard-cached existence and size index of a blob tree.
+
+    Thread-safe; shards are listed lazily on first lookup.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root: Blob tree root (data/blobs/sha256)
+        """
+        super().__init__()
+        self.root = root
+        self._lock = threading.Lock()
+
+    def mark_dirty(self, sha256: str) -> None:
+        """A blob was written or removed; relist its shard on next use."""
+        with self._lock:
+            super().mark_dirty(sha256)
+
+    def invalidate(self) -> None:
+        """Drop every shard listing."""
+        with self._lock:
+            self.clear()
+
+    def sizes(self, hashes: Iterable[str]) -> Dict[str, Optional[int]]:
+        """
+        Look up many blobs at once.
+
+        Args:
+            hashes: sha256 hex strings (any case)
+
+        Returns:
+            Input hash -> size in bytes, or None if the blob doesn't exist
+        """
+        result: Dict[str, Optional[int]] = {}
+        by_prefix: Dict[str, List[Tuple[str, bytes]]] = {}
+        for sha256 in hashes:
+            result[sha256] = None
+            digest = _digest(sha256)
+            if digest is not None:
+                by_prefix.setdefault(sha256[:2].lower(), []).append((sha256, digest))
+
+        with self._lock:
+            for prefix, wanted in by_prefix.items():
+                blobs = self._shard_blobs(prefix)
+                for sha256, digest in wanted:
+                    result[sha256] = blobs.get(digest)
+        return result
+
+    def _shard_blobs(self, prefix: str) -> Dict[bytes, int]:
+        path = os.path.join(self.root, prefix)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self._drop(prefix)
+            return {}
+        return self._listing(prefix, path, mtime_ns)
+
+    def _scan_shard(self, path: str) -> Dict[bytes, int]:
+        blobs: Dict[bytes, int] = {}
+        try:
+            for entry in iter_shard(path):
+                digest = _digest(entry.sha256) if entry.kind == BLOB else None
+                if digest is not None:
+                    blobs[digest] = entry.size
+        except OSError as e:
+            logger.warning("[BlobSnapshot] Failed to scan %s: %s", path, e)
+        return blobs
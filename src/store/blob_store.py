@@ -6,7 +6,7 @@ Content-addressable storage for model files using SHA256 hashing.
 Features:
 - Deduplication by SHA256 hash
 - Atomic downloads with .part files
-- Hash verification
+- Hash verification (parallel, skips blobs unchanged since their last verify)
 - Support for file:// URLs (for testing)
 - Progress callbacks
 """
@@ -18,12 +18,17 @@ import json
 import logging
 import os
 import shutil
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
+from .blob_snapshot import BLOB, PART, SEGMENTS, SYNC_PART_SUFFIX, BlobEntry, BlobScan, BlobSnapshot
 from .download_service import DownloadService
+from .hash_ledger import HashLedger
 from .layout import StoreLayout
 from .models import BlobManifest
 
@@ -45,9 +50,37 @@ class DownloadError(BlobStoreError):
     pass
 
 
+class VerificationCancelled(BlobStoreError):
+    """Raised inside a hashing worker when verification was cancelled."""
+    pass
+
+
 # Progress callback type: (downloaded_bytes, total_bytes)
 ProgressCallback = Callable[[int, int], None]
 
+# Verification progress callback type: (sha256, hashed_bytes, total_bytes).
+# Called from worker threads.
+VerifyProgressCallback = Callable[[str, int, int], None]
+
+# Blob change listener type: (sha256). Called after a blob or its manifest
+# was created or removed, on the thread that made the change.
+BlobListener = Callable[[str], None]
+
+# Read size for verification: large sequential reads keep the disk busy and
+# let hashlib (which releases the GIL) run on several cores at once
+VERIFY_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+@dataclass
+class VerifyReport:
+    """Result of BlobStore.verify_blobs."""
+    valid: List[str] = field(default_factory=list)
+    invalid: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)  # Valid via ledger, not rehashed
+    cancelled: bool = False
+    bytes_hashed: int = 0
+    duration_ms: int = 0
+
 
 def compute_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
     """
@@ -67,6 +100,47 @@ def compute_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
     return sha256.hexdigest().lower()
 
 
+def _hash_file(
+    path: Path,
+    chunk_size: int = VERIFY_CHUNK_SIZE,
+    on_bytes: Optional[Callable[[int], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> str:
+    """
+    Hash a file with one reusable buffer, reporting progress per chunk.
+
+    Args:
+        path: Path to file
+        chunk_size: Read size
+        on_bytes: Called with the cumulative number of bytes hashed
+        cancel: Checked between chunks
+
+    Raises:
+        VerificationCancelled: If cancel was set
+    """
+    sha256 = hashlib.sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    done = 0
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            if cancel is not None and cancel.is_set():
+                raise VerificationCancelled(str(path))
+            sha256.update(view[:n])
+            done += n
+            if on_bytes is not None:
+                on_bytes(done)
+    return sha256.hexdigest().lower()
+
+
 def compute_sha256_streaming(
     data_iter,
     chunk_size: int = 1024 * 1024
@@ -100,6 +174,7 @@ class BlobStore:
     DEFAULT_CHUNK_SIZE = 8192
     DEFAULT_TIMEOUT = 300
     DEFAULT_MAX_WORKERS = 4
+    DEFAULT_VERIFY_WORKERS = min(4, os.cpu_count() or 1)
     
     def __init__(
         self,
@@ -110,6 +185,7 @@ class BlobStore:
         api_key: Optional[str] = None,
         auth_providers: Optional[List] = None,
         download_service: Optional[DownloadService] = None,
+        hash_ledger: Optional[HashLedger] = None,
     ):
         """
         Initialize blob store.
@@ -122,6 +198,7 @@ class BlobStore:
             api_key: Optional API key (deprecated, use auth_providers)
             auth_providers: List of DownloadAuthProvider instances for URL auth injection
             download_service: Optional shared DownloadService instance
+            hash_ledger: Optional shared HashLedger instance
         """
         self.layout = layout
         self.chunk_size = chunk_size
@@ -136,14 +213,49 @@ class BlobStore:
             from .download_auth import CivitaiAuthProvider
             self._auth_providers = [CivitaiAuthProvider(self.api_key)]
 
+        self.hash_ledger = hash_ledger if hash_ledger is not None else HashLedger(layout)
+
         if download_service is not None:
             self._download_service = download_service
         else:
             self._download_service = DownloadService(
                 auth_providers=self._auth_providers,
                 chunk_size=self.chunk_size,
+                hash_ledger=self.hash_ledger,
             )
 
+        self._listeners: List[BlobListener] = []
+        self._snapshot = BlobSnapshot(layout.blobs_path)
+        self._scan = BlobScan()
+
+    # =========================================================================
+    # Change Listeners
+    # =========================================================================
+
+    def add_listener(self, listener: BlobListener) -> None:
+        """Register a callback for blob and manifest writes/removals."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: BlobListener) -> None:
+        """Unregister a previously added callback."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def notify_changed(self, sha256: str) -> None:
+        """Report a blob written or removed outside BlobStore (e.g. a restore from backup)."""
+        self._notify(sha256)
+
+    def _notify(self, sha256: str) -> None:
+        """Dispatch a change event to all listeners, isolating failures."""
+        self._snapshot.mark_dirty(sha256)
+        self._scan.invalidate()
+        for listener in list(self._listeners):
+            try:
+                listener(sha256.lower())
+            except Exception as e:
+                logger.warning("[BlobStore] Listener %r failed: %s", listener, e)
+
     # =========================================================================
     # Blob Path Operations
     # =========================================================================
@@ -162,6 +274,22 @@ class BlobStore:
         if path.exists():
             return path.stat().st_size
         return None
+
+    def blob_sizes(self, hashes: Iterable[str]) -> Dict[str, Optional[int]]:
+        """
+        Get sizes of many blobs at once from the cached blob listing.
+
+        Args:
+            hashes: Blob hashes to look up
+
+        Returns:
+            Input hash -> size in bytes, or None if the blob doesn't exist
+        """
+        return self._snapshot.sizes(hashes)
+
+    def existing_blobs(self, hashes: Iterable[str]) -> Set[str]:
+        """Return the subset of hashes whose blobs exist (see blob_sizes)."""
+        return {sha256 for sha256, size in self.blob_sizes(hashes).items() if size is not None}
     
     # =========================================================================
     # Download Operations
@@ -173,6 +301,7 @@ class BlobStore:
         expected_sha256: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
         force: bool = False,
+        part_name: Optional[str] = None,
     ) -> str:
         """
         Download a file to blob store.
@@ -182,6 +311,8 @@ class BlobStore:
             expected_sha256: Expected SHA256 hash. If None, hash is computed after download.
             progress_callback: Optional progress callback (downloaded, total)
             force: If True, re-download even if blob exists
+            part_name: Stable name for the partial file when the hash is unknown,
+                so a later call can resume it (default: a random name)
         
         Returns:
             SHA256 hash of downloaded file
@@ -201,6 +332,8 @@ class BlobStore:
             return self._copy_local_file(parsed.path, expected_sha256)
         
         # HTTP/HTTPS download
+        if part_name is not None:
+            return self._download_http(url, expected_sha256, progress_callback, part_name)
         return self._download_http(url, expected_sha256, progress_callback)
     
     def _copy_local_file(
@@ -213,8 +346,8 @@ class BlobStore:
         if not source.exists():
             raise DownloadError(f"Local file not found: {source_path}")
         
-        # Compute hash
-        actual_sha256 = compute_sha256(source)
+        # Compute hash (skipped if this file was hashed before and is unchanged)
+        actual_sha256 = self.hash_ledger.sha256(source)
         
         # Verify if expected
         if expected_sha256 and actual_sha256 != expected_sha256.lower():
@@ -231,6 +364,7 @@ class BlobStore:
         # Copy to blob store
         blob_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, blob_path)
+        self._notify(actual_sha256)
         
         return actual_sha256
     
@@ -239,6 +373,7 @@ class BlobStore:
         url: str,
         expected_sha256: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        part_name: Optional[str] = None,
     ) -> str:
         """Download file via HTTP/HTTPS.
 
@@ -247,14 +382,7 @@ class BlobStore:
         """
         from .download_service import DownloadError as DLError
 
-        # Determine part file location
-        if expected_sha256:
-            part_path = self.layout.blob_part_path(expected_sha256)
-        else:
-            import uuid
-            temp_name = f"download_{uuid.uuid4().hex}"
-            part_path = self.layout.tmp_path / temp_name
-
+        part_path = self.part_path(expected_sha256, part_name)
         part_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -277,6 +405,15 @@ class BlobStore:
                 raise HashMismatchError(msg) from e
             raise DownloadError(msg) from e
     
+    def part_path(self, expected_sha256: Optional[str] = None, part_name: Optional[str] = None) -> Path:
+        """Partial-download path: next to the blob if the hash is known, else in tmp/."""
+        if expected_sha256:
+            return self.layout.blob_part_path(expected_sha256)
+        if part_name is None:
+            import uuid
+            part_name = f"download_{uuid.uuid4().hex}"
+        return self.layout.tmp_path / part_name
+
     def _finalize_download(self, part_path: Path, sha256: str) -> str:
         """Move completed download to final blob location."""
         blob_path = self.blob_path(sha256)
@@ -289,6 +426,7 @@ class BlobStore:
         # Atomic rename to final location
         blob_path.parent.mkdir(parents=True, exist_ok=True)
         part_path.replace(blob_path)
+        self._notify(sha256)
         
         return sha256
     
@@ -358,17 +496,23 @@ class BlobStore:
     
     def verify(self, sha256: str) -> bool:
         """
-        Verify a blob's integrity.
+        Verify a blob's integrity (always rehashes).
         
         Returns:
             True if blob exists and hash matches
         """
         path = self.blob_path(sha256)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return False
         
         actual = compute_sha256(path)
-        return actual == sha256.lower()
+        if actual == sha256.lower():
+            self.hash_ledger.record(path, actual, st)
+            return True
+        self.hash_ledger.forget(path)
+        return False
     
     def verify_all(self) -> Tuple[List[str], List[str]]:
         """
@@ -377,47 +521,115 @@ class BlobStore:
         Returns:
             Tuple of (valid_hashes, invalid_hashes)
         """
-        valid = []
-        invalid = []
-        
-        blobs_path = self.layout.blobs_path
-        if not blobs_path.exists():
-            return valid, invalid
-        
-        for prefix_dir in blobs_path.iterdir():
-            if not prefix_dir.is_dir():
+        report = self.verify_blobs()
+        return report.valid, report.invalid
+
+    def verify_blobs(
+        self,
+        hashes: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        force: bool = False,
+        progress: Optional[VerifyProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> VerifyReport:
+        """
+        Verify blobs concurrently.
+
+        Blobs whose (device, inode, size, mtime) are unchanged since their
+        last successful verification are reported valid without rehashing,
+        unless force is set. Missing blobs are reported invalid.
+
+        Args:
+            hashes: Blobs to verify (default: every blob in the store)
+            max_workers: Hashing threads (default DEFAULT_VERIFY_WORKERS)
+            force: Rehash everything, ignoring the hash ledger
+            progress: Per-blob progress callback, called from worker threads
+            cancel: Set to stop; blobs not finished are left out of the report
+
+        Returns:
+            VerifyReport with valid/invalid lists in input order
+        """
+        start = time.time()
+        report = VerifyReport()
+        if hashes is None:
+            hashes = self.list_blobs()
+
+        results: Dict[str, bool] = {}
+        to_hash: List[Tuple[str, Path, os.stat_result]] = []
+        for sha256 in hashes:
+            expected = sha256.lower()
+            path = self.blob_path(expected)
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                results[sha256] = False
                 continue
-            for blob_file in prefix_dir.iterdir():
-                # Skip .part (partial downloads) and .meta (manifests)
-                if blob_file.is_file() and not blob_file.suffix:
-                    expected = blob_file.name
-                    if self.verify(expected):
-                        valid.append(expected)
-                    else:
-                        invalid.append(expected)
-
-        return valid, invalid
+            if not force and self.hash_ledger.lookup(path, st) == expected:
+                results[sha256] = True
+                report.skipped.append(sha256)
+                continue
+            to_hash.append((sha256, path, st))
+
+        def hash_one(sha256: str, path: Path, st: os.stat_result) -> bool:
+            on_bytes = None
+            if progress is not None:
+                on_bytes = lambda done: progress(sha256, done, st.st_size)
+            actual = _hash_file(path, on_bytes=on_bytes, cancel=cancel)
+            if actual == sha256.lower():
+                self.hash_ledger.record(path, actual, st)
+                return True
+            self.hash_ledger.forget(path)
+            return False
+
+        if to_hash:
+            workers = max(1, min(max_workers or self.DEFAULT_VERIFY_WORKERS, len(to_hash)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(hash_one, sha256, path, st): (sha256, st.st_size)
+                    for sha256, path, st in to_hash
+                }
+                for future in as_completed(futures):
+                    sha256, size = futures[future]
+                    try:
+                        results[sha256] = future.result()
+                        report.bytes_hashed += size
+                    except (VerificationCancelled, CancelledError):
+                        report.cancelled = True
+                    except OSError as e:
+                        logger.warning("[BlobStore] Cannot read blob %s: %s", sha256[:12], e)
+                        results[sha256] = False
+                    if cancel is not None and cancel.is_set():
+                        report.cancelled = True
+                        for pending in futures:
+                            pending.cancel()
+
+        for sha256 in hashes:
+            if sha256 in results:
+                (report.valid if results[sha256] else report.invalid).append(sha256)
+
+        report.duration_ms = int((time.time() - start) * 1000)
+        return report
     
     # =========================================================================
     # Cleanup
     # =========================================================================
     
-    def list_blobs(self) -> List[str]:
-        """List all blob SHA256 hashes (excludes .part and .meta files)."""
-        blobs = []
-        blobs_path = self.layout.blobs_path
-        if not blobs_path.exists():
-            return blobs
+    def scan_blobs(self, max_age: float = 0.0) -> List[BlobEntry]:
+        """
+        Enumerate blobs, .part and .meta files in one scandir pass.
 
-        for prefix_dir in blobs_path.iterdir():
-            if not prefix_dir.is_dir():
-                continue
-            for blob_file in prefix_dir.iterdir():
-                # Skip .part (partial downloads) and .meta (manifests)
-                if blob_file.is_file() and not blob_file.suffix:
-                    blobs.append(blob_file.name)
+        Args:
+            max_age: Reuse a listing up to this many seconds old, unless a
+                blob was written or removed through the store since (0 = walk)
 
-        return blobs
+        Returns:
+            BlobEntry list (shared with other callers; treat as read-only)
+        """
+        return self._scan.entries(self.layout.blobs_path, max_age)
+
+    def list_blobs(self, max_age: float = 0.0) -> List[str]:
+        """List all blob SHA256 hashes (excludes .part and .meta files)."""
+        return [entry.sha256 for entry in self.scan_blobs(max_age) if entry.kind == BLOB]
     
     def remove_blob(self, sha256: str) -> bool:
         """
@@ -436,48 +648,35 @@ class BlobStore:
                 path.parent.rmdir()
             except OSError:
                 pass  # Directory not empty
+            self._notify(sha256)
             return True
         return False
     
     def clean_partial(self) -> int:
         """
-        Remove all partial downloads (.part files).
+        Remove all partial downloads (.part files and their .segments state).
+
+        Interrupted restores (<hash>.sync.part) are kept: the sync journal
+        resumes them.
         
         Returns:
-            Number of files removed
+            Number of .part files removed
         """
         count = 0
-        blobs_path = self.layout.blobs_path
-        if not blobs_path.exists():
-            return count
-        
-        for prefix_dir in blobs_path.iterdir():
-            if not prefix_dir.is_dir():
+        for entry in self.scan_blobs():
+            if entry.kind not in (PART, SEGMENTS) or entry.path.endswith(SYNC_PART_SUFFIX):
                 continue
-            for part_file in prefix_dir.glob("*.part"):
-                try:
-                    part_file.unlink()
-                    count += 1
-                except Exception:
-                    pass
-        
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                continue
+            if entry.kind == PART:
+                count += 1
         return count
     
-    def get_total_size(self) -> int:
+    def get_total_size(self, max_age: float = 0.0) -> int:
         """Get total size of all blobs in bytes."""
-        total = 0
-        blobs_path = self.layout.blobs_path
-        if not blobs_path.exists():
-            return total
-        
-        for prefix_dir in blobs_path.iterdir():
-            if not prefix_dir.is_dir():
-                continue
-            for blob_file in prefix_dir.iterdir():
-                if blob_file.is_file() and not blob_file.name.endswith(".part"):
-                    total += blob_file.stat().st_size
-        
-        return total
+        return sum(entry.size for entry in self.scan_blobs(max_age) if entry.kind == BLOB)
     
     # =========================================================================
     # Adopt Existing Files
@@ -504,7 +703,7 @@ class BlobStore:
             raise BlobStoreError(f"Source file not found: {source_path}")
         
         # Compute or use expected hash
-        sha256 = expected_sha256.lower() if expected_sha256 else compute_sha256(source_path)
+        sha256 = expected_sha256.lower() if expected_sha256 else self.hash_ledger.sha256(source_path)
         
         # Check if already in store
         blob_path = self.blob_path(sha256)
@@ -518,12 +717,14 @@ class BlobStore:
         if prefer_hardlink:
             try:
                 os.link(source_path, blob_path)
+                self._notify(sha256)
                 return sha256
             except OSError:
                 pass  # Fall through to copy
         
         # Fall back to copy
         shutil.copy2(source_path, blob_path)
+        self._notify(sha256)
         return sha256
 
     # =========================================================================
@@ -585,6 +786,7 @@ class BlobStore:
                 json.dump(manifest.model_dump(mode="json"), f, indent=2)
             temp_path.replace(path)
             logger.debug(f"[BlobStore] Created manifest for {sha256[:12]}")
+            self._notify(sha256)
             return True
         except Exception as e:
             logger.error(f"[BlobStore] Failed to write manifest {sha256[:12]}: {e}")
@@ -605,6 +807,7 @@ class BlobStore:
         if path.exists():
             try:
                 path.unlink()
+                self._notify(sha256)
                 return True
             except Exception as e:
                 logger.warning(f"[BlobStore] Failed to delete manifest {sha256[:12]}: {e}")
@@ -9,7 +9,9 @@ and metadata sync (previews, description, model info) via Civitai API.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, List, Optional
 
 from .models import (
     Pack,
@@ -30,11 +32,16 @@ class CivitaiUpdateProvider:
 
     Checks for new versions by calling the Civitai API and comparing
     the latest version_id against the currently locked version_id.
+
+    Safe to use from several threads: concurrent lookups of the same model
+    share one API call.
     """
 
     def __init__(self, civitai_client: Optional[Any] = None):
         self._civitai = civitai_client
         self._model_cache: Dict[int, Dict[str, Any]] = {}
+        self._inflight: Dict[int, Future] = {}
+        self._cache_lock = threading.Lock()
 
     @property
     def civitai(self):
@@ -46,16 +53,49 @@ class CivitaiUpdateProvider:
 
     def get_model_cached(self, model_id: int) -> Dict[str, Any]:
         """Fetch model data with per-session cache to avoid duplicate API calls."""
-        if model_id in self._model_cache:
-            logger.debug("[CivitaiUpdateProvider] Cache hit for model %d", model_id)
-            return self._model_cache[model_id]
-        data = self.civitai.get_model(model_id)
-        self._model_cache[model_id] = data
+        with self._cache_lock:
+            if model_id in self._model_cache:
+                logger.debug("[CivitaiUpdateProvider] Cache hit for model %d", model_id)
+                return self._model_cache[model_id]
+            pending = self._inflight.get(model_id)
+            if pending is None:
+                pending = self._inflight[model_id] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return pending.result()  # Another thread is fetching this model
+
+        try:
+            data = self.civitai.get_model(model_id)
+        except BaseException as e:
+            with self._cache_lock:
+                self._inflight.pop(model_id, None)
+            pending.set_exception(e)
+            raise
+        with self._cache_lock:
+            self._model_cache[model_id] = data
+            self._inflight.pop(model_id, None)
+        pending.set_result(data)
         return data
 
     def clear_cache(self) -> None:
         """Clear the model response cache (call before/after check-all sessions)."""
-        self._model_cache.clear()
+        with self._cache_lock:
+            self._model_cache.clear()
+
+    def revalidate(self) -> None:
+        """Have the next lookups confirm the client's cached model pages with Civitai."""
+        expire = getattr(self._civitai, "expire_cached_models", None)
+        if callable(expire):
+            expire()
+
+    def group_key(self, dep: PackDependency) -> Optional[Hashable]:
+        """Key under which dependencies share one API lookup (the model id)."""
+        if not dep.selector.civitai:
+            return None
+        return dep.selector.civitai.model_id
 
     # =========================================================================
     # UpdateProvider interface
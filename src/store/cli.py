@@ -830,17 +830,23 @@ def update_command(
 def doctor_command(
     rebuild_views: bool = typer.Option(False, "--rebuild-views", help="Force rebuild views"),
     verify_blobs: bool = typer.Option(True, "--verify-blobs/--no-verify-blobs", help="Verify blob integrity"),
+    rebuild_db: Optional[str] = typer.Option(None, "--rebuild-db", help="Rebuild SQLite index: auto|force"),
     json: bool = typer.Option(False, "--json", help="Output as JSON"),
 ):
     """Run diagnostics and repairs on the store."""
     store = get_store()
     require_initialized(store)
 
+    if rebuild_db is not None and rebuild_db not in ("auto", "force"):
+        output_error("--rebuild-db must be 'auto' or 'force'")
+        raise typer.Exit(1)
+
     try:
         if not json:
             console.print("[dim]Running diagnostics...[/dim]")
         report = store.doctor(
             rebuild_views=rebuild_views,
+            rebuild_db=rebuild_db,
             verify_blobs=verify_blobs,
         )
 
@@ -1320,6 +1326,7 @@ def inventory_impacts(
 def inventory_verify(
     all_blobs: bool = typer.Option(False, "--all", "-a", help="Verify all blobs"),
     sha256: Optional[str] = typer.Option(None, "--sha256", "-s", help="Verify specific blob"),
+    force: bool = typer.Option(False, "--force", "-f", help="Rehash blobs unchanged since their last verification"),
     json: bool = typer.Option(False, "--json", help="Output as JSON"),
 ):
     """Verify blob integrity (check hashes)."""
@@ -1342,10 +1349,11 @@ def inventory_verify(
         ) as progress:
             task = progress.add_task("Verifying blobs...", total=None)
 
+            # Unchanged blobs are skipped unless forced
             if sha256:
-                result = store.inventory_service.verify_blobs(sha256_list=[sha256])
+                result = store.inventory_service.verify_blobs(sha256_list=[sha256], force=force)
             else:
-                result = store.inventory_service.verify_blobs(all_blobs=True)
+                result = store.inventory_service.verify_blobs(all_blobs=True, force=force)
 
             progress.update(task, description="Done")
 
@@ -1356,6 +1364,11 @@ def inventory_verify(
 
             console.print(f"[bold]Verified:[/bold] {result['verified']} blob(s)")
             console.print(f"[bold]Duration:[/bold] {result['duration_ms']}ms")
+            if result.get("skipped"):
+                console.print(
+                    f"[dim]{result['skipped']} unchanged since last verification "
+                    "(use --force to rehash)[/dim]"
+                )
 
             valid_count = len(result['valid'])
             invalid_count = len(result['invalid'])
@@ -1861,16 +1874,22 @@ def backup_push(
 # =============================================================================
 
 @backup_app.command("state-status")
-def state_status():
+def state_status(
+    rescan: bool = typer.Option(
+        False,
+        "--rescan",
+        help="Rebuild the backup state manifest (if the backup was changed outside Synapse)"
+    ),
+):
     """
     Show sync status of the state/ directory.
 
-    Compares local state/ with backup state/ and shows differences.
+    Compares local state/ with backup state/ by content hash and shows differences.
     """
     store = get_store()
 
     with console.status("Analyzing state files..."):
-        result = store.backup_service.get_state_sync_status()
+        result = store.backup_service.get_state_sync_status(rescan=rescan)
 
     if result.errors:
         for err in result.errors:
@@ -1975,6 +1994,8 @@ def state_sync(
         console.print(f"[yellow]Backup only:[/yellow] {summary.backup_only}")
     if summary.modified > 0:
         console.print(f"[magenta]Modified:[/magenta] {summary.modified}")
+    if summary.conflicts > 0:
+        console.print(f"[red]Conflicts:[/red] {summary.conflicts}")
 
     if not dry_run:
         console.print(f"\n[green]✓ Synced {result.synced_files} file(s)[/green]")
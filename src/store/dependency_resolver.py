@@ -316,6 +316,9 @@ class UrlResolver:
 class LocalFileResolver:
     """Resolves local file dependencies (LOCAL_FILE strategy)."""
 
+    def __init__(self, hash_ledger: Any = None):
+        self._hash_ledger = hash_ledger
+
     def resolve(self, dep: PackDependency, **kwargs: Any) -> Optional[ResolvedArtifact]:
         if not dep.selector.local_path:
             return None
@@ -324,8 +327,11 @@ class LocalFileResolver:
         if not path.exists():
             return None
 
-        from .blob_store import compute_sha256
-        sha256 = compute_sha256(path)
+        if self._hash_ledger is not None:
+            sha256 = self._hash_ledger.sha256(path)
+        else:
+            from .blob_store import compute_sha256
+            sha256 = compute_sha256(path)
 
         return ResolvedArtifact(
             kind=dep.kind,
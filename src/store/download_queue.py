@@ -0,0 +1,615 @@
+"""
+Synapse Store v2 - Persistent Download Queue
+
+Queue-backed scheduler for blob downloads, persisted at
+data/registry/downloads.sqlite so queued and interrupted downloads survive
+an API restart and resume from their .part files.
+
+Scheduling rules:
+- at most max_concurrent downloads run at once, and at most max_per_host
+  against any single host
+- lower priority values run first (PRIORITY_USER before
+  PRIORITY_BACKGROUND), then submission order
+- a global bandwidth ceiling is applied by the DownloadService's
+  BandwidthLimiter, shared by every running transfer
+
+Jobs can be paused, resumed and cancelled. A running job is interrupted at
+its next progress tick; pausing keeps the .part file (and segment state),
+cancelling removes it.
+
+What happens after the blob is in the store is up to the caller: each job
+carries a kind, and the handler registered for that kind runs with the
+finished job (job.sha256 set, job.meta free for the handler's own fields).
+Handlers are looked up at completion time, so jobs restored after a restart
+finish the same way as the ones submitted in this process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .blob_store import BlobStore
+from .download_service import BandwidthLimiter
+from .download_service import DownloadError as TransferError
+from .download_service import segment_state_path
+from .layout import StoreError, StoreLayout
+
+logger = logging.getLogger(__name__)
+
+
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 10
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+PAUSED = "paused"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+TERMINAL_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    expected_sha256 TEXT,
+    priority INTEGER NOT NULL,
+    force INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    status TEXT NOT NULL,
+    sha256 TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+class DownloadQueueError(StoreError):
+    """Error in the download queue."""
+    pass
+
+
+class _Interrupted(TransferError):
+    """Raised from the progress callback to stop a running transfer."""
+    pass
+
+
+JobHandler = Callable[["DownloadJob"], None]
+JobListener = Callable[["DownloadJob"], None]
+
+
+@dataclass
+class DownloadJob:
+    """A queued blob download."""
+    job_id: str
+    url: str
+    expected_sha256: Optional[str] = None
+    priority: int = PRIORITY_USER
+    force: bool = False
+    kind: str = "blob"
+    meta: Dict[str, Any] = field(default_factory=dict)
+    status: str = QUEUED
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    seq: int = 0
+
+    # Live progress (not persisted)
+    downloaded_bytes: int = 0
+    total_bytes: int = 0
+    speed_bps: float = 0.0
+    eta_seconds: int = 0
+
+    # Requested interruption of a running job: "pause", "cancel" or "shutdown"
+    interrupt: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc.lower()
+
+    @property
+    def part_name(self) -> str:
+        """Stable .part name for downloads without a known hash."""
+        return f"download_{self.job_id}"
+
+    @property
+    def progress(self) -> float:
+        if self.status == COMPLETED:
+            return 100.0
+        if self.total_bytes > 0:
+            return self.downloaded_bytes / self.total_bytes * 100
+        return 0.0
+
+
+class DownloadScheduler:
+    """
+    Persistent, prioritized download queue with concurrency limits.
+
+    Nothing runs until start() is called; start() also restores the jobs
+    left queued or running by a previous process.
+    """
+
+    DEFAULT_MAX_CONCURRENT = 3
+    DEFAULT_MAX_PER_HOST = 2
+
+    def __init__(
+        self,
+        layout: StoreLayout,
+        blob_store: BlobStore,
+        bandwidth: Optional[BandwidthLimiter] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            layout: Store layout manager
+            blob_store: Blob store that performs the downloads
+            bandwidth: Limiter shared with the blob store's DownloadService
+            max_concurrent: Max downloads running at once
+            max_per_host: Max downloads running against one host
+        """
+        self.layout = layout
+        self.blob_store = blob_store
+        self.bandwidth = bandwidth
+        self.max_concurrent = max_concurrent
+        self.max_per_host = max_per_host
+
+        self._jobs: Dict[str, DownloadJob] = {}
+        self._handlers: Dict[str, JobHandler] = {}
+        self._listeners: List[JobListener] = []
+        self._cond = threading.Condition()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._stopping = False
+        self._seq = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    # =========================================================================
+    # Configuration
+    # =========================================================================
+
+    def register_handler(self, kind: str, handler: JobHandler) -> None:
+        """Set the completion handler for jobs of a kind (replaces any previous one)."""
+        self._handlers[kind] = handler
+
+    def add_listener(self, listener: JobListener) -> None:
+        """Call listener(job) on every status or progress change."""
+        self._listeners.append(listener)
+
+    def set_limits(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        bandwidth_bps: Optional[int] = None,
+    ) -> None:
+        """
+        Change scheduling limits; takes effect for the next dispatch.
+
+        Args:
+            max_concurrent: Max downloads running at once
+            max_per_host: Max downloads running against one host
+            bandwidth_bps: Global ceiling in bytes/s (0 = unlimited)
+        """
+        with self._cond:
+            if max_concurrent is not None:
+                self.max_concurrent = max(1, max_concurrent)
+            if max_per_host is not None:
+                self.max_per_host = max(1, max_per_host)
+            if bandwidth_bps is not None and self.bandwidth is not None:
+                self.bandwidth.rate = max(0, bandwidth_bps)
+            self._cond.notify_all()
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self.layout.download_queue_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _save(self, job: DownloadJob) -> None:
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO jobs
+                            (job_id, seq, url, expected_sha256, priority, force, kind,
+                             meta, status, sha256, error, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            job.job_id, job.seq, job.url, job.expected_sha256,
+                            job.priority, int(job.force), job.kind,
+                            json.dumps(job.meta), job.status, job.sha256, job.error,
+                            job.created_at, datetime.now(timezone.utc).isoformat(),
+                        ),
+                    )
+        except sqlite3.Error as e:
+            logger.warning("[DownloadQueue] Failed to persist job %s: %s", job.job_id, e)
+
+    def _delete(self, job_id: str) -> None:
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        except sqlite3.Error as e:
+            logger.warning("[DownloadQueue] Failed to delete job %s: %s", job_id, e)
+
+    def _restore(self) -> List[DownloadJob]:
+        """Load unfinished jobs and drop finished ones from the database."""
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        f"DELETE FROM jobs WHERE status IN ({','.join('?' * len(TERMINAL_STATUSES))})",
+                        TERMINAL_STATUSES,
+                    )
+                rows = conn.execute("SELECT * FROM jobs ORDER BY seq").fetchall()
+        except sqlite3.Error as e:
+            logger.warning("[DownloadQueue] Discarding unreadable queue: %s", e)
+            return []
+
+        jobs = []
+        for row in rows:
+            jobs.append(DownloadJob(
+                job_id=row["job_id"],
+                url=row["url"],
+                expected_sha256=row["expected_sha256"],
+                priority=row["priority"],
+                force=bool(row["force"]),
+                kind=row["kind"],
+                meta=json.loads(row["meta"]),
+                # A job that was running when the process stopped goes back
+                # in the queue; its .part file is still there
+                status=PAUSED if row["status"] == PAUSED else QUEUED,
+                created_at=row["created_at"],
+                seq=row["seq"],
+            ))
+        return jobs
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> List[DownloadJob]:
+        """
+        Restore persisted jobs and start dispatching (idempotent).
+
+        Returns:
+            Jobs restored from a previous run (empty if already started)
+        """
+        with self._cond:
+            if self._dispatcher is not None:
+                return []
+
+            restored = [j for j in self._restore() if j.job_id not in self._jobs]
+            for job in restored:
+                self._jobs[job.job_id] = job
+                self._save(job)
+            self._seq = max([j.seq for j in self._jobs.values()], default=0)
+
+            self._stopping = False
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="download-scheduler", daemon=True,
+            )
+            self._dispatcher.start()
+
+        if restored:
+            logger.info("[DownloadQueue] Restored %d download(s)", len(restored))
+        for job in restored:
+            self._notify(job)
+        return restored
+
+    def shutdown(self) -> None:
+        """
+        Stop dispatching and interrupt running downloads.
+
+        Interrupted downloads keep their .part files and are restored as
+        queued by the next start().
+        """
+        with self._cond:
+            self._stopping = True
+            for job in self._jobs.values():
+                if job.status == RUNNING:
+                    job.interrupt = "shutdown"
+            self._cond.notify_all()
+            dispatcher, self._dispatcher = self._dispatcher, None
+
+        if dispatcher is not None:
+            dispatcher.join(timeout=5)
+
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =========================================================================
+    # Queue Operations
+    # =========================================================================
+
+    def submit(
+        self,
+        url: str,
+        *,
+        expected_sha256: Optional[str] = None,
+        priority: int = PRIORITY_USER,
+        force: bool = False,
+        kind: str = "blob",
+        meta: Optional[Dict[str, Any]] = None,
+        job_id: Optional[str] = None,
+    ) -> DownloadJob:
+        """
+        Queue a download.
+
+        A download of a blob that is already queued or running (same
+        expected_sha256) is not queued twice: the existing job is returned,
+        moved up to the more urgent priority if it is still queued.
+
+        Args:
+            url: Download URL
+            expected_sha256: Expected hash (also makes the .part path stable)
+            priority: Lower runs first (PRIORITY_USER, PRIORITY_BACKGROUND)
+            force: Re-download even if the blob exists
+            kind: Completion handler to run (see register_handler)
+            meta: JSON-serializable data for the handler and UI
+            job_id: Explicit ID (default: random 8 hex chars)
+
+        Returns:
+            The queued job, or the existing job for the same blob
+        """
+        expected_sha256 = expected_sha256.lower() if expected_sha256 else None
+        with self._cond:
+            existing = self._active_job_for(expected_sha256)
+            if existing is not None:
+                if existing.status == QUEUED and priority < existing.priority:
+                    existing.priority = priority
+                    self._save(existing)
+                    self._cond.notify_all()
+                logger.info(
+                    "[DownloadQueue] %s already queued as %s: %s",
+                    expected_sha256[:12], existing.job_id, url[:100],
+                )
+                return existing
+
+            job_id = job_id or uuid.uuid4().hex[:8]
+            if job_id in self._jobs:
+                raise DownloadQueueError(f"Download already queued: {job_id}")
+            self._seq += 1
+            job = DownloadJob(
+                job_id=job_id,
+                url=url,
+                expected_sha256=expected_sha256,
+                priority=priority,
+                force=force,
+                kind=kind,
+                meta=dict(meta or {}),
+                seq=self._seq,
+            )
+            self._jobs[job_id] = job
+            self._save(job)
+            self._cond.notify_all()
+
+        logger.info("[DownloadQueue] Queued %s (priority=%d): %s", job_id, priority, url[:100])
+        self._notify(job)
+        return job
+
+    def _active_job_for(self, sha256: Optional[str]) -> Optional[DownloadJob]:
+        """Queued or running job for a blob (caller holds _cond)."""
+        if sha256 is None:
+            return None
+        for job in self._jobs.values():
+            if job.expected_sha256 == sha256 and job.status in (QUEUED, RUNNING):
+                return job
+        return None
+
+    def get(self, job_id: str) -> Optional[DownloadJob]:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> List[DownloadJob]:
+        """All known jobs in submission order."""
+        with self._cond:
+            return sorted(self._jobs.values(), key=lambda j: j.seq)
+
+    def pause(self, job_id: str) -> bool:
+        """Pause a queued or running job. Returns False if it can't be paused."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            if job.status == QUEUED:
+                job.status = PAUSED
+                self._save(job)
+            elif job.status == RUNNING:
+                job.interrupt = "pause"
+                return True
+            else:
+                return job.status == PAUSED
+        self._notify(job)
+        return True
+
+    def resume(self, job_id: str) -> bool:
+        """Re-queue a paused (or failed) job. Returns False if it can't be resumed."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in (PAUSED, FAILED):
+                return False
+            job.status = QUEUED
+            job.error = None
+            self._save(job)
+            self._cond.notify_all()
+        self._notify(job)
+        return True
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job and discard its partial download. Returns False if unknown."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            if job.status == RUNNING:
+                job.interrupt = "cancel"
+                return True
+            if job.status in TERMINAL_STATUSES:
+                return True
+            job.status = CANCELLED
+            self._save(job)
+        self._discard_part(job)
+        self._notify(job)
+        return True
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job from memory and the database."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in TERMINAL_STATUSES:
+                return
+            del self._jobs[job_id]
+        self._delete(job_id)
+
+    # =========================================================================
+    # Dispatching
+    # =========================================================================
+
+    def _runnable(self) -> List[DownloadJob]:
+        """Queued jobs that fit the current limits, best first. Caller holds _cond."""
+        running = [j for j in self._jobs.values() if j.status == RUNNING]
+        slots = self.max_concurrent - len(running)
+        per_host = Counter(j.host for j in running)
+
+        ready = []
+        queued = sorted(
+            (j for j in self._jobs.values() if j.status == QUEUED),
+            key=lambda j: (j.priority, j.seq),
+        )
+        for job in queued:
+            if slots <= 0:
+                break
+            if per_host[job.host] >= self.max_per_host:
+                continue
+            ready.append(job)
+            per_host[job.host] += 1
+            slots -= 1
+        return ready
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                ready = self._runnable()
+                while not self._stopping and not ready:
+                    self._cond.wait()
+                    ready = self._runnable()
+                if self._stopping:
+                    return
+                for job in ready:
+                    job.status = RUNNING
+                    job.interrupt = None
+                    self._save(job)
+
+            for job in ready:
+                self._notify(job)
+                threading.Thread(
+                    target=self._run, args=(job,), name=f"download-{job.job_id}", daemon=True,
+                ).start()
+
+    def _run(self, job: DownloadJob) -> None:
+        """Download one job and run its completion handler."""
+        started = last_tick = time.monotonic()
+        last_bytes = 0
+
+        def progress(downloaded: int, total: int) -> None:
+            nonlocal last_tick, last_bytes
+            if job.interrupt:
+                raise _Interrupted(f"Download {job.interrupt}")
+
+            job.downloaded_bytes = downloaded
+            job.total_bytes = total
+            now = time.monotonic()
+            if now - last_tick > 0.5:
+                job.speed_bps = (downloaded - last_bytes) / (now - last_tick)
+                job.eta_seconds = (
+                    int((total - downloaded) / job.speed_bps) if job.speed_bps > 0 and total else 0
+                )
+                last_tick, last_bytes = now, downloaded
+            self._notify(job)
+
+        try:
+            job.sha256 = self.blob_store.download(
+                job.url,
+                expected_sha256=job.expected_sha256,
+                progress_callback=progress,
+                force=job.force,
+                part_name=job.part_name,
+            )
+            handler = self._handlers.get(job.kind)
+            if handler is not None:
+                handler(job)
+            status, error = COMPLETED, None
+            logger.info(
+                "[DownloadQueue] Completed %s in %.1fs: %s",
+                job.job_id, time.monotonic() - started, job.sha256[:16],
+            )
+        except Exception as e:
+            reason = job.interrupt
+            if reason == "pause":
+                status, error = PAUSED, None
+            elif reason == "cancel":
+                status, error = CANCELLED, None
+                self._discard_part(job)
+            elif reason == "shutdown":
+                status, error = QUEUED, None
+            else:
+                status, error = FAILED, str(e)
+                logger.error("[DownloadQueue] Failed %s: %s", job.job_id, e)
+
+        with self._cond:
+            job.status = status
+            job.error = error
+            job.interrupt = None
+            job.speed_bps = 0.0
+            job.eta_seconds = 0
+            if not self._stopping or status != QUEUED:
+                self._save(job)
+            self._cond.notify_all()
+        self._notify(job)
+
+    def _discard_part(self, job: DownloadJob) -> None:
+        part = self.blob_store.part_path(job.expected_sha256, job.part_name)
+        part.unlink(missing_ok=True)
+        segment_state_path(part).unlink(missing_ok=True)
+
+    def _notify(self, job: DownloadJob) -> None:
+        for listener in self._listeners:
+            try:
+                listener(job)
+            except Exception as e:
+                logger.warning("[DownloadQueue] Listener failed for %s: %s", job.job_id, e)
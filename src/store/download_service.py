@@ -3,8 +3,11 @@ Synapse Store v2 - Centralized Download Service
 
 Provides a single, reusable HTTP download implementation with:
 - Auth provider matching and header injection
-- Per-request sessions (thread-safe for concurrent downloads)
+- Pooled keep-alive connections via a shared HttpPool, or per-request
+  sessions when no pool is given (thread-safe for concurrent downloads)
 - Resume via Range headers and .part files
+- Optional segmented mode: N parallel byte ranges with per-segment resume
+- Optional global bandwidth ceiling shared by all transfers
 - SHA256 streaming verification
 - HTML content-type error detection
 - Split timeout (connect, read)
@@ -17,7 +20,12 @@ download implementations across the codebase.
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, List, Optional
@@ -25,13 +33,19 @@ from typing import Callable, List, Optional
 import requests
 
 from .download_auth import DownloadAuthProvider
+from .hash_ledger import HashLedger
+from .http_pool import USER_AGENT, HttpPool
 
 logger = logging.getLogger(__name__)
 
 # Progress callback type: (downloaded_bytes, total_bytes)
 ProgressCallback = Callable[[int, int], None]
 
-USER_AGENT = "Mozilla/5.0 (compatible; Synapse/2.0)"
+# Segmented downloads: smallest range worth its own connection, read size
+# per connection, and how often (bytes per segment) the state file is saved
+MIN_SEGMENT_SIZE = 64 * 1024 * 1024
+SEGMENT_CHUNK_SIZE = 1024 * 1024
+SEGMENT_STATE_INTERVAL = 32 * 1024 * 1024
 
 
 @dataclass
@@ -47,19 +61,106 @@ class DownloadError(Exception):
     pass
 
 
+class _RangeIgnoredError(DownloadError):
+    """A segment request got the whole file (200) instead of its range (206)."""
+
+
+@dataclass
+class _Segment:
+    """One byte range of a segmented download (end is inclusive)."""
+    start: int
+    end: int
+    done: int = 0
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def complete(self) -> bool:
+        return self.done >= self.length
+
+
+class BandwidthLimiter:
+    """
+    Token bucket shared by every transfer of a DownloadService.
+
+    Each written chunk takes its size in tokens; when the bucket runs dry
+    the writing thread sleeps until the tokens are refilled. rate is in
+    bytes per second and can be changed at any time; 0 means unlimited.
+    """
+
+    def __init__(self, rate: int = 0):
+        self.rate = rate
+        self._tokens = 0.0
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, nbytes: int) -> None:
+        """Account for nbytes, sleeping as long as needed to honour the rate."""
+        rate = self.rate
+        if rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            # Bucket holds at most one second of burst
+            self._tokens = min(rate, self._tokens + (now - self._stamp) * rate)
+            self._stamp = now
+            self._tokens -= nbytes
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def segment_state_path(dest: Path) -> Path:
+    """Sidecar file holding per-segment progress for a segmented download."""
+    return dest.with_name(dest.name + ".segments")
+
+
 class DownloadService:
     """Centralized HTTP download with auth, resume, hashing, progress.
 
-    Thread-safe: creates a new requests.Session per download call.
+    Thread-safe: with an HttpPool, all calls share the pool's session and its
+    keep-alive connections; without one, each call creates and closes its
+    own requests.Session.
+
+    With segments > 1, large files served with ``Accept-Ranges: bytes`` are
+    split into byte ranges fetched over parallel connections (see
+    download_to_file). Everything else uses a single stream.
     """
 
+    DEFAULT_SEGMENTS = 4
+
     def __init__(
         self,
         auth_providers: Optional[List[DownloadAuthProvider]] = None,
         chunk_size: int = 8192,
+        hash_ledger: Optional[HashLedger] = None,
+        segments: int = 1,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+        http_pool: Optional[HttpPool] = None,
+        bandwidth_limiter: Optional[BandwidthLimiter] = None,
     ):
         self._auth_providers = auth_providers or []
+        self.http_pool = http_pool
+        self.bandwidth_limiter = bandwidth_limiter
         self.chunk_size = chunk_size
+        self._hash_ledger = hash_ledger
+        self.segments = max(1, segments)
+        self.min_segment_size = min_segment_size
+
+    def _open_session(self) -> requests.Session:
+        """Get a session: the pool's shared one, or a fresh per-request one."""
+        if self.http_pool is not None:
+            return self.http_pool.session()
+        session = requests.Session()
+        session.headers.update({"User-Agent": USER_AGENT})
+        return session
+
+    def _release_session(self, session: requests.Session) -> None:
+        """Close per-request sessions; pooled connections stay alive."""
+        if self.http_pool is None:
+            session.close()
 
     def _prepare_auth(self, url: str):
         """Match auth provider for URL and return (download_url, headers, matched_provider)."""
@@ -100,9 +201,21 @@ class DownloadService:
         timeout: tuple[int, int] = (15, 60),
         chunk_size: Optional[int] = None,
         resume: bool = True,
+        segments: Optional[int] = None,
     ) -> DownloadResult:
         """Download URL to file with auth injection, resume, hash verify.
 
+        When more than one segment is allowed, the first response doubles as
+        the range probe: if it advertises ``Accept-Ranges: bytes`` with a
+        known length of at least two minimum segments, dest is preallocated,
+        the first connection keeps the leading range and the remaining ranges
+        are fetched in parallel. Per-segment progress is saved next to dest
+        (see segment_state_path) so an interrupted download resumes each
+        range where it stopped. The hash is still computed in file order, as
+        the contiguous downloaded prefix grows. If the server answers a range
+        request with the whole file, the partial download is discarded and
+        fetched again as a single stream.
+
         Args:
             url: HTTP/HTTPS URL to download
             dest: Destination file path (downloads directly, no .part management)
@@ -111,6 +224,7 @@ class DownloadService:
             timeout: (connect_timeout, read_timeout) in seconds
             chunk_size: Override default chunk size
             resume: If True, resume partial downloads via Range header
+            segments: Max parallel connections (default: the service setting)
 
         Returns:
             DownloadResult with sha256 hash and size
@@ -140,15 +254,31 @@ class DownloadService:
                     type(matched_auth).__name__ if matched_auth else "NONE",
                 )
 
-        # Per-request session for thread safety
-        session = requests.Session()
-        session.headers.update({"User-Agent": USER_AGENT})
+        session = self._open_session()
+        response = None
 
         try:
             headers = {**auth_headers}
             mode = "wb"
             initial_size = 0
 
+            # An interrupted segmented download resumes segment by segment,
+            # whatever the current segment setting
+            if resume:
+                state = self._load_segment_state(dest, url)
+                if state is not None:
+                    total_size, parts = state
+                    return self._download_segments(
+                        url, download_url, auth_headers, dest, parts, total_size,
+                        first_response=None,
+                        expected_sha256=expected_sha256,
+                        progress_callback=progress_callback,
+                        timeout=timeout,
+                        chunk=chunk,
+                    )
+            else:
+                segment_state_path(dest).unlink(missing_ok=True)
+
             if resume and dest.exists():
                 initial_size = dest.stat().st_size
                 headers["Range"] = f"bytes={initial_size}-"
@@ -164,7 +294,10 @@ class DownloadService:
             # Handle range response — file already fully downloaded
             if response.status_code == 416:  # Range not satisfiable
                 if dest.exists():
-                    actual = self._compute_sha256(dest, chunk)
+                    if self._hash_ledger is not None:
+                        actual = self._hash_ledger.sha256(dest)
+                    else:
+                        actual = self._compute_sha256(dest, chunk)
                     if expected_sha256 and actual != expected_sha256.lower():
                         dest.unlink(missing_ok=True)
                         raise DownloadError(
@@ -193,6 +326,25 @@ class DownloadService:
             total_size = int(content_length) + initial_size if content_length else 0
             downloaded = initial_size
 
+            parts = self._plan_segments(
+                response, initial_size, total_size,
+                segments if segments is not None else self.segments,
+            )
+            if parts:
+                # Ranges are fetched from where the redirects ended; auth
+                # headers only go back to the host they were meant for
+                segment_url = response.url or download_url
+                return self._download_segments(
+                    url, segment_url,
+                    auth_headers if segment_url == download_url else {},
+                    dest, parts, total_size,
+                    first_response=response,
+                    expected_sha256=expected_sha256,
+                    progress_callback=progress_callback,
+                    timeout=timeout,
+                    chunk=chunk,
+                )
+
             # Stream with hashing
             sha256 = hashlib.sha256()
 
@@ -209,6 +361,8 @@ class DownloadService:
                     if data:
                         f.write(data)
                         sha256.update(data)
+                        if self.bandwidth_limiter is not None:
+                            self.bandwidth_limiter.consume(len(data))
                         downloaded += len(data)
                         if progress_callback:
                             progress_callback(downloaded, total_size)
@@ -221,6 +375,11 @@ class DownloadService:
                     f"Hash mismatch for {url}: expected {expected_sha256}, got {actual_sha256}"
                 )
 
+            # The file was hashed while writing; remember it so the rename
+            # into the blob store and later verifies don't read it again
+            if self._hash_ledger is not None:
+                self._hash_ledger.record(dest, actual_sha256)
+
             return DownloadResult(
                 sha256=actual_sha256,
                 size=downloaded,
@@ -230,13 +389,277 @@ class DownloadService:
         except requests.RequestException as e:
             # Don't delete file on network errors - allow resume
             raise DownloadError(f"Download failed for {url}: {e}") from e
+        except _RangeIgnoredError as e:
+            # Segments were dropped with the partial file; fetch it whole
+            logger.warning("[DownloadService] %s; retrying as a single stream", e)
         except DownloadError:
             raise
         except Exception:
             dest.unlink(missing_ok=True)
             raise
         finally:
-            session.close()
+            # Hand an unread connection back to the pool
+            if response is not None:
+                response.close()
+            self._release_session(session)
+
+        return self.download_to_file(
+            url, dest,
+            expected_sha256=expected_sha256,
+            progress_callback=progress_callback,
+            timeout=timeout,
+            chunk_size=chunk_size,
+            resume=False,
+            segments=1,
+        )
+
+    # =========================================================================
+    # Segmented Downloads
+    # =========================================================================
+
+    def _plan_segments(
+        self,
+        response: requests.Response,
+        initial_size: int,
+        total_size: int,
+        segments: int,
+    ) -> List[_Segment]:
+        """Split a fresh download into byte ranges, or return [] for single-stream."""
+        if segments < 2 or initial_size > 0 or response.status_code != 200:
+            return []
+        if str(response.headers.get("accept-ranges", "")).lower() != "bytes":
+            return []
+        # Ranges address encoded bytes, which iter_content would decode
+        if str(response.headers.get("content-encoding", "identity")).lower() != "identity":
+            return []
+
+        count = min(segments, total_size // max(1, self.min_segment_size))
+        if count < 2:
+            return []
+
+        size = math.ceil(total_size / count)
+        return [
+            _Segment(start, min(start + size, total_size) - 1)
+            for start in range(0, total_size, size)
+        ]
+
+    def _load_segment_state(self, dest: Path, url: str) -> Optional[tuple[int, List[_Segment]]]:
+        """Load saved segment progress; discard it (and dest) if it doesn't match."""
+        state_path = segment_state_path(dest)
+        if not state_path.exists():
+            return None
+
+        try:
+            data = json.loads(state_path.read_text())
+            total_size = int(data["size"])
+            parts = [_Segment(int(a), int(b), int(done)) for a, b, done in data["segments"]]
+            if data.get("url") == url and dest.exists() and dest.stat().st_size == total_size:
+                return total_size, parts
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("[DownloadService] Unreadable segment state %s: %s", state_path, e)
+
+        # dest is a preallocated file of unknown content; start over
+        logger.info("[DownloadService] Discarding stale segment state for %s", dest)
+        state_path.unlink(missing_ok=True)
+        dest.unlink(missing_ok=True)
+        return None
+
+    @staticmethod
+    def _save_segment_state(dest: Path, url: str, total_size: int, snapshot: list) -> None:
+        """Atomically write segment progress next to dest."""
+        state_path = segment_state_path(dest)
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"url": url, "size": total_size, "segments": snapshot}))
+        tmp_path.replace(state_path)
+
+    def _download_segments(
+        self,
+        url: str,
+        segment_url: str,
+        headers: dict[str, str],
+        dest: Path,
+        parts: List[_Segment],
+        total_size: int,
+        *,
+        first_response: Optional[requests.Response],
+        expected_sha256: Optional[str],
+        progress_callback: Optional[ProgressCallback],
+        timeout: tuple[int, int],
+        chunk: int,
+    ) -> DownloadResult:
+        """Fetch the incomplete segments in parallel and hash the file in order.
+
+        first_response, when given, is a fresh 200 response whose body is
+        consumed for the first segment only.
+        """
+        resumed = first_response is None
+        chunk = max(chunk, SEGMENT_CHUNK_SIZE)
+        state_path = segment_state_path(dest)
+
+        if not resumed:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with open(dest, "wb") as f:
+                f.truncate(total_size)
+            self._save_segment_state(dest, url, total_size, [[p.start, p.end, p.done] for p in parts])
+
+        logger.info(
+            "[DownloadService] Segmented download: %d segments, %d bytes, resumed=%s, url=%s",
+            len(parts), total_size, resumed, url[:100],
+        )
+
+        cond = threading.Condition()
+        abort = threading.Event()
+        pending = [p for p in parts if not p.complete]
+        running = [len(pending)]
+
+        def fetch(part: _Segment, response: Optional[requests.Response]) -> None:
+            session = None
+            try:
+                if response is None:
+                    session = self._open_session()
+                    response = session.get(
+                        segment_url,
+                        headers={**headers, "Range": f"bytes={part.start + part.done}-{part.end}"},
+                        stream=True,
+                        timeout=timeout,
+                    )
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise _RangeIgnoredError(
+                            f"Server ignored Range request for {url} (HTTP {response.status_code})"
+                        )
+
+                with open(dest, "r+b") as f:
+                    f.seek(part.start + part.done)
+                    for data in response.iter_content(chunk_size=chunk):
+                        if abort.is_set():
+                            return
+                        if not data:
+                            continue
+                        data = data[: part.length - part.done]
+                        f.write(data)
+                        f.flush()
+                        if self.bandwidth_limiter is not None:
+                            self.bandwidth_limiter.consume(len(data))
+                        with cond:
+                            part.done += len(data)
+                            cond.notify_all()
+                        if part.complete:
+                            break
+
+                if not part.complete:
+                    raise DownloadError(
+                        f"Connection closed early for {url} "
+                        f"(segment {part.start}-{part.end}, {part.done}/{part.length} bytes)"
+                    )
+            except BaseException:
+                abort.set()
+                raise
+            finally:
+                if response is not None:
+                    response.close()
+                if session is not None:
+                    self._release_session(session)
+                with cond:
+                    running[0] -= 1
+                    cond.notify_all()
+
+        def progress() -> tuple[int, int, list]:
+            # (contiguous end, downloaded bytes, state snapshot); caller holds cond
+            contiguous = total_size
+            for p in parts:
+                if not p.complete:
+                    contiguous = p.start + p.done
+                    break
+            return (
+                contiguous,
+                sum(p.done for p in parts),
+                [[p.start, p.end, p.done] for p in parts],
+            )
+
+        sha256 = hashlib.sha256()
+        hashed = 0
+        with cond:
+            _, reported, _ = progress()
+        last_saved = reported
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, len(pending)), thread_name_prefix="segment",
+            ) as executor:
+                futures = [
+                    executor.submit(fetch, p, first_response if p is parts[0] else None)
+                    for p in pending
+                ]
+
+                try:
+                    # Unbuffered: read-ahead would cache not-yet-written zeros
+                    with open(dest, "rb", buffering=0) as reader:
+                        while True:
+                            with cond:
+                                cond.wait_for(
+                                    lambda hashed=hashed, reported=reported: (
+                                        running[0] == 0
+                                        or progress()[0] > hashed
+                                        or progress()[1] != reported
+                                    ),
+                                    timeout=1.0,
+                                )
+                                contiguous, downloaded, snapshot = progress()
+                                finished = running[0] == 0
+
+                            if progress_callback and downloaded != reported:
+                                progress_callback(downloaded, total_size)
+                            reported = downloaded
+
+                            if downloaded - last_saved >= SEGMENT_STATE_INTERVAL:
+                                self._save_segment_state(dest, url, total_size, snapshot)
+                                last_saved = downloaded
+
+                            # Hash the newly contiguous prefix (still in page cache)
+                            reader.seek(hashed)
+                            while hashed < contiguous:
+                                data = reader.read(min(chunk, contiguous - hashed))
+                                if not data:
+                                    break
+                                sha256.update(data)
+                                hashed += len(data)
+
+                            if finished:
+                                break
+                finally:
+                    abort.set()
+
+            errors = [f.exception() for f in futures if f.exception() is not None]
+            if errors:
+                raise errors[0]
+        except _RangeIgnoredError:
+            # The saved ranges can never be fetched; don't leave them to resume
+            state_path.unlink(missing_ok=True)
+            dest.unlink(missing_ok=True)
+            raise
+        except (requests.RequestException, DownloadError):
+            # Keep dest and the state file so the next attempt resumes
+            with cond:
+                self._save_segment_state(dest, url, total_size, progress()[2])
+            raise
+        except BaseException:
+            state_path.unlink(missing_ok=True)
+            raise
+
+        actual_sha256 = sha256.hexdigest().lower()
+        state_path.unlink(missing_ok=True)
+
+        if expected_sha256 and actual_sha256 != expected_sha256.lower():
+            dest.unlink(missing_ok=True)
+            raise DownloadError(
+                f"Hash mismatch for {url}: expected {expected_sha256}, got {actual_sha256}"
+            )
+
+        if self._hash_ledger is not None:
+            self._hash_ledger.record(dest, actual_sha256)
+
+        return DownloadResult(sha256=actual_sha256, size=total_size, resumed=resumed)
 
     def download_to_bytes(
         self,
@@ -264,8 +687,7 @@ class DownloadService:
                 "token=" in download_url, url[:100],
             )
 
-        session = requests.Session()
-        session.headers.update({"User-Agent": USER_AGENT})
+        session = self._open_session()
 
         try:
             response = session.get(
@@ -294,7 +716,7 @@ class DownloadService:
         except requests.RequestException as e:
             raise DownloadError(f"Download failed for {url}: {e}") from e
         finally:
-            session.close()
+            self._release_session(session)
 
     @staticmethod
     def _compute_sha256(path: Path, chunk_size: int = 8192) -> str:
@@ -0,0 +1,226 @@
+"""
+Synapse Store v2 - File Copy
+
+Large-file copy used by backup sync and restore.
+
+Two paths, picked per call:
+
+- Plain copy (no hash wanted): the data never enters Python. The kernel is
+  asked to copy with os.copy_file_range (which also reflinks on filesystems
+  that support it), then os.sendfile, then a readinto/write loop as the last
+  resort when neither is available for the pair of files.
+- Hashing copy: every chunk is read once into a reusable buffer, fed to
+  sha256 and written out, so verification needs no second read of the copy.
+  hashlib and os.write release the GIL, so several copies run in parallel.
+
+With resume=True an existing dst is treated as a prefix of src (a .part
+left by an interrupted copy) and only the remainder is copied; the hashing
+copy reads the prefix back once to seed the hash.
+
+    bytes_copied = copy_file(src, dst)
+    bytes_copied, sha256 = copy_file_hashed(src, dst, on_bytes=progress, resume=True)
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Chunk per kernel copy call / buffer size for the hashing copy. Large reads
+# keep external drives streaming; progress is reported once per chunk.
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+# errnos meaning "this kernel copy path is not available here, try the next"
+_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EBADF,
+    errno.EPERM,
+}
+
+# Called with the cumulative number of bytes copied
+BytesCallback = Callable[[int], None]
+
+
+def _advise_sequential(fd: int) -> None:
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _resume_offset(src_size: int, dst: Path, resume: bool) -> int:
+    """Bytes of dst that can be kept (0 unless resuming a shorter or equal dst)."""
+    if not resume:
+        return 0
+    try:
+        dst_size = os.stat(dst).st_size
+    except FileNotFoundError:
+        return 0
+    return dst_size if dst_size <= src_size else 0
+
+
+def _kernel_copy(
+    copy_chunk: Callable[[int, int], int],
+    start: int,
+    size: int,
+    on_bytes: Optional[BytesCallback],
+) -> Optional[int]:
+    """
+    Drive a kernel copy primitive from start until size bytes are in place.
+
+    Args:
+        copy_chunk: (offset, count) -> bytes copied (0 at EOF)
+        start: Offset to start at (same in source and destination)
+        size: Source size at open time
+        on_bytes: Progress callback
+
+    Returns:
+        Final offset, or None if the primitive is unsupported (nothing copied)
+    """
+    done = start
+    while done < size:
+        try:
+            n = copy_chunk(done, min(COPY_CHUNK_SIZE, size - done))
+        except OSError as e:
+            if done == start and e.errno in _FALLBACK_ERRNOS:
+                return None
+            raise
+        if n == 0:
+            break  # Source shrank while copying
+        done += n
+        if on_bytes is not None:
+            on_bytes(done)
+    return done
+
+
+def _open_dst(dst: Path, start: int):
+    """Open dst for writing at start, truncating anything past it."""
+    fdst = open(dst, "r+b" if start else "wb", buffering=0)
+    if start:
+        fdst.truncate(start)
+        fdst.seek(start)
+    return fdst
+
+
+def copy_file(
+    src: Path,
+    dst: Path,
+    on_bytes: Optional[BytesCallback] = None,
+    resume: bool = False,
+) -> int:
+    """
+    Copy src to dst using the fastest available path.
+
+    Args:
+        src: Source file
+        dst: Destination file (created, truncated, or extended when resuming)
+        on_bytes: Called with the cumulative number of bytes in dst
+        resume: Keep an existing dst prefix and copy only the rest
+
+    Returns:
+        Size of dst after the copy
+    """
+    with open(src, "rb", buffering=0) as fsrc:
+        infd = fsrc.fileno()
+        size = os.fstat(infd).st_size
+        start = _resume_offset(size, dst, resume)
+        _advise_sequential(infd)
+
+        with _open_dst(dst, start) as fdst:
+            outfd = fdst.fileno()
+            if size > start and hasattr(os, "copy_file_range"):
+                done = _kernel_copy(
+                    lambda offset, count: os.copy_file_range(infd, outfd, count, offset, offset),
+                    start, size, on_bytes,
+                )
+                if done is not None:
+                    return done
+
+            if size > start and hasattr(os, "sendfile"):
+                done = _kernel_copy(
+                    lambda offset, count: os.sendfile(outfd, infd, offset, count),
+                    start, size, on_bytes,
+                )
+                if done is not None:
+                    return done
+
+            fsrc.seek(start)
+            fdst.seek(start)
+            return _buffered_copy(fsrc, fdst, None, on_bytes, start)
+
+
+def copy_file_hashed(
+    src: Path,
+    dst: Path,
+    on_bytes: Optional[BytesCallback] = None,
+    resume: bool = False,
+) -> Tuple[int, str]:
+    """
+    Copy src to dst, computing the sha256 of dst's bytes in the same pass.
+
+    Args:
+        src: Source file
+        dst: Destination file (created, truncated, or extended when resuming)
+        on_bytes: Called with the cumulative number of bytes in dst
+        resume: Keep an existing dst prefix and copy only the rest
+
+    Returns:
+        (size of dst, lowercase sha256 hex digest of dst)
+    """
+    hasher = hashlib.sha256()
+    with open(src, "rb", buffering=0) as fsrc:
+        start = _resume_offset(os.fstat(fsrc.fileno()).st_size, dst, resume)
+        if start:
+            with open(dst, "rb", buffering=0) as fprefix:
+                _hash_prefix(fprefix, hasher, start)
+            fsrc.seek(start)
+        _advise_sequential(fsrc.fileno())
+        with _open_dst(dst, start) as fdst:
+            done = _buffered_copy(fsrc, fdst, hasher, on_bytes, start)
+    return done, hasher.hexdigest().lower()
+
+
+def _hash_prefix(f, hasher, length: int) -> None:
+    """Feed the first length bytes of f to hasher."""
+    buffer = bytearray(COPY_CHUNK_SIZE)
+    view = memoryview(buffer)
+    remaining = length
+    while remaining:
+        n = f.readinto(view[:min(COPY_CHUNK_SIZE, remaining)])
+        if not n:
+            break
+        hasher.update(view[:n])
+        remaining -= n
+
+
+def _buffered_copy(fsrc, fdst, hasher, on_bytes: Optional[BytesCallback], start: int = 0) -> int:
+    """readinto/write loop over one reusable buffer, optionally hashing."""
+    buffer = bytearray(COPY_CHUNK_SIZE)
+    view = memoryview(buffer)
+    done = start
+    while True:
+        n = fsrc.readinto(buffer)
+        if not n:
+            break
+        chunk = view[:n]
+        if hasher is not None:
+            hasher.update(chunk)
+        written = 0
+        while written < n:
+            written += fdst.write(chunk[written:])
+        done += n
+        if on_bytes is not None:
+            on_bytes(done)
+    return done
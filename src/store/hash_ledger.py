@@ -0,0 +1,223 @@
+"""
+Synapse Store v2 - Verified-Hash Ledger
+
+Remembers which files have already been hashed, stored at
+data/registry/hashes.sqlite:
+
+    (device, inode) -> (size, mtime_ns) -> sha256, verified_at
+
+Entries are keyed by inode rather than path, so a hash recorded for a
+download's .part file still applies after it is renamed into the blob
+store, and a hash recorded for an adopted file applies to its hardlink.
+
+A lookup only hits when the file's current size and mtime still match the
+recorded ones, so any rewrite, truncation or replacement of the file forces
+a rehash. Callers take the stat *before* hashing and record with that stat:
+if the file changes while it is being hashed, the recorded fingerprint is
+already stale and the next lookup misses.
+
+Use HashLedger.sha256() instead of compute_sha256() wherever a file's hash
+is needed; pass force=True where a fresh read from disk is the point.
+
+The ledger is a pure cache. Any database error is logged and treated as a
+miss; it never fails the operation that consulted it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from .layout import StoreLayout
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    path TEXT,
+    verified_at TEXT NOT NULL,
+    PRIMARY KEY (device, inode)
+);
+"""
+
+
+class HashLedger:
+    """
+    Persistent (device, inode, size, mtime_ns) -> sha256 table.
+
+    A single connection is shared across threads and serialized by a lock;
+    the database is opened lazily on first use.
+    """
+
+    def __init__(self, layout: StoreLayout):
+        """
+        Initialize ledger.
+
+        Args:
+            layout: Store layout manager
+        """
+        self.layout = layout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self.layout.hash_ledger_path
+
+    # =========================================================================
+    # Connection Management
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database (once)."""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            # Corrupt ledger: it's only a cache, so start over
+            logger.warning("[HashLedger] Discarding unreadable ledger %s: %s", self.db_path, e)
+            for suffix in ("", "-wal", "-shm"):
+                Path(str(self.db_path) + suffix).unlink(missing_ok=True)
+            conn = self._open()
+
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS hashes")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =========================================================================
+    # Lookup / Record
+    # =========================================================================
+
+    def lookup(self, path: Path, st: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Return the recorded sha256 for a file if it is unchanged.
+
+        Args:
+            path: File path
+            st: Current stat of the file (taken now if not given)
+
+        Returns:
+            Lowercase sha256, or None if unknown or the file changed
+        """
+        try:
+            if st is None:
+                st = os.stat(path)
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT size, mtime_ns, sha256 FROM hashes WHERE device = ? AND inode = ?",
+                    (st.st_dev, st.st_ino),
+                ).fetchone()
+        except FileNotFoundError:
+            return None
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("[HashLedger] Lookup failed for %s: %s", path, e)
+            return None
+
+        if row is None or (row[0], row[1]) != (st.st_size, st.st_mtime_ns):
+            return None
+        return row[2]
+
+    def record(self, path: Path, sha256: str, st: Optional[os.stat_result] = None) -> None:
+        """
+        Record a freshly computed hash.
+
+        Args:
+            path: File path
+            sha256: Hash of the file contents
+            st: Stat taken *before* hashing (taken now if not given)
+        """
+        try:
+            if st is None:
+                st = os.stat(path)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO hashes
+                            (device, inode, size, mtime_ns, sha256, path, verified_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns,
+                            sha256.lower(), str(path), datetime.now().isoformat(),
+                        ),
+                    )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("[HashLedger] Record failed for %s: %s", path, e)
+
+    def forget(self, path: Path) -> None:
+        """Drop the entry for a file (e.g. after a failed verification)."""
+        try:
+            st = os.stat(path)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "DELETE FROM hashes WHERE device = ? AND inode = ?",
+                        (st.st_dev, st.st_ino),
+                    )
+        except FileNotFoundError:
+            pass
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("[HashLedger] Forget failed for %s: %s", path, e)
+
+    def sha256(self, path: Path, force: bool = False) -> str:
+        """
+        Return a file's SHA256, hashing only if the ledger has no valid entry.
+
+        Args:
+            path: File path
+            force: Always read and hash the file (the result is recorded)
+
+        Returns:
+            Lowercase hex SHA256
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        from .blob_store import compute_sha256
+
+        st = os.stat(path)
+        if not force:
+            cached = self.lookup(path, st)
+            if cached is not None:
+                logger.debug("[HashLedger] Hit for %s", path)
+                return cached
+
+        sha256 = compute_sha256(path)
+        self.record(path, sha256, st)
+        return sha256
@@ -0,0 +1,112 @@
+"""
+Synapse Store v2 - Shared HTTP Connection Pool
+
+One urllib3 pool manager (via a requests HTTPAdapter) shared by every
+synchronous HTTP client the Store owns: DownloadService (blob, preview and
+pack-builder downloads) and the Store-created CivitaiClient. Connections to
+a host are kept alive and reused across calls and threads, so a pack import
+with 100 previews pays one TLS handshake per host instead of one per file.
+
+    pool = HttpPool()
+    session = pool.session()          # shared Session, for DownloadService
+    pool.mount(client.session)        # a client's own Session, same sockets
+    ...
+    pool.close()
+
+Sessions that carry their own default headers (e.g. the CivitaiClient's
+Authorization header) keep their Session object and only share the
+transport via mount(); the shared session() carries nothing but the
+User-Agent, and per-request auth is passed per call.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; Synapse/2.0)"
+
+
+class HttpPool:
+    """
+    Thread-safe pooled HTTP transport.
+
+    urllib3 keeps one connection pool per host, up to max_hosts hosts; each
+    keeps at most max_per_host idle keep-alive connections. Requests beyond
+    that limit still get a connection (it is discarded after use instead of
+    being kept) rather than blocking: a segmented download holds several
+    connections to one host at once, and blocking on the pool could deadlock
+    concurrent downloads against each other.
+    """
+
+    DEFAULT_MAX_HOSTS = 16
+    DEFAULT_MAX_PER_HOST = 10
+
+    def __init__(
+        self,
+        max_hosts: int = DEFAULT_MAX_HOSTS,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            max_hosts: Number of per-host connection pools kept
+            max_per_host: Keep-alive connections kept per host
+        """
+        self.max_hosts = max_hosts
+        self.max_per_host = max_per_host
+        self._adapter = HTTPAdapter(
+            pool_connections=max_hosts,
+            pool_maxsize=max_per_host,
+            pool_block=False,
+        )
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Route a session's http(s) traffic through the shared connection pools."""
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def session(self) -> requests.Session:
+        """
+        Return the shared session (created on first use).
+
+        Callers must not close it or change its default headers; pass
+        per-request headers instead.
+        """
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers.update({"User-Agent": USER_AGENT})
+                self._session = self.mount(session)
+            return self._session
+
+    def close(self) -> None:
+        """
+        Close the shared session and every pooled connection.
+
+        The pool stays usable: later requests open new connections, so a
+        request still in flight when the Store is reset doesn't fail.
+        """
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+        self._adapter.close()
+        logger.debug("[HttpPool] Closed")
+
+    def __enter__(self) -> "HttpPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
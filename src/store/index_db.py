@@ -0,0 +1,1159 @@
+"""
+Synapse Store v2 - SQLite Index
+
+Queryable index of packs, dependencies, resolved artifacts, previews and
+profiles, stored at data/registry/index.sqlite, with an FTS5 full-text
+table for pack search.
+
+The JSON files in state/ remain the source of truth. The index is a derived
+cache that is:
+- Updated incrementally by StoreLayout on every pack/lock/profile write
+- Reconciled against file fingerprints (mtime_ns, size) before queries,
+  so edits made outside Synapse (git pull, manual edits) are picked up
+- Rebuildable at any time via `doctor --rebuild-db auto|force`
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .layout import LayoutListener, StoreError, StoreLayout
+from .models import Pack, PackLock, Profile
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+# (st_mtime_ns, st_size) of a state file, None if the file does not exist
+Fingerprint = Optional[Tuple[int, int]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS packs (
+    name TEXT PRIMARY KEY,
+    pack_type TEXT,
+    pack_category TEXT,
+    version TEXT,
+    description TEXT,
+    base_model TEXT,
+    author TEXT,
+    source_provider TEXT,
+    source_model_id INTEGER,
+    source_version_id INTEGER,
+    source_url TEXT,
+    cover_url TEXT,
+    tags TEXT,
+    user_tags TEXT,
+    trigger_words TEXT,
+    is_nsfw INTEGER NOT NULL DEFAULT 0,
+    is_nsfw_hidden INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    dependencies_count INTEGER NOT NULL DEFAULT 0,
+    load_error TEXT,
+    pack_mtime_ns INTEGER,
+    pack_size INTEGER,
+    lock_mtime_ns INTEGER,
+    lock_size INTEGER,
+    indexed_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS dependencies (
+    pack TEXT NOT NULL,
+    dependency_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    kind TEXT,
+    required INTEGER NOT NULL DEFAULT 1,
+    strategy TEXT,
+    expose_filename TEXT,
+    PRIMARY KEY (pack, dependency_id)
+);
+
+CREATE TABLE IF NOT EXISTS pack_refs (
+    pack TEXT NOT NULL,
+    ref_pack TEXT NOT NULL,
+    required INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (pack, ref_pack)
+);
+CREATE INDEX IF NOT EXISTS idx_pack_refs_ref ON pack_refs(ref_pack);
+
+CREATE TABLE IF NOT EXISTS artifacts (
+    pack TEXT NOT NULL,
+    dependency_id TEXT NOT NULL,
+    kind TEXT,
+    sha256 TEXT,
+    size_bytes INTEGER,
+    provider TEXT,
+    model_id INTEGER,
+    version_id INTEGER,
+    file_id INTEGER,
+    repo_id TEXT,
+    filename TEXT,
+    PRIMARY KEY (pack, dependency_id)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_sha256 ON artifacts(sha256);
+
+CREATE TABLE IF NOT EXISTS unresolved (
+    pack TEXT NOT NULL,
+    dependency_id TEXT NOT NULL,
+    reason TEXT,
+    PRIMARY KEY (pack, dependency_id)
+);
+
+CREATE TABLE IF NOT EXISTS previews (
+    pack TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    filename TEXT,
+    url TEXT,
+    nsfw INTEGER NOT NULL DEFAULT 0,
+    media_type TEXT,
+    PRIMARY KEY (pack, position)
+);
+
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS profile_packs (
+    profile TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    pack TEXT NOT NULL,
+    PRIMARY KEY (profile, position)
+);
+CREATE INDEX IF NOT EXISTS idx_profile_packs_pack ON profile_packs(pack);
+
+-- Full-text search; rowid mirrors packs.rowid
+CREATE VIRTUAL TABLE IF NOT EXISTS pack_fts USING fts5(
+    name,
+    description,
+    tags,
+    user_tags,
+    trigger_words,
+    base_model,
+    dependency_ids,
+    filenames,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+# Per-pack rows derived from pack.json and from lock.json respectively
+_PACK_CHILD_TABLES = ("dependencies", "pack_refs", "previews")
+_LOCK_CHILD_TABLES = ("artifacts", "unresolved")
+_DATA_TABLES = (
+    ("packs", "profiles", "profile_packs", "pack_fts") + _PACK_CHILD_TABLES + _LOCK_CHILD_TABLES
+)
+
+# `field:value` search filters -> FTS column
+SEARCH_FIELDS: Dict[str, str] = {
+    "name": "name",
+    "desc": "description",
+    "description": "description",
+    "tag": "tags",
+    "tags": "tags",
+    "user_tag": "user_tags",
+    "user_tags": "user_tags",
+    "trigger": "trigger_words",
+    "trigger_words": "trigger_words",
+    "base": "base_model",
+    "base_model": "base_model",
+    "dep": "dependency_ids",
+    "dependency": "dependency_ids",
+    "file": "filenames",
+    "filename": "filenames",
+}
+
+# bm25 weights in FTS column order: a hit in the name outranks one in a description
+_FTS_WEIGHTS = (10.0, 1.0, 3.0, 3.0, 2.0, 2.0, 2.0, 2.0)
+
+_FIELD_TOKEN_RE = re.compile(r'^(\w+):(.+)$')
+
+# Sort keys accepted by list_packs -> SQL expression (never NULL, so keyset
+# cursors compare cleanly)
+PACK_SORT_KEYS: Dict[str, str] = {
+    "name": "lower(p.name)",
+    "created_at": "COALESCE(p.created_at, '')",
+    "pack_type": "COALESCE(p.pack_type, '')",
+    "base_model": "COALESCE(p.base_model, '')",
+    "dependencies_count": "p.dependencies_count",
+}
+
+# A dependency counts as unresolved when it has no artifact in the lock, or
+# when there is no lock at all (mirrors the pack card logic in the API)
+_HAS_UNRESOLVED_SQL = """
+    CASE
+        WHEN p.load_error IS NOT NULL THEN 1
+        WHEN p.lock_mtime_ns IS NULL THEN p.dependencies_count > 0
+        ELSE EXISTS (
+            SELECT 1 FROM dependencies d
+            WHERE d.pack = p.name AND NOT EXISTS (
+                SELECT 1 FROM artifacts a
+                WHERE a.pack = d.pack AND a.dependency_id = d.dependency_id
+            )
+        )
+    END
+"""
+
+
+class StoreIndexError(StoreError):
+    """Error accessing the SQLite index."""
+    pass
+
+
+@dataclass
+class IndexStats:
+    """Result of an index refresh or rebuild."""
+    mode: str
+    packs_indexed: int = 0
+    locks_indexed: int = 0
+    packs_removed: int = 0
+    profiles_indexed: int = 0
+    profiles_removed: int = 0
+    errors: int = 0
+    duration_ms: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """True if anything was (re)indexed or removed."""
+        return bool(
+            self.packs_indexed or self.locks_indexed or self.packs_removed
+            or self.profiles_indexed or self.profiles_removed
+        )
+
+
+@dataclass
+class PackPage:
+    """One page of pack rows from StoreIndex.list_packs."""
+    rows: List[sqlite3.Row]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(sort_value: Any, name: str) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    raw = json.dumps([sort_value, name], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a token produced by _encode_cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, name = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise StoreIndexError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(name, str):
+        raise StoreIndexError(f"Invalid cursor: {cursor!r}")
+    return sort_value, name
+
+
+def _fingerprint(path: Path) -> Fingerprint:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _enum_value(value: Any) -> Optional[str]:
+    """Return the string value of an enum (or plain value)."""
+    if value is None:
+        return None
+    return value.value if hasattr(value, "value") else str(value)
+
+
+class StoreIndex(LayoutListener):
+    """
+    SQLite index over the store state.
+
+    Registered as a StoreLayout listener so every save_pack / save_pack_lock /
+    delete_pack / save_profile keeps the index current without rescans.
+    Queries call refresh() first, which only stats pack.json/lock.json and
+    re-parses files whose fingerprint changed.
+
+    A single connection is shared across threads and serialized by a lock;
+    the database is opened lazily on first use.
+    """
+
+    def __init__(self, layout: StoreLayout):
+        """
+        Initialize index.
+
+        Args:
+            layout: Store layout manager
+        """
+        self.layout = layout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._last_refresh: Optional[float] = None
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self.layout.db_path
+
+    # =========================================================================
+    # Connection Management
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database (once) and ensure the schema is current."""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            # Corrupt index: it's only a cache, so start over
+            logger.warning("[StoreIndex] Discarding unreadable index %s: %s", self.db_path, e)
+            self._discard_db_files()
+            conn = self._open()
+
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema(conn)
+        return conn
+
+    def _discard_db_files(self) -> None:
+        """Remove the database and its WAL/SHM side files."""
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(self.db_path) + suffix).unlink(missing_ok=True)
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Create tables, dropping everything if the schema version changed."""
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is not None and int(row["value"]) == SCHEMA_VERSION:
+            return
+
+        if row is not None:
+            logger.info(
+                "[StoreIndex] Schema version %s -> %s, recreating index",
+                row["value"], SCHEMA_VERSION,
+            )
+            for table in _DATA_TABLES:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.executescript(_SCHEMA)
+
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        """Run a read query under the index lock."""
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    # =========================================================================
+    # LayoutListener Hooks
+    # =========================================================================
+
+    def on_pack_saved(self, pack: Pack) -> None:
+        self.index_pack(pack)
+
+    def on_lock_saved(self, lock: PackLock) -> None:
+        self.index_lock(lock)
+
+    def on_pack_deleted(self, pack_name: str) -> None:
+        self.remove_pack(pack_name)
+
+    def on_profile_saved(self, profile: Profile) -> None:
+        self.index_profile(profile)
+
+    def on_profile_deleted(self, profile_name: str) -> None:
+        self.remove_profile(profile_name)
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def index_pack(self, pack: Pack, fingerprint: Fingerprint = None) -> None:
+        """
+        Insert or replace a pack and its dependencies, refs and previews.
+
+        Args:
+            pack: Parsed pack
+            fingerprint: pack.json fingerprint taken before reading; stat'ed
+                         now if not given
+        """
+        if fingerprint is None:
+            fingerprint = _fingerprint(self.layout.pack_json_path(pack.name))
+        pack_mtime, pack_size = fingerprint or (None, None)
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._delete_pack_children(conn, pack.name)
+                conn.execute(
+                    """
+                    INSERT INTO packs (
+                        name, pack_type, pack_category, version, description,
+                        base_model, author, source_provider, source_model_id,
+                        source_version_id, source_url, cover_url, tags, user_tags,
+                        trigger_words, is_nsfw, is_nsfw_hidden, created_at,
+                        dependencies_count, load_error, pack_mtime_ns, pack_size,
+                        indexed_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        pack_type = excluded.pack_type,
+                        pack_category = excluded.pack_category,
+                        version = excluded.version,
+                        description = excluded.description,
+                        base_model = excluded.base_model,
+                        author = excluded.author,
+                        source_provider = excluded.source_provider,
+                        source_model_id = excluded.source_model_id,
+                        source_version_id = excluded.source_version_id,
+                        source_url = excluded.source_url,
+                        cover_url = excluded.cover_url,
+                        tags = excluded.tags,
+                        user_tags = excluded.user_tags,
+                        trigger_words = excluded.trigger_words,
+                        is_nsfw = excluded.is_nsfw,
+                        is_nsfw_hidden = excluded.is_nsfw_hidden,
+                        created_at = excluded.created_at,
+                        dependencies_count = excluded.dependencies_count,
+                        load_error = NULL,
+                        pack_mtime_ns = excluded.pack_mtime_ns,
+                        pack_size = excluded.pack_size,
+                        indexed_at = excluded.indexed_at
+                    """,
+                    (
+                        pack.name,
+                        _enum_value(pack.pack_type),
+                        _enum_value(pack.pack_category),
+                        pack.version,
+                        pack.description,
+                        pack.base_model,
+                        pack.author,
+                        _enum_value(pack.source.provider) if pack.source else None,
+                        pack.source.model_id if pack.source else None,
+                        pack.source.version_id if pack.source else None,
+                        pack.source.url if pack.source else None,
+                        pack.cover_url,
+                        json.dumps(pack.tags or []),
+                        json.dumps(pack.user_tags or []),
+                        json.dumps(pack.trigger_words or []),
+                        int(pack.is_nsfw),
+                        int(pack.is_nsfw_hidden),
+                        pack.created_at.isoformat() if pack.created_at else None,
+                        len(pack.dependencies),
+                        pack_mtime,
+                        pack_size,
+                        datetime.now().isoformat(),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO dependencies (pack, dependency_id, position, kind, required, strategy, expose_filename) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            pack.name,
+                            dep.id,
+                            position,
+                            _enum_value(dep.kind),
+                            int(dep.required),
+                            _enum_value(dep.selector.strategy) if dep.selector else None,
+                            dep.expose.filename if dep.expose else None,
+                        )
+                        for position, dep in enumerate(pack.dependencies)
+                    ],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO pack_refs (pack, ref_pack, required) VALUES (?, ?, ?)",
+                    [(pack.name, ref.pack_name, int(ref.required)) for ref in pack.pack_dependencies],
+                )
+                conn.executemany(
+                    "INSERT INTO previews (pack, position, filename, url, nsfw, media_type) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (pack.name, position, p.filename, p.url, int(p.nsfw), p.media_type)
+                        for position, p in enumerate(pack.previews)
+                    ],
+                )
+                self._update_fts(conn, pack.name)
+
+    def index_lock(self, lock: PackLock, fingerprint: Fingerprint = None) -> None:
+        """
+        Replace resolved artifacts and unresolved entries for a pack.
+
+        Args:
+            lock: Parsed lock
+            fingerprint: lock.json fingerprint taken before reading; stat'ed
+                         now if not given
+        """
+        if fingerprint is None:
+            fingerprint = _fingerprint(self.layout.pack_lock_path(lock.pack))
+        lock_mtime, lock_size = fingerprint or (None, None)
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._write_lock_rows(conn, lock)
+                conn.execute(
+                    "UPDATE packs SET lock_mtime_ns = ?, lock_size = ? WHERE name = ?",
+                    (lock_mtime, lock_size, lock.pack),
+                )
+                self._update_fts(conn, lock.pack)
+
+    def _write_lock_rows(self, conn: sqlite3.Connection, lock: PackLock) -> None:
+        """Replace artifact and unresolved rows for a lock (no commit)."""
+        for table in _LOCK_CHILD_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE pack = ?", (lock.pack,))
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO artifacts (
+                pack, dependency_id, kind, sha256, size_bytes, provider,
+                model_id, version_id, file_id, repo_id, filename
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    lock.pack,
+                    r.dependency_id,
+                    _enum_value(r.artifact.kind),
+                    r.artifact.sha256.lower() if r.artifact.sha256 else None,
+                    r.artifact.size_bytes,
+                    _enum_value(r.artifact.provider.name) if r.artifact.provider else None,
+                    r.artifact.provider.model_id if r.artifact.provider else None,
+                    r.artifact.provider.version_id if r.artifact.provider else None,
+                    r.artifact.provider.file_id if r.artifact.provider else None,
+                    r.artifact.provider.repo_id if r.artifact.provider else None,
+                    r.artifact.provider.filename if r.artifact.provider else None,
+                )
+                for r in lock.resolved
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO unresolved (pack, dependency_id, reason) VALUES (?, ?, ?)",
+            [(lock.pack, u.dependency_id, u.reason) for u in lock.unresolved],
+        )
+
+    def remove_pack(self, pack_name: str) -> None:
+        """Remove a pack and all rows that belong to it."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._delete_fts(conn, pack_name)
+                self._delete_pack_children(conn, pack_name)
+                for table in _LOCK_CHILD_TABLES:
+                    conn.execute(f"DELETE FROM {table} WHERE pack = ?", (pack_name,))
+                conn.execute("DELETE FROM packs WHERE name = ?", (pack_name,))
+
+    def _update_fts(self, conn: sqlite3.Connection, pack_name: str) -> None:
+        """Rebuild the full-text row for a pack from its relational rows (no commit)."""
+        row = conn.execute(
+            "SELECT rowid, name, description, tags, user_tags, trigger_words, base_model, load_error "
+            "FROM packs WHERE name = ?",
+            (pack_name,),
+        ).fetchone()
+        if row is None:
+            return
+        conn.execute("DELETE FROM pack_fts WHERE rowid = ?", (row["rowid"],))
+        if row["load_error"]:
+            return
+
+        dep_ids: List[str] = []
+        filenames: List[str] = []
+        for dep in conn.execute(
+            "SELECT dependency_id, expose_filename FROM dependencies WHERE pack = ? ORDER BY position",
+            (pack_name,),
+        ):
+            dep_ids.append(dep["dependency_id"])
+            if dep["expose_filename"]:
+                filenames.append(dep["expose_filename"])
+        for art in conn.execute(
+            "SELECT filename FROM artifacts WHERE pack = ? AND filename IS NOT NULL", (pack_name,)
+        ):
+            if art["filename"] not in filenames:
+                filenames.append(art["filename"])
+
+        conn.execute(
+            "INSERT INTO pack_fts (rowid, name, description, tags, user_tags, trigger_words, "
+            "base_model, dependency_ids, filenames) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                row["rowid"],
+                row["name"],
+                row["description"] or "",
+                " ".join(json.loads(row["tags"] or "[]")),
+                " ".join(json.loads(row["user_tags"] or "[]")),
+                " ".join(json.loads(row["trigger_words"] or "[]")),
+                row["base_model"] or "",
+                " ".join(dep_ids),
+                " ".join(filenames),
+            ),
+        )
+
+    def _delete_fts(self, conn: sqlite3.Connection, pack_name: str) -> None:
+        """Remove the full-text row for a pack (no commit)."""
+        conn.execute(
+            "DELETE FROM pack_fts WHERE rowid IN (SELECT rowid FROM packs WHERE name = ?)",
+            (pack_name,),
+        )
+
+    def _delete_pack_children(self, conn: sqlite3.Connection, pack_name: str) -> None:
+        """Delete rows derived from pack.json (not from lock.json)."""
+        for table in _PACK_CHILD_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE pack = ?", (pack_name,))
+
+    def index_profile(self, profile: Profile, fingerprint: Fingerprint = None) -> None:
+        """Insert or replace a profile and its ordered pack list."""
+        if fingerprint is None:
+            fingerprint = _fingerprint(self.layout.profile_json_path(profile.name))
+        mtime, size = fingerprint or (None, None)
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO profiles (name, mtime_ns, size) VALUES (?, ?, ?)",
+                    (profile.name, mtime, size),
+                )
+                conn.execute("DELETE FROM profile_packs WHERE profile = ?", (profile.name,))
+                conn.executemany(
+                    "INSERT INTO profile_packs (profile, position, pack) VALUES (?, ?, ?)",
+                    [(profile.name, i, entry.name) for i, entry in enumerate(profile.packs)],
+                )
+
+    def remove_profile(self, profile_name: str) -> None:
+        """Remove a profile from the index."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM profile_packs WHERE profile = ?", (profile_name,))
+                conn.execute("DELETE FROM profiles WHERE name = ?", (profile_name,))
+
+    def _record_pack_error(self, pack_name: str, fingerprint: Fingerprint, error: str) -> None:
+        """Remember a pack.json that failed to parse so it isn't retried until it changes."""
+        mtime, size = fingerprint or (None, None)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._delete_pack_children(conn, pack_name)
+                conn.execute(
+                    """
+                    INSERT INTO packs (name, load_error, pack_mtime_ns, pack_size, indexed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        load_error = excluded.load_error,
+                        pack_mtime_ns = excluded.pack_mtime_ns,
+                        pack_size = excluded.pack_size,
+                        indexed_at = excluded.indexed_at
+                    """,
+                    (pack_name, error, mtime, size, datetime.now().isoformat()),
+                )
+                self._update_fts(conn, pack_name)
+
+    # =========================================================================
+    # Reconciliation
+    # =========================================================================
+
+    def _scan_pack_fingerprints(self) -> Dict[str, Tuple[Fingerprint, Fingerprint]]:
+        """Stat pack.json and lock.json for every pack directory on disk."""
+        result: Dict[str, Tuple[Fingerprint, Fingerprint]] = {}
+        packs_path = self.layout.packs_path
+        if not packs_path.exists():
+            return result
+        with os.scandir(packs_path) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                pack_dir = Path(entry.path)
+                pack_fp = _fingerprint(pack_dir / "pack.json")
+                if pack_fp is None:
+                    continue
+                result[entry.name] = (pack_fp, _fingerprint(pack_dir / "lock.json"))
+        return result
+
+    def _scan_profile_fingerprints(self) -> Dict[str, Fingerprint]:
+        """Stat profile.json for every profile directory on disk."""
+        result: Dict[str, Fingerprint] = {}
+        profiles_path = self.layout.profiles_path
+        if not profiles_path.exists():
+            return result
+        with os.scandir(profiles_path) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                fp = _fingerprint(Path(entry.path) / "profile.json")
+                if fp is not None:
+                    result[entry.name] = fp
+        return result
+
+    def refresh(self, max_age: Optional[float] = None) -> IndexStats:
+        """
+        Reconcile the index with state/ using file fingerprints.
+
+        Only files whose (mtime_ns, size) differ from the indexed values are
+        re-parsed. Cost for an unchanged store is one stat per pack.json,
+        lock.json and profile.json.
+
+        Args:
+            max_age: Skip the scan if the last refresh finished less than
+                     this many seconds ago. Writes through StoreLayout are
+                     indexed immediately regardless; this only delays
+                     picking up out-of-band edits.
+
+        Returns:
+            IndexStats describing what changed (mode "skipped" if max_age hit)
+        """
+        if (
+            max_age is not None
+            and self._last_refresh is not None
+            and time.monotonic() - self._last_refresh < max_age
+        ):
+            return IndexStats(mode="skipped")
+
+        start = time.perf_counter()
+        stats = IndexStats(mode="auto")
+
+        with self._lock:
+            on_disk = self._scan_pack_fingerprints()
+            stored = {
+                row["name"]: (
+                    (row["pack_mtime_ns"], row["pack_size"]),
+                    (row["lock_mtime_ns"], row["lock_size"]) if row["lock_mtime_ns"] is not None else None,
+                )
+                for row in self._query(
+                    "SELECT name, pack_mtime_ns, pack_size, lock_mtime_ns, lock_size FROM packs"
+                )
+            }
+
+            for name in stored.keys() - on_disk.keys():
+                self.remove_pack(name)
+                stats.packs_removed += 1
+
+            for name, (pack_fp, lock_fp) in on_disk.items():
+                stored_pack_fp, stored_lock_fp = stored.get(name, (None, None))
+
+                if pack_fp != stored_pack_fp:
+                    try:
+                        self.index_pack(self.layout.load_pack(name, readonly=True), fingerprint=pack_fp)
+                        stats.packs_indexed += 1
+                    except Exception as e:
+                        logger.warning("[StoreIndex] Failed to index pack '%s': %s", name, e)
+                        self._record_pack_error(name, pack_fp, str(e))
+                        stats.errors += 1
+                        continue
+                    # Pack row may be new: lock fingerprint must be re-checked
+                    stored_lock_fp = self._stored_lock_fingerprint(name)
+
+                if lock_fp != stored_lock_fp:
+                    try:
+                        if lock_fp is None:
+                            self._clear_lock(name)
+                        else:
+                            lock = self.layout.load_pack_lock(name, readonly=True)
+                            if lock is not None:
+                                self.index_lock(lock, fingerprint=lock_fp)
+                        stats.locks_indexed += 1
+                    except Exception as e:
+                        logger.warning("[StoreIndex] Failed to index lock '%s': %s", name, e)
+                        stats.errors += 1
+
+            self._refresh_profiles(stats)
+            self._last_refresh = time.monotonic()
+
+        stats.duration_ms = int((time.perf_counter() - start) * 1000)
+        if stats.changed:
+            logger.debug("[StoreIndex] Refresh: %s", stats)
+        return stats
+
+    def _stored_lock_fingerprint(self, pack_name: str) -> Fingerprint:
+        rows = self._query("SELECT lock_mtime_ns, lock_size FROM packs WHERE name = ?", (pack_name,))
+        if not rows or rows[0]["lock_mtime_ns"] is None:
+            return None
+        return rows[0]["lock_mtime_ns"], rows[0]["lock_size"]
+
+    def _clear_lock(self, pack_name: str) -> None:
+        """Drop lock-derived rows for a pack whose lock.json disappeared."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for table in _LOCK_CHILD_TABLES:
+                    conn.execute(f"DELETE FROM {table} WHERE pack = ?", (pack_name,))
+                conn.execute(
+                    "UPDATE packs SET lock_mtime_ns = NULL, lock_size = NULL WHERE name = ?",
+                    (pack_name,),
+                )
+                self._update_fts(conn, pack_name)
+
+    def _refresh_profiles(self, stats: IndexStats) -> None:
+        on_disk = self._scan_profile_fingerprints()
+        stored = {
+            row["name"]: (row["mtime_ns"], row["size"])
+            for row in self._query("SELECT name, mtime_ns, size FROM profiles")
+        }
+        for name in stored.keys() - on_disk.keys():
+            self.remove_profile(name)
+            stats.profiles_removed += 1
+        for name, fp in on_disk.items():
+            if stored.get(name) == fp:
+                continue
+            try:
+                self.index_profile(self.layout.load_profile(name), fingerprint=fp)
+                stats.profiles_indexed += 1
+            except Exception as e:
+                logger.warning("[StoreIndex] Failed to index profile '%s': %s", name, e)
+                stats.errors += 1
+
+    def rebuild(self, mode: str = "auto") -> IndexStats:
+        """
+        Rebuild the index.
+
+        Args:
+            mode: "auto" reconciles changed files only; "force" discards
+                  every row and re-parses all packs, locks and profiles.
+
+        Returns:
+            IndexStats for the rebuild
+
+        Raises:
+            StoreIndexError: If mode is not "auto" or "force"
+        """
+        if mode not in ("auto", "force"):
+            raise StoreIndexError(f"Invalid rebuild mode: {mode!r} (expected 'auto' or 'force')")
+
+        if mode == "force":
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    for table in _DATA_TABLES:
+                        conn.execute(f"DELETE FROM {table}")
+
+        stats = self.refresh()
+        stats.mode = mode
+        logger.info(
+            "[StoreIndex] Rebuild (%s): %d packs, %d locks, %d profiles in %dms",
+            mode, stats.packs_indexed, stats.locks_indexed, stats.profiles_indexed, stats.duration_ms,
+        )
+        return stats
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def count_packs(self) -> int:
+        """Number of indexed packs (including ones that failed to parse)."""
+        return self._query("SELECT COUNT(*) AS n FROM packs")[0]["n"]
+
+    def iter_model_rows(self, kind: Optional[str] = None) -> Iterator[sqlite3.Row]:
+        """
+        Iterate resolved artifacts joined with their pack and dependency.
+
+        Only dependencies declared in pack.json that have a sha256 in the
+        lock are returned, in pack name / dependency order.
+
+        Args:
+            kind: Optional case-insensitive dependency kind filter
+        """
+        sql = """
+            SELECT p.name AS pack, p.base_model, d.dependency_id, d.kind,
+                   a.sha256, a.size_bytes, a.filename
+            FROM dependencies d
+            JOIN packs p ON p.name = d.pack
+            JOIN artifacts a ON a.pack = d.pack AND a.dependency_id = d.dependency_id
+            WHERE a.sha256 IS NOT NULL AND a.sha256 != ''
+        """
+        params: Tuple = ()
+        if kind:
+            sql += " AND lower(d.kind) = lower(?)"
+            params = (kind,)
+        sql += " ORDER BY p.name, d.position"
+        yield from self._query(sql, params)
+
+    def blob_references(self, sha256: str) -> List[sqlite3.Row]:
+        """
+        Return every resolved artifact pointing at a blob.
+
+        Rows carry the lock's artifact fields plus the pack.json dependency's
+        kind and expose filename (NULL if the dependency is not declared),
+        in pack name / dependency order.
+
+        Args:
+            sha256: Blob hash (any case)
+        """
+        return self._query(
+            """
+            SELECT a.pack, a.dependency_id, COALESCE(d.kind, a.kind) AS kind,
+                   d.expose_filename, a.size_bytes, a.provider, a.model_id,
+                   a.version_id, a.file_id, a.repo_id, a.filename
+            FROM artifacts a
+            LEFT JOIN dependencies d ON d.pack = a.pack AND d.dependency_id = a.dependency_id
+            WHERE a.sha256 = ?
+            ORDER BY a.pack, COALESCE(d.position, 0), a.dependency_id
+            """,
+            (sha256.lower(),),
+        )
+
+    def dependent_packs(self, pack_name: str) -> List[str]:
+        """Return names of packs listing pack_name in their pack_dependencies, sorted."""
+        rows = self._query(
+            "SELECT pack FROM pack_refs WHERE ref_pack = ? AND pack != ? ORDER BY pack",
+            (pack_name, pack_name),
+        )
+        return [row["pack"] for row in rows]
+
+    def first_preview_with_ext(self, pack_name: str, extensions: List[str]) -> Optional[str]:
+        """
+        Return the first indexed preview filename matching the extension order.
+
+        Extensions are tried in order; within one extension, pack preview
+        order wins.
+        """
+        rows = self._query(
+            "SELECT filename FROM previews WHERE pack = ? AND filename IS NOT NULL ORDER BY position",
+            (pack_name,),
+        )
+        filenames = [row["filename"] for row in rows]
+        for ext in extensions:
+            for filename in filenames:
+                if filename.lower().endswith(ext):
+                    return filename
+        return None
+
+    def list_packs(
+        self,
+        pack_type: Optional[str] = None,
+        base_model: Optional[str] = None,
+        tag: Optional[str] = None,
+        nsfw: Optional[bool] = None,
+        has_unresolved: Optional[bool] = None,
+        include_hidden: bool = True,
+        sort: str = "name",
+        descending: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> PackPage:
+        """
+        Filtered, sorted and keyset-paginated pack listing.
+
+        Packs that failed to parse are only listed when no filter is given.
+
+        Args:
+            pack_type: Case-insensitive pack type filter
+            base_model: Case-insensitive base model filter
+            tag: Tag that must be present in tags or user_tags
+            nsfw: Filter on the nsfw-pack flag
+            has_unresolved: Filter on unresolved dependencies
+            include_hidden: Include packs tagged nsfw-pack-hide
+            sort: One of PACK_SORT_KEYS
+            descending: Reverse sort order (ties still break on name)
+            limit: Page size; None returns everything after the cursor
+            cursor: next_cursor from the previous page
+
+        Returns:
+            PackPage with rows (p.* plus has_unresolved), the total number of
+            matching packs and the cursor for the next page
+
+        Raises:
+            StoreIndexError: On unknown sort key or malformed cursor
+        """
+        if sort not in PACK_SORT_KEYS:
+            raise StoreIndexError(
+                f"Unknown sort key: {sort!r} (expected one of {', '.join(PACK_SORT_KEYS)})"
+            )
+        sort_expr = PACK_SORT_KEYS[sort]
+
+        where: List[str] = []
+        params: List[Any] = []
+        if pack_type:
+            where.append("lower(p.pack_type) = lower(?)")
+            params.append(pack_type)
+        if base_model:
+            where.append("lower(p.base_model) = lower(?)")
+            params.append(base_model)
+        if tag:
+            where.append(
+                "(EXISTS (SELECT 1 FROM json_each(p.tags) WHERE lower(value) = lower(?))"
+                " OR EXISTS (SELECT 1 FROM json_each(p.user_tags) WHERE lower(value) = lower(?)))"
+            )
+            params += [tag, tag]
+        if nsfw is not None:
+            where.append("p.is_nsfw = ?")
+            params.append(int(nsfw))
+        if has_unresolved is not None:
+            where.append(f"({_HAS_UNRESOLVED_SQL}) = ?")
+            params.append(int(has_unresolved))
+        if where:
+            where.append("p.load_error IS NULL")
+        if not include_hidden:
+            where.append("p.is_nsfw_hidden = 0")
+
+        where_sql = (" WHERE " + " AND ".join(where)) if where else ""
+        total = self._query(f"SELECT COUNT(*) AS n FROM packs p{where_sql}", tuple(params))[0]["n"]
+
+        page_where = list(where)
+        page_params = list(params)
+        if cursor:
+            after_value, after_name = _decode_cursor(cursor)
+            op = "<" if descending else ">"
+            page_where.append(f"({sort_expr} {op} ? OR ({sort_expr} = ? AND p.name > ?))")
+            page_params += [after_value, after_value, after_name]
+
+        sql = (
+            f"SELECT p.*, {sort_expr} AS sort_value, ({_HAS_UNRESOLVED_SQL}) AS has_unresolved"
+            " FROM packs p"
+        )
+        if page_where:
+            sql += " WHERE " + " AND ".join(page_where)
+        sql += f" ORDER BY {sort_expr} {'DESC' if descending else 'ASC'}, p.name ASC"
+        if limit:
+            # Fetch one extra row to know whether another page exists
+            sql += " LIMIT ?"
+            page_params.append(limit + 1)
+
+        rows = self._query(sql, tuple(page_params))
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1]["sort_value"], rows[-1]["name"])
+        return PackPage(rows=rows, total=total, next_cursor=next_cursor)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+    ) -> List[sqlite3.Row]:
+        """
+        Full-text search over packs.
+
+        Query syntax:
+        - Bare terms are prefix-matched against all fields and ANDed
+          ("pony ani" matches "Pony Anime LoRA")
+        - `field:value` restricts a term to one field, e.g. `tag:anime`,
+          `base:SDXL`, `trigger:masterpiece`, `file:foo_v2`
+          (see SEARCH_FIELDS); `type:lora` filters on pack type
+        - Blank queries match every pack
+
+        Plain-text queries additionally match packs whose name or dependency
+        id contains the text as a substring (e.g. "XL" in "RealVisXL"); those
+        are appended after the ranked full-text hits.
+
+        Args:
+            query: Search query
+            limit: Optional maximum number of results
+
+        Returns:
+            Pack rows ordered by relevance (bm25), then name
+        """
+        match, pack_type, free_text = self._build_match(query)
+        type_sql = " AND lower(p.pack_type) = lower(?)" if pack_type else ""
+        type_params: Tuple = (pack_type,) if pack_type else ()
+
+        if not match:
+            sql = "SELECT p.*, NULL AS score FROM packs p WHERE p.load_error IS NULL"
+            sql += type_sql + " ORDER BY p.name"
+            params: Tuple = type_params
+            if limit:
+                sql += " LIMIT ?"
+                params += (limit,)
+            return self._query(sql, params)
+
+        weights = ", ".join(str(w) for w in _FTS_WEIGHTS)
+        rows = self._query(
+            f"""
+            SELECT p.*, bm25(pack_fts, {weights}) AS score
+            FROM pack_fts
+            JOIN packs p ON p.rowid = pack_fts.rowid
+            WHERE pack_fts MATCH ?{type_sql}
+            ORDER BY score, p.name
+            """,
+            (match,) + type_params,
+        )
+
+        if free_text:
+            pattern = "%" + re.sub(r"([\\%_])", r"\\\1", free_text.lower()) + "%"
+            seen = {row["name"] for row in rows}
+            rows += [
+                row for row in self._query(
+                    f"""
+                    SELECT p.*, NULL AS score FROM packs p
+                    WHERE p.load_error IS NULL{type_sql}
+                      AND (lower(p.name) LIKE ? ESCAPE '\\'
+                           OR EXISTS (SELECT 1 FROM dependencies d
+                                      WHERE d.pack = p.name
+                                        AND lower(d.dependency_id) LIKE ? ESCAPE '\\'))
+                    ORDER BY p.name
+                    """,
+                    type_params + (pattern, pattern),
+                )
+                if row["name"] not in seen
+            ]
+
+        return rows[:limit] if limit else rows
+
+    @staticmethod
+    def _build_match(query: str) -> Tuple[str, Optional[str], str]:
+        """
+        Translate a user query into an FTS5 MATCH expression.
+
+        Every term is quoted so user input can never inject FTS syntax.
+
+        Returns:
+            Tuple of (match_expression, pack_type_filter, free_text), where
+            free_text is the query without filters if no field filter was used
+        """
+        clauses: List[str] = []
+        pack_type: Optional[str] = None
+        plain_terms: List[str] = []
+        has_field_filter = False
+
+        for token in query.split():
+            column = None
+            value = token
+            field_match = _FIELD_TOKEN_RE.match(token)
+            if field_match:
+                field = field_match.group(1).lower()
+                if field == "type":
+                    pack_type = field_match.group(2)
+                    continue
+                if field in SEARCH_FIELDS:
+                    column = SEARCH_FIELDS[field]
+                    value = field_match.group(2)
+                    has_field_filter = True
+
+            if column is None:
+                plain_terms.append(token)
+
+            # Keep only characters the tokenizer would index
+            if not re.search(r"\w", value):
+                continue
+            term = '"' + value.replace('"', '""') + '"*'
+            clauses.append(f"{column} : {term}" if column else term)
+
+        free_text = "" if has_field_filter else " ".join(plain_terms)
+        return " AND ".join(clauses), pack_type, free_text
@@ -0,0 +1,348 @@
+"""
+Synapse Store v2 - Incremental Inventory Model
+
+Maintained in-memory view of what build_inventory() needs:
+
+    local blobs     sha256 -> size       (data/blobs/sha256/<xx>/<sha256>)
+    manifests       sha256 -> BlobManifest, for blobs with a .meta file
+    backup blobs    sha256 -> size       (same layout on the backup drive)
+    references      sha256 -> [PackReference] from every pack lock
+
+Nothing is rescanned unless it may have changed:
+
+- Blob directories are cached per shard (<xx>/ directory) and validated by
+  the shard directory's mtime, which changes whenever a blob, .part or .meta
+  file is created, renamed or removed there. BlobStore writes also mark
+  their shard dirty directly (see on_blob_changed). A shard modified within
+  RACY_WINDOW_NS of its scan is rescanned on every refresh, so coarse
+  filesystem timestamps can't hide a change made right after a scan. The
+  shard bookkeeping is blob_snapshot.ShardCache, shared with BlobSnapshot.
+- Pack references are cached per pack and validated by the (mtime_ns, size)
+  of pack.json and lock.json; StoreLayout writes drop the entry directly.
+
+refresh() returns an InventorySnapshot whose version string changes exactly
+when the data changed; callers key their derived results (and HTTP ETags) on
+it. invalidate() forces a full rescan.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .blob_snapshot import BLOB, META, ShardCache, iter_shard
+from .layout import LayoutListener, StoreLayout
+from .models import BlobManifest, BlobOrigin, Pack, PackLock, PackReference
+
+if TYPE_CHECKING:
+    from .backup_service import BackupService
+    from .blob_store import BlobStore
+
+logger = logging.getLogger(__name__)
+
+
+_FileStamp = Optional[Tuple[int, int]]
+
+
+def _stamp(path: str) -> _FileStamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Blob sizes and .meta mtimes (sha256 -> mtime_ns) of one shard
+_DirListing = Tuple[Dict[str, int], Dict[str, int]]
+
+
+class BlobDirectory(ShardCache[_DirListing]):
+    """
+    Shard-cached listing of a sha256/<xx>/<hash> blob tree.
+
+    Not thread-safe; InventoryModel serializes access.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._root: Optional[Path] = None
+        self.blobs: Dict[str, int] = {}
+        self.manifests: Dict[str, int] = {}
+
+    def clear(self) -> None:
+        super().clear()
+        self.blobs = {}
+        self.manifests = {}
+
+    def refresh(self, root: Optional[Path]) -> bool:
+        """
+        Bring the listing up to date.
+
+        Args:
+            root: Blob tree root (None or missing means empty)
+
+        Returns:
+            True if the listing changed
+        """
+        if root != self._root:
+            self._root = root
+            had_data = bool(self._shards)
+            self.clear()
+            changed = had_data
+        else:
+            changed = False
+
+        seen = set()
+        try:
+            entries = list(os.scandir(root)) if root is not None else []
+        except OSError:
+            entries = []
+
+        for entry in entries:
+            try:
+                if not entry.is_dir():
+                    continue
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            prefix = entry.name
+            seen.add(prefix)
+            old = self._shards.get(prefix)
+            listing = self._listing(prefix, entry.path, mtime_ns)
+            if old is None or (old.listing is not listing and old.listing != listing):
+                changed = True
+
+        for prefix in list(self._shards):
+            if prefix not in seen:
+                changed |= self._drop(prefix)
+        self._dirty.clear()
+
+        if changed:
+            self.blobs = {}
+            self.manifests = {}
+            for shard in self._shards.values():
+                blobs, manifests = shard.listing
+                self.blobs.update(blobs)
+                self.manifests.update(manifests)
+        return changed
+
+    def _scan_shard(self, path: str) -> _DirListing:
+        blobs: Dict[str, int] = {}
+        manifests: Dict[str, int] = {}
+        try:
+            for entry in iter_shard(path):
+                if entry.kind == BLOB:
+                    blobs[entry.sha256] = entry.size
+                elif entry.kind == META:
+                    manifests[entry.sha256] = entry.mtime_ns
+        except OSError as e:
+            logger.warning("[InventoryModel] Failed to scan %s: %s", path, e)
+        return blobs, manifests
+
+
+@dataclass
+class InventorySnapshot:
+    """Consistent view of the model as of one refresh()."""
+    version: str
+    local_blobs: Dict[str, int]
+    backup_blobs: Dict[str, int]
+    references: Dict[str, List[PackReference]]
+
+
+class InventoryModel(LayoutListener):
+    """
+    Incrementally maintained blob and reference inventory.
+
+    Registered as a StoreLayout listener and a BlobStore listener by
+    InventoryService; thread-safe.
+    """
+
+    def __init__(self, layout: StoreLayout, blob_store: "BlobStore"):
+        """
+        Initialize model.
+
+        Args:
+            layout: Store layout manager
+            blob_store: Blob store instance (for manifest reads)
+        """
+        self.layout = layout
+        self.blob_store = blob_store
+        self._lock = threading.RLock()
+        self._local = BlobDirectory()
+        self._backup = BlobDirectory()
+        self._pack_refs: Dict[str, Tuple[Tuple[_FileStamp, _FileStamp], List[Tuple[str, PackReference]]]] = {}
+        self._references: Dict[str, List[PackReference]] = {}
+        self._manifests: Dict[str, Tuple[int, Optional[BlobManifest]]] = {}
+        self._epoch = uuid.uuid4().hex[:8]
+        self._generation = 0
+
+    # =========================================================================
+    # Write Events
+    # =========================================================================
+
+    def on_blob_changed(self, sha256: str) -> None:
+        """BlobStore listener: a blob or its manifest was written or removed."""
+        with self._lock:
+            self._local.mark_dirty(sha256)
+
+    def on_pack_saved(self, pack: Pack) -> None:
+        with self._lock:
+            self._pack_refs.pop(pack.name, None)
+
+    def on_lock_saved(self, lock: PackLock) -> None:
+        with self._lock:
+            self._pack_refs.pop(lock.pack, None)
+
+    def on_pack_deleted(self, pack_name: str) -> None:
+        with self._lock:
+            self._pack_refs.pop(pack_name, None)
+
+    def invalidate(self) -> None:
+        """Drop everything; the next refresh() rescans from scratch."""
+        with self._lock:
+            self._local.clear()
+            self._backup.clear()
+            self._pack_refs.clear()
+            self._manifests.clear()
+            self._generation += 1
+
+    # =========================================================================
+    # Refresh
+    # =========================================================================
+
+    def refresh(self, backup_service: Optional["BackupService"] = None) -> InventorySnapshot:
+        """
+        Revalidate the model against disk and return a snapshot.
+
+        Args:
+            backup_service: Backup service; its blobs are included while connected
+
+        Returns:
+            InventorySnapshot (dicts are shared; treat as read-only)
+        """
+        backup_root = None
+        if backup_service is not None:
+            try:
+                if backup_service.is_connected():
+                    backup_root = backup_service.backup_blobs_path
+            except Exception as e:
+                logger.warning("[InventoryModel] Backup status unavailable: %s", e)
+
+        with self._lock:
+            changed = self._local.refresh(self.layout.blobs_path)
+            changed |= self._backup.refresh(backup_root)
+            changed |= self._refresh_references()
+            if changed:
+                self._generation += 1
+            return InventorySnapshot(
+                version=f"{self._epoch}-{self._generation}",
+                local_blobs=self._local.blobs,
+                backup_blobs=self._backup.blobs,
+                references=self._references,
+            )
+
+    def manifest(self, sha256: str) -> Optional[BlobManifest]:
+        """Return a local blob's manifest, parsed once per .meta file version."""
+        with self._lock:
+            mtime_ns = self._local.manifests.get(sha256)
+            if mtime_ns is None:
+                return None
+            cached = self._manifests.get(sha256)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+        manifest = self.blob_store.read_manifest(sha256)
+        with self._lock:
+            self._manifests[sha256] = (mtime_ns, manifest)
+        return manifest
+
+    def _refresh_references(self) -> bool:
+        """Re-read references of packs whose pack.json or lock.json changed."""
+        packs_path = self.layout.packs_path
+        try:
+            entries = [e for e in os.scandir(packs_path) if e.is_dir()]
+        except OSError:
+            entries = []
+
+        changed = False
+        seen = set()
+        for entry in entries:
+            stamps = (
+                _stamp(os.path.join(entry.path, "pack.json")),
+                _stamp(os.path.join(entry.path, "lock.json")),
+            )
+            if stamps[0] is None:
+                continue  # Not a pack
+            name = entry.name
+            seen.add(name)
+            cached = self._pack_refs.get(name)
+            if cached is not None and cached[0] == stamps:
+                continue
+            refs = self._load_pack_references(name)
+            if cached is None or cached[1] != refs:
+                changed = True
+            self._pack_refs[name] = (stamps, refs)
+
+        for name in list(self._pack_refs):
+            if name not in seen:
+                del self._pack_refs[name]
+                changed = True
+
+        if changed or not self._references and self._pack_refs:
+            references: Dict[str, List[PackReference]] = {}
+            for name in sorted(self._pack_refs):
+                for sha256, ref in self._pack_refs[name][1]:
+                    references.setdefault(sha256, []).append(ref)
+            self._references = references
+        return changed
+
+    def _load_pack_references(self, pack_name: str) -> List[Tuple[str, PackReference]]:
+        """Build (sha256, PackReference) pairs for one pack's resolved artifacts."""
+        refs: List[Tuple[str, PackReference]] = []
+        try:
+            lock = self.layout.load_pack_lock(pack_name, readonly=True)
+            pack = self.layout.load_pack(pack_name, readonly=True)
+        except Exception as e:
+            logger.warning("[Inventory] Error processing pack '%s': %s", pack_name, e)
+            return refs  # Skip packs with missing/invalid locks
+
+        dependencies = {dep.id: dep for dep in pack.dependencies}
+        for resolved in lock.resolved:
+            sha256 = resolved.artifact.sha256
+            if not sha256:
+                continue
+
+            # Get expose filename from pack dependency
+            expose_filename = None
+            kind = resolved.artifact.kind
+            dep = dependencies.get(resolved.dependency_id)
+            if dep is not None:
+                expose_filename = dep.expose.filename
+                kind = dep.kind
+
+            # Build origin from artifact provider
+            origin = None
+            if resolved.artifact.provider:
+                prov = resolved.artifact.provider
+                origin = BlobOrigin(
+                    provider=prov.name,
+                    model_id=prov.model_id,
+                    version_id=prov.version_id,
+                    file_id=prov.file_id,
+                    filename=prov.filename,
+                    repo_id=prov.repo_id,
+                )
+
+            refs.append((sha256.lower(), PackReference(
+                pack_name=pack_name,
+                dependency_id=resolved.dependency_id,
+                kind=kind,
+                expose_filename=expose_filename,
+                size_bytes=resolved.artifact.size_bytes,
+                origin=origin,
+            )))
+        return refs
@@ -7,22 +7,26 @@ Provides comprehensive blob inventory with:
 - Missing blob detection
 - Safe cleanup operations
 - Location tracking (local vs backup)
+- Incremental refresh (see inventory_model.InventoryModel)
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from .blob_store import BlobStore
+from .blob_store import BlobStore, VerifyProgressCallback
+from .inventory_model import InventoryModel, InventorySnapshot
 from .layout import StoreLayout
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from .backup_service import BackupService
+    from .index_db import StoreIndex
 from .models import (
     AssetKind,
     BackupStats,
@@ -41,6 +45,42 @@ from .models import (
 )
 
 
+# Index age get_item accepts (seconds); layout writes are indexed
+# immediately, so this only delays out-of-band lock edits
+INDEX_MAX_AGE = 2.0
+
+
+def _reference_from_row(row) -> PackReference:
+    """Convert a StoreIndex.blob_references row to a PackReference."""
+    try:
+        kind = AssetKind(row["kind"])
+    except ValueError:
+        kind = AssetKind.UNKNOWN
+
+    origin = None
+    if row["provider"]:
+        try:
+            origin = BlobOrigin(
+                provider=ProviderName(row["provider"]),
+                model_id=row["model_id"],
+                version_id=row["version_id"],
+                file_id=row["file_id"],
+                filename=row["filename"],
+                repo_id=row["repo_id"],
+            )
+        except ValueError:
+            origin = None
+
+    return PackReference(
+        pack_name=row["pack"],
+        dependency_id=row["dependency_id"],
+        kind=kind,
+        expose_filename=row["expose_filename"],
+        size_bytes=row["size_bytes"],
+        origin=origin,
+    )
+
+
 class InventoryService:
     """
     Service for blob inventory management.
@@ -59,6 +99,7 @@ class InventoryService:
         layout: StoreLayout,
         blob_store: BlobStore,
         backup_service: Optional["BackupService"] = None,
+        index: Optional["StoreIndex"] = None,
     ):
         """
         Initialize inventory service.
@@ -67,66 +108,116 @@ class InventoryService:
             layout: Store layout manager
             blob_store: Blob store instance
             backup_service: Optional backup service for location detection
+            index: Optional store index for single-blob reference lookups
         """
         self.layout = layout
         self.blob_store = blob_store
         self.backup_service = backup_service
+        self.index = index
+
+        # Maintained from layout/blob write events, revalidated per refresh
+        self.model = InventoryModel(layout, blob_store)
+        layout.add_listener(self.model)
+        blob_store.add_listener(self.model.on_blob_changed)
+
+        # Unfiltered, unverified items of the last snapshot: (version, items)
+        self._items_lock = threading.Lock()
+        self._items_cache: Optional[Tuple[str, List[InventoryItem]]] = None
 
     def set_backup_service(self, backup_service: "BackupService") -> None:
         """Set or update the backup service reference."""
         self.backup_service = backup_service
 
+    def invalidate(self) -> None:
+        """Force a full rescan on the next build_inventory()."""
+        self.model.invalidate()
+        with self._items_lock:
+            self._items_cache = None
+
     def build_inventory(
         self,
         kind_filter: Optional[AssetKind] = None,
         status_filter: Optional[BlobStatus] = None,
         include_verification: bool = False,
+        rescan: bool = False,
     ) -> InventoryResponse:
         """
         Build complete inventory by cross-referencing blobs and pack locks.
 
         Algorithm:
-        1. List all physical blobs (local and backup)
-        2. Scan all pack locks for references
-        3. Cross-reference to determine status
-        4. Optionally verify hashes
+        1. Refresh the inventory model (rescans only changed blob shards/packs)
+        2. Cross-reference blobs and references to determine status
+           (reused from the previous call if the snapshot is unchanged)
+        3. Optionally verify hashes
 
         Args:
             kind_filter: Filter by asset kind
             status_filter: Filter by blob status
             include_verification: If True, verify blob hashes (slow!)
+            rescan: If True, discard the model and rescan everything
 
         Returns:
             Complete inventory response with summary and items
         """
         # NOTE: No routine logging - this is called frequently for UI refresh
         # Only log errors
+        if rescan:
+            self.invalidate()
 
-        # Step 1: Get all physical blobs (local)
         try:
-            local_blobs = set(self.blob_store.list_blobs())
+            snapshot = self.model.refresh(self.backup_service)
         except Exception as e:
-            logger.error("[Inventory] Failed to list local blobs: %s", e, exc_info=True)
+            logger.error("[Inventory] Failed to list blobs: %s", e, exc_info=True)
             raise
 
-        # Step 1b: Get backup blobs if backup service is available
-        backup_blobs: Set[str] = set()
-        if self.backup_service and self.backup_service.is_connected():
-            try:
-                backup_blobs = set(self.backup_service.list_backup_blobs())
-            except Exception as e:
-                logger.warning("[Inventory] Failed to list backup blobs: %s", e)
+        # Items only change with the snapshot, so reuse them between refreshes
+        cached = self._items_cache
+        if cached is not None and cached[0] == snapshot.version and not include_verification:
+            items = list(cached[1])
+        else:
+            items = self._build_items(snapshot, include_verification)
+            if not include_verification:
+                with self._items_lock:
+                    self._items_cache = (snapshot.version, items)
+                items = list(items)
+
+        # Step 6: Apply filters
+        if kind_filter:
+            items = [i for i in items if i.kind == kind_filter]
+        if status_filter:
+            items = [i for i in items if i.status == status_filter]
+
+        # Step 7: Build summary
+        summary = self._build_summary(items)
+
+        return InventoryResponse(
+            generated_at=datetime.now().isoformat(),
+            version=snapshot.version,
+            summary=summary,
+            items=items,
+        )
+
+    def _build_items(self, snapshot: InventorySnapshot, verify: bool) -> List[InventoryItem]:
+        """
+        Cross-reference a snapshot's blobs and references into inventory items.
+
+        Args:
+            snapshot: Model snapshot to build from
+            verify: If True, verify hashes of local blobs
+
+        Returns:
+            Unfiltered inventory items
+        """
+        local_blobs = snapshot.local_blobs.keys()
+        backup_blobs = snapshot.backup_blobs.keys()
+        ref_map = snapshot.references
 
         # All physical blobs (union of local and backup)
         all_physical_blobs = local_blobs | backup_blobs
 
-        # Step 2: Build reference map from all pack locks
-        ref_map = self._build_reference_map()
-
-        # Step 3: Determine referenced blobs
-        referenced_blobs = set(ref_map.keys())
+        # Determine referenced blobs
+        referenced_blobs = ref_map.keys()
 
-        # Step 4: Calculate sets
         # Blobs that exist locally and are referenced
         local_referenced = local_blobs & referenced_blobs
         # Blobs that exist locally but not referenced (orphan)
@@ -138,146 +229,79 @@ class InventoryService:
         # Blobs referenced but don't exist anywhere (truly missing)
         missing_blobs = referenced_blobs - all_physical_blobs
 
-        # Step 5: Build items
         items: List[InventoryItem] = []
 
         # Referenced blobs (exist locally and are referenced)
         for sha256 in local_referenced:
-            on_backup = sha256 in backup_blobs
-            item = self._build_item(
+            items.append(self._build_item(
                 sha256=sha256,
                 status=BlobStatus.REFERENCED,
                 refs=ref_map[sha256],
-                verify=include_verification,
+                verify=verify,
                 on_local=True,
-                on_backup=on_backup,
-            )
-            items.append(item)
+                on_backup=sha256 in backup_blobs,
+                snapshot=snapshot,
+            ))
 
         # Orphan blobs (exist locally but not referenced)
         for sha256 in orphan_blobs:
-            on_backup = sha256 in backup_blobs
-            item = self._build_item(
+            items.append(self._build_item(
                 sha256=sha256,
                 status=BlobStatus.ORPHAN,
                 refs=[],
-                verify=include_verification,
+                verify=verify,
                 on_local=True,
-                on_backup=on_backup,
-            )
-            items.append(item)
+                on_backup=sha256 in backup_blobs,
+                snapshot=snapshot,
+            ))
 
         # Backup-only referenced blobs (on backup but not local, and referenced)
         for sha256 in backup_only_referenced:
-            item = self._build_item(
+            items.append(self._build_item(
                 sha256=sha256,
                 status=BlobStatus.BACKUP_ONLY,
                 refs=ref_map[sha256],
                 verify=False,  # Can't verify without local copy
                 on_local=False,
                 on_backup=True,
-            )
-            items.append(item)
+                snapshot=snapshot,
+            ))
 
         # Backup-only orphan blobs (on backup but not local, not referenced)
         for sha256 in backup_only_orphan:
-            item = self._build_item(
+            items.append(self._build_item(
                 sha256=sha256,
                 status=BlobStatus.ORPHAN,  # Still orphan, just on backup
                 refs=[],
                 verify=False,
                 on_local=False,
                 on_backup=True,
-            )
-            items.append(item)
+                snapshot=snapshot,
+            ))
 
         # Missing blobs (referenced but don't exist anywhere)
         for sha256 in missing_blobs:
-            item = self._build_item(
+            items.append(self._build_item(
                 sha256=sha256,
                 status=BlobStatus.MISSING,
                 refs=ref_map[sha256],
                 verify=False,  # Can't verify what doesn't exist
                 on_local=False,
                 on_backup=False,
-            )
-            items.append(item)
-
-        # Step 6: Apply filters
-        if kind_filter:
-            items = [i for i in items if i.kind == kind_filter]
-        if status_filter:
-            items = [i for i in items if i.status == status_filter]
+                snapshot=snapshot,
+            ))
 
-        # Step 7: Build summary
-        summary = self._build_summary(items)
-
-        return InventoryResponse(
-            generated_at=datetime.now().isoformat(),
-            summary=summary,
-            items=items,
-        )
+        return items
 
     def _build_reference_map(self) -> Dict[str, List[PackReference]]:
         """
-        Scan all pack locks and build sha256 -> [references] map.
+        Get the sha256 -> [references] map from all pack locks.
 
         Returns:
             Dict mapping SHA256 hashes to list of pack references
         """
         # NOTE: No routine logging - this is called frequently for UI refresh
-        ref_map: Dict[str, List[PackReference]] = {}
-        packs = self.layout.list_packs()
-
-        for pack_name in packs:
-            try:
-                lock = self.layout.load_pack_lock(pack_name)
-                pack = self.layout.load_pack(pack_name)
-
-                for resolved in lock.resolved:
-                    sha256 = resolved.artifact.sha256
-                    if not sha256:
-                        continue
-
-                    sha256 = sha256.lower()
-                    if sha256 not in ref_map:
-                        ref_map[sha256] = []
-
-                    # Get expose filename from pack dependency
-                    expose_filename = None
-                    kind = resolved.artifact.kind
-                    for dep in pack.dependencies:
-                        if dep.id == resolved.dependency_id:
-                            expose_filename = dep.expose.filename
-                            kind = dep.kind
-                            break
-
-                    # Build origin from artifact provider
-                    origin = None
-                    if resolved.artifact.provider:
-                        prov = resolved.artifact.provider
-                        origin = BlobOrigin(
-                            provider=prov.name,
-                            model_id=prov.model_id,
-                            version_id=prov.version_id,
-                            file_id=prov.file_id,
-                            filename=prov.filename,
-                            repo_id=prov.repo_id,
-                        )
-
-                    ref_map[sha256].append(PackReference(
-                        pack_name=pack_name,
-                        dependency_id=resolved.dependency_id,
-                        kind=kind,
-                        expose_filename=expose_filename,
-                        size_bytes=resolved.artifact.size_bytes,
-                        origin=origin,
-                    ))
-            except Exception as e:
-                logger.warning("[Inventory] Error processing pack '%s': %s", pack_name, e)
-                continue  # Skip packs with missing/invalid locks
-
-        return ref_map
+        return self.model.refresh(self.backup_service).references
 
     def _build_item(
         self,
@@ -287,6 +311,7 @@ class InventoryService:
         verify: bool = False,
         on_local: bool = True,
         on_backup: bool = False,
+        snapshot: Optional[InventorySnapshot] = None,
     ) -> InventoryItem:
         """
         Build an inventory item from blob hash and references.
@@ -298,13 +323,19 @@ class InventoryService:
             verify: If True, verify blob hash
             on_local: Whether blob exists locally
             on_backup: Whether blob exists on backup
+            snapshot: Model snapshot providing sizes and manifests (no disk access)
 
         Returns:
             Populated InventoryItem
         """
         # Determine size
         size_bytes = 0
-        if on_local:
+        if snapshot is not None:
+            if on_local:
+                size_bytes = snapshot.local_blobs.get(sha256, 0)
+            elif on_backup:
+                size_bytes = snapshot.backup_blobs.get(sha256, 0)
+        elif on_local:
             size = self.blob_store.blob_size(sha256)
             if size is not None:
                 size_bytes = size
@@ -338,7 +369,10 @@ class InventoryService:
                 display_name = first_ref.origin.filename
         else:
             # No pack references - try to read manifest for orphan blobs
-            manifest = self.blob_store.read_manifest(sha256)
+            if snapshot is not None:
+                manifest = self.model.manifest(sha256)
+            else:
+                manifest = self.blob_store.read_manifest(sha256)
             if manifest:
                 display_name = manifest.original_filename
                 kind = manifest.kind
@@ -551,6 +585,53 @@ class InventoryService:
 
         return result
 
+    def get_item(self, sha256: str) -> Optional[InventoryItem]:
+        """
+        Build the inventory item for a single blob.
+
+        With an index, references come from its sha256 lookup instead of a
+        full inventory build.
+
+        Args:
+            sha256: SHA256 hash of the blob
+
+        Returns:
+            Inventory item, or None if the blob is neither present nor referenced
+        """
+        sha256 = sha256.lower()
+        if self.index is None:
+            inventory = self.build_inventory()
+            return next((i for i in inventory.items if i.sha256 == sha256), None)
+
+        self.index.refresh(max_age=INDEX_MAX_AGE)
+        refs = [_reference_from_row(row) for row in self.index.blob_references(sha256)]
+
+        on_local = self.blob_store.blob_exists(sha256)
+        on_backup = self._exists_on_backup(sha256)
+        if on_local:
+            status = BlobStatus.REFERENCED if refs else BlobStatus.ORPHAN
+        elif on_backup:
+            status = BlobStatus.BACKUP_ONLY if refs else BlobStatus.ORPHAN
+        elif refs:
+            status = BlobStatus.MISSING
+        else:
+            return None
+
+        return self._build_item(
+            sha256=sha256,
+            status=status,
+            refs=refs,
+            on_local=on_local,
+            on_backup=on_backup,
+        )
+
+    def _exists_on_backup(self, sha256: str) -> bool:
+        """Check whether a blob is present on connected backup storage."""
+        if not self.backup_service or not self.backup_service.is_connected():
+            return False
+        backup_path = self.backup_service.backup_blob_path(sha256)
+        return backup_path is not None and backup_path.exists()
+
     def get_impacts(self, sha256: str) -> ImpactAnalysis:
         """
         Analyze what would break if a blob is deleted.
@@ -564,13 +645,11 @@ class InventoryService:
         logger.debug("[Inventory] Analyzing impacts for blob %s", sha256[:12] if len(sha256) >= 12 else sha256)
 
         try:
-            inventory = self.build_inventory()
+            item = self.get_item(sha256)
         except Exception as e:
-            logger.error("[Inventory] Failed to build inventory for impacts: %s", e, exc_info=True)
+            logger.error("[Inventory] Failed to look up blob for impacts: %s", e, exc_info=True)
             raise
 
-        item = next((i for i in inventory.items if i.sha256 == sha256.lower()), None)
-
         if not item:
             logger.debug("[Inventory] Blob %s not found in inventory", sha256[:12])
             return ImpactAnalysis(
@@ -648,12 +727,7 @@ class InventoryService:
         # Check if this delete would remove the LAST copy of a referenced blob
         # It's safe to delete from one location if a copy remains in the other
         on_local = self.blob_store.blob_exists(sha256)
-        on_backup = (
-            self.backup_service
-            and self.backup_service.is_connected()
-            and self.backup_service.backup_blob_path(sha256) is not None
-            and self.backup_service.backup_blob_path(sha256).exists()
-        )
+        on_backup = self._exists_on_backup(sha256)
 
         would_be_last_copy = False
         if target == "both":
@@ -782,13 +856,24 @@ class InventoryService:
         self,
         sha256_list: Optional[List[str]] = None,
         all_blobs: bool = False,
+        force: bool = False,
+        max_workers: Optional[int] = None,
+        progress: Optional[VerifyProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> Dict:
         """
         Verify blob integrity.
 
+        Blobs are hashed in parallel; blobs unchanged since their last
+        successful verification are skipped unless force is set.
+
         Args:
             sha256_list: Specific blobs to verify
             all_blobs: If True, verify all blobs
+            force: Rehash every blob, ignoring previous results
+            max_workers: Number of hashing threads
+            progress: Per-blob progress callback (sha256, hashed_bytes, total_bytes)
+            cancel: Event that stops verification when set
 
         Returns:
             Verification result
@@ -796,28 +881,29 @@ class InventoryService:
         import time
 
         logger.info(
-            "[Inventory] Starting blob verification (all_blobs=%s, specific=%d)",
+            "[Inventory] Starting blob verification (all_blobs=%s, specific=%d, force=%s)",
             all_blobs,
             len(sha256_list or []),
+            force,
         )
         start = time.time()
 
         try:
-            if all_blobs:
-                valid, invalid = self.blob_store.verify_all()
-            else:
-                valid = []
-                invalid = []
-                for h in (sha256_list or []):
-                    if self.blob_store.verify(h):
-                        valid.append(h)
-                    else:
-                        invalid.append(h)
-                        logger.warning("[Inventory] Blob verification failed: %s", h[:12])
+            report = self.blob_store.verify_blobs(
+                None if all_blobs else (sha256_list or []),
+                max_workers=max_workers,
+                force=force,
+                progress=progress,
+                cancel=cancel,
+            )
         except Exception as e:
             logger.error("[Inventory] Blob verification failed: %s", e, exc_info=True)
             raise
 
+        valid, invalid = report.valid, report.invalid
+        for h in invalid:
+            logger.warning("[Inventory] Blob verification failed: %s", h[:12])
+
         duration_ms = int((time.time() - start) * 1000)
 
         if invalid:
@@ -839,6 +925,8 @@ class InventoryService:
             "valid": valid,
             "invalid": invalid,
             "duration_ms": duration_ms,
+            "skipped": len(report.skipped),
+            "cancelled": report.cancelled,
         }
 
     def migrate_manifests(self, dry_run: bool = True) -> MigrateManifestsResult:
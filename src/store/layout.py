@@ -18,14 +18,19 @@ Manages the v2 storage layout:
 
 from __future__ import annotations
 
+import copy
 import json
+import logging
 import os
 import shutil
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Type, TypeVar
 
 import filelock
+from pydantic import BaseModel, ConfigDict
 
 from .models import (
     Pack,
@@ -36,6 +41,10 @@ from .models import (
     UISets,
 )
 
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class StoreError(Exception):
     """Base exception for store errors."""
@@ -62,6 +71,249 @@ class ProfileNotFoundError(StoreError):
     pass
 
 
+class LayoutListener:
+    """
+    Receives notifications about state writes performed through StoreLayout.
+
+    Subclasses override only the hooks they care about. Hooks run after the
+    file has been written; exceptions are logged and never reach the writer.
+    """
+
+    def on_pack_saved(self, pack: Pack) -> None:
+        """Called after pack.json has been written."""
+
+    def on_lock_saved(self, lock: PackLock) -> None:
+        """Called after lock.json has been written."""
+
+    def on_pack_deleted(self, pack_name: str) -> None:
+        """Called after a pack directory has been removed."""
+
+    def on_profile_saved(self, profile: Profile) -> None:
+        """Called after profile.json has been written."""
+
+    def on_profile_deleted(self, profile_name: str) -> None:
+        """Called after a profile directory has been removed."""
+
+
+def _readonly(*args: Any, **kwargs: Any) -> None:
+    raise TypeError("Shared readonly model; load it without readonly=True to modify it")
+
+
+class _FrozenList(list):
+    """List inside a shared readonly model; in-place changes raise TypeError."""
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain lists
+        return (list, (list(self),))
+
+
+class _FrozenDict(dict):
+    """Dict inside a shared readonly model; in-place changes raise TypeError."""
+
+    pop = popitem = setdefault = update = clear = _readonly
+    __setitem__ = __delitem__ = __ior__ = _readonly
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (dict, (dict(self),))
+
+
+# model class -> frozen subclass, and back; see _freeze()
+_frozen_classes: Dict[type, type] = {}
+_plain_classes: Dict[type, type] = {}
+_frozen_classes_lock = threading.Lock()
+
+
+def _thaw(model: BaseModel, memo: Optional[Dict[int, Any]] = None) -> BaseModel:
+    """Deep copy of a frozen model as its plain, mutable class."""
+    plain = _plain_classes[type(model)]
+    thawed = plain.__new__(plain)
+    object.__setattr__(thawed, "__dict__", copy.deepcopy(model.__dict__, memo))
+    object.__setattr__(thawed, "__pydantic_extra__", copy.deepcopy(model.__pydantic_extra__, memo))
+    object.__setattr__(thawed, "__pydantic_fields_set__", set(model.__pydantic_fields_set__))
+    object.__setattr__(
+        thawed, "__pydantic_private__", copy.deepcopy(getattr(model, "__pydantic_private__", None), memo),
+    )
+    return thawed
+
+
+def _unpickle_thawed(model_cls: type, state: Dict[str, Any]) -> BaseModel:
+    model = model_cls.__new__(model_cls)
+    model.__setstate__(state)
+    return model
+
+
+def _reduce_frozen(self: BaseModel, protocol: int = 2) -> Any:
+    thawed = _thaw(self)
+    return (_unpickle_thawed, (type(thawed), thawed.__getstate__()))
+
+
+def _frozen_model_copy(
+    self: BaseModel, *, update: Optional[Dict[str, Any]] = None, deep: bool = False,
+) -> BaseModel:
+    # Always deep: a shallow copy would share the frozen containers
+    thawed = _thaw(self)
+    return thawed.model_copy(update=update) if update else thawed
+
+
+def _frozen_class(model_cls: type) -> type:
+    """Subclass of model_cls whose instances reject attribute assignment."""
+    with _frozen_classes_lock:
+        frozen = _frozen_classes.get(model_cls)
+        if frozen is None:
+            frozen = type(model_cls.__name__, (model_cls,), {
+                "__module__": model_cls.__module__,
+                "__qualname__": model_cls.__qualname__,
+                "model_config": ConfigDict(**model_cls.model_config, frozen=True),
+                # Copies and pickles come back as plain, mutable model_cls
+                "model_copy": _frozen_model_copy,
+                "__copy__": lambda self: _thaw(self),
+                "__deepcopy__": lambda self, memo=None: _thaw(self, memo),
+                "__reduce__": _reduce_frozen,
+                "__reduce_ex__": _reduce_frozen,
+            })
+            # BaseModel.__eq__ compares generic origins, so frozen and
+            # regular instances with the same fields stay equal
+            frozen.__pydantic_generic_metadata__ = {
+                **model_cls.__pydantic_generic_metadata__, "origin": model_cls,
+            }
+            _frozen_classes[model_cls] = frozen
+            _plain_classes[frozen] = model_cls
+        return frozen
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Deep-freeze a parsed value for sharing.
+
+    Models (at any depth) reject attribute assignment, and their lists and
+    dicts are replaced by read-only ones. Models are frozen in place; the
+    frozen value is returned.
+    """
+    if isinstance(value, BaseModel):
+        fields = value.__dict__
+        for name, field_value in fields.items():
+            fields[name] = _freeze(field_value)
+        extra = value.__pydantic_extra__
+        if extra:
+            object.__setattr__(value, "__pydantic_extra__", _freeze(extra))
+        object.__setattr__(value, "__class__", _frozen_class(type(value)))
+        return value
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
+class ModelCache:
+    """
+    Process-wide LRU cache of parsed state models.
+
+    Entries are keyed by (path, model class) and validated against the file's
+    (mtime_ns, size), so edits made outside StoreLayout are picked up on the
+    next load. StoreLayout.write_json invalidates entries explicitly.
+
+    Each entry keeps the raw file bytes and, once requested, a shared parsed
+    instance:
+    - load(readonly=False) returns a fresh model parsed from the cached bytes
+      (no disk read), which the caller may mutate freely
+    - load(readonly=True) returns the shared instance without any parsing.
+      It is deep-frozen: assigning to a field of it or of any nested model
+      raises a ValidationError, modifying a list or dict inside it raises
+      TypeError. model_copy(), copy.deepcopy() and pickle return the plain,
+      mutable model class.
+
+    Mutable loads are parsed rather than copied from the shared instance:
+    pydantic's JSON validation is several times faster than any deep copy
+    of a pack (model_copy(deep=True), pickle, or a structural copy).
+    """
+
+    DEFAULT_MAXSIZE = 2048
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # key -> [fingerprint, raw bytes, shared model or None]
+        self._entries: "OrderedDict[Tuple[str, type], List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Path, model_cls: Type[ModelT], readonly: bool = False) -> ModelT:
+        """
+        Load and validate a JSON file as model_cls.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        st = os.stat(path)
+        fingerprint = (st.st_mtime_ns, st.st_size)
+        key = (str(path), model_cls)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                raw, shared = entry[1], entry[2]
+            else:
+                entry = None
+                self.misses += 1
+
+        if entry is None:
+            raw = Path(path).read_bytes()
+            shared = None
+            entry = [fingerprint, raw, None]
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        if not readonly:
+            return model_cls.model_validate_json(raw)
+        if shared is None:
+            shared = model_cls.model_validate_json(raw)
+            _freeze(shared)
+            entry[2] = shared
+        return shared
+
+    def invalidate(self, path: Path) -> None:
+        """Drop all entries for a file."""
+        path_str = str(path)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path_str]:
+                del self._entries[key]
+
+    def invalidate_tree(self, directory: Path) -> None:
+        """Drop all entries for files below a directory."""
+        prefix = str(directory) + os.sep
+        with self._lock:
+            for key in [k for k in self._entries if k[0].startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
 class StoreLayout:
     """
     Manages the v2 storage layout.
@@ -70,6 +322,9 @@ class StoreLayout:
     """
     
     LOCK_TIMEOUT = 30.0  # seconds
+
+    # Shared by all layouts in the process; keys are absolute paths
+    model_cache = ModelCache()
     
     def __init__(self, root: Optional[Path] = None):
         """
@@ -87,6 +342,33 @@ class StoreLayout:
         # Check for separate state/data roots
         self.state_root = Path(os.environ.get("SYNAPSE_STATE_ROOT", self.root / "state"))
         self.data_root = Path(os.environ.get("SYNAPSE_DATA_ROOT", self.root / "data"))
+
+        self._listeners: List[LayoutListener] = []
+
+    # =========================================================================
+    # Write Listeners
+    # =========================================================================
+
+    def add_listener(self, listener: LayoutListener) -> None:
+        """Register a listener for pack/lock/profile writes."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: LayoutListener) -> None:
+        """Unregister a previously added listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, hook: str, *args: Any) -> None:
+        """Dispatch a write event to all listeners, isolating failures."""
+        for listener in list(self._listeners):
+            try:
+                getattr(listener, hook)(*args)
+            except Exception as e:
+                logger.warning(
+                    "[StoreLayout] Listener %s.%s failed: %s",
+                    type(listener).__name__, hook, e,
+                )
     
     # =========================================================================
     # Path Properties
@@ -142,11 +424,41 @@ class StoreLayout:
         """Path to SQLite database."""
         return self.registry_path / "index.sqlite"
     
+    @property
+    def hash_ledger_path(self) -> Path:
+        """Path to the verified-hash ledger database."""
+        return self.registry_path / "hashes.sqlite"
+
+    @property
+    def download_queue_path(self) -> Path:
+        """Path to the persistent download queue."""
+        return self.registry_path / "downloads.sqlite"
+
+    @property
+    def update_results_path(self) -> Path:
+        """Path to the stored results of background update checks."""
+        return self.registry_path / "updates.sqlite"
+
+    @property
+    def sync_journal_path(self) -> Path:
+        """Path to the backup sync session journal."""
+        return self.registry_path / "sync_sessions.sqlite"
+
+    @property
+    def state_manifest_path(self) -> Path:
+        """Path to the local state/ content manifest used by state sync."""
+        return self.registry_path / "state_manifest.json"
+    
     @property
     def cache_path(self) -> Path:
         """Path to cache directory."""
         return self.data_path / "cache"
     
+    @property
+    def civitai_cache_path(self) -> Path:
+        """Path to cached Civitai API responses."""
+        return self.cache_path / "civitai"
+
     @property
     def tmp_path(self) -> Path:
         """Path to temp directory."""
@@ -371,6 +683,7 @@ class StoreLayout:
             
             # Atomic rename
             tmp_path.replace(path)
+            self.model_cache.invalidate(path)
         finally:
             # Clean up temp file if it still exists
             if tmp_path.exists():
@@ -424,39 +737,55 @@ class StoreLayout:
         """Check if a pack exists."""
         return self.pack_json_path(pack_name).exists()
     
-    def load_pack(self, pack_name: str) -> Pack:
-        """Load a pack by name."""
-        path = self.pack_json_path(pack_name)
-        if not path.exists():
+    def load_pack(self, pack_name: str, readonly: bool = False) -> Pack:
+        """
+        Load a pack by name.
+
+        Args:
+            pack_name: Pack name
+            readonly: Return the shared, frozen cached instance instead of a
+                      private copy
+        """
+        try:
+            return self.model_cache.load(self.pack_json_path(pack_name), Pack, readonly)
+        except FileNotFoundError:
             raise PackNotFoundError(f"Pack not found: {pack_name}")
-        data = self.read_json(path)
-        return Pack.model_validate(data)
     
     def save_pack(self, pack: Pack) -> None:
         """Save a pack."""
         path = self.pack_json_path(pack.name)
         path.parent.mkdir(parents=True, exist_ok=True)
         self.write_json(path, pack.model_dump(by_alias=True))
+        self._notify("on_pack_saved", pack)
     
-    def load_pack_lock(self, pack_name: str) -> Optional[PackLock]:
-        """Load lock file for a pack. Returns None if not exists."""
-        path = self.pack_lock_path(pack_name)
-        if not path.exists():
+    def load_pack_lock(self, pack_name: str, readonly: bool = False) -> Optional[PackLock]:
+        """
+        Load lock file for a pack. Returns None if not exists.
+
+        Args:
+            pack_name: Pack name
+            readonly: Return the shared, frozen cached instance instead of a
+                      private copy
+        """
+        try:
+            return self.model_cache.load(self.pack_lock_path(pack_name), PackLock, readonly)
+        except FileNotFoundError:
             return None
-        data = self.read_json(path)
-        return PackLock.model_validate(data)
     
     def save_pack_lock(self, lock: PackLock) -> None:
         """Save lock file for a pack."""
         path = self.pack_lock_path(lock.pack)
         path.parent.mkdir(parents=True, exist_ok=True)
         self.write_json(path, lock.model_dump(by_alias=True))
+        self._notify("on_lock_saved", lock)
     
     def delete_pack(self, pack_name: str) -> bool:
         """Delete a pack. Returns True if deleted."""
         pack_dir = self.pack_dir(pack_name)
         if pack_dir.exists():
             shutil.rmtree(pack_dir)
+            self.model_cache.invalidate_tree(pack_dir)
+            self._notify("on_pack_deleted", pack_name)
             return True
         return False
     
@@ -490,6 +819,7 @@ class StoreLayout:
         path = self.profile_json_path(profile.name)
         path.parent.mkdir(parents=True, exist_ok=True)
         self.write_json(path, profile.model_dump(by_alias=True))
+        self._notify("on_profile_saved", profile)
     
     def delete_profile(self, profile_name: str) -> bool:
         """Delete a profile. Returns True if deleted. Cannot delete 'global'."""
@@ -498,6 +828,7 @@ class StoreLayout:
         profile_dir = self.profile_dir(profile_name)
         if profile_dir.exists():
             shutil.rmtree(profile_dir)
+            self._notify("on_profile_deleted", profile_name)
             return True
         return False
     
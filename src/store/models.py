@@ -240,6 +240,21 @@ class BackupConfig(BaseModel):
     warn_before_delete_last_copy: bool = True  # Warn when deleting last copy
 
 
+class DownloadConfig(BaseModel):
+    """Limits for the download queue."""
+    max_concurrent: int = 3  # Downloads running at once
+    max_per_host: int = 2  # Downloads running against one host
+    max_bandwidth_mb_per_s: float = 0  # Global ceiling in MB/s, 0 = unlimited
+
+
+class UpdateCheckConfig(BaseModel):
+    """Schedule of the background update checker."""
+    enabled: bool = True
+    interval_minutes: float = 360  # Recheck a pack once its plan is this old
+    batch_size: int = 5  # Packs checked per batch
+    max_checks_per_minute: float = 10  # Pack checks allowed per minute, across batches
+
+
 class StoreConfig(BaseModel):
     """Main store configuration (state/config.json)."""
     schema_: str = Field(default="synapse.config.v2", alias="schema")
@@ -248,6 +263,8 @@ class StoreConfig(BaseModel):
     providers: Dict[str, ProviderConfig] = Field(default_factory=dict)
     base_model_aliases: Dict[str, BaseModelAlias] = Field(default_factory=dict)
     backup: BackupConfig = Field(default_factory=BackupConfig)
+    downloads: DownloadConfig = Field(default_factory=DownloadConfig)
+    updates: UpdateCheckConfig = Field(default_factory=UpdateCheckConfig)
 
     model_config = {"populate_by_name": True}
     
@@ -1241,6 +1258,7 @@ class SearchResultItem(BaseModel):
     provider: Optional[str] = None
     source_model_id: Optional[int] = None
     source_url: Optional[str] = None
+    score: Optional[float] = None  # Relevance (higher is better), None for unranked results
 
 
 class SearchResult(BaseModel):
@@ -1391,6 +1409,7 @@ class InventorySummary(BaseModel):
 class InventoryResponse(BaseModel):
     """Response from inventory endpoint."""
     generated_at: str
+    version: Optional[str] = None  # Changes whenever the underlying inventory changes
     summary: InventorySummary
     items: List[InventoryItem] = Field(default_factory=list)
 
@@ -1451,6 +1470,30 @@ class BlobManifest(BaseModel):
 # Backup Storage Models
 # =============================================================================
 
+class SyncSessionItem(BaseModel):
+    """Journal entry for one blob of a sync session."""
+    sha256: str
+    size_bytes: int = 0
+    status: str  # "pending", "copying", "done", "failed"
+    bytes_done: int = 0  # For "copying"/"failed": size of the .part file so far
+    error: Optional[str] = None
+
+
+class SyncSession(BaseModel):
+    """A journaled (resumable) blob transfer between local and backup storage."""
+    session_id: str
+    scope: str  # "sync" or "pull:<pack>"
+    direction: str  # "to_backup" or "from_backup"
+    status: str  # "running", "completed", "failed"
+    blobs_total: int = 0
+    blobs_done: int = 0
+    bytes_total: int = 0
+    bytes_done: int = 0
+    created_at: str
+    updated_at: str
+    items: List[SyncSessionItem] = Field(default_factory=list)
+
+
 class BackupStatus(BaseModel):
     """Status of the backup storage connection."""
     enabled: bool
@@ -1465,6 +1508,8 @@ class BackupStatus(BaseModel):
     # Config options (for UI)
     auto_backup_new: bool = False
     warn_before_delete_last_copy: bool = True
+    # Unfinished (resumable) sync sessions with per-blob status
+    sessions: List[SyncSession] = Field(default_factory=list)
 
 
 class BackupOperationResult(BaseModel):
@@ -1504,6 +1549,8 @@ class SyncResult(BaseModel):
     bytes_synced: int = 0
     items: List[SyncItem] = Field(default_factory=list)
     errors: List[str] = Field(default_factory=list)
+    session_id: Optional[str] = None  # Journal session (None for dry runs)
+    resumed: bool = False  # True if an interrupted session was continued
 
 
 # =============================================================================
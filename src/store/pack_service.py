@@ -1210,7 +1210,7 @@ class PackService:
             SelectorStrategy.BASE_MODEL_HINT: BaseModelHintResolver(self.civitai, self.layout),
             SelectorStrategy.HUGGINGFACE_FILE: HuggingFaceResolver(),
             SelectorStrategy.URL_DOWNLOAD: UrlResolver(),
-            SelectorStrategy.LOCAL_FILE: LocalFileResolver(),
+            SelectorStrategy.LOCAL_FILE: LocalFileResolver(self.blob_store.hash_ledger),
         }
 
     def _resolve_dependency(
@@ -237,15 +237,14 @@ class ProfileService:
             if restored:
                 result.notes.append(f"restored_{len(restored)}_blobs_from_backup")
 
-            # Build and activate for each UI
-            for ui in ui_targets:
-                report = self.view_builder.build(ui, work_profile, packs_data)
+            # Build and activate for all UIs concurrently
+            reports = self.view_builder.build_many(
+                ui_targets, work_profile, packs_data, activate=True,
+            )
+            for report in reports.values():
                 result.shadowed.extend(report.shadowed)
 
-                # Activate
-                self.view_builder.activate(ui, work_profile.name)
-
-        # Update runtime stack (atomic operation with lock)
+        # Update runtime stack (atomic operation with lock, after all builds)
         with self.layout.lock():
             runtime = self.layout.load_runtime()
             for ui in ui_targets:
@@ -335,9 +334,7 @@ class ProfileService:
                 profile = self.layout.load_profile(to_profile)
                 packs_data = self._load_packs_for_profile(profile)
 
-                for ui in ui_targets:
-                    self.view_builder.build(ui, profile, packs_data)
-                    self.view_builder.activate(ui, to_profile)
+                self.view_builder.build_many(ui_targets, profile, packs_data, activate=True)
             except ProfileNotFoundError:
                 result.notes.append("profile_not_found")
         else:
@@ -390,13 +387,8 @@ class ProfileService:
         if install_missing:
             self._install_missing_blobs(packs_data)
         
-        # Build views for each UI
-        reports = {}
-        for ui in ui_targets:
-            reports[ui] = self.view_builder.build(ui, profile, packs_data)
-            self.view_builder.activate(ui, profile_name)
-        
-        return reports
+        # Build and activate views for all UIs concurrently
+        return self.view_builder.build_many(ui_targets, profile, packs_data, activate=True)
     
     def sync_profile_from_ui_set(
         self,
@@ -483,8 +475,8 @@ class ProfileService:
         packs_data = {}
         for pack_entry in profile.packs:
             try:
-                pack = self.layout.load_pack(pack_entry.name)
-                lock = self.layout.load_pack_lock(pack_entry.name)
+                pack = self.layout.load_pack(pack_entry.name, readonly=True)
+                lock = self.layout.load_pack_lock(pack_entry.name, readonly=True)
                 packs_data[pack_entry.name] = (pack, lock)
             except Exception:
                 continue
@@ -503,6 +495,11 @@ class ProfileService:
             List of installed blob SHA256 hashes
         """
         installed = []
+        present = self.blob_store.existing_blobs(
+            resolved.artifact.sha256
+            for _, lock in packs_data.values() if lock is not None
+            for resolved in lock.resolved if resolved.artifact.sha256
+        )
 
         for pack_name, (pack, lock) in packs_data.items():
             if lock is None:
@@ -513,7 +510,7 @@ class ProfileService:
                 if not sha256:
                     continue
 
-                if self.blob_store.blob_exists(sha256):
+                if sha256 in present:
                     continue
 
                 # Try restore from backup first (auto-restore feature)
@@ -523,6 +520,7 @@ class ProfileService:
                             result = self.backup_service.restore_blob(sha256)
                             if result.success:
                                 installed.append(sha256)
+                                present.add(sha256)
                                 continue  # Successfully restored, no need to download
                         except Exception:
                             pass  # Restore failed, try download
@@ -533,6 +531,7 @@ class ProfileService:
                     try:
                         self.blob_store.download(urls[0], sha256)
                         installed.append(sha256)
+                        present.add(sha256)
                     except Exception:
                         pass  # Log error, continue
 
@@ -0,0 +1,308 @@
+"""
+Synapse Store v2 - Progress Event Hub
+
+Push channel for long-running operations (downloads, backup sync, inventory
+verify). Producers publish the full current state of an item; subscribers
+receive only what changed since they last looked, coalesced and rate-limited:
+
+    hub = ProgressHub()
+    hub.publish("download", download_id, {"status": "downloading", ...})
+    hub.remove("download", download_id)
+
+    sub = hub.subscribe(channels={"download"})
+    sub.snapshot()     # everything currently known, on connect
+    sub.drain()        # deltas since the last drain (at most one per interval)
+
+Producers may publish on every chunk; publishing only overwrites the item's
+state, so a subscriber that drains every 250 ms sees one delta per item with
+the latest values, no matter how many updates happened in between.
+
+Items of a grouped channel (downloads with a group_id) also produce an
+aggregate item on the group channel ("download_group") with summed bytes,
+speed, ETA and a combined status.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Channels
+DOWNLOAD = "download"
+DOWNLOAD_GROUP = "download_group"
+BACKUP_SYNC = "backup_sync"
+VERIFY = "verify"
+
+# channel -> (aggregate channel, item field holding the group key)
+GROUPED_CHANNELS = {DOWNLOAD: (DOWNLOAD_GROUP, "group_id")}
+
+_ACTIVE_STATUSES = ("downloading", "running", "pending", "queued")
+
+ItemKey = Tuple[str, str]
+
+
+@dataclass
+class ProgressEvent:
+    """One item's change: data holds changed fields, or None if the item was removed."""
+    channel: str
+    key: str
+    data: Optional[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"channel": self.channel, "key": self.key, "data": self.data}
+
+
+class ProgressHub:
+    """
+    Thread-safe latest-state store with per-subscriber delta tracking.
+
+    Every publish bumps a global sequence number; subscribers remember the
+    last sequence they drained and the values they last sent, so a delta
+    is computed only for items that changed and only contains changed fields.
+    Removed items are kept as tombstones for TOMBSTONE_TTL seconds so slow
+    subscribers still learn about the removal.
+    """
+
+    TOMBSTONE_TTL = 60.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[ItemKey, Optional[Dict[str, Any]]] = {}
+        self._versions: Dict[ItemKey, int] = {}
+        self._removed_at: Dict[ItemKey, float] = {}
+        self._seq = itertools.count(1)
+        self._last_seq = 0
+
+    # =========================================================================
+    # Producers
+    # =========================================================================
+
+    def publish(self, channel: str, key: str, data: Dict[str, Any]) -> None:
+        """
+        Set an item's current state (merged into what was published before).
+
+        Args:
+            channel: Channel name (download, backup_sync, verify, ...)
+            key: Item key within the channel (download id, operation id)
+            data: Current field values; must be JSON-serializable
+        """
+        item = (channel, key)
+        with self._lock:
+            current = self._state.get(item)
+            merged = dict(current) if current else {}
+            merged.update(data)
+            self._state[item] = merged
+            self._removed_at.pop(item, None)
+            self._bump(item)
+
+    def remove(self, channel: str, key: str) -> None:
+        """Drop an item; subscribers that saw it receive a removal event."""
+        item = (channel, key)
+        with self._lock:
+            if self._state.get(item) is None:
+                return
+            self._state[item] = None
+            self._removed_at[item] = time.monotonic()
+            self._bump(item)
+            self._prune()
+
+    def get(self, channel: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of an item's current state."""
+        with self._lock:
+            data = self._state.get((channel, key))
+            return dict(data) if data is not None else None
+
+    def subscribe(
+        self,
+        channels: Optional[Iterable[str]] = None,
+        interval: float = 0.25,
+    ) -> "ProgressSubscription":
+        """
+        Create a subscriber.
+
+        Args:
+            channels: Channels to receive (all if None). Subscribing to a
+                grouped channel also delivers its aggregate channel.
+            interval: Minimum seconds between two non-empty drains
+        """
+        return ProgressSubscription(self, channels, interval)
+
+    def _bump(self, item: ItemKey) -> None:
+        seq = next(self._seq)
+        self._versions[item] = seq
+        self._last_seq = seq
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.TOMBSTONE_TTL
+        for item, removed in list(self._removed_at.items()):
+            if removed < cutoff:
+                del self._removed_at[item]
+                self._state.pop(item, None)
+                self._versions.pop(item, None)
+
+    # =========================================================================
+    # Subscriber Support
+    # =========================================================================
+
+    def _changes_since(self, seq: int) -> Tuple[int, Dict[ItemKey, Optional[Dict[str, Any]]]]:
+        """Return (latest seq, items changed after seq) - a consistent copy."""
+        with self._lock:
+            if seq >= self._last_seq:
+                return self._last_seq, {}
+            changed = {
+                item: dict(self._state[item]) if self._state[item] is not None else None
+                for item, version in self._versions.items()
+                if version > seq
+            }
+            return self._last_seq, changed
+
+    def _items(self, channel: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                dict(data) for (ch, _), data in self._state.items()
+                if ch == channel and data is not None
+            ]
+
+
+def aggregate_group(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine a download group's items into one progress record.
+
+    Args:
+        items: Current state of every download in the group
+
+    Returns:
+        Summed bytes/speed, derived progress and ETA, counts and a status:
+        "downloading" while any item is active, else "paused" or "failed"
+        if any item is, else "completed".
+    """
+    total = sum(int(i.get("total_bytes") or 0) for i in items)
+    done = sum(int(i.get("downloaded_bytes") or 0) for i in items)
+    speed = sum(
+        float(i.get("speed_bps") or 0) for i in items
+        if i.get("status") in _ACTIVE_STATUSES
+    )
+    statuses = [i.get("status") for i in items]
+
+    if any(s in _ACTIVE_STATUSES for s in statuses):
+        status = "downloading"
+    elif "paused" in statuses:
+        status = "paused"
+    elif "failed" in statuses:
+        status = "failed"
+    else:
+        status = "completed"
+
+    return {
+        "group_label": next((i.get("group_label") for i in items if i.get("group_label")), None),
+        "status": status,
+        "count": len(items),
+        "completed_count": statuses.count("completed"),
+        "downloaded_bytes": done,
+        "total_bytes": total,
+        "progress": round(done / total * 100, 1) if total > 0 else 0.0,
+        "speed_bps": speed,
+        "eta_seconds": int((total - done) / speed) if speed > 0 and total > done else 0,
+    }
+
+
+class ProgressSubscription:
+    """
+    One subscriber's view of a ProgressHub.
+
+    Not thread-safe; each stream owns its subscription.
+    """
+
+    def __init__(self, hub: ProgressHub, channels: Optional[Iterable[str]], interval: float):
+        self.hub = hub
+        self.interval = interval
+        self._channels: Optional[Set[str]] = None
+        if channels is not None:
+            self._channels = set(channels)
+            for channel, (group_channel, _) in GROUPED_CHANNELS.items():
+                if channel in self._channels:
+                    self._channels.add(group_channel)
+        self._seq = 0
+        self._sent: Dict[ItemKey, Dict[str, Any]] = {}
+        self._last_flush = 0.0
+
+    def _wants(self, channel: str) -> bool:
+        return self._channels is None or channel in self._channels
+
+    def snapshot(self) -> List[ProgressEvent]:
+        """Return every live item as full events and start tracking deltas from here."""
+        self._seq, changed = self.hub._changes_since(0)
+        self._sent.clear()
+        events = self._diff(changed, initial=True)
+        self._last_flush = time.monotonic()
+        return events
+
+    def drain(self, force: bool = False) -> List[ProgressEvent]:
+        """
+        Return deltas since the last drain/snapshot.
+
+        Returns an empty list without consuming anything if called again
+        within interval seconds (unless force), so changes coalesce.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.interval:
+            return []
+        seq, changed = self.hub._changes_since(self._seq)
+        if not changed:
+            return []
+        self._seq = seq
+        self._last_flush = now
+        return self._diff(changed)
+
+    def _diff(
+        self,
+        changed: Dict[ItemKey, Optional[Dict[str, Any]]],
+        initial: bool = False,
+    ) -> List[ProgressEvent]:
+        events: List[ProgressEvent] = []
+        touched_groups: Set[ItemKey] = set()
+
+        for (channel, key), data in changed.items():
+            grouping = GROUPED_CHANNELS.get(channel)
+            if grouping is not None:
+                group_channel, group_field = grouping
+                group_keys = {(data or {}).get(group_field), self._sent.get((channel, key), {}).get(group_field)}
+                touched_groups.update((group_channel, g) for g in group_keys if g)
+            if self._wants(channel):
+                self._emit(events, (channel, key), data, initial)
+
+        for group_channel, group_key in touched_groups:
+            if not self._wants(group_channel):
+                continue
+            source = next(ch for ch, (gc, _) in GROUPED_CHANNELS.items() if gc == group_channel)
+            group_field = GROUPED_CHANNELS[source][1]
+            members = [i for i in self.hub._items(source) if i.get(group_field) == group_key]
+            aggregate = aggregate_group(members) if members else None
+            self._emit(events, (group_channel, group_key), aggregate, initial)
+
+        return events
+
+    def _emit(
+        self,
+        events: List[ProgressEvent],
+        item: ItemKey,
+        data: Optional[Dict[str, Any]],
+        initial: bool,
+    ) -> None:
+        previous = self._sent.get(item)
+        if data is None:
+            if previous is not None:
+                del self._sent[item]
+                events.append(ProgressEvent(item[0], item[1], None))
+            return
+
+        if previous is None or initial:
+            delta = dict(data)
+        else:
+            delta = {k: v for k, v in data.items() if previous.get(k) != v}
+        self._sent[item] = dict(data)
+        if delta:
+            events.append(ProgressEvent(item[0], item[1], delta))
@@ -0,0 +1,200 @@
+"""
+Synapse Store v2 - State Manifest
+
+Content-hash manifest of a state/ tree, used by BackupService.sync_state:
+
+    relative path -> (sha256, size, mtime_ns)
+
+The local manifest (data/registry/state_manifest.json) is refreshed by a
+stat walk of state/ that rehashes only files whose size or mtime changed.
+It also remembers, per path, the hash both sides last agreed on, which is
+what tells "modified on one side" apart from "modified on both" (conflict).
+
+The backup manifest (<backup>/.synapse/store/state_manifest.json) is only
+updated by our own writes to the backup, so status never walks the backup
+tree. It is rebuilt by a walk when missing or on request (rescan).
+
+Files whose mtime falls within RACY_WINDOW_NS of the last refresh are
+rehashed on the next refresh, since a same-size rewrite inside the
+filesystem's timestamp granularity would otherwise go unnoticed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from .blob_snapshot import RACY_WINDOW_NS
+
+logger = logging.getLogger(__name__)
+
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class StateFileEntry:
+    """Manifest record for one state file."""
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+def _hash_file(path: Path) -> str:
+    """State files are small JSON documents; hash in one read."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def iter_state_files(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yield (relative posix path, stat) for every state file under root.
+
+    Hidden files and *.tmp (atomic write leftovers) are skipped.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(Path(entry.path))
+            elif entry.is_file() and not entry.name.endswith(".tmp"):
+                rel_path = Path(entry.path).relative_to(root).as_posix()
+                yield rel_path, entry.stat()
+
+
+class StateManifest:
+    """
+    Path -> content hash map of one side of the state sync, stored as JSON.
+
+    Not thread-safe; BackupService serializes access.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: JSON file the manifest is stored in
+        """
+        self.path = path
+        self.entries: Dict[str, StateFileEntry] = {}
+        self.synced: Dict[str, str] = {}  # path -> sha256 both sides last agreed on
+        self.refreshed_ns = 0
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["StateManifest"]:
+        """
+        Load a manifest.
+
+        Returns:
+            The manifest, or None if it is missing or unreadable
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("[StateManifest] Ignoring unreadable manifest %s: %s", path, e)
+            return None
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+
+        manifest = cls(path)
+        try:
+            manifest.entries = {
+                rel_path: StateFileEntry(entry["sha256"], entry["size"], entry["mtime_ns"])
+                for rel_path, entry in data.get("files", {}).items()
+            }
+            manifest.synced = dict(data.get("synced", {}))
+            manifest.refreshed_ns = int(data.get("refreshed_ns", 0))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("[StateManifest] Ignoring malformed manifest %s: %s", path, e)
+            return None
+        return manifest
+
+    def save(self, write_json) -> None:
+        """
+        Write the manifest if it changed.
+
+        Args:
+            write_json: Atomic JSON writer (StoreLayout.write_json)
+        """
+        if not self.dirty:
+            return
+        write_json(self.path, {
+            "version": MANIFEST_VERSION,
+            "refreshed_ns": self.refreshed_ns,
+            "files": {
+                rel_path: {"sha256": e.sha256, "size": e.size, "mtime_ns": e.mtime_ns}
+                for rel_path, e in self.entries.items()
+            },
+            "synced": self.synced,
+        })
+        self.dirty = False
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def refresh(self, root: Path) -> None:
+        """
+        Bring entries in line with the files under root.
+
+        Only files that are new, changed (size or mtime) or were written
+        inside the racy window of the previous refresh are hashed.
+        """
+        racy_ns = self.refreshed_ns - RACY_WINDOW_NS
+        self.refreshed_ns = time.time_ns()
+        seen = set()
+        for rel_path, st in iter_state_files(root):
+            seen.add(rel_path)
+            known = self.entries.get(rel_path)
+            if (
+                known is not None
+                and known.size == st.st_size
+                and known.mtime_ns == st.st_mtime_ns
+                and known.mtime_ns < racy_ns
+            ):
+                continue
+            try:
+                sha256 = _hash_file(root / rel_path)
+            except OSError:
+                continue  # Vanished mid-walk
+            if known is None or known.sha256 != sha256 or known.mtime_ns != st.st_mtime_ns:
+                self.dirty = True
+            self.entries[rel_path] = StateFileEntry(sha256, st.st_size, st.st_mtime_ns)
+
+        for rel_path in set(self.entries) - seen:
+            del self.entries[rel_path]
+            self.dirty = True
+
+    def record(self, rel_path: str, path: Path, sha256: Optional[str] = None) -> StateFileEntry:
+        """
+        Record a file just written at path (hashing it unless sha256 is given).
+
+        Returns:
+            The new entry
+        """
+        st = path.stat()
+        entry = StateFileEntry(sha256 or _hash_file(path), st.st_size, st.st_mtime_ns)
+        self.entries[rel_path] = entry
+        self.dirty = True
+        return entry
+
+    def mark_synced(self, rel_path: str, sha256: str) -> None:
+        """Remember sha256 as the content both sides agree on."""
+        if self.synced.get(rel_path) != sha256:
+            self.synced[rel_path] = sha256
+            self.dirty = True
@@ -0,0 +1,328 @@
+"""
+Synapse Store v2 - Sync Session Journal
+
+Records backup transfers (BackupService.sync, Store.pull_pack) as sessions
+at data/registry/sync_sessions.sqlite:
+
+    session (scope, direction, status) -> items (sha256, size, status, error)
+
+A session stays open until every item is done. Starting the same scope and
+direction again while one is open continues it instead of starting over:
+items already done are skipped, and items that were copying resume from
+their .part file on the target side when the copy is verified (see
+BackupService._copy_file).
+
+Item statuses: pending -> copying -> done | failed. Session statuses:
+running (open, possibly interrupted), failed (finished with failed items,
+still resumable), completed (closed).
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .layout import StoreLayout
+from .models import SyncSession, SyncSessionItem
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA_VERSION = 1
+
+# Item statuses
+PENDING = "pending"
+COPYING = "copying"
+DONE = "done"
+FAILED = "failed"
+
+# Session statuses
+RUNNING = "running"
+COMPLETED = "completed"
+
+# Completed sessions kept for history; older ones are pruned
+KEEP_COMPLETED = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_scope ON sessions(scope, direction, status);
+
+CREATE TABLE IF NOT EXISTS items (
+    session_id TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    error TEXT,
+    PRIMARY KEY (session_id, sha256)
+);
+"""
+
+
+class SyncJournal:
+    """
+    Persistent record of sync sessions and per-blob progress.
+
+    A single connection is shared across threads and serialized by a lock;
+    the database is opened lazily on first use.
+    """
+
+    def __init__(self, layout: StoreLayout):
+        """
+        Initialize journal.
+
+        Args:
+            layout: Store layout manager
+        """
+        self.layout = layout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self.layout.sync_journal_path
+
+    # =========================================================================
+    # Connection Management
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database (once)."""
+        if self._conn is not None:
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._open()
+        except sqlite3.DatabaseError as e:
+            # Corrupt journal: losing it only means the next run starts over
+            logger.warning("[SyncJournal] Discarding unreadable journal %s: %s", self.db_path, e)
+            for suffix in ("", "-wal", "-shm"):
+                Path(str(self.db_path) + suffix).unlink(missing_ok=True)
+            conn = self._open()
+
+        self._conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS items")
+            conn.execute("DROP TABLE IF EXISTS sessions")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =========================================================================
+    # Sessions
+    # =========================================================================
+
+    def open_session(
+        self,
+        scope: str,
+        direction: str,
+        items: Iterable[Tuple[str, int]],
+        discard: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Start a session, or continue the open one for the same scope/direction.
+
+        Args:
+            scope: What is being transferred ("sync", "pull:<pack>")
+            direction: "to_backup" or "from_backup"
+            items: (sha256, size_bytes) to transfer. A continued session
+                   gains new items and drops unfinished ones no longer listed
+                   (they were copied some other way or are gone).
+            discard: Optional callback(sha256) for each dropped item, to
+                     delete its .part file
+
+        Returns:
+            (session_id, resumed)
+        """
+        items = [(sha256.lower(), size) for sha256, size in items]
+        now = datetime.now().isoformat()
+        stale: List[Tuple[str, str]] = []
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                row = conn.execute(
+                    "SELECT session_id FROM sessions WHERE scope = ? AND direction = ? "
+                    "AND status != ? ORDER BY created_at DESC LIMIT 1",
+                    (scope, direction, COMPLETED),
+                ).fetchone()
+                if row is not None:
+                    session_id, resumed = row["session_id"], True
+                    conn.execute(
+                        "UPDATE sessions SET status = ?, updated_at = ? WHERE session_id = ?",
+                        (RUNNING, now, session_id),
+                    )
+                else:
+                    session_id, resumed = uuid.uuid4().hex, False
+                    conn.execute(
+                        "INSERT INTO sessions (session_id, scope, direction, status, created_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (session_id, scope, direction, RUNNING, now, now),
+                    )
+                start = conn.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM items WHERE session_id = ?",
+                    (session_id,),
+                ).fetchone()[0]
+                conn.executemany(
+                    "INSERT OR IGNORE INTO items (session_id, sha256, position, size_bytes, status) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (session_id, sha256, start + i, size, PENDING)
+                        for i, (sha256, size) in enumerate(items)
+                    ],
+                )
+                if resumed:
+                    wanted = {sha256 for sha256, _ in items}
+                    stale = [
+                        (session_id, row["sha256"])
+                        for row in conn.execute(
+                            "SELECT sha256 FROM items WHERE session_id = ? AND status != ?",
+                            (session_id, DONE),
+                        )
+                        if row["sha256"] not in wanted
+                    ]
+                    conn.executemany("DELETE FROM items WHERE session_id = ? AND sha256 = ?", stale)
+
+        if discard is not None:
+            for _, sha256 in stale:
+                try:
+                    discard(sha256)
+                except OSError as e:
+                    logger.warning("[SyncJournal] Could not discard %s: %s", sha256[:12], e)
+        return session_id, resumed
+
+    def has_open_session(self, scope: str, direction: str) -> bool:
+        """Check whether an unfinished session exists for scope/direction."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT 1 FROM sessions WHERE scope = ? AND direction = ? AND status != ? LIMIT 1",
+                (scope, direction, COMPLETED),
+            ).fetchone()
+        return row is not None
+
+    def items(self, session_id: str) -> Dict[str, SyncSessionItem]:
+        """Return the session's items keyed by sha256, in journal order."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT sha256, size_bytes, status, error FROM items "
+                "WHERE session_id = ? ORDER BY position",
+                (session_id,),
+            ).fetchall()
+        return {
+            row["sha256"]: SyncSessionItem(
+                sha256=row["sha256"],
+                size_bytes=row["size_bytes"],
+                status=row["status"],
+                error=row["error"],
+            )
+            for row in rows
+        }
+
+    def set_item(self, session_id: str, sha256: str, status: str, error: Optional[str] = None) -> None:
+        """Record an item's status change."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE items SET status = ?, error = ? WHERE session_id = ? AND sha256 = ?",
+                    (status, error, session_id, sha256.lower()),
+                )
+                conn.execute(
+                    "UPDATE sessions SET updated_at = ? WHERE session_id = ?",
+                    (datetime.now().isoformat(), session_id),
+                )
+
+    def finish(self, session_id: str) -> str:
+        """
+        Close the session if every item is done, otherwise mark it failed.
+
+        Returns:
+            The session's new status
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                remaining = conn.execute(
+                    "SELECT COUNT(*) FROM items WHERE session_id = ? AND status != ?",
+                    (session_id, DONE),
+                ).fetchone()[0]
+                status = COMPLETED if remaining == 0 else FAILED
+                conn.execute(
+                    "UPDATE sessions SET status = ?, updated_at = ? WHERE session_id = ?",
+                    (status, datetime.now().isoformat(), session_id),
+                )
+                self._prune(conn)
+        return status
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete completed sessions beyond the newest KEEP_COMPLETED (no commit)."""
+        stale = [
+            row["session_id"]
+            for row in conn.execute(
+                "SELECT session_id FROM sessions WHERE status = ? "
+                "ORDER BY updated_at DESC LIMIT -1 OFFSET ?",
+                (COMPLETED, KEEP_COMPLETED),
+            )
+        ]
+        for session_id in stale:
+            conn.execute("DELETE FROM items WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def open_sessions(self) -> List[SyncSession]:
+        """
+        Return sessions that are not completed, newest first, with their items.
+
+        bytes_done counts finished items only; callers fill in .part progress
+        for items that are copying.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT * FROM sessions WHERE status != ? ORDER BY created_at DESC",
+                (COMPLETED,),
+            ).fetchall()
+
+        sessions = []
+        for row in rows:
+            items = list(self.items(row["session_id"]).values())
+            done = [item for item in items if item.status == DONE]
+            sessions.append(SyncSession(
+                session_id=row["session_id"],
+                scope=row["scope"],
+                direction=row["direction"],
+                status=row["status"],
+                blobs_total=len(items),
+                blobs_done=len(done),
+                bytes_total=sum(item.size_bytes for item in items),
+                bytes_done=sum(item.size_bytes for item in done),
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+                items=items,
+            ))
+        return sessions
@@ -0,0 +1,419 @@
+"""
+Synapse Store v2 - Background Update Checker
+
+Keeps an update plan for every updatable pack without anyone waiting on the
+network. Results are persisted at data/registry/updates.sqlite as
+
+    pack -> (checked_at, plan, error, invalidated)
+
+so GET /api/updates/check-all answers from the table instantly, reporting
+how old each plan is.
+
+A daemon thread picks the packs whose plan is missing, invalidated or older
+than the configured interval (least recently checked first) and checks up
+to batch_size of them through UpdateService.iter_check_all_updates, which
+shares provider lookups within the batch. After each batch it waits long
+enough to stay within max_checks_per_minute, so a large library is
+refreshed gradually rather than in one burst. Schedule settings are read
+from StoreConfig.updates before every batch.
+
+Writes to a pack's pack.json or lock.json (imports, applied updates, edits)
+invalidate its stored plan through the StoreLayout listener hooks.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .layout import LayoutListener, StoreLayout
+from .models import Pack, PackLock, UpdateCheckConfig, UpdatePlan
+
+if TYPE_CHECKING:
+    from .update_service import UpdateService
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS update_results (
+    pack TEXT PRIMARY KEY,
+    checked_at REAL NOT NULL,
+    plan TEXT,
+    error TEXT,
+    invalidated INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+@dataclass
+class CheckedPlan:
+    """Stored outcome of one pack's update check."""
+    pack: str
+    checked_at: float  # Unix time
+    plan: Optional[UpdatePlan] = None
+    error: Optional[str] = None
+    invalidated: bool = False  # Pack changed since the check
+
+
+class UpdateResultStore:
+    """
+    SQLite table of the latest update check per pack.
+
+    Thread-safe; the connection is opened on first use.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Database file (data/registry/updates.sqlite)
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def load(self) -> Dict[str, CheckedPlan]:
+        """Return every stored result by pack name."""
+        try:
+            with self._lock:
+                rows = self._connect().execute("SELECT * FROM update_results").fetchall()
+        except sqlite3.Error as e:
+            logger.warning("[UpdateChecker] Failed to read update results: %s", e)
+            return {}
+
+        results = {}
+        for row in rows:
+            plan = None
+            if row["plan"] is not None:
+                try:
+                    plan = UpdatePlan.model_validate_json(row["plan"])
+                except ValueError as e:
+                    logger.debug("[UpdateChecker] Dropping unreadable plan of %s: %s", row["pack"], e)
+                    continue
+            results[row["pack"]] = CheckedPlan(
+                pack=row["pack"],
+                checked_at=row["checked_at"],
+                plan=plan,
+                error=row["error"],
+                invalidated=bool(row["invalidated"]),
+            )
+        return results
+
+    def save(self, result: CheckedPlan) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO update_results
+                            (pack, checked_at, plan, error, invalidated)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (
+                            result.pack,
+                            result.checked_at,
+                            result.plan.model_dump_json() if result.plan is not None else None,
+                            result.error,
+                            int(result.invalidated),
+                        ),
+                    )
+        except sqlite3.Error as e:
+            logger.warning("[UpdateChecker] Failed to store update result of %s: %s", result.pack, e)
+
+    def invalidate(self, pack_name: str) -> None:
+        """Mark a pack's result as outdated (it stays readable until rechecked)."""
+        self._execute("UPDATE update_results SET invalidated = 1 WHERE pack = ?", (pack_name,))
+
+    def delete(self, pack_name: str) -> None:
+        self._execute("DELETE FROM update_results WHERE pack = ?", (pack_name,))
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        try:
+            with self._lock:
+                if self._conn is None and not self.path.exists():
+                    return  # Nothing stored yet
+                conn = self._connect()
+                with conn:
+                    conn.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.warning("[UpdateChecker] Failed to update results: %s", e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class UpdateChecker(LayoutListener):
+    """
+    Refreshes stored update plans in the background.
+
+    Nothing runs until start() is called; check() forces a synchronous
+    check at any time. Checks are serialized, so a forced check waits for
+    the running batch (at most batch_size packs).
+    """
+
+    # Seconds between looks for outdated plans when there is nothing to do
+    POLL_SECONDS = 60.0
+
+    def __init__(
+        self,
+        layout: StoreLayout,
+        update_service: "UpdateService",
+        results: Optional[UpdateResultStore] = None,
+    ):
+        """
+        Initialize checker.
+
+        Args:
+            layout: Store layout manager
+            update_service: Service performing the checks
+            results: Result table (default: layout.update_results_path)
+        """
+        self.layout = layout
+        self.update_service = update_service
+        self.results = results or UpdateResultStore(layout.update_results_path)
+
+        self._check_lock = threading.Lock()
+        self._changed_at: Dict[str, float] = {}  # pack -> time of last pack/lock write
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def config(self) -> UpdateCheckConfig:
+        try:
+            return self.layout.load_config().updates
+        except Exception as e:
+            logger.debug("[UpdateChecker] Using default schedule: %s", e)
+            return UpdateCheckConfig()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    # =========================================================================
+    # Write Events
+    # =========================================================================
+
+    def _invalidate(self, pack_name: str) -> None:
+        self._changed_at[pack_name] = time.time()
+        self.results.invalidate(pack_name)
+        self._wake.set()
+
+    def on_pack_saved(self, pack: Pack) -> None:
+        self._invalidate(pack.name)
+
+    def on_lock_saved(self, lock: PackLock) -> None:
+        self._invalidate(lock.pack)
+
+    def on_pack_deleted(self, pack_name: str) -> None:
+        self._changed_at.pop(pack_name, None)
+        self.results.delete(pack_name)
+
+    # =========================================================================
+    # Results
+    # =========================================================================
+
+    def updatable_packs(self) -> List[str]:
+        """Names of packs that have at least one updatable dependency."""
+        names = []
+        for pack_name in self.layout.list_packs():
+            try:
+                pack = self.layout.load_pack(pack_name, readonly=True)
+            except Exception as e:
+                logger.debug("[UpdateChecker] Skipping pack %s: %s", pack_name, e)
+                continue
+            if self.update_service.is_updatable(pack):
+                names.append(pack_name)
+        return names
+
+    def stored_results(self) -> Dict[str, CheckedPlan]:
+        """Stored results of the packs that are currently updatable."""
+        stored = self.results.load()
+        return {name: stored[name] for name in self.updatable_packs() if name in stored}
+
+    def outdated_packs(self, now: Optional[float] = None) -> List[str]:
+        """
+        Updatable packs whose plan is missing, invalidated or older than the interval.
+
+        Returns:
+            Pack names, never-checked first, then least recently checked
+        """
+        return self._select(self._is_outdated(now))
+
+    def unchecked_packs(self) -> List[str]:
+        """
+        Updatable packs with no valid plan: never checked, or changed since.
+
+        Unlike merely old plans, these can't be shown as "last known state".
+        """
+        return self._select(lambda result: result.invalidated)
+
+    def status(self, now: Optional[float] = None) -> Tuple[Dict[str, CheckedPlan], List[str]]:
+        """
+        stored_results() and outdated_packs() from a single pass over the packs.
+
+        Returns:
+            (stored results of updatable packs, outdated pack names)
+        """
+        updatable = self.updatable_packs()
+        stored = self.results.load()
+        results = {name: stored[name] for name in updatable if name in stored}
+        return results, self._select(self._is_outdated(now), updatable, stored)
+
+    def _is_outdated(self, now: Optional[float]) -> Callable[[CheckedPlan], bool]:
+        now = now if now is not None else time.time()
+        max_age = self.config.interval_minutes * 60
+        return lambda result: result.invalidated or now - result.checked_at >= max_age
+
+    def _select(
+        self,
+        outdated: Callable[[CheckedPlan], bool],
+        updatable: Optional[List[str]] = None,
+        stored: Optional[Dict[str, CheckedPlan]] = None,
+    ) -> List[str]:
+        stored = self.results.load() if stored is None else stored
+        selected = []
+        for name in (self.updatable_packs() if updatable is None else updatable):
+            result = stored.get(name)
+            if result is None:
+                selected.append((0.0, name))
+            elif outdated(result):
+                selected.append((result.checked_at, name))
+        return [name for _, name in sorted(selected)]
+
+    # =========================================================================
+    # Checks
+    # =========================================================================
+
+    def iter_check(self, pack_names: Optional[Iterable[str]] = None) -> Iterator[CheckedPlan]:
+        """
+        Check packs now and store the results.
+
+        Args:
+            pack_names: Packs to check (default: every updatable pack)
+
+        Yields:
+            CheckedPlan per pack as its check completes; packs whose check
+            failed are yielded last, with error set
+        """
+        with self._check_lock:
+            started = time.time()
+            updatable = self.updatable_packs()
+            if pack_names is not None:
+                wanted = set(pack_names)
+                updatable = [name for name in updatable if name in wanted]
+            pending = set(updatable)
+            for pack_name, plan in self.update_service.iter_check_all_updates(pack_names=updatable):
+                pending.discard(pack_name)
+                yield self._store(CheckedPlan(pack=pack_name, checked_at=time.time(), plan=plan), started)
+
+            # Not yielded by the service: failed to load or check
+            for pack_name in sorted(pending):
+                yield self._store(CheckedPlan(
+                    pack=pack_name, checked_at=time.time(), error="Update check failed",
+                ), started)
+
+    def check_pack(self, pack_name: str) -> UpdatePlan:
+        """
+        Check one pack now and store its plan (GET /api/updates/check/{pack}).
+
+        Unlike iter_check, the pack need not be updatable and a failed check
+        raises instead of being stored.
+
+        Returns:
+            The pack's update plan
+        """
+        started = time.time()
+        plan = self.update_service.plan_update(pack_name)
+        self._store(CheckedPlan(pack=pack_name, checked_at=time.time(), plan=plan), started)
+        return plan
+
+    def check(self, pack_names: Optional[Iterable[str]] = None) -> Dict[str, CheckedPlan]:
+        """Check packs now (default: every updatable pack); see iter_check."""
+        return {result.pack: result for result in self.iter_check(pack_names)}
+
+    def _store(self, result: CheckedPlan, started: float) -> CheckedPlan:
+        # A write during the check may have changed what the plan should be
+        result.invalidated = self._changed_at.get(result.pack, 0.0) >= started
+        self.results.save(result)
+        return result
+
+    def run_batch(self) -> int:
+        """
+        Check the next batch of outdated packs.
+
+        Returns:
+            Number of packs checked
+        """
+        batch = self.outdated_packs()[:max(1, self.config.batch_size)]
+        if not batch:
+            return 0
+        checked = sum(1 for _ in self.iter_check(batch))
+        logger.debug("[UpdateChecker] Checked %d pack(s): %s", checked, ", ".join(batch))
+        return len(batch)
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the background thread (idempotent)."""
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="update-checker", daemon=True)
+            self._thread.start()
+
+    def wake(self) -> None:
+        """Look for outdated plans now instead of at the next poll."""
+        self._wake.set()
+
+    def shutdown(self) -> None:
+        """Stop the background thread and close the result table."""
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        self._stopping.set()
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout=10)
+        self.results.close()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            config = self.config
+            checked = 0
+            if config.enabled:
+                try:
+                    checked = self.run_batch()
+                except Exception as e:
+                    logger.warning("[UpdateChecker] Background check failed: %s", e)
+
+            if checked:
+                # Rate budget: n checks use up n / max_checks_per_minute minutes
+                delay = checked * 60.0 / max(config.max_checks_per_minute, 1e-3)
+                if self._stopping.wait(delay):
+                    break
+            else:
+                self._wake.wait(self.POLL_SECONDS)
+                self._wake.clear()
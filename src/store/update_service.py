@@ -12,8 +12,10 @@ lock file updates, batch operations, and post-update sync.
 from __future__ import annotations
 
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .blob_store import BlobStore
 from .layout import StoreLayout
@@ -39,7 +41,10 @@ from .models import (
     UpdateResult,
 )
 from .update_provider import UpdateCheckResult, UpdateProvider
-from .view_builder import ViewBuilder
+from .view_builder import MultiViewBuildError, ViewBuilder
+
+if TYPE_CHECKING:
+    from .index_db import StoreIndex
 
 
 # Strategies that support automatic updates (follow_latest policy)
@@ -71,12 +76,19 @@ class UpdateService:
     operations to registered UpdateProvider implementations.
     """
 
+    # Concurrent pack groups checked by check_all_updates
+    CHECK_WORKERS = 8
+
+    # Concurrent blob downloads when syncing a batch update
+    DOWNLOAD_WORKERS = 4
+
     def __init__(
         self,
         layout: StoreLayout,
         blob_store: BlobStore,
         view_builder: ViewBuilder,
         providers: Optional[Dict[SelectorStrategy, UpdateProvider]] = None,
+        index: Optional["StoreIndex"] = None,
     ):
         """
         Initialize update service.
@@ -86,11 +98,13 @@ class UpdateService:
             blob_store: Blob store
             view_builder: View builder
             providers: Registry mapping SelectorStrategy -> UpdateProvider
+            index: Optional store index for reverse pack dependency lookups
         """
         self.layout = layout
         self.blob_store = blob_store
         self.view_builder = view_builder
         self._providers: Dict[SelectorStrategy, UpdateProvider] = providers or {}
+        self.index = index
 
     def register_provider(self, strategy: SelectorStrategy, provider: UpdateProvider) -> None:
         """Register an update provider for a selector strategy."""
@@ -260,6 +274,10 @@ class UpdateService:
         Returns:
             List of pack names that have pack_name in their pack_dependencies.
         """
+        if self.index is not None:
+            self.index.refresh()
+            return self.index.dependent_packs(pack_name)
+
         reverse_deps = []
         for other_name in self.layout.list_packs():
             if other_name == pack_name:
@@ -488,7 +506,23 @@ class UpdateService:
                 already_up_to_date=False,
             )
 
-        # Apply update
+        result, lock = self._apply_plan(pack_name, plan, choose, ui_targets, options)
+
+        # Sync if requested
+        if sync and ui_targets:
+            result.synced = self._sync_after_update(pack_name, lock, ui_targets)
+
+        return result
+
+    def _apply_plan(
+        self,
+        pack_name: str,
+        plan: UpdatePlan,
+        choose: Optional[Dict[str, int]],
+        ui_targets: Optional[List[str]],
+        options: Optional[UpdateOptions],
+    ) -> Tuple[UpdateResult, PackLock]:
+        """Write the updated lock and apply options (no downloads or views)."""
         lock = self.apply_update(pack_name, plan, choose)
 
         result = UpdateResult(
@@ -503,11 +537,7 @@ class UpdateService:
         if options:
             self._apply_options(pack_name, options, result)
 
-        # Sync if requested
-        if sync and ui_targets:
-            result.synced = self._sync_after_update(pack_name, lock, ui_targets)
-
-        return result
+        return result, lock
 
     def _apply_options(
         self,
@@ -563,6 +593,13 @@ class UpdateService:
         """
         Apply updates to multiple packs.
 
+        Runs in phases rather than pack by pack:
+        1. Plan every pack concurrently (provider lookups are shared).
+        2. Apply the plans, writing each pack's lock atomically.
+        3. With sync, download the new blobs of all packs at once (each
+           blob once, even if several packs need it) on a bounded pool.
+        4. With sync, rebuild the views of each UI once.
+
         Args:
             pack_names: List of packs to update
             choose: Optional nested dict: pack_name -> dep_id -> file_id
@@ -574,112 +611,279 @@ class UpdateService:
             BatchUpdateResult with per-pack results
         """
         batch_result = BatchUpdateResult()
+        pack_names = list(dict.fromkeys(pack_names))
+        plans = self._plan_many(pack_names)
 
+        results: Dict[str, UpdateResult] = {}
+        applied: Dict[str, PackLock] = {}
+        errors: Dict[str, str] = {}
         for pack_name in pack_names:
             try:
+                plan = plans[pack_name]
+                if isinstance(plan, Exception):
+                    raise plan
+                if plan.already_up_to_date:
+                    results[pack_name] = UpdateResult(
+                        pack=pack_name,
+                        applied=False,
+                        lock_updated=False,
+                        synced=False,
+                        ui_targets=[],
+                        already_up_to_date=True,
+                    )
+                    continue
                 pack_choose = choose.get(pack_name) if choose else None
-                result = self.update_pack(
-                    pack_name,
-                    choose=pack_choose,
-                    sync=sync,
-                    ui_targets=ui_targets,
-                    options=options,
+                results[pack_name], applied[pack_name] = self._apply_plan(
+                    pack_name, plan, pack_choose, ui_targets, options,
                 )
-                batch_result.results[pack_name] = result.model_dump()
-                if result.applied:
-                    batch_result.total_applied += 1
-                elif result.already_up_to_date:
-                    batch_result.total_skipped += 1
             except Exception as e:
+                errors[pack_name] = str(e)
+
+        if sync and ui_targets and applied:
+            failed = self._download_blobs(applied.values())
+            views_built = self._rebuild_views(ui_targets)
+            for pack_name, lock in applied.items():
+                results[pack_name].synced = views_built and not any(
+                    (r.artifact.sha256 or "").lower() in failed for r in lock.resolved
+                )
+
+        for pack_name in pack_names:
+            if pack_name in errors:
                 batch_result.results[pack_name] = {
-                    "error": str(e),
+                    "error": errors[pack_name],
                     "applied": False,
                 }
                 batch_result.total_failed += 1
+                continue
+            result = results[pack_name]
+            batch_result.results[pack_name] = result.model_dump()
+            if result.applied:
+                batch_result.total_applied += 1
+            elif result.already_up_to_date:
+                batch_result.total_skipped += 1
 
         return batch_result
 
+    def _plan_many(self, pack_names: List[str]) -> Dict[str, Any]:
+        """Plan packs concurrently; maps pack_name -> UpdatePlan or the exception raised."""
+        def plan(pack_name: str) -> Tuple[str, Any]:
+            try:
+                return pack_name, self.plan_update(pack_name)
+            except Exception as e:
+                return pack_name, e
+
+        if len(pack_names) <= 1:
+            return dict(plan(name) for name in pack_names)
+        workers = min(len(pack_names), self.CHECK_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="update-plan") as pool:
+            return dict(pool.map(plan, pack_names))
+
     def _sync_after_update(
         self,
         pack_name: str,
         lock: PackLock,
         ui_targets: List[str],
     ) -> bool:
-        """Download new blobs and rebuild views after update."""
+        """
+        Download new blobs and rebuild views after update.
+
+        Returns:
+            True if every blob is present and the views were rebuilt
+        """
         try:
-            # Download new blobs
+            failed = self._download_blobs([lock])
+            views_built = self._rebuild_views(ui_targets)
+            return not failed and views_built
+        except Exception:
+            return False
+
+    def _download_blobs(self, locks: Iterable[PackLock]) -> Set[str]:
+        """
+        Download the missing blobs of several locks, each blob once.
+
+        Returns:
+            sha256 of blobs that failed to download
+        """
+        wanted: Dict[str, str] = {}
+        for lock in locks:
             for resolved in lock.resolved:
                 sha256 = resolved.artifact.sha256
                 urls = resolved.artifact.download.urls
+                if sha256 and urls:
+                    wanted.setdefault(sha256.lower(), urls[0])
+        if not wanted:
+            return set()
 
-                if sha256 and not self.blob_store.blob_exists(sha256) and urls and len(urls) > 0:
-                    try:
-                        self.blob_store.download(urls[0], sha256)
-                    except Exception as e:
-                        logger.warning("Failed to download blob %s: %s", sha256[:12], e)
+        present = self.blob_store.existing_blobs(wanted)
+        missing = [(sha256, url) for sha256, url in wanted.items() if sha256 not in present]
 
-            # Rebuild views for each UI
-            runtime = self.layout.load_runtime()
+        def download(item: Tuple[str, str]) -> Optional[str]:
+            sha256, url = item
+            try:
+                self.blob_store.download(url, sha256)
+                return None
+            except Exception as e:
+                logger.warning("Failed to download blob %s: %s", sha256[:12], e)
+                return sha256
+
+        if len(missing) <= 1:
+            outcomes = [download(item) for item in missing]
+        else:
+            workers = min(len(missing), self.DOWNLOAD_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="update-download") as pool:
+                outcomes = list(pool.map(download, missing))
+        return {sha256 for sha256 in outcomes if sha256 is not None}
+
+    def _rebuild_views(self, ui_targets: List[str]) -> bool:
+        """
+        Rebuild and activate the active profile's views of each UI.
 
-            for ui in ui_targets:
-                active_profile = runtime.get_active_profile(ui)
-                if active_profile:
-                    try:
-                        profile = self.layout.load_profile(active_profile)
-                        # Load packs for profile
-                        packs_data = {}
-                        for p in profile.packs:
-                            try:
-                                pack = self.layout.load_pack(p.name)
-                                pack_lock = self.layout.load_pack_lock(p.name)
-                                packs_data[p.name] = (pack, pack_lock)
-                            except Exception:
-                                continue
-
-                        self.view_builder.build(ui, profile, packs_data)
-                        self.view_builder.activate(ui, active_profile)
-                    except Exception as e:
-                        logger.warning("Failed to rebuild views for UI %s: %s", ui, e)
+        UIs sharing an active profile are built together (build_many).
 
-            return True
-        except Exception:
-            return False
+        Returns:
+            True if every UI was rebuilt
+        """
+        runtime = self.layout.load_runtime()
+        by_profile: Dict[str, List[str]] = {}
+        for ui in ui_targets:
+            active_profile = runtime.get_active_profile(ui)
+            if active_profile:
+                by_profile.setdefault(active_profile, []).append(ui)
+
+        ok = True
+        for profile_name, uis in by_profile.items():
+            try:
+                profile = self.layout.load_profile(profile_name)
+                # Load packs for profile (shared instances, so cached view plans apply)
+                packs_data = {}
+                for p in profile.packs:
+                    try:
+                        pack = self.layout.load_pack(p.name, readonly=True)
+                        pack_lock = self.layout.load_pack_lock(p.name, readonly=True)
+                        packs_data[p.name] = (pack, pack_lock)
+                    except Exception:
+                        continue
+
+                self.view_builder.build_many(uis, profile, packs_data, activate=True)
+            except MultiViewBuildError as e:
+                ok = False
+                for ui, error in e.failures.items():
+                    logger.warning("Failed to rebuild views for UI %s: %s", ui, error)
+            except Exception as e:
+                ok = False
+                logger.warning("Failed to rebuild views for UIs %s: %s", ", ".join(uis), e)
+        return ok
 
     # =========================================================================
     # Batch Operations
     # =========================================================================
 
-    def check_all_updates(self) -> Dict[str, UpdatePlan]:
+    def check_all_updates(self, workers: Optional[int] = None) -> Dict[str, UpdatePlan]:
         """
         Check for updates on all packs.
 
-        Clears provider model caches before and after the check loop
-        to avoid stale data while deduplicating API calls within a session.
+        See iter_check_all_updates; this collects its results.
 
         Returns:
-            Dict mapping pack_name -> UpdatePlan
+            Dict mapping pack_name -> UpdatePlan, in pack name order
         """
-        # Clear provider caches before check-all session
-        for provider in self._providers.values():
-            if hasattr(provider, "clear_cache"):
-                provider.clear_cache()
+        return dict(sorted(self.iter_check_all_updates(workers), key=lambda item: item[0]))
+
+    def iter_check_all_updates(
+        self,
+        workers: Optional[int] = None,
+        pack_names: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, UpdatePlan]]:
+        """
+        Check all updatable packs concurrently, yielding plans as they complete.
 
-        plans = {}
+        Packs are grouped by the provider lookup they need (a provider's
+        optional group_key(dep), e.g. the Civitai model id) and each group is
+        checked by one worker, so a model shared by many packs is fetched
+        once. Request pacing across workers is left to the provider's client.
 
-        for pack_name in self.layout.list_packs():
+        Provider caches are cleared before the first check and after the
+        last, so a session never sees stale data but deduplicates within itself.
+        Persistent response caches behind the providers are revalidated
+        (cheap conditional requests) rather than trusted. Packs that fail to
+        load or check are skipped.
+
+        Args:
+            workers: Concurrent groups (default CHECK_WORKERS)
+            pack_names: Check only these packs (default: every pack)
+
+        Yields:
+            (pack_name, UpdatePlan) in completion order
+        """
+        self._clear_provider_caches(revalidate=True)
+        try:
+            groups = self._group_updatable_packs(pack_names)
+            if not groups:
+                return
+
+            results: "queue.Queue[Tuple[str, Optional[UpdatePlan], Optional[Exception]]]" = queue.Queue()
+
+            def check_group(pack_names: List[str]) -> None:
+                for pack_name in pack_names:
+                    try:
+                        results.put((pack_name, self.plan_update(pack_name), None))
+                    except Exception as e:
+                        results.put((pack_name, None, e))
+
+            remaining = sum(len(group) for group in groups)
+            pool = ThreadPoolExecutor(
+                max_workers=max(1, min(workers or self.CHECK_WORKERS, len(groups))),
+                thread_name_prefix="update-check",
+            )
+            try:
+                for group in groups:
+                    pool.submit(check_group, group)
+                while remaining:
+                    pack_name, plan, error = results.get()
+                    remaining -= 1
+                    if error is not None:
+                        logger.debug("Skipping pack %s during update check: %s", pack_name, error)
+                        continue
+                    yield pack_name, plan
+            finally:
+                # Stopped early: drop groups not started yet
+                pool.shutdown(wait=True, cancel_futures=True)
+        finally:
+            # Clear caches after session to free memory
+            self._clear_provider_caches()
+
+    def _group_updatable_packs(self, pack_names: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """Load packs (default: all) and group the updatable ones by shared provider lookup."""
+        groups: Dict[Hashable, List[str]] = {}
+        for pack_name in (self.layout.list_packs() if pack_names is None else pack_names):
             try:
                 pack = self.layout.load_pack(pack_name)
-                if self.is_updatable(pack):
-                    plans[pack_name] = self.plan_update(pack_name)
             except Exception as e:
                 logger.debug("Skipping pack %s during update check: %s", pack_name, e)
+                continue
+            if self.is_updatable(pack):
+                groups.setdefault(self._group_key(pack), []).append(pack_name)
+        return list(groups.values())
+
+    def _group_key(self, pack: Pack) -> Hashable:
+        """Group key of a pack's first updatable dependency (the pack itself if none)."""
+        for dep in pack.dependencies:
+            if dep.update_policy.mode != UpdatePolicyMode.FOLLOW_LATEST:
+                continue
+            provider = self._get_provider(dep.selector.strategy)
+            if provider is None or not hasattr(provider, "group_key"):
+                continue
+            key = provider.group_key(dep)
+            if key is not None:
+                return (dep.selector.strategy, key)
+        return ("pack", pack.name)
 
-        # Clear caches after session to free memory
+    def _clear_provider_caches(self, revalidate: bool = False) -> None:
         for provider in self._providers.values():
             if hasattr(provider, "clear_cache"):
                 provider.clear_cache()
-
-        return plans
+            if revalidate and hasattr(provider, "revalidate"):
+                provider.revalidate()
 
     def get_updatable_packs(self) -> List[str]:
         """
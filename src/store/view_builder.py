@@ -9,7 +9,14 @@ Views are symlink trees that point into the blob store:
 Features:
 - Multi-UI support (ComfyUI, Forge, A1111, SD.Next)
 - Profile-based views
-- Atomic builds (build to staging, then replace)
+- Atomic builds (build to staging, then replace) for new views
+- Incremental rebuilds: diff the existing symlink tree against the plan and
+  add, remove or retarget only what changed (each link swapped atomically)
+- Plan cache: each pack's resolved entries (and blob existence) are cached
+  by its pack.json/lock.json fingerprint and the (pack, lock) objects they
+  were planned from (StoreLayout's shared readonly models), and shared by
+  every profile and UI; a profile's merged entry list is cached until one
+  of its packs changes
 - Active profile symlinks
 - Last-wins conflict resolution
 - Shadowed file tracking
@@ -20,6 +27,9 @@ from __future__ import annotations
 import os
 import platform
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
@@ -48,6 +58,16 @@ class SymlinkError(ViewBuildError):
     pass
 
 
+class MultiViewBuildError(ViewBuildError):
+    """One or more UIs failed during a multi-UI build; the others completed."""
+    
+    def __init__(self, failures: Dict[str, Exception], reports: Dict[str, "BuildReport"]):
+        self.failures = failures
+        self.reports = reports
+        details = "; ".join(f"{ui}: {error}" for ui, error in failures.items())
+        super().__init__(f"View build failed for {len(failures)} UI(s): {details}")
+
+
 @dataclass
 class ViewEntry:
     """A single entry in a view plan."""
@@ -67,6 +87,7 @@ class ViewPlan:
     entries: List[ViewEntry] = field(default_factory=list)
     shadowed: List[ShadowedEntry] = field(default_factory=list)
     missing_blobs: List[Tuple[str, str, str]] = field(default_factory=list)  # (pack, dep_id, sha256)
+    _positions: Dict[str, int] = field(default_factory=dict, repr=False)  # dst_relpath -> index
     
     def add_entry(
         self,
@@ -88,30 +109,32 @@ class ViewPlan:
         
         dst_relpath = f"{kind_path}/{expose_filename}"
         
-        # Check for existing entry with same destination
-        for i, existing in enumerate(self.entries):
-            if existing.dst_relpath == dst_relpath:
-                # Shadow the existing entry
-                shadowed = ShadowedEntry(
-                    ui=self.ui,
-                    dst_relpath=dst_relpath,
-                    winner_pack=pack_name,
-                    loser_pack=existing.pack_name,
-                )
-                self.shadowed.append(shadowed)
-                
-                # Replace with new entry
-                self.entries[i] = ViewEntry(
-                    pack_name=pack_name,
-                    dependency_id=dependency_id,
-                    kind=kind,
-                    expose_filename=expose_filename,
-                    sha256=sha256,
-                    dst_relpath=dst_relpath,
-                )
-                return shadowed
+        # Check for existing entry with same destination (indexed: O(1) per add)
+        i = self._positions.get(dst_relpath)
+        if i is not None:
+            existing = self.entries[i]
+            # Shadow the existing entry
+            shadowed = ShadowedEntry(
+                ui=self.ui,
+                dst_relpath=dst_relpath,
+                winner_pack=pack_name,
+                loser_pack=existing.pack_name,
+            )
+            self.shadowed.append(shadowed)
+            
+            # Replace with new entry
+            self.entries[i] = ViewEntry(
+                pack_name=pack_name,
+                dependency_id=dependency_id,
+                kind=kind,
+                expose_filename=expose_filename,
+                sha256=sha256,
+                dst_relpath=dst_relpath,
+            )
+            return shadowed
         
         # No conflict, add new entry
+        self._positions[dst_relpath] = len(self.entries)
         self.entries.append(ViewEntry(
             pack_name=pack_name,
             dependency_id=dependency_id,
@@ -128,10 +151,42 @@ class BuildReport:
     """Report from a view build operation."""
     ui: str
     profile: str
-    entries_created: int
+    entries_created: int  # Links in the view after the build
     shadowed: List[ShadowedEntry] = field(default_factory=list)
     missing_blobs: List[Tuple[str, str, str]] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    incremental: bool = False  # True if the existing view was patched in place
+    entries_added: int = 0
+    entries_removed: int = 0
+    entries_retargeted: int = 0
+    duration_ms: int = 0  # Plan + apply
+    plan_ms: int = 0  # Plan computation alone
+    plan_cached: bool = False  # True if the profile's entries came from the plan cache
+
+
+# (mtime_ns, size, inode) of pack.json then lock.json; the inode changes on
+# every atomic (write-and-rename) save even within one mtime tick
+PackFingerprint = Tuple[int, int, int, int, int, int]
+
+
+@dataclass
+class _PackPlan:
+    """UI-independent view entries of one pack."""
+    fingerprint: Optional[PackFingerprint]
+    source: Tuple[Pack, PackLock]  # Objects planned from; valid only for these
+    entries: List[Tuple[str, AssetKind, str, str]]  # (dep_id, kind, filename, sha256)
+    missing: List[Tuple[str, str, str]]  # (pack, dep_id, sha256)
+    blobs: Set[str]  # Every sha256 the entries depend on (present or missing)
+
+
+@dataclass
+class _ProfilePlan:
+    """A profile's packs' entries in profile order (before per-UI paths/shadowing)."""
+    key: Tuple[Tuple[str, PackFingerprint], ...]
+    sources: List[Tuple[Pack, PackLock]]  # Objects planned from, in key order
+    generation: int
+    entries: List[Tuple[str, str, AssetKind, str, str]]  # (pack, dep_id, kind, filename, sha256)
+    missing: List[Tuple[str, str, str]]
 
 
 def create_symlink(source: Path, target: Path) -> None:
@@ -173,6 +228,54 @@ def create_symlink(source: Path, target: Path) -> None:
         source.symlink_to(target)
 
 
+def _scan_view(root: Path) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    List a view directory.
+    
+    Returns:
+        (symlinks as relpath -> link target, relpaths of other non-directory files)
+    """
+    links: Dict[str, str] = {}
+    others: Set[str] = set()
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                rel_path = Path(entry.path).relative_to(root).as_posix()
+                if entry.is_symlink():
+                    links[rel_path] = os.readlink(entry.path)
+                elif entry.is_dir():
+                    stack.append(Path(entry.path))
+                else:
+                    others.add(rel_path)
+    return links, others
+
+
+def _replace_symlink(link_path: Path, target: str) -> None:
+    """Point link_path at target, swapping atomically if something is already there."""
+    link_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = link_path.with_name(f".{link_path.name}.new")
+    if tmp_path.is_symlink() or tmp_path.exists():
+        tmp_path.unlink()
+    os.symlink(target, tmp_path)
+    try:
+        os.replace(tmp_path, link_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _prune_empty_dirs(directory: Path, root: Path) -> None:
+    """Remove directory and its parents up to (not including) root while empty."""
+    while directory != root and root in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
 class ViewBuilder:
     """
     Builds and manages view directories.
@@ -180,6 +283,8 @@ class ViewBuilder:
     Views are symlink trees for each UI that point into the blob store.
     """
     
+    MAX_PARALLEL_BUILDS = 4  # Concurrent UI builds in build_many
+    
     def __init__(
         self,
         layout: StoreLayout,
@@ -197,6 +302,13 @@ class ViewBuilder:
         self.layout = layout
         self.blob_store = blob_store
         self._config = config
+        
+        # Plan cache (see module docstring); builds for several UIs may run at once
+        self._plan_lock = threading.Lock()
+        self._pack_plans: Dict[str, _PackPlan] = {}
+        self._profile_plans: Dict[str, _ProfilePlan] = {}
+        self._generation = 0  # Bumped whenever a pack plan is dropped
+        self.blob_store.add_listener(self._on_blob_changed)
     
     @property
     def config(self) -> StoreConfig:
@@ -226,6 +338,16 @@ class ViewBuilder:
         Returns:
             ViewPlan with entries and shadowed info
         """
+        plan, _ = self._compute_plan(ui, profile, packs)
+        return plan
+    
+    def _compute_plan(
+        self,
+        ui: str,
+        profile: Profile,
+        packs: Dict[str, Tuple[Pack, Optional[PackLock]]],
+    ) -> Tuple[ViewPlan, bool]:
+        """compute_plan, also returning whether the profile entries were cached."""
         plan = ViewPlan(ui=ui, profile=profile.name)
         
         # Get kind map for this UI
@@ -233,43 +355,159 @@ class ViewBuilder:
         if not kind_map:
             kind_map = UIKindMap()  # Use defaults
         
-        # Process packs in order (last wins)
-        for pack_entry in profile.packs:
-            pack_name = pack_entry.name
-            if pack_name not in packs:
+        profile_plan, cached = self._profile_plan(profile, packs)
+        plan.missing_blobs.extend(profile_plan.missing)
+        
+        # Add in profile order (last wins, handles shadowing)
+        for pack_name, dep_id, kind, filename, sha256 in profile_plan.entries:
+            plan.add_entry(
+                pack_name=pack_name,
+                dependency_id=dep_id,
+                kind=kind,
+                expose_filename=filename,
+                sha256=sha256,
+                kind_map=kind_map,
+            )
+        
+        return plan, cached
+    
+    # =========================================================================
+    # Plan Cache
+    # =========================================================================
+    
+    def invalidate_plans(self, pack_name: Optional[str] = None) -> None:
+        """
+        Drop cached plans for one pack, or for everything.
+        
+        Pack file changes are picked up from their mtimes; this is for changes
+        the cache cannot see (e.g. blobs deleted behind BlobStore's back).
+        """
+        with self._plan_lock:
+            if pack_name is None:
+                self._pack_plans.clear()
+                self._profile_plans.clear()
+            else:
+                self._pack_plans.pop(pack_name, None)
+            self._generation += 1
+    
+    def _on_blob_changed(self, sha256: str) -> None:
+        """BlobStore listener: blob existence changed for packs using sha256."""
+        with self._plan_lock:
+            stale = [name for name, cached in self._pack_plans.items() if sha256 in cached.blobs]
+            for name in stale:
+                del self._pack_plans[name]
+            if stale:
+                self._generation += 1
+    
+    def _fingerprint(self, pack_name: str) -> Optional[PackFingerprint]:
+        """Stat-based identity of a pack's files, or None if not on disk."""
+        try:
+            pack_st = os.stat(self.layout.pack_json_path(pack_name))
+            lock_st = os.stat(self.layout.pack_lock_path(pack_name))
+        except OSError:
+            return None
+        return (
+            pack_st.st_mtime_ns, pack_st.st_size, pack_st.st_ino,
+            lock_st.st_mtime_ns, lock_st.st_size, lock_st.st_ino,
+        )
+    
+    def _profile_plan(
+        self,
+        profile: Profile,
+        packs: Dict[str, Tuple[Pack, Optional[PackLock]]],
+    ) -> Tuple[_ProfilePlan, bool]:
+        """
+        Return the profile's merged entries, from cache when no pack changed.
+        
+        A cached plan is reused only for the very (pack, lock) objects it was
+        computed from: the fingerprint says the files are unchanged, but a
+        caller may pass models it modified in memory. Packs that are not on
+        disk (only passed in memory) are never cached.
+        """
+        names = [
+            entry.name for entry in profile.packs
+            if entry.name in packs and packs[entry.name][1] is not None
+        ]
+        fingerprints = [self._fingerprint(name) for name in names]
+        sources = [packs[name] for name in names]
+        cacheable = all(fp is not None for fp in fingerprints)
+        key = tuple(zip(names, fingerprints, strict=True))
+        
+        with self._plan_lock:
+            cached = self._profile_plans.get(profile.name)
+            if (
+                cacheable
+                and cached is not None
+                and cached.key == key
+                and cached.generation == self._generation
+                and all(
+                    pack is cached_pack and lock is cached_lock
+                    for (pack, lock), (cached_pack, cached_lock)
+                    in zip(sources, cached.sources, strict=True)
+                )
+            ):
+                return cached, True
+            
+            generation = self._generation
+            entries: List[Tuple[str, str, AssetKind, str, str]] = []
+            missing: List[Tuple[str, str, str]] = []
+            for (name, fingerprint), (pack, lock) in zip(key, sources, strict=True):
+                pack_plan = self._pack_plans.get(name)
+                if (
+                    fingerprint is None
+                    or pack_plan is None
+                    or pack_plan.fingerprint != fingerprint
+                    or pack_plan.source[0] is not pack
+                    or pack_plan.source[1] is not lock
+                ):
+                    pack_plan = self._plan_pack(name, pack, lock, fingerprint)
+                    if fingerprint is not None:
+                        self._pack_plans[name] = pack_plan
+                entries.extend((name, *entry) for entry in pack_plan.entries)
+                missing.extend(pack_plan.missing)
+            
+            profile_plan = _ProfilePlan(
+                key=key, sources=sources, generation=generation, entries=entries, missing=missing,
+            )
+            if cacheable:
+                self._profile_plans[profile.name] = profile_plan
+            return profile_plan, False
+    
+    def _plan_pack(
+        self,
+        pack_name: str,
+        pack: Pack,
+        lock: PackLock,
+        fingerprint: Optional[PackFingerprint],
+    ) -> _PackPlan:
+        """Resolve a pack's view entries and check which blobs exist."""
+        pack_plan = _PackPlan(
+            fingerprint=fingerprint, source=(pack, lock), entries=[], missing=[], blobs=set(),
+        )
+        present = self.blob_store.existing_blobs(
+            resolved.artifact.sha256 for resolved in lock.resolved if resolved.artifact.sha256
+        )
+        
+        # Process each resolved dependency
+        for resolved in lock.resolved:
+            # Find the dependency definition in pack
+            dep = pack.get_dependency(resolved.dependency_id)
+            if dep is None:
                 continue
             
-            pack, lock = packs[pack_name]
-            if lock is None:
+            sha256 = resolved.artifact.sha256
+            if not sha256:
                 continue
+            pack_plan.blobs.add(sha256.lower())
             
-            # Process each resolved dependency
-            for resolved in lock.resolved:
-                # Find the dependency definition in pack
-                dep = pack.get_dependency(resolved.dependency_id)
-                if dep is None:
-                    continue
-                
-                sha256 = resolved.artifact.sha256
-                if not sha256:
-                    continue
-                
-                # Check if blob exists
-                if not self.blob_store.blob_exists(sha256):
-                    plan.missing_blobs.append((pack_name, dep.id, sha256))
-                    continue
-                
-                # Add to plan (handles shadowing)
-                plan.add_entry(
-                    pack_name=pack_name,
-                    dependency_id=dep.id,
-                    kind=dep.kind,
-                    expose_filename=dep.expose.filename,
-                    sha256=sha256,
-                    kind_map=kind_map,
-                )
+            # Check if blob exists
+            if sha256 not in present:
+                pack_plan.missing.append((pack_name, dep.id, sha256))
+                continue
+            
+            pack_plan.entries.append((dep.id, dep.kind, dep.expose.filename, sha256))
         
-        return plan
+        return pack_plan
     
     # =========================================================================
     # View Building
@@ -280,22 +518,31 @@ class ViewBuilder:
         ui: str,
         profile: Profile,
         packs: Dict[str, Tuple[Pack, Optional[PackLock]]],
+        incremental: bool = True,
     ) -> BuildReport:
         """
         Build view for a UI and profile.
         
-        Uses atomic build: creates in staging directory, then replaces.
+        A view that does not exist yet is built in a staging directory and
+        renamed into place. An existing view is diffed against the plan and
+        only the links that changed are added, removed or retargeted; each
+        link is replaced atomically, so the UI never sees a missing file for
+        an entry that stays. On Windows (where links may be hardlinks or
+        copies) and with incremental=False the view is always fully rebuilt.
         
         Args:
             ui: UI name
             profile: Profile to build
             packs: Dict mapping pack_name -> (pack, lock)
+            incremental: Patch an existing view instead of rebuilding it
         
         Returns:
             BuildReport with results
         """
+        started = time.perf_counter()
+        
         # Compute plan
-        plan = self.compute_plan(ui, profile, packs)
+        plan, plan_cached = self._compute_plan(ui, profile, packs)
         
         report = BuildReport(
             ui=ui,
@@ -303,11 +550,22 @@ class ViewBuilder:
             entries_created=0,
             shadowed=plan.shadowed,
             missing_blobs=plan.missing_blobs,
+            plan_ms=int((time.perf_counter() - started) * 1000),
+            plan_cached=plan_cached,
         )
         
-        # Build in staging directory
-        staging_dir = self.layout.tmp_path / "views" / ui / f"{profile.name}.new"
         final_dir = self.layout.view_profile_path(ui, profile.name)
+        if incremental and final_dir.is_dir() and platform.system() != "Windows":
+            self._apply_diff(plan, final_dir, report)
+        else:
+            self._build_staged(plan, final_dir, report)
+        
+        report.duration_ms = int((time.perf_counter() - started) * 1000)
+        return report
+    
+    def _build_staged(self, plan: ViewPlan, final_dir: Path, report: BuildReport) -> None:
+        """Build the whole view in staging, then swap it in."""
+        staging_dir = self.layout.tmp_path / "views" / plan.ui / f"{plan.profile}.new"
         
         # Clean staging
         if staging_dir.exists():
@@ -323,6 +581,7 @@ class ViewBuilder:
                 try:
                     create_symlink(link_path, blob_path)
                     report.entries_created += 1
+                    report.entries_added += 1
                 except Exception as e:
                     report.errors.append(f"Failed to create link {entry.dst_relpath}: {e}")
             
@@ -344,8 +603,96 @@ class ViewBuilder:
             # Clean up staging
             if staging_dir.exists():
                 shutil.rmtree(staging_dir)
+    
+    def _apply_diff(self, plan: ViewPlan, final_dir: Path, report: BuildReport) -> None:
+        """Patch an existing view in place so it matches the plan."""
+        report.incremental = True
+        wanted = {
+            entry.dst_relpath: str(self.blob_store.blob_path(entry.sha256))
+            for entry in plan.entries
+        }
+        links, others = _scan_view(final_dir)
+        
+        # Remove links (and stray files) the plan no longer has
+        for rel_path in [p for p in links if p not in wanted] + [p for p in others if p not in wanted]:
+            path = final_dir / rel_path
+            try:
+                path.unlink()
+                report.entries_removed += 1
+                _prune_empty_dirs(path.parent, final_dir)
+            except OSError as e:
+                report.errors.append(f"Failed to remove link {rel_path}: {e}")
+        
+        # Add new links, retarget changed ones
+        for rel_path, target in wanted.items():
+            current = links.get(rel_path)
+            if current == target:
+                report.entries_created += 1
+                continue
+            try:
+                _replace_symlink(final_dir / rel_path, target)
+            except OSError as e:
+                report.errors.append(f"Failed to create link {rel_path}: {e}")
+                continue
+            report.entries_created += 1
+            if current is None and rel_path not in others:
+                report.entries_added += 1
+            else:
+                report.entries_retargeted += 1
+    
+    def build_many(
+        self,
+        ui_targets: List[str],
+        profile: Profile,
+        packs: Dict[str, Tuple[Pack, Optional[PackLock]]],
+        activate: bool = False,
+    ) -> Dict[str, BuildReport]:
+        """
+        Build (and optionally activate) views for several UIs concurrently.
         
-        return report
+        UIs are independent directories, so their builds run on a bounded
+        pool; the plan is computed once and shared through the plan cache.
+        A failing UI does not stop the others.
+        
+        Args:
+            ui_targets: UI names
+            profile: Profile to build
+            packs: Dict mapping pack_name -> (pack, lock)
+            activate: Point each UI's 'active' link at the profile after building
+        
+        Returns:
+            Dict mapping ui -> BuildReport, in ui_targets order
+        
+        Raises:
+            MultiViewBuildError: If any UI failed, after all UIs finished
+        """
+        def build_one(ui: str) -> Tuple[str, Optional[BuildReport], Optional[Exception]]:
+            try:
+                report = self.build(ui, profile, packs)
+                if activate:
+                    self.activate(ui, profile.name)
+                return ui, report, None
+            except Exception as e:
+                return ui, None, e
+        
+        if len(ui_targets) <= 1:
+            outcomes = [build_one(ui) for ui in ui_targets]
+        else:
+            workers = min(len(ui_targets), self.MAX_PARALLEL_BUILDS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="view-build") as pool:
+                outcomes = list(pool.map(build_one, ui_targets))
+        
+        results: Dict[str, BuildReport] = {}
+        failures: Dict[str, Exception] = {}
+        for ui, report, error in outcomes:
+            if error is None:
+                results[ui] = report
+            else:
+                failures[ui] = error
+        
+        if failures:
+            raise MultiViewBuildError(failures, results)
+        return results
     
     def build_for_ui_set(
         self,
@@ -362,11 +709,7 @@ class ViewBuilder:
         ui_sets = self.layout.load_ui_sets()
         ui_names = ui_sets.sets.get(ui_set_name, [])
         
-        reports = {}
-        for ui in ui_names:
-            reports[ui] = self.build(ui, profile, packs)
-        
-        return reports
+        return self.build_many(ui_names, profile, packs)
     
     # =========================================================================
     # Activation
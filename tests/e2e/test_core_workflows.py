@@ -243,7 +243,7 @@ class TestCheckAllUpdatesAPIContract:
                 store, name="TestPack", model_id=100,
                 version_id=101, file_id=1011, sha256="old",
             )
-            resp = client.get("/api/updates/check-all")
+            resp = client.get("/api/updates/check-all?refresh=true")
             data = resp.json()
 
             assert "TestPack" in data["plans"], f"Missing TestPack in plans: {data['plans'].keys()}"
@@ -271,7 +271,7 @@ class TestCheckAllUpdatesAPIContract:
                 store, name="VersionTrackPack", model_id=200,
                 version_id=201, file_id=2011, sha256="old",
             )
-            resp = client.get("/api/updates/check-all")
+            resp = client.get("/api/updates/check-all?refresh=true")
             data = resp.json()
             plan = data["plans"]["VersionTrackPack"]
 
@@ -720,7 +720,7 @@ class TestJourneyUpdateCycle:
                                    version_id=1101, file_id=11011, sha256="sha_v1")
 
             # Step 1: Check for updates via API
-            resp = client.get("/api/updates/check-all")
+            resp = client.get("/api/updates/check-all?refresh=true")
             data = resp.json()
             assert data["packs_with_updates"] >= 1
             assert "UpdateJourneyPack" in data["plans"]
@@ -793,7 +793,7 @@ class TestJourneyBatchUpdate:
             _create_pack_with_lock(store, name="BatchBP", model_id=1500, version_id=1501, file_id=15011, sha256="b_old")
 
             # Check all
-            resp = client.get("/api/updates/check-all")
+            resp = client.get("/api/updates/check-all?refresh=true")
             data = resp.json()
             assert data["packs_with_updates"] >= 2
 
@@ -1136,7 +1136,7 @@ class TestUpdateServiceEdgeCases:
                                    version_id=2101, file_id=21011, sha256="p_old",
                                    policy="PINNED")
 
-            resp = client.get("/api/updates/check-all")
+            resp = client.get("/api/updates/check-all?refresh=true")
             assert resp.status_code == 200
             data = resp.json()
 
@@ -334,11 +334,14 @@ class TestDownloadServiceConcurrency:
             )
 
         assert pack is not None
-        # Each download should create a separate session (thread safety)
-        assert len(sessions_created) >= 1
-        # All sessions should be closed
-        for s in sessions_created:
-            s.close.assert_called()
+        # Concurrent downloads share the store's pooled session
+        assert len(sessions_created) == 1
+        assert sessions_created[0].get.call_count >= 5
+        sessions_created[0].close.assert_not_called()
+
+        # Closing the store releases the pooled connections
+        store.close()
+        sessions_created[0].close.assert_called_once()
 
 
 # ============================================================================
@@ -707,6 +707,63 @@ class TestListPacksEndpoint:
             assert result["packs"][0]["thumbnail_type"] == "video"
             assert result["packs"][0]["thumbnail"].endswith(".mp4")
 
+    def test_list_packs_paginated_from_index(self):
+        """Filters/limit switch to the indexed listing with keyset cursors."""
+        from src.store import Store
+        from src.store.api import list_packs
+        from src.store.models import AssetKind, Pack, PackSource, ProviderName
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = Store(Path(tmp_dir))
+            store.init()
+            for i, kind in enumerate([AssetKind.LORA, AssetKind.CHECKPOINT, AssetKind.LORA]):
+                store.layout.save_pack(Pack(
+                    name=f"pack-{i}",
+                    pack_type=kind,
+                    source=PackSource(provider=ProviderName.CIVITAI, model_id=i),
+                    user_tags=["nsfw-pack-hide"] if i == 2 else [],
+                ))
+
+            first = list_packs(show_nsfw=True, store=store, limit=2)
+            assert [p["name"] for p in first["packs"]] == ["pack-0", "pack-1"]
+            assert first["total"] == 3
+            second = list_packs(show_nsfw=True, store=store, limit=2, cursor=first["next_cursor"])
+            assert [p["name"] for p in second["packs"]] == ["pack-2"]
+            assert second["next_cursor"] is None
+
+            loras = list_packs(show_nsfw=False, store=store, pack_type="lora")
+            assert [p["name"] for p in loras["packs"]] == ["pack-0"]
+
+            last = list_packs(show_nsfw=True, store=store, sort="name", order="desc", limit=1)
+            assert last["packs"][0]["name"] == "pack-2"
+
+    def test_thumbnail_cache_is_bounded_and_dropped_on_delete(self):
+        """The thumbnail cache evicts least recently used entries and deleted packs."""
+        from unittest.mock import patch
+        from src.store import Store
+        from src.store import api
+        from src.store.models import AssetKind, Pack, PackSource, ProviderName
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+             patch.object(api, "THUMBNAIL_CACHE_SIZE", 2), \
+             patch.object(api, "_thumbnail_cache", api.OrderedDict()):
+            store = Store(Path(tmp_dir))
+            store.init()
+            for i in range(3):
+                store.layout.save_pack(Pack(
+                    name=f"pack-{i}",
+                    pack_type=AssetKind.LORA,
+                    source=PackSource(provider=ProviderName.CIVITAI, model_id=i),
+                ))
+
+            listed = [p["name"] for p in api.list_packs(show_nsfw=True, store=store)["packs"]]
+            cached = [Path(key).parent.parent.name for key in api._thumbnail_cache]
+            assert cached == listed[1:]
+
+            api.delete_pack(listed[2], store=store)
+            cached = [Path(key).parent.parent.name for key in api._thumbnail_cache]
+            assert cached == [listed[1]]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -826,6 +826,305 @@ class TestSyncEdgeCases:
         assert not store.blob_store.blob_exists(sha256)
 
 
+    def test_sync_parallel_reports_aggregated_progress(self, tmp_path):
+        """Pooled sync copies every blob and reports totals across workers."""
+        store = Store(tmp_path)
+        store.init()
+
+        shas = [
+            store.blob_store.adopt(_create_temp_file(tmp_path, f"parallel blob {i}".encode()))
+            for i in range(6)
+        ]
+
+        backup_path = tmp_path / "backup"
+        backup_path.mkdir()
+        store.configure_backup(BackupConfig(enabled=True, path=str(backup_path)))
+
+        finished = []
+        byte_updates = []
+        result = store.backup_service.sync(
+            direction="to_backup",
+            dry_run=False,
+            progress_callback=lambda sha, done, total: finished.append(sha),
+            bytes_callback=lambda done, total: byte_updates.append((done, total)),
+            workers=3,
+        )
+
+        assert result.blobs_synced == 6
+        assert sorted(finished) == sorted(shas)
+        assert byte_updates[-1] == (result.bytes_to_sync, result.bytes_to_sync)
+        assert all(store.backup_service.verify_backup_blob(sha) for sha in shas)
+
+    def test_sync_checks_space_once_up_front(self, tmp_path):
+        """Not enough room for the batch: nothing is copied."""
+        from unittest.mock import patch
+
+        store = Store(tmp_path)
+        store.init()
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, b"too big for backup"))
+
+        backup_path = tmp_path / "backup"
+        backup_path.mkdir()
+        store.configure_backup(BackupConfig(enabled=True, path=str(backup_path)))
+
+        with patch("src.store.backup_service.shutil.disk_usage") as usage:
+            usage.return_value.free = 1
+            result = store.sync_backup(direction="to_backup", dry_run=False)
+
+        assert usage.call_count == 1
+        assert result.blobs_synced == 0
+        assert "not enough backup space" in result.errors[0].lower()
+        assert not store.blob_exists_on_backup(sha256)
+
+
+class TestResumableSync:
+    """Test journaled sync sessions and .part copies."""
+
+    def _store_with_backup(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        backup_path = tmp_path / "backup"
+        backup_path.mkdir()
+        store.configure_backup(BackupConfig(enabled=True, path=str(backup_path)))
+        return store
+
+    def test_interrupted_sync_resumes_session(self, tmp_path):
+        """Blobs copied before the interruption are not copied again."""
+        from unittest.mock import patch
+        from src.store import backup_service as backup_module
+
+        store = Store(tmp_path)
+        store.init()
+        good = store.blob_store.adopt(_create_temp_file(tmp_path, b"copied before unplug"))
+        bad = store.blob_store.adopt(_create_temp_file(tmp_path, b"copy interrupted"))
+        backup_path = tmp_path / "backup"
+        backup_path.mkdir()
+        store.configure_backup(BackupConfig(enabled=True, path=str(backup_path)))
+
+        real_copy = backup_module.copy_file_hashed
+
+        def unplug(src, dst, on_bytes=None, resume=False):
+            if src.name == bad:
+                dst.write_bytes(src.read_bytes()[:4])
+                raise OSError(5, "Input/output error")
+            return real_copy(src, dst, on_bytes, resume)
+
+        with patch.object(backup_module, "copy_file_hashed", side_effect=unplug):
+            first = store.sync_backup(direction="to_backup", dry_run=False)
+
+        assert first.blobs_synced == 1
+        assert not store.blob_exists_on_backup(bad)
+        status = store.get_backup_status()
+        assert len(status.sessions) == 1
+        items = {item.sha256: item for item in status.sessions[0].items}
+        assert items[good].status == "done"
+        assert items[bad].status == "failed"
+
+        with patch.object(backup_module, "copy_file_hashed", side_effect=real_copy) as copy:
+            second = store.sync_backup(direction="to_backup", dry_run=False)
+
+        assert second.resumed is True
+        assert second.session_id == first.session_id
+        assert [call.args[0].name for call in copy.call_args_list] == [bad]
+        assert store.backup_service.verify_backup_blob(bad)
+        assert store.get_backup_status().sessions == []
+
+    def test_copy_extends_existing_part(self, tmp_path):
+        """A .part left by an interrupted copy is continued, then renamed."""
+        store = self._store_with_backup(tmp_path)
+        content = b"resumable blob content " * 100
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, content))
+
+        target = store.backup_service.backup_blob_path(sha256)
+        target.parent.mkdir(parents=True)
+        part = store.backup_service._part_path(target)
+        part.write_bytes(content[:1000])
+
+        result = store.backup_blob(sha256)
+
+        assert result.success is True
+        assert target.read_bytes() == content
+        assert not part.exists()
+
+    def test_stale_part_is_recopied(self, tmp_path):
+        """A .part whose prefix does not match the source is started over."""
+        store = self._store_with_backup(tmp_path)
+        content = b"fresh blob content " * 100
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, content))
+
+        target = store.backup_service.backup_blob_path(sha256)
+        target.parent.mkdir(parents=True)
+        store.backup_service._part_path(target).write_bytes(b"garbage")
+
+        result = store.backup_blob(sha256)
+
+        assert result.success is True
+        assert target.read_bytes() == content
+
+    def test_unverified_copy_overwrites_part(self, tmp_path):
+        """Without a hash to check, a leftover .part prefix is not trusted."""
+        store = self._store_with_backup(tmp_path)
+        src = _create_temp_file(tmp_path, b"state file content " * 50)
+        dst = tmp_path / "copy" / "state.json"
+        dst.parent.mkdir()
+        part = store.backup_service._part_path(dst)
+        part.write_bytes(b"stale prefix from another version")
+
+        store.backup_service._copy_file(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert not part.exists()
+
+    def test_part_files_are_not_backup_blobs(self, tmp_path):
+        """Half-copied files never look like complete blobs."""
+        store = self._store_with_backup(tmp_path)
+        sha256 = "ab" * 32
+        target = store.backup_service.backup_blob_path(sha256)
+        target.parent.mkdir(parents=True)
+        store.backup_service._part_path(target).write_bytes(b"partial")
+
+        assert not store.blob_exists_on_backup(sha256)
+        assert store.backup_service.list_backup_blobs() == []
+        assert store.get_backup_status().total_blobs == 0
+
+    def test_completed_session_not_reported(self, tmp_path):
+        """Status only lists sessions that still have work left."""
+        store = self._store_with_backup(tmp_path)
+        store.blob_store.adopt(_create_temp_file(tmp_path, b"one shot sync"))
+
+        result = store.sync_backup(direction="to_backup", dry_run=False)
+
+        assert result.session_id is not None
+        assert result.resumed is False
+        assert store.get_backup_status().sessions == []
+
+    def test_concurrent_run_of_session_is_refused(self, tmp_path):
+        """A second sync of the same scope is refused while the first runs."""
+        import threading
+        from unittest.mock import patch
+        from src.store import backup_service as backup_module
+
+        store = self._store_with_backup(tmp_path)
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, b"slow copy"))
+        real_copy = backup_module.copy_file_hashed
+        copying = threading.Event()
+        release = threading.Event()
+
+        def slow(src, dst, on_bytes=None, resume=False):
+            copying.set()
+            release.wait(5)
+            return real_copy(src, dst, on_bytes, resume)
+
+        with patch.object(backup_module, "copy_file_hashed", side_effect=slow):
+            first = {}
+            runner = threading.Thread(
+                target=lambda: first.update(result=store.sync_backup(direction="to_backup", dry_run=False)),
+            )
+            runner.start()
+            assert copying.wait(5)
+            second = store.sync_backup(direction="to_backup", dry_run=False)
+            release.set()
+            runner.join(5)
+
+        assert second.session_id is None
+        assert "already running" in second.errors[0]
+        assert first["result"].blobs_synced == 1
+        assert store.blob_exists_on_backup(sha256)
+
+    def test_dropped_session_item_loses_its_part(self, tmp_path):
+        """A continued session deletes the .part of blobs it no longer copies."""
+        store = self._store_with_backup(tmp_path)
+        service = store.backup_service
+        kept, dropped = "aa" * 32, "bb" * 32
+        service.journal.open_session("sync", "to_backup", [(kept, 1), (dropped, 1)])
+        part = service._part_path(service.backup_blob_path(dropped))
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"half")
+
+        service.journal.open_session(
+            "sync", "to_backup", [(kept, 1)],
+            discard=lambda sha256: service._discard_part(sha256, "to_backup"),
+        )
+
+        assert not part.exists()
+        sessions = service.journal.open_sessions()
+        assert [item.sha256 for item in sessions[0].items] == [kept]
+
+
+class TestStateSync:
+    """Test manifest-based state/ sync."""
+
+    def _store_with_backup(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        backup_path = tmp_path / "backup"
+        backup_path.mkdir()
+        store.configure_backup(BackupConfig(enabled=True, path=str(backup_path)))
+        return store
+
+    def test_copy_without_mtime_is_synced(self, tmp_path):
+        """Same content with a different mtime counts as synced."""
+        import os
+
+        store = self._store_with_backup(tmp_path)
+        store.backup_service.sync_state(direction="to_backup", dry_run=False)
+
+        config = store.backup_service.backup_state_path / "config.json"
+        st = config.stat()
+        os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns - 3600 * 1_000_000_000))
+
+        result = store.backup_service.get_state_sync_status(rescan=True)
+
+        assert result.summary.modified == 0
+        assert result.summary.synced == result.summary.total_files
+
+    def test_status_does_not_walk_backup(self, tmp_path):
+        """After a sync, status reads the backup manifest instead of the tree."""
+        from unittest.mock import patch
+        from src.store import state_manifest
+
+        store = self._store_with_backup(tmp_path)
+        store.backup_service.sync_state(direction="to_backup", dry_run=False)
+        backup_state = store.backup_service.backup_state_path
+
+        with patch.object(
+            state_manifest, "iter_state_files", wraps=state_manifest.iter_state_files,
+        ) as walk:
+            result = store.backup_service.get_state_sync_status()
+
+        assert result.summary.local_only == 0
+        assert all(call.args[0] != backup_state for call in walk.call_args_list)
+
+    def test_both_sides_modified_is_conflict(self, tmp_path):
+        store = self._store_with_backup(tmp_path)
+        store.backup_service.sync_state(direction="to_backup", dry_run=False)
+        local_config = store.layout.state_path / "config.json"
+        backup_config = store.backup_service.backup_state_path / "config.json"
+
+        local_config.write_text('{"edited": "locally"}')
+        backup_config.write_text('{"edited": "on backup"}')
+        status = store.backup_service.get_state_sync_status(rescan=True)
+        result = store.backup_service.sync_state(direction="bidirectional", dry_run=False)
+
+        assert status.summary.conflicts == 1
+        assert result.synced_files == 0
+        assert any("config.json" in error for error in result.errors)
+        assert local_config.read_text() == '{"edited": "locally"}'
+
+    def test_one_side_modified_copies_from_changed_side(self, tmp_path):
+        store = self._store_with_backup(tmp_path)
+        store.backup_service.sync_state(direction="to_backup", dry_run=False)
+        local_config = store.layout.state_path / "config.json"
+        backup_config = store.backup_service.backup_state_path / "config.json"
+
+        backup_config.write_text('{"edited": "on backup"}')
+        store.backup_service.get_state_sync_status(rescan=True)
+        result = store.backup_service.sync_state(direction="bidirectional", dry_run=False)
+
+        assert result.summary.modified == 1
+        assert local_config.read_text() == '{"edited": "on backup"}'
+
+
 class TestSyncDirectionSymmetry:
     """Test that sync works correctly in both directions."""
 
@@ -280,6 +280,48 @@ class TestBlobStore:
             assert not partial1.exists()
             assert not partial2.exists()
 
+    def test_clean_partial_removes_segment_state(self):
+        """Segment sidecars go with their .part file, orphaned or not."""
+        from src.store import StoreLayout, BlobStore
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            layout = StoreLayout(Path(tmpdir))
+            layout.init_store()
+            store = BlobStore(layout)
+            
+            partial = store.blob_path("aa" + "0" * 62).with_suffix(".part")
+            partial.parent.mkdir(parents=True, exist_ok=True)
+            partial.write_bytes(b"incomplete")
+            sidecar = partial.with_name(partial.name + ".segments")
+            sidecar.write_text("{}")
+            orphan = store.blob_path("aa" + "1" * 62).with_suffix(".part.segments")
+            orphan.write_text("{}")
+            
+            count = store.clean_partial()
+            
+            assert count == 1
+            assert not partial.exists()
+            assert not sidecar.exists()
+            assert not orphan.exists()
+
+    def test_clean_partial_keeps_interrupted_restores(self):
+        """Journaled restore copies (.sync.part) are left for the sync to resume."""
+        from src.store import StoreLayout, BlobStore
+        from src.store.backup_service import BackupService
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            layout = StoreLayout(Path(tmpdir))
+            layout.init_store()
+            store = BlobStore(layout)
+            
+            blob = store.blob_path("aa" + "0" * 62)
+            restore = blob.with_name(blob.name + BackupService.PART_SUFFIX)
+            restore.parent.mkdir(parents=True, exist_ok=True)
+            restore.write_bytes(b"half restored")
+            
+            assert store.clean_partial() == 0
+            assert restore.exists()
+
 
 class TestBlobManifest:
     """Tests for blob manifest operations (write-once metadata)."""
@@ -520,3 +562,185 @@ class TestComputeSha256:
             expected = hashlib.sha256(content).hexdigest()
             
             assert result == expected
+
+
+class TestParallelVerify:
+    """Tests for BlobStore.verify_blobs (parallel engine + hash ledger)."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from src.store import StoreLayout, BlobStore
+
+        layout = StoreLayout(tmp_path)
+        layout.init_store()
+        store = BlobStore(layout)
+        yield store
+        store.hash_ledger.close()
+
+    def _add_blob(self, store, content: bytes) -> str:
+        sha = hashlib.sha256(content).hexdigest()
+        path = store.blob_path(sha)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        return sha
+
+    def test_verifies_all_in_parallel(self, store):
+        shas = [self._add_blob(store, f"blob {i}".encode()) for i in range(6)]
+
+        report = store.verify_blobs(max_workers=3)
+
+        assert sorted(report.valid) == sorted(shas)
+        assert report.invalid == []
+        assert report.bytes_hashed == sum(len(f"blob {i}") for i in range(6))
+
+    def test_rerun_skips_unchanged_blobs(self, store):
+        sha = self._add_blob(store, b"stable")
+        store.verify_blobs([sha])
+
+        report = store.verify_blobs([sha])
+        assert report.valid == [sha]
+        assert report.skipped == [sha]
+        assert report.bytes_hashed == 0
+
+        forced = store.verify_blobs([sha], force=True)
+        assert forced.skipped == []
+        assert forced.bytes_hashed == len(b"stable")
+
+    def test_modified_blob_is_rehashed(self, store):
+        sha = self._add_blob(store, b"original")
+        store.verify_blobs([sha])
+
+        store.blob_path(sha).write_bytes(b"tampered")
+        report = store.verify_blobs([sha])
+        assert report.invalid == [sha]
+        assert report.skipped == []
+
+    def test_missing_blob_is_invalid(self, store):
+        assert store.verify_blobs(["0" * 64]).invalid == ["0" * 64]
+
+    def test_progress_and_cancel(self, store):
+        import threading
+
+        shas = [self._add_blob(store, f"blob {i}".encode()) for i in range(4)]
+        cancel = threading.Event()
+        seen = []
+
+        def progress(sha, done, total):
+            seen.append((sha, done, total))
+            cancel.set()
+
+        report = store.verify_blobs(shas, max_workers=1, progress=progress, cancel=cancel)
+
+        assert report.cancelled
+        assert len(report.valid) == 1
+        assert seen[0][1] == seen[0][2]
+
+
+class TestBlobSizes:
+    """Tests for batched existence/size lookups (BlobStore.blob_sizes)."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from src.store import StoreLayout, BlobStore
+
+        layout = StoreLayout(tmp_path)
+        layout.init_store()
+        store = BlobStore(layout)
+        yield store
+        store.hash_ledger.close()
+
+    def _adopt(self, store, tmp_path, content: bytes) -> str:
+        source = tmp_path / "source.bin"
+        source.write_bytes(content)
+        return store.adopt(source)
+
+    def test_sizes_and_existing(self, store, tmp_path):
+        sha = self._adopt(store, tmp_path, b"twelve bytes")
+        missing = "0" * 64
+
+        sizes = store.blob_sizes([sha.upper(), missing, "not-a-hash"])
+
+        assert sizes == {sha.upper(): 12, missing: None, "not-a-hash": None}
+        assert store.existing_blobs([sha, missing]) == {sha}
+
+    def test_own_writes_invalidate(self, store, tmp_path):
+        import os
+
+        sha = self._adopt(store, tmp_path, b"first")
+        shard = store.blob_path(sha).parent
+        old_ns = 1_000_000_000_000_000_000
+        os.utime(shard, ns=(old_ns, old_ns))
+        assert store.existing_blobs([sha]) == {sha}
+
+        # Listing is reused while the shard is unchanged
+        from unittest.mock import patch
+        with patch("src.store.blob_snapshot.os.scandir") as scandir:
+            assert store.existing_blobs([sha]) == {sha}
+        scandir.assert_not_called()
+
+        store.remove_blob(sha)
+        assert store.existing_blobs([sha]) == set()
+
+    def test_external_changes_detected_by_shard_mtime(self, store):
+        import os
+
+        content = b"dropped in"
+        sha = hashlib.sha256(content).hexdigest()
+        path = store.blob_path(sha)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        old_ns = 1_000_000_000_000_000_000
+        os.utime(path.parent, ns=(old_ns, old_ns))
+        assert store.blob_sizes([sha]) == {sha: None}
+
+        path.write_bytes(content)  # Bypasses BlobStore; shard mtime changes
+        assert store.blob_sizes([sha]) == {sha: len(content)}
+
+
+class TestBlobScan:
+    """Tests for the shared blob tree enumeration (BlobStore.scan_blobs)."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from src.store import StoreLayout, BlobStore
+
+        layout = StoreLayout(tmp_path)
+        layout.init_store()
+        store = BlobStore(layout)
+        yield store
+        store.hash_ledger.close()
+
+    def test_classifies_blobs_parts_and_manifests(self, store, tmp_path):
+        from src.store.blob_snapshot import BLOB, META, PART
+
+        content = b"scanned blob"
+        source = tmp_path / "source.bin"
+        source.write_bytes(content)
+        sha = store.adopt(source)
+        manifest_path = store.blob_path(sha).with_suffix(".meta")
+        manifest_path.write_text("{}")
+        part = store.blob_path("cd" + "0" * 62).with_suffix(".part")
+        part.parent.mkdir(parents=True, exist_ok=True)
+        part.write_bytes(b"half")
+
+        entries = {(e.sha256, e.kind): e for e in store.scan_blobs()}
+
+        assert set(entries) == {(sha, BLOB), (sha, META), ("cd" + "0" * 62, PART)}
+        assert entries[(sha, BLOB)].size == len(content)
+        assert store.list_blobs() == [sha]
+        assert store.get_total_size() == len(content)
+
+    def test_cached_listing_reused_until_store_write(self, store, tmp_path):
+        from unittest.mock import patch
+
+        source = tmp_path / "a.bin"
+        source.write_bytes(b"a")
+        store.adopt(source)
+        first = store.scan_blobs(max_age=60)
+
+        with patch("src.store.blob_snapshot.scan_blobs") as scan:
+            assert store.scan_blobs(max_age=60) is first
+        scan.assert_not_called()
+
+        source.write_bytes(b"b")
+        sha_b = store.adopt(source)
+        assert sha_b in store.list_blobs(max_age=60)
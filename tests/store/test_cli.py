@@ -371,7 +371,7 @@ class TestInventoryVerify:
         assert result.exit_code == 0
         assert "Verified" in result.output
         assert "10" in result.output
-        mock_store.inventory_service.verify_blobs.assert_called_with(all_blobs=True)
+        mock_store.inventory_service.verify_blobs.assert_called_with(all_blobs=True, force=False)
 
     def test_verify_specific(self, mock_store):
         """Test verify specific blob."""
@@ -385,7 +385,7 @@ class TestInventoryVerify:
         result = runner.invoke(app, ["inventory", "verify", "--sha256", "a" * 64])
 
         assert result.exit_code == 0
-        mock_store.inventory_service.verify_blobs.assert_called_with(sha256_list=["a" * 64])
+        mock_store.inventory_service.verify_blobs.assert_called_with(sha256_list=["a" * 64], force=False)
 
     def test_verify_no_args(self, mock_store):
         """Test verify without required args."""
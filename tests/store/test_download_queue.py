@@ -0,0 +1,237 @@
+"""
+Tests for DownloadScheduler
+
+Tests the persistent download queue: limits, priorities, pause/resume,
+cancellation and restore after a restart.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.store.download_queue import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    PAUSED,
+    PRIORITY_BACKGROUND,
+    QUEUED,
+    RUNNING,
+    DownloadQueueError,
+    DownloadScheduler,
+)
+from src.store.download_service import BandwidthLimiter
+from src.store.layout import StoreLayout
+
+
+@pytest.fixture
+def layout(tmp_path):
+    layout = StoreLayout(tmp_path / "store")
+    layout.init_store()
+    return layout
+
+
+class FakeBlobStore:
+    """Blob store whose downloads block until released."""
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.started = []
+        self.release = {}
+        self.lock = threading.Lock()
+
+    def part_path(self, expected_sha256=None, part_name=None):
+        return self.layout.tmp_path / part_name
+
+    def download(self, url, expected_sha256=None, progress_callback=None, force=False, part_name=None):
+        with self.lock:
+            self.started.append(url)
+            event = self.release.setdefault(url, threading.Event())
+        while not event.wait(0.01):
+            if progress_callback:
+                progress_callback(1, 2)
+        return "a" * 64
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def blob_store(layout):
+    return FakeBlobStore(layout)
+
+
+@pytest.fixture
+def scheduler(layout, blob_store):
+    scheduler = DownloadScheduler(layout, blob_store, max_concurrent=2, max_per_host=1)
+    yield scheduler
+    for event in blob_store.release.values():
+        event.set()
+    scheduler.shutdown()
+
+
+class TestScheduling:
+    """Limits and priorities."""
+
+    def test_per_host_and_global_limits(self, scheduler, blob_store):
+        a1 = scheduler.submit("https://a.example/1")
+        a2 = scheduler.submit("https://a.example/2")
+        b1 = scheduler.submit("https://b.example/1")
+        c1 = scheduler.submit("https://c.example/1")
+        scheduler.start()
+
+        assert wait_for(lambda: len(blob_store.started) == 2)
+        time.sleep(0.05)
+        # One per host, two overall: a2 waits for a1, c1 for a free slot
+        assert blob_store.started == ["https://a.example/1", "https://b.example/1"]
+        assert (a2.status, c1.status) == (QUEUED, QUEUED)
+
+        blob_store.release.setdefault("https://a.example/1", threading.Event()).set()
+        assert wait_for(lambda: a1.status == COMPLETED)
+        assert wait_for(lambda: len(blob_store.started) == 3)
+        assert blob_store.started[2] == "https://a.example/2"
+        assert b1.status == RUNNING
+
+    def test_user_jobs_run_before_background(self, layout, blob_store):
+        scheduler = DownloadScheduler(layout, blob_store, max_concurrent=1)
+        scheduler.submit("https://x.example/restore", priority=PRIORITY_BACKGROUND)
+        scheduler.submit("https://x.example/user")
+        scheduler.start()
+
+        assert wait_for(lambda: blob_store.started == ["https://x.example/user"])
+        blob_store.release["https://x.example/user"].set()
+        assert wait_for(lambda: len(blob_store.started) == 2)
+        blob_store.release["https://x.example/restore"].set()
+        scheduler.shutdown()
+
+    def test_duplicate_job_id_rejected(self, scheduler):
+        scheduler.submit("https://a.example/1", job_id="job")
+        with pytest.raises(DownloadQueueError):
+            scheduler.submit("https://a.example/2", job_id="job")
+
+    def test_same_blob_is_queued_once(self, scheduler, blob_store):
+        sha256 = "ab" * 32
+        first = scheduler.submit("https://a.example/1", expected_sha256=sha256, priority=PRIORITY_BACKGROUND)
+        again = scheduler.submit("https://b.example/1", expected_sha256=sha256.upper())
+
+        assert again is first
+        assert first.priority < PRIORITY_BACKGROUND  # Raised to the user request
+        assert len(scheduler.jobs()) == 1
+
+        scheduler.start()
+        assert wait_for(lambda: first.status == RUNNING)
+        assert scheduler.submit("https://c.example/1", expected_sha256=sha256) is first
+
+        blob_store.release.setdefault("https://a.example/1", threading.Event()).set()
+        assert wait_for(lambda: first.status == COMPLETED)
+        assert scheduler.submit("https://a.example/1", expected_sha256=sha256) is not first
+
+
+class TestControl:
+    """Pause, resume, cancel and completion handlers."""
+
+    def test_pause_and_resume_running_job(self, scheduler, blob_store):
+        job = scheduler.submit("https://a.example/1")
+        scheduler.start()
+        assert wait_for(lambda: job.status == RUNNING)
+
+        assert scheduler.pause(job.job_id)
+        assert wait_for(lambda: job.status == PAUSED)
+
+        blob_store.release["https://a.example/1"].set()
+        assert scheduler.resume(job.job_id)
+        assert wait_for(lambda: job.status == COMPLETED)
+        assert job.sha256 == "a" * 64
+
+    def test_cancel_queued_job_discards_part(self, scheduler, layout):
+        job = scheduler.submit("https://a.example/1")
+        part = layout.tmp_path / job.part_name
+        part.write_bytes(b"partial")
+
+        assert scheduler.cancel(job.job_id)
+        assert job.status == CANCELLED
+        assert not part.exists()
+
+    def test_handler_failure_fails_job(self, scheduler, blob_store):
+        seen = []
+
+        def handler(job):
+            seen.append(job.sha256)
+            raise RuntimeError("not a model")
+
+        scheduler.register_handler("asset", handler)
+        events = []
+        scheduler.add_listener(lambda job: events.append(job.status))
+
+        job = scheduler.submit("https://a.example/1", kind="asset")
+        blob_store.release.setdefault("https://a.example/1", threading.Event()).set()
+        scheduler.start()
+
+        assert wait_for(lambda: job.status == FAILED)
+        assert seen == ["a" * 64]
+        assert job.error == "not a model"
+        assert events[0] == QUEUED and events[-1] == FAILED
+
+
+class TestPersistence:
+    """Queue survives a restart."""
+
+    def test_unfinished_jobs_restored(self, layout, blob_store):
+        first = DownloadScheduler(layout, blob_store)
+        queued = first.submit("https://a.example/1", meta={"pack_name": "p"})
+        paused = first.submit("https://a.example/2")
+        first.pause(paused.job_id)
+        first.shutdown()
+
+        second = DownloadScheduler(layout, blob_store)
+        blob_store.release.setdefault("https://a.example/1", threading.Event()).set()
+        restored = {job.job_id: job for job in second.start()}
+
+        assert set(restored) == {queued.job_id, paused.job_id}
+        assert restored[queued.job_id].meta == {"pack_name": "p"}
+        assert restored[paused.job_id].status == PAUSED  # Not resumed behind the user's back
+        assert wait_for(lambda: restored[queued.job_id].status == COMPLETED)
+        second.shutdown()
+
+    def test_interrupted_job_requeued(self, layout, blob_store):
+        first = DownloadScheduler(layout, blob_store)
+        job = first.submit("https://a.example/1")
+        first.start()
+        assert wait_for(lambda: job.status == RUNNING)
+        first.shutdown()
+
+        second = DownloadScheduler(layout, blob_store)
+        blob_store.release["https://a.example/1"].set()
+        restored = second.start()
+        assert [j.job_id for j in restored] == [job.job_id]
+        assert wait_for(lambda: restored[0].status == COMPLETED)
+        second.shutdown()
+
+        # Finished jobs are dropped on the next start
+        third = DownloadScheduler(layout, blob_store)
+        assert third.start() == []
+        third.shutdown()
+
+
+class TestBandwidthLimiter:
+    """Global bandwidth ceiling."""
+
+    def test_throttles_to_rate(self):
+        limiter = BandwidthLimiter(rate=100_000)
+        started = time.monotonic()
+        limiter.consume(20_000)
+        limiter.consume(20_000)
+        assert time.monotonic() - started >= 0.35
+
+    def test_unlimited_by_default(self):
+        limiter = BandwidthLimiter()
+        started = time.monotonic()
+        limiter.consume(10 ** 9)
+        assert time.monotonic() - started < 0.1
@@ -11,6 +11,9 @@ Tests the actual FastAPI endpoints via TestClient:
 These tests verify the HTTP layer, not just service logic.
 """
 
+import threading
+import time
+
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -572,3 +575,60 @@ class TestDownloadEntrySchema:
         assert parsed["started_at"] is None, (
             "Backend must set started_at to a valid ISO string, not None"
         )
+
+
+# =============================================================================
+# Download Queue: pause / resume / cancel through the API
+# =============================================================================
+
+
+class TestQueuedDownloadControl:
+    """download-asset goes through the store's persistent download queue."""
+
+    @pytest.fixture
+    def blocking_download(self, test_store: Store):
+        release = threading.Event()
+
+        def download(url, expected_sha256=None, progress_callback=None, force=False, part_name=None):
+            while not release.wait(0.01):
+                progress_callback(50, 100)
+            return "b" * 64
+
+        test_store.blob_store.download = download
+        yield release
+        release.set()
+        test_store.download_scheduler.shutdown()
+
+    def _wait_status(self, download_id, status):
+        for _ in range(200):
+            if _active_downloads.get(download_id, {}).get("status") == status:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_pause_resume_and_cancel(self, client: TestClient, test_store: Store, test_pack, blocking_download):
+        response = client.post(
+            "/api/packs/test-download-pack/download-asset",
+            json={"asset_name": "main-model", "url": "https://example.com/model.safetensors"},
+        )
+        download_id = response.json()["download_id"]
+        assert self._wait_status(download_id, "downloading")
+        assert test_store.download_scheduler.get(download_id).meta["asset_type"] == "checkpoint"
+
+        assert client.post(f"/api/packs/downloads/{download_id}/pause").status_code == 200
+        assert self._wait_status(download_id, "paused")
+
+        assert client.post(f"/api/packs/downloads/{download_id}/resume").status_code == 200
+        assert self._wait_status(download_id, "downloading")
+
+        client.delete(f"/api/packs/downloads/{download_id}")
+        job = test_store.download_scheduler.get(download_id)
+        for _ in range(200):
+            if job.status == "cancelled":
+                break
+            time.sleep(0.01)
+        assert job.status == "cancelled"
+        assert download_id not in _active_downloads
+
+    def test_pause_unknown_download_404(self, client: TestClient):
+        assert client.post("/api/packs/downloads/nope/pause").status_code == 404
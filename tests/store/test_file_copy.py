@@ -0,0 +1,57 @@
+"""
+Tests for file_copy
+
+Tests the kernel copy path, its fallbacks, and the single-pass hashing copy.
+"""
+
+import errno
+import hashlib
+import os
+from unittest.mock import patch
+
+from src.store import file_copy
+from src.store.file_copy import copy_file, copy_file_hashed
+
+
+CONTENT = os.urandom(file_copy.COPY_CHUNK_SIZE * 2 + 123)
+
+
+def test_copy_file(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(CONTENT)
+    progress = []
+
+    assert copy_file(src, dst, progress.append) == len(CONTENT)
+    assert dst.read_bytes() == CONTENT
+    assert progress[-1] == len(CONTENT)
+
+
+def test_copy_file_falls_back_when_kernel_copy_unsupported(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(CONTENT)
+    unsupported = OSError(errno.EXDEV, "cross-device")
+
+    with patch.object(os, "copy_file_range", side_effect=unsupported, create=True), \
+            patch.object(os, "sendfile", side_effect=unsupported, create=True):
+        assert copy_file(src, dst) == len(CONTENT)
+
+    assert dst.read_bytes() == CONTENT
+
+
+def test_copy_file_empty(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(b"")
+
+    assert copy_file(src, dst) == 0
+    assert dst.read_bytes() == b""
+
+
+def test_copy_file_hashed(tmp_path):
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    src.write_bytes(CONTENT)
+
+    copied, sha256 = copy_file_hashed(src, dst)
+
+    assert copied == len(CONTENT)
+    assert sha256 == hashlib.sha256(CONTENT).hexdigest()
+    assert dst.read_bytes() == CONTENT
@@ -0,0 +1,107 @@
+"""
+Tests for HashLedger
+
+Tests the persistent (device, inode, size, mtime) -> sha256 ledger and the
+call sites that consult it instead of rehashing.
+"""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.store import Store
+from src.store.hash_ledger import HashLedger
+from src.store.layout import StoreLayout
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    layout = StoreLayout(tmp_path / "store")
+    layout.init_store()
+    ledger = HashLedger(layout)
+    yield ledger
+    ledger.close()
+
+
+def _write(path, content: bytes) -> str:
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+class TestLedger:
+    """Lookup / record semantics."""
+
+    def test_sha256_hashes_once(self, ledger, tmp_path):
+        path = tmp_path / "model.safetensors"
+        expected = _write(path, b"weights")
+
+        with patch("src.store.blob_store.compute_sha256", return_value=expected) as compute:
+            assert ledger.sha256(path) == expected
+            assert ledger.sha256(path) == expected
+            assert compute.call_count == 1
+
+            ledger.sha256(path, force=True)
+            assert compute.call_count == 2
+
+    def test_modified_file_misses(self, ledger, tmp_path):
+        path = tmp_path / "model.safetensors"
+        _write(path, b"one")
+        ledger.sha256(path)
+
+        expected = _write(path, b"two, longer")
+        assert ledger.lookup(path) is None
+        assert ledger.sha256(path) == expected
+
+    def test_entry_follows_rename(self, ledger, tmp_path):
+        part = tmp_path / "blob.part"
+        expected = _write(part, b"downloaded")
+        ledger.record(part, expected)
+
+        final = tmp_path / "blob"
+        part.replace(final)
+        assert ledger.lookup(final) == expected
+
+    def test_stat_before_hashing_guards_concurrent_writes(self, ledger, tmp_path):
+        path = tmp_path / "model.safetensors"
+        _write(path, b"before")
+        stale = os.stat(path)
+        _write(path, b"after the write")
+
+        ledger.record(path, "0" * 64, stale)
+        assert ledger.lookup(path) is None
+
+    def test_corrupt_database_is_discarded(self, tmp_path):
+        layout = StoreLayout(tmp_path / "store")
+        layout.init_store()
+        layout.hash_ledger_path.write_bytes(b"garbage" * 100)
+
+        ledger = HashLedger(layout)
+        path = tmp_path / "f"
+        expected = _write(path, b"x")
+        assert ledger.sha256(path) == expected
+        ledger.close()
+
+
+class TestCallSites:
+    """Store services share one ledger."""
+
+    def test_adopt_then_verify_skips_rehash(self, tmp_path):
+        store = Store(tmp_path / "store")
+        store.init()
+        source = tmp_path / "model.safetensors"
+        expected = _write(source, b"checkpoint bytes")
+
+        sha = store.blob_store.adopt(source)
+        assert sha == expected
+
+        # Hardlinked blob shares the inode, so the adopt hash is reused
+        report = store.blob_store.verify_blobs([sha])
+        assert report.valid == [sha]
+        assert report.skipped == [sha]
+
+    def test_services_share_ledger(self, tmp_path):
+        store = Store(tmp_path / "store")
+        assert store.blob_store.hash_ledger is store.hash_ledger
+        assert store.backup_service.hash_ledger is store.hash_ledger
@@ -0,0 +1,384 @@
+"""
+Tests for StoreIndex
+
+Tests the SQLite index maintained from StoreLayout write events.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.store import Store
+from src.store.index_db import StoreIndex, StoreIndexError
+from src.store.layout import StoreLayout
+from src.store.models import (
+    ArtifactProvider,
+    AssetKind,
+    DependencySelector,
+    ExposeConfig,
+    Pack,
+    PackDependency,
+    PackDependencyRef,
+    PackLock,
+    PackSource,
+    PreviewInfo,
+    Profile,
+    ProfilePackEntry,
+    ProviderName,
+    ResolvedArtifact,
+    ResolvedDependency,
+    SelectorStrategy,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def layout(temp_dir):
+    """Create an initialized StoreLayout with an attached index."""
+    layout = StoreLayout(temp_dir)
+    layout.init_store()
+    return layout
+
+
+@pytest.fixture
+def index(layout):
+    """Create a StoreIndex listening to the layout."""
+    index = StoreIndex(layout)
+    layout.add_listener(index)
+    yield index
+    index.close()
+
+
+def make_pack(name: str, kind: AssetKind = AssetKind.LORA, dep_ids=("main",)) -> Pack:
+    return Pack(
+        name=name,
+        pack_type=kind,
+        source=PackSource(provider=ProviderName.CIVITAI, model_id=1),
+        base_model="SDXL",
+        dependencies=[
+            PackDependency(
+                id=dep_id,
+                kind=kind,
+                selector=DependencySelector(strategy=SelectorStrategy.LOCAL_FILE),
+                expose=ExposeConfig(filename=f"{name}_{dep_id}.safetensors"),
+            )
+            for dep_id in dep_ids
+        ],
+        previews=[PreviewInfo(filename="a.mp4"), PreviewInfo(filename="b.png")],
+    )
+
+
+def make_lock(name: str, sha256: str, dep_id: str = "main") -> PackLock:
+    return PackLock(
+        pack=name,
+        resolved=[
+            ResolvedDependency(
+                dependency_id=dep_id,
+                artifact=ResolvedArtifact(
+                    kind=AssetKind.LORA,
+                    sha256=sha256,
+                    size_bytes=123,
+                    provider=ArtifactProvider(name=ProviderName.CIVITAI, filename="file.safetensors"),
+                ),
+            )
+        ],
+    )
+
+
+class TestIncrementalUpdates:
+    """Index follows layout writes without rescans."""
+
+    def test_save_pack_indexes_pack(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+
+        rows = index._query("SELECT * FROM packs WHERE name = 'alpha'")
+        assert len(rows) == 1
+        assert rows[0]["base_model"] == "SDXL"
+        assert rows[0]["dependencies_count"] == 1
+
+    def test_save_lock_indexes_artifacts(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+        layout.save_pack_lock(make_lock("alpha", "A" * 64))
+
+        rows = list(index.iter_model_rows())
+        assert len(rows) == 1
+        assert rows[0]["sha256"] == "a" * 64  # Normalized to lowercase
+        assert rows[0]["size_bytes"] == 123
+
+    def test_delete_pack_removes_rows(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+        layout.save_pack_lock(make_lock("alpha", "a" * 64))
+        layout.delete_pack("alpha")
+
+        assert index.count_packs() == 0
+        assert list(index.iter_model_rows()) == []
+
+    def test_profile_saved_and_deleted(self, layout, index):
+        layout.save_profile(Profile(name="work", packs=[ProfilePackEntry(name="alpha")]))
+        rows = index._query("SELECT pack FROM profile_packs WHERE profile = 'work'")
+        assert [r["pack"] for r in rows] == ["alpha"]
+
+        layout.delete_profile("work")
+        assert index._query("SELECT * FROM profiles WHERE name = 'work'") == []
+
+    def test_refresh_after_incremental_is_noop(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+        layout.save_pack_lock(make_lock("alpha", "a" * 64))
+        index.refresh()  # Picks up the global profile written by init
+
+        stats = index.refresh()
+        assert not stats.changed
+
+
+class TestReconciliation:
+    """Out-of-band edits are picked up by refresh()."""
+
+    def test_picks_up_external_pack(self, layout, index):
+        # Write without going through the layout (e.g. git pull)
+        pack = make_pack("external")
+        path = layout.pack_json_path("external")
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(pack.model_dump(by_alias=True, mode="json")))
+
+        stats = index.refresh()
+        assert stats.packs_indexed == 1
+        assert index.count_packs() == 1
+
+    def test_removed_directory_is_dropped(self, layout, index):
+        import shutil
+
+        layout.save_pack(make_pack("alpha"))
+        shutil.rmtree(layout.pack_dir("alpha"))
+
+        stats = index.refresh()
+        assert stats.packs_removed == 1
+        assert index.count_packs() == 0
+
+    def test_unreadable_pack_recorded_once(self, layout, index):
+        path = layout.pack_json_path("broken")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        first = index.refresh()
+        second = index.refresh()
+        assert first.errors == 1
+        assert second.errors == 0  # Not retried until the file changes
+        rows = index._query("SELECT load_error FROM packs WHERE name = 'broken'")
+        assert rows[0]["load_error"]
+
+
+class TestRebuild:
+    """doctor --rebuild-db support."""
+
+    def test_force_reindexes_everything(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+        layout.save_pack(make_pack("beta"))
+
+        stats = index.rebuild("force")
+        assert stats.mode == "force"
+        assert stats.packs_indexed == 2
+
+    def test_invalid_mode(self, index):
+        with pytest.raises(StoreIndexError):
+            index.rebuild("sometimes")
+
+    def test_corrupt_db_is_discarded(self, layout):
+        layout.db_path.parent.mkdir(parents=True, exist_ok=True)
+        layout.db_path.write_bytes(b"definitely not sqlite" * 100)
+
+        index = StoreIndex(layout)
+        layout.save_pack(make_pack("alpha"))
+        stats = index.refresh()
+        assert stats.packs_indexed == 1
+        index.close()
+
+    def test_store_doctor_rebuild_db(self, temp_dir):
+        store = Store(temp_dir)
+        store.init()
+        store.layout.save_pack(make_pack("alpha"))
+
+        report = store.doctor(rebuild_views=False, rebuild_db="force")
+        assert report.actions.db_rebuilt == "force"
+        assert any("Index rebuilt" in n for n in report.notes)
+
+
+class TestStoreQueries:
+    """Store facade methods served from the index."""
+
+    def test_list_models_from_index(self, temp_dir):
+        store = Store(temp_dir)
+        store.init()
+        sha = "b" * 64
+        blob = store.blob_store.blob_path(sha)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        blob.write_bytes(b"x")
+
+        store.layout.save_pack(make_pack("alpha"))
+        store.layout.save_pack_lock(make_lock("alpha", sha))
+        previews = store.layout.pack_previews_path("alpha")
+        previews.mkdir(parents=True)
+        (previews / "b.png").write_bytes(b"png")
+
+        models = store.list_models()
+        assert len(models) == 1
+        assert models[0]["id"] == "alpha:main"
+        assert models[0]["kind"] == "lora"
+        assert models[0]["image"] == "/previews/alpha/resources/previews/b.png"
+
+        assert store.list_models(kind="checkpoint") == []
+
+    def test_list_models_skips_missing_blobs(self, temp_dir):
+        store = Store(temp_dir)
+        store.init()
+        store.layout.save_pack(make_pack("alpha"))
+        store.layout.save_pack_lock(make_lock("alpha", "c" * 64))
+
+        assert store.list_models() == []
+
+
+class TestFullTextSearch:
+    """FTS5-backed Store.search."""
+
+    @pytest.fixture
+    def store(self, temp_dir):
+        store = Store(temp_dir)
+        store.init()
+
+        anime = make_pack("pony-anime-style")
+        anime.description = "Bright cel shading"
+        anime.tags = ["anime", "style"]
+        anime.trigger_words = ["celshade"]
+        anime.base_model = "Pony"
+        store.layout.save_pack(anime)
+
+        checkpoint = make_pack("RealVision", kind=AssetKind.CHECKPOINT, dep_ids=("base",))
+        checkpoint.base_model = "SD 1.5"
+        checkpoint.description = "Photoreal anime-free model"
+        store.layout.save_pack(checkpoint)
+        store.layout.save_pack_lock(make_lock("RealVision", "d" * 64, dep_id="base"))
+        return store
+
+    def test_uses_db(self, store):
+        result = store.search("pony")
+        assert result.used_db is True
+        assert [i.pack_name for i in result.items] == ["pony-anime-style"]
+
+    def test_prefix_matching(self, store):
+        assert [i.pack_name for i in store.search("cel").items] == ["pony-anime-style"]
+
+    def test_name_hit_ranks_above_description_hit(self, store):
+        names = [i.pack_name for i in store.search("anime").items]
+        assert names == ["pony-anime-style", "RealVision"]
+        assert store.search("anime").items[0].score > store.search("anime").items[1].score
+
+    def test_field_filters(self, store):
+        assert [i.pack_name for i in store.search("tag:anime").items] == ["pony-anime-style"]
+        assert [i.pack_name for i in store.search("trigger:celshade").items] == ["pony-anime-style"]
+        assert [i.pack_name for i in store.search("base:SD").items] == ["RealVision"]
+        assert [i.pack_name for i in store.search("type:checkpoint").items] == ["RealVision"]
+
+    def test_dependency_and_filename(self, store):
+        assert [i.pack_name for i in store.search("dep:base").items] == ["RealVision"]
+        # Provider filename from the lock
+        assert [i.pack_name for i in store.search("file:file").items] == ["RealVision"]
+
+    def test_fts_syntax_is_escaped(self, store):
+        result = store.search('pony" OR NEAR(')
+        assert result.used_db is True
+        assert result.items == []
+
+    def test_limit(self, store):
+        assert len(store.search("", limit=1).items) == 1
+
+    def test_deleted_pack_not_found(self, store):
+        store.layout.delete_pack("pony-anime-style")
+        assert store.search("pony").items == []
+
+    def test_substring_matches_follow_ranked_hits(self, store):
+        # "Vision" is inside a token, so only the substring fallback finds it
+        result = store.search("vision")
+        assert [i.pack_name for i in result.items] == ["RealVision"]
+        assert result.items[0].score is None
+
+
+class TestPackListing:
+    """Filtered, sorted and paginated StoreIndex.list_packs."""
+
+    @pytest.fixture
+    def populated(self, layout, index):
+        for name, kind in (("a", AssetKind.LORA), ("b", AssetKind.CHECKPOINT), ("c", AssetKind.LORA)):
+            layout.save_pack(make_pack(name, kind=kind))
+        layout.save_pack_lock(make_lock("a", "a" * 64))  # a is fully resolved
+        return index
+
+    def test_keyset_pages_cover_everything(self, populated):
+        seen = []
+        cursor = None
+        while True:
+            page = populated.list_packs(limit=2, cursor=cursor)
+            seen += [row["name"] for row in page.rows]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        assert seen == ["a", "b", "c"]
+        assert page.total == 3
+
+    def test_filters(self, populated):
+        assert [r["name"] for r in populated.list_packs(pack_type="LORA").rows] == ["a", "c"]
+        assert [r["name"] for r in populated.list_packs(has_unresolved=True).rows] == ["b", "c"]
+        assert populated.list_packs(base_model="sdxl").total == 3
+
+    def test_descending_sort(self, populated):
+        rows = populated.list_packs(sort="pack_type", descending=True).rows
+        assert [r["name"] for r in rows] == ["a", "c", "b"]
+
+    def test_invalid_sort_and_cursor(self, populated):
+        with pytest.raises(StoreIndexError):
+            populated.list_packs(sort="size")
+        with pytest.raises(StoreIndexError):
+            populated.list_packs(cursor="%%%")
+
+
+class TestReverseReferences:
+    """sha256 -> references and pack -> dependents lookups."""
+
+    def test_blob_references(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+        layout.save_pack_lock(make_lock("alpha", "A" * 64))
+        layout.save_pack(make_pack("beta"))
+        layout.save_pack_lock(make_lock("beta", "a" * 64))
+
+        rows = index.blob_references("A" * 64)
+        assert [r["pack"] for r in rows] == ["alpha", "beta"]
+        assert rows[0]["kind"] == "lora"
+        assert rows[0]["expose_filename"] == "alpha_main.safetensors"
+        assert rows[0]["filename"] == "file.safetensors"
+
+    def test_blob_references_follow_lock_changes(self, layout, index):
+        layout.save_pack(make_pack("alpha"))
+        layout.save_pack_lock(make_lock("alpha", "a" * 64))
+        layout.save_pack_lock(make_lock("alpha", "b" * 64))
+
+        assert index.blob_references("a" * 64) == []
+        assert len(index.blob_references("b" * 64)) == 1
+
+    def test_dependent_packs(self, layout, index):
+        layout.save_pack(make_pack("base"))
+        for name in ("lora2", "lora1"):
+            pack = make_pack(name)
+            pack.pack_dependencies = [PackDependencyRef(pack_name="base")]
+            layout.save_pack(pack)
+
+        assert index.dependent_packs("base") == ["lora1", "lora2"]
+        assert index.dependent_packs("lora1") == []
+
+        layout.delete_pack("lora1")
+        assert index.dependent_packs("base") == ["lora2"]
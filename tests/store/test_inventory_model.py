@@ -0,0 +1,144 @@
+"""Tests for the incremental inventory model."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.store import Store
+from src.store.api import store_router, require_initialized
+from src.store.inventory_model import BlobDirectory
+from src.store.models import BlobStatus
+
+from .test_inventory import _create_pack_with_blob, _create_temp_file
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    """Backdate mtimes so shards are no longer inside the racy window."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames + [""]:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestInventoryModel:
+    """Test snapshot versioning and incremental revalidation."""
+
+    def test_version_stable_without_changes(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        store.blob_store.adopt(_create_temp_file(tmp_path, b"stable blob"))
+
+        first = store.get_inventory()
+        second = store.get_inventory()
+
+        assert first.version is not None
+        assert first.version == second.version
+
+    def test_blob_write_changes_version(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        before = store.get_inventory()
+
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, b"new blob"))
+        after = store.get_inventory()
+
+        assert after.version != before.version
+        assert sha256 in {i.sha256 for i in after.items}
+
+    def test_blob_removal_detected(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, b"doomed blob"))
+        assert store.get_inventory().summary.blobs_orphan == 1
+
+        store.blob_store.remove_blob(sha256)
+
+        assert store.get_inventory().summary.blobs_total == 0
+
+    def test_lock_save_updates_references(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        content = b"soon referenced"
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, content))
+        assert store.get_inventory().items[0].status == BlobStatus.ORPHAN
+
+        _create_pack_with_blob(store, "RefPack", sha256, len(content))
+
+        item = store.get_inventory().items[0]
+        assert item.status == BlobStatus.REFERENCED
+        assert item.used_by_packs == ["RefPack"]
+
+    def test_unchanged_shards_are_not_rescanned(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        store.blob_store.adopt(_create_temp_file(tmp_path, b"settled blob"))
+        _age_tree(store.layout.blobs_path)
+        store.get_inventory()
+
+        with patch.object(BlobDirectory, "_scan_shard") as scan:
+            store.get_inventory()
+
+        scan.assert_not_called()
+
+    def test_external_change_detected_via_shard_mtime(self, tmp_path):
+        """Files dropped in without BlobStore still show up."""
+        store = Store(tmp_path)
+        store.init()
+        sha256 = store.blob_store.adopt(_create_temp_file(tmp_path, b"first blob"))
+        _age_tree(store.layout.blobs_path)
+        store.get_inventory()
+
+        other = sha256[:2] + "f" * 62
+        (store.layout.blobs_path / sha256[:2] / other).write_bytes(b"x")
+
+        assert other in {i.sha256 for i in store.get_inventory().items}
+
+    def test_rescan_rebuilds(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        store.blob_store.adopt(_create_temp_file(tmp_path, b"rescanned blob"))
+        before = store.get_inventory()
+
+        after = store.get_inventory(rescan=True)
+
+        assert after.version != before.version
+        assert after.summary.blobs_total == 1
+
+
+class TestInventoryETag:
+    """Test conditional GET /api/store/inventory."""
+
+    def _client(self, store):
+        app = FastAPI()
+        app.include_router(store_router, prefix="/api/store")
+        app.dependency_overrides[require_initialized] = lambda: store
+        return TestClient(app)
+
+    def test_not_modified_when_unchanged(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        store.blob_store.adopt(_create_temp_file(tmp_path, b"etag blob"))
+        client = self._client(store)
+
+        first = client.get("/api/store/inventory")
+        etag = first.headers["etag"]
+        second = client.get("/api/store/inventory", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+
+    def test_modified_after_write(self, tmp_path):
+        store = Store(tmp_path)
+        store.init()
+        client = self._client(store)
+        etag = client.get("/api/store/inventory").headers["etag"]
+
+        store.blob_store.adopt(_create_temp_file(tmp_path, b"another etag blob"))
+        response = client.get("/api/store/inventory", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["summary"]["blobs_total"] == 1
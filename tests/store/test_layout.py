@@ -4,13 +4,17 @@ Tests for StoreLayout
 Tests the v2 storage layout management.
 """
 
+import copy
 import json
+import pickle
 import tempfile
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from src.store.layout import (
+    ModelCache,
     PackNotFoundError,
     ProfileNotFoundError,
     StoreLayout,
@@ -280,3 +284,89 @@ class TestJsonIO:
         assert '"z":' in content
         assert content.index('"a"') < content.index('"z"')  # a before z
         assert content.endswith("\n")  # Trailing newline
+
+
+class TestModelCache:
+    """Tests for the parsed Pack/PackLock cache."""
+
+    @pytest.fixture
+    def cache(self, layout, monkeypatch):
+        cache = ModelCache(maxsize=2)
+        monkeypatch.setattr(StoreLayout, "model_cache", cache)
+        layout.init_store()
+        layout.save_pack(Pack(name="A", pack_type=AssetKind.LORA, source=PackSource(provider=ProviderName.CIVITAI, model_id=1)))
+        return cache
+
+    def test_repeated_loads_hit(self, layout, cache):
+        layout.load_pack("A")
+        layout.load_pack("A")
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_default_load_returns_private_copy(self, layout, cache):
+        first = layout.load_pack("A")
+        first.description = "mutated"
+        assert layout.load_pack("A").description is None
+        assert layout.load_pack("A", readonly=True).description is None
+
+    def test_readonly_load_is_shared(self, layout, cache):
+        assert layout.load_pack("A", readonly=True) is layout.load_pack("A", readonly=True)
+
+    def test_readonly_load_is_frozen(self, layout, cache):
+        shared = layout.load_pack("A", readonly=True)
+        with pytest.raises(ValidationError):
+            shared.description = "mutated"
+        with pytest.raises(ValidationError):
+            shared.source.model_id = 2
+        assert shared == layout.load_pack("A")
+        assert isinstance(shared, Pack)
+
+    def test_readonly_containers_are_frozen(self, layout, cache):
+        shared = layout.load_pack("A", readonly=True)
+        with pytest.raises(TypeError):
+            shared.tags.append("corrupt")
+        with pytest.raises(TypeError):
+            shared.dependencies.clear()
+        assert layout.load_pack("A", readonly=True).tags == []
+
+    def test_readonly_copies_are_plain(self, layout, cache):
+        shared = layout.load_pack("A", readonly=True)
+        for copied in (
+            shared.model_copy(),
+            shared.model_copy(update={"description": "updated"}),
+            copy.deepcopy(shared),
+            pickle.loads(pickle.dumps(shared)),
+        ):
+            assert type(copied) is Pack
+            copied.description = "mutated"
+            copied.tags.append("mine")
+            copied.source.model_id = 2
+        assert shared == layout.load_pack("A")
+
+    def test_save_invalidates(self, layout, cache):
+        layout.load_pack("A", readonly=True)
+        layout.save_pack(Pack(name="A", pack_type=AssetKind.LORA, source=PackSource(provider=ProviderName.CIVITAI, model_id=1), description="new"))
+        assert layout.load_pack("A", readonly=True).description == "new"
+
+    def test_external_edit_detected(self, layout, cache):
+        layout.load_pack("A")
+        path = layout.pack_json_path("A")
+        data = json.loads(path.read_text())
+        data["description"] = "edited by hand"
+        path.write_text(json.dumps(data))
+        assert layout.load_pack("A").description == "edited by hand"
+
+    def test_delete_and_missing(self, layout, cache):
+        layout.load_pack("A")
+        layout.delete_pack("A")
+        with pytest.raises(PackNotFoundError):
+            layout.load_pack("A")
+        assert layout.load_pack_lock("A") is None
+        assert cache.stats()["size"] == 0
+
+    def test_lru_bound(self, layout, cache):
+        layout.save_pack(Pack(name="B", pack_type=AssetKind.LORA, source=PackSource(provider=ProviderName.CIVITAI, model_id=1)))
+        layout.save_pack(Pack(name="C", pack_type=AssetKind.LORA, source=PackSource(provider=ProviderName.CIVITAI, model_id=1)))
+        for name in ("A", "B", "C"):
+            layout.load_pack(name)
+        assert cache.stats()["size"] == 2
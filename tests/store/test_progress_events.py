@@ -0,0 +1,158 @@
+"""
+Tests for ProgressHub and the /store/events stream
+
+Tests delta coalescing, rate limiting, removals, download group aggregates
+and the SSE endpoint's snapshot/progress messages.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+from src.store import api
+from src.store.progress_events import (
+    BACKUP_SYNC,
+    DOWNLOAD,
+    DOWNLOAD_GROUP,
+    ProgressHub,
+    aggregate_group,
+)
+
+
+def _by_item(events):
+    return {(e.channel, e.key): e.data for e in events}
+
+
+class TestSubscription:
+    """Deltas, coalescing and removals."""
+
+    def test_snapshot_then_only_changed_fields(self):
+        hub = ProgressHub()
+        hub.publish(DOWNLOAD, "d1", {"status": "downloading", "downloaded_bytes": 0, "total_bytes": 100})
+        sub = hub.subscribe(channels=[DOWNLOAD], interval=0)
+
+        snapshot = _by_item(sub.snapshot())
+        assert snapshot[(DOWNLOAD, "d1")]["total_bytes"] == 100
+
+        hub.publish(DOWNLOAD, "d1", {"downloaded_bytes": 10})
+        hub.publish(DOWNLOAD, "d1", {"downloaded_bytes": 50})
+        assert _by_item(sub.drain()) == {(DOWNLOAD, "d1"): {"downloaded_bytes": 50}}
+        assert sub.drain() == []
+
+    def test_drain_rate_limited(self):
+        hub = ProgressHub()
+        sub = hub.subscribe(interval=60)
+        sub.snapshot()
+
+        hub.publish(DOWNLOAD, "d1", {"status": "downloading"})
+        assert sub.drain() == []  # Held back, not lost
+        assert _by_item(sub.drain(force=True)) == {(DOWNLOAD, "d1"): {"status": "downloading"}}
+
+    def test_removal_reaches_subscribers_that_saw_item(self):
+        hub = ProgressHub()
+        hub.publish(DOWNLOAD, "d1", {"status": "completed"})
+        seen = hub.subscribe(interval=0)
+        seen.snapshot()
+
+        hub.remove(DOWNLOAD, "d1")
+        late = hub.subscribe(interval=0)
+        assert late.snapshot() == []
+        assert _by_item(seen.drain()) == {(DOWNLOAD, "d1"): None}
+
+    def test_channel_filter(self):
+        hub = ProgressHub()
+        sub = hub.subscribe(channels=[BACKUP_SYNC], interval=0)
+        sub.snapshot()
+        hub.publish(DOWNLOAD, "d1", {"status": "downloading"})
+        hub.publish(BACKUP_SYNC, "to_backup", {"blobs_done": 1})
+        assert list(_by_item(sub.drain())) == [(BACKUP_SYNC, "to_backup")]
+
+
+class TestGroups:
+    """Download group aggregates."""
+
+    def test_group_aggregate_follows_members(self):
+        hub = ProgressHub()
+        sub = hub.subscribe(channels=[DOWNLOAD], interval=0)
+        sub.snapshot()
+
+        for key in ("a", "b"):
+            hub.publish(DOWNLOAD, key, {
+                "group_id": "g", "status": "downloading",
+                "downloaded_bytes": 25, "total_bytes": 100, "speed_bps": 10,
+            })
+        group = _by_item(sub.drain())[(DOWNLOAD_GROUP, "g")]
+        assert group["progress"] == 25.0
+        assert group["speed_bps"] == 20
+        assert group["eta_seconds"] == 7
+
+        hub.publish(DOWNLOAD, "a", {"status": "completed", "downloaded_bytes": 100, "speed_bps": 0})
+        delta = _by_item(sub.drain())[(DOWNLOAD_GROUP, "g")]
+        assert delta["completed_count"] == 1
+        assert "count" not in delta  # Unchanged fields are not resent
+
+        hub.remove(DOWNLOAD, "a")
+        hub.remove(DOWNLOAD, "b")
+        assert _by_item(sub.drain())[(DOWNLOAD_GROUP, "g")] is None
+
+    def test_aggregate_status(self):
+        assert aggregate_group([{"status": "completed"}, {"status": "failed"}])["status"] == "failed"
+        assert aggregate_group([{"status": "pending"}, {"status": "failed"}])["status"] == "downloading"
+
+
+class TestEventsEndpoint:
+    """SSE stream and API publishers."""
+
+    def _read_stream(self, hub, monkeypatch, on_poll, polls=3, **params):
+        monkeypatch.setattr(api, "_progress_hub", hub)
+        request = MagicMock()
+        count = 0
+
+        async def is_disconnected():
+            nonlocal count
+            count += 1
+            on_poll(count)
+            return count > polls
+
+        request.is_disconnected = is_disconnected
+
+        async def collect():
+            response = await api.stream_progress_events(request, interval=0.1, **params)
+            return [chunk async for chunk in response.body_iterator]
+
+        parsed = []
+        for chunk in asyncio.run(collect()):
+            event, data = chunk.strip().split("\n")
+            parsed.append((event[len("event: "):], json.loads(data[len("data: "):])))
+        return parsed
+
+    def test_snapshot_and_progress_messages(self, monkeypatch):
+        hub = ProgressHub()
+        hub.publish(DOWNLOAD, "d1", {"status": "downloading", "downloaded_bytes": 1})
+
+        def on_poll(count):
+            if count == 1:
+                hub.publish(DOWNLOAD, "d1", {"downloaded_bytes": 2})
+                hub.publish(DOWNLOAD, "d1", {"downloaded_bytes": 3})
+                hub.publish(BACKUP_SYNC, "to_backup", {"blobs_done": 1})
+
+        messages = self._read_stream(hub, monkeypatch, on_poll, channels="download")
+
+        assert messages[0] == ("snapshot", [{
+            "channel": "download", "key": "d1",
+            "data": {"status": "downloading", "downloaded_bytes": 1},
+        }])
+        # Both updates coalesced into one delta; other channels filtered out
+        assert messages[1:] == [("progress", [{
+            "channel": "download", "key": "d1", "data": {"downloaded_bytes": 3},
+        }])]
+
+    def test_cancel_publishes_removal(self, monkeypatch):
+        hub = ProgressHub()
+        monkeypatch.setattr(api, "_progress_hub", hub)
+        api._active_downloads["sse-test"] = api._new_download_entry("sse-test", {"group_id": "g"})
+        api._publish_download(api._active_downloads["sse-test"])
+        assert hub.get(DOWNLOAD, "sse-test")["status"] == "pending"
+
+        api.cancel_download("sse-test")
+        assert hub.get(DOWNLOAD, "sse-test") is None
@@ -0,0 +1,100 @@
+"""Tests for the state sync content manifest."""
+
+import hashlib
+import os
+from unittest.mock import patch
+
+from src.store import state_manifest
+from src.store.state_manifest import StateManifest, iter_state_files
+
+
+def _write(root, rel_path, content: bytes):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def _age(path, seconds: int = 60):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestStateManifest:
+    """Test incremental hashing and persistence."""
+
+    def test_refresh_hashes_files(self, tmp_path):
+        root = tmp_path / "state"
+        _write(root, "packs/A/pack.json", b'{"name": "A"}')
+        _write(root, ".hidden", b"skip")
+        _write(root, "config.json.tmp", b"skip")
+
+        manifest = StateManifest(tmp_path / "manifest.json")
+        manifest.refresh(root)
+
+        assert set(manifest.entries) == {"packs/A/pack.json"}
+        assert manifest.entries["packs/A/pack.json"].sha256 == hashlib.sha256(b'{"name": "A"}').hexdigest()
+
+    def test_unchanged_files_not_rehashed(self, tmp_path):
+        root = tmp_path / "state"
+        _age(_write(root, "packs/A/pack.json", b"settled"))
+        manifest = StateManifest(tmp_path / "manifest.json")
+        manifest.refresh(root)
+
+        with patch.object(state_manifest, "_hash_file") as hash_file:
+            manifest.refresh(root)
+
+        hash_file.assert_not_called()
+
+    def test_racy_files_rehashed(self, tmp_path):
+        """A same-size rewrite right after a refresh is still noticed."""
+        root = tmp_path / "state"
+        path = _write(root, "config.json", b"aaaa")
+        manifest = StateManifest(tmp_path / "manifest.json")
+        manifest.refresh(root)
+
+        st = os.stat(path)
+        path.write_bytes(b"bbbb")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        manifest.refresh(root)
+
+        assert manifest.entries["config.json"].sha256 == hashlib.sha256(b"bbbb").hexdigest()
+
+    def test_removed_files_dropped(self, tmp_path):
+        root = tmp_path / "state"
+        path = _write(root, "profiles/work/profile.json", b"{}")
+        manifest = StateManifest(tmp_path / "manifest.json")
+        manifest.refresh(root)
+
+        path.unlink()
+        manifest.refresh(root)
+
+        assert manifest.entries == {}
+        assert manifest.dirty
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        from src.store.layout import StoreLayout
+
+        root = tmp_path / "state"
+        _write(root, "packs/A/pack.json", b"{}")
+        manifest = StateManifest(tmp_path / "manifest.json")
+        manifest.refresh(root)
+        manifest.mark_synced("packs/A/pack.json", manifest.entries["packs/A/pack.json"].sha256)
+        manifest.save(StoreLayout(tmp_path).write_json)
+
+        loaded = StateManifest.load(tmp_path / "manifest.json")
+
+        assert loaded.entries == manifest.entries
+        assert loaded.synced == manifest.synced
+        assert not manifest.dirty
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        (tmp_path / "bad.json").write_text("{not json")
+
+        assert StateManifest.load(tmp_path / "missing.json") is None
+        assert StateManifest.load(tmp_path / "bad.json") is None
+
+    def test_iter_state_files_relative_posix_paths(self, tmp_path):
+        _write(tmp_path, "a/b/c.json", b"{}")
+
+        assert [rel for rel, _ in iter_state_files(tmp_path)] == ["a/b/c.json"]
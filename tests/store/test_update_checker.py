@@ -0,0 +1,192 @@
+"""Tests for the background update checker and its stored results."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.store import Store
+from src.store.models import (
+    ArtifactProvider,
+    AssetKind,
+    CivitaiSelector,
+    DependencySelector,
+    ExposeConfig,
+    Pack,
+    PackDependency,
+    PackLock,
+    PackSource,
+    ProviderName,
+    ResolvedArtifact,
+    ResolvedDependency,
+    SelectorStrategy,
+    UpdatePolicy,
+    UpdatePolicyMode,
+)
+
+
+def _model_response(model_id: int, version_id: int) -> dict:
+    return {
+        "id": model_id,
+        "modelVersions": [{
+            "id": version_id,
+            "files": [{"id": version_id * 10, "name": "model.safetensors", "hashes": {"SHA256": "NEW"}}],
+        }],
+    }
+
+
+def _save_pack(store: Store, name: str, model_id: int, version_id: int) -> None:
+    store.layout.save_pack(Pack(
+        name=name,
+        pack_type=AssetKind.LORA,
+        source=PackSource(provider=ProviderName.CIVITAI, model_id=model_id),
+        dependencies=[PackDependency(
+            id="main",
+            kind=AssetKind.LORA,
+            selector=DependencySelector(
+                strategy=SelectorStrategy.CIVITAI_MODEL_LATEST,
+                civitai=CivitaiSelector(model_id=model_id),
+            ),
+            update_policy=UpdatePolicy(mode=UpdatePolicyMode.FOLLOW_LATEST),
+            expose=ExposeConfig(filename="model.safetensors"),
+        )],
+    ))
+    store.layout.save_pack_lock(PackLock(pack=name, resolved=[ResolvedDependency(
+        dependency_id="main",
+        artifact=ResolvedArtifact(
+            kind=AssetKind.LORA,
+            sha256="old",
+            provider=ArtifactProvider(
+                name=ProviderName.CIVITAI, model_id=model_id,
+                version_id=version_id, file_id=version_id * 10,
+                filename="model.safetensors",
+            ),
+        ),
+    )]))
+
+
+@pytest.fixture
+def civitai():
+    civitai = MagicMock()
+    civitai.get_model.side_effect = lambda model_id: _model_response(model_id, 2)
+    return civitai
+
+
+@pytest.fixture
+def store(tmp_path, civitai):
+    store = Store(tmp_path, civitai_client=civitai)
+    store.init()
+    yield store
+    store.close()
+
+
+class TestUpdateChecker:
+    def test_check_persists_results(self, store):
+        _save_pack(store, "A", model_id=1, version_id=1)
+        _save_pack(store, "B", model_id=2, version_id=2)
+        checker = store.update_checker
+
+        assert checker.unchecked_packs() == ["A", "B"]
+        checker.check()
+
+        stored = checker.results.load()
+        assert set(stored) == {"A", "B"}
+        assert stored["A"].plan.changes and not stored["B"].plan.changes
+        assert checker.unchecked_packs() == []
+        assert checker.outdated_packs() == []
+
+    def test_pack_write_invalidates_stored_plan(self, store):
+        _save_pack(store, "A", model_id=1, version_id=1)
+        checker = store.update_checker
+        checker.check()
+
+        _save_pack(store, "A", model_id=1, version_id=2)
+
+        assert checker.results.load()["A"].invalidated
+        assert checker.unchecked_packs() == ["A"]
+
+    def test_aged_plans_are_outdated_but_kept(self, store):
+        _save_pack(store, "A", model_id=1, version_id=1)
+        checker = store.update_checker
+        checker.check()
+
+        later = time.time() + checker.config.interval_minutes * 60 + 1
+        assert checker.outdated_packs(now=later) == ["A"]
+        assert checker.unchecked_packs() == []
+
+    def test_run_batch_respects_batch_size(self, store):
+        for i in range(3):
+            _save_pack(store, f"P{i}", model_id=10 + i, version_id=1)
+        config = store.get_config()
+        config.updates.batch_size = 2
+        store.save_config(config)
+        checker = store.update_checker
+
+        assert checker.run_batch() == 2
+        assert len(checker.results.load()) == 2
+        assert checker.run_batch() == 1
+        assert checker.run_batch() == 0
+
+    def test_deleted_pack_result_is_dropped(self, store):
+        _save_pack(store, "A", model_id=1, version_id=1)
+        store.update_checker.check()
+
+        store.layout.delete_pack("A")
+
+        assert store.update_checker.results.load() == {}
+
+    def test_check_all_answers_from_stored_results(self, store, civitai):
+        from src.store.api import check_all_updates
+
+        _save_pack(store, "A", model_id=1, version_id=1)
+        checker = store.update_checker
+        checker.check()
+        _save_pack(store, "A", model_id=1, version_id=1)  # Any write invalidates
+        _save_pack(store, "B", model_id=2, version_id=1)  # Never checked
+        calls = civitai.get_model.call_count
+
+        with patch.object(checker, "wake") as wake, \
+             patch.object(checker, "updatable_packs", wraps=checker.updatable_packs) as updatable:
+            response = check_all_updates(refresh=False, stream=False, store=store)
+
+        assert civitai.get_model.call_count == calls
+        assert "A" in response.plans  # Last plan, pending recheck
+        assert response.outdated_packs == ["B", "A"]
+        wake.assert_called_once()
+        assert updatable.call_count == 1
+
+    def test_check_pack_stores_its_plan(self, store):
+        from src.store.api import check_pack_updates
+
+        _save_pack(store, "A", model_id=1, version_id=1)
+        _save_pack(store, "B", model_id=2, version_id=1)
+
+        response = check_pack_updates("A", store=store)
+
+        assert response.has_updates
+        stored = store.update_checker.results.load()
+        assert set(stored) == {"A"}
+        assert stored["A"].plan.changes
+        assert store.update_checker.unchecked_packs() == ["B"]
+
+    def test_check_all_stream_events(self, store):
+        from src.store.api import _stream_update_checks
+
+        _save_pack(store, "A", model_id=1, version_id=1)
+        _save_pack(store, "B", model_id=2, version_id=2)
+
+        events = []
+        for chunk in _stream_update_checks(store):
+            event_line, data_line = chunk.strip().split("\n")
+            events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+
+        assert [name for name, _ in events] == ["start", "plan", "plan", "done"]
+        assert events[0][1] == {"total": 2}
+        plans = {data["pack"]: data for name, data in events if name == "plan"}
+        assert plans["A"]["has_updates"] and plans["A"]["plan"]["changes"]
+        assert not plans["B"]["plan"]["changes"]
+        assert all(data["checked_at"] and data["error"] is None for data in plans.values())
+        assert events[-1][1]["packs_checked"] == 2
+        assert events[-1][1]["total_changes"] == 1
+        assert set(store.update_checker.results.load()) == {"A", "B"}
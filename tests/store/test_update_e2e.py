@@ -32,6 +32,7 @@ from src.store.models import (
     PackLock,
     PackSource,
     PreviewInfo,
+    ProfilePackEntry,
     ProviderName,
     ResolvedArtifact,
     ResolvedDependency,
@@ -184,12 +185,12 @@ def _setup_service(packs: dict, locks: dict, civitai_responses: dict, all_pack_n
     mock_layout = MagicMock()
     mock_layout.list_packs.return_value = list(all_pack_names or packs.keys())
 
-    def load_pack(name):
+    def load_pack(name, readonly=False):
         if name in packs:
             return packs[name]
         raise FileNotFoundError(f"Pack not found: {name}")
 
-    def load_lock(name):
+    def load_lock(name, readonly=False):
         return locks.get(name)
 
     mock_layout.load_pack.side_effect = load_pack
@@ -289,6 +290,32 @@ class TestE2ESinglePackFlow:
         assert resolved.artifact.provider.file_id == 2000
         assert resolved.artifact.sha256 == "bbb222"
 
+    def test_sync_reports_failed_download(self):
+        """update_pack(sync=True) is not synced when a new blob fails to download."""
+        new_sha = "b" * 64
+        pack = _make_pack("my-pack", model_id=500)
+        lock = _make_lock("my-pack", "main-checkpoint",
+                          model_id=500, version_id=100, file_id=1000,
+                          sha256="a" * 64)
+        civitai = {
+            500: _civitai_model_response(model_id=500, version_id=200, file_id=2000, sha256=new_sha),
+        }
+        service, mock_layout, _ = _setup_service(
+            packs={"my-pack": pack},
+            locks={"my-pack": lock},
+            civitai_responses=civitai,
+        )
+        service.blob_store.existing_blobs.return_value = set()
+        service.blob_store.download.side_effect = OSError("connection reset")
+        mock_layout.load_runtime.return_value.get_active_profile.return_value = "global"
+
+        result = service.update_pack("my-pack", sync=True, ui_targets=["comfyui"])
+
+        assert result.applied is True
+        assert result.synced is False
+        service.blob_store.download.assert_called_once()
+        assert service.blob_store.download.call_args.args[1] == new_sha
+
     def test_already_up_to_date_skips_apply(self):
         """When Civitai has same version as lock, nothing happens."""
         pack = _make_pack("my-pack", model_id=500)
@@ -409,6 +436,47 @@ class TestE2EBatchFlow:
         # pack-c unchanged
         assert locks["pack-c"].resolved[0].artifact.provider.version_id == 500
 
+    def test_batch_sync_downloads_shared_blob_once_and_rebuilds_views_once(self):
+        """Two packs updating to the same file: one download, one view rebuild per profile."""
+        shared_new = "c" * 64
+        pack_a = _make_pack("pack-a", model_id=10)
+        lock_a = _make_lock("pack-a", "main-checkpoint",
+                            model_id=10, version_id=100, file_id=1000,
+                            sha256="a" * 64)
+        pack_b = _make_pack("pack-b", model_id=20)
+        lock_b = _make_lock("pack-b", "main-checkpoint",
+                            model_id=20, version_id=300, file_id=3000,
+                            sha256="b" * 64)
+
+        civitai = {
+            10: _civitai_model_response(model_id=10, version_id=200, file_id=2000, sha256=shared_new),
+            20: _civitai_model_response(model_id=20, version_id=400, file_id=4000, sha256=shared_new),
+        }
+        packs = {"pack-a": pack_a, "pack-b": pack_b}
+        locks = {"pack-a": lock_a, "pack-b": lock_b}
+
+        service, mock_layout, _ = _setup_service(packs, locks, civitai)
+        service.blob_store.existing_blobs.return_value = set()
+        mock_layout.load_runtime.return_value.get_active_profile.return_value = "global"
+        mock_layout.load_profile.return_value.packs = [
+            ProfilePackEntry(name="pack-a"), ProfilePackEntry(name="pack-b"),
+        ]
+
+        result = service.apply_batch(
+            ["pack-a", "pack-b"], sync=True, ui_targets=["comfyui", "forge"],
+        )
+
+        assert result.total_applied == 2
+        assert all(r["synced"] for r in result.results.values())
+        service.blob_store.download.assert_called_once()
+        assert service.blob_store.download.call_args.args[1] == shared_new
+        service.view_builder.build_many.assert_called_once()
+        assert service.view_builder.build_many.call_args.args[0] == ["comfyui", "forge"]
+        # Views are built from the shared readonly models (reusable view plans)
+        assert set(service.view_builder.build_many.call_args.args[2]) == {"pack-a", "pack-b"}
+        mock_layout.load_pack.assert_any_call("pack-a", readonly=True)
+        mock_layout.load_pack_lock.assert_any_call("pack-b", readonly=True)
+
     def test_batch_with_broken_pack(self):
         """
         Batch with a non-existent pack should report failure
@@ -1154,10 +1222,10 @@ class TestE2ECivitaiErrors:
         mock_layout = MagicMock()
         mock_layout.list_packs.return_value = ["ok-pack", "fail-pack"]
 
-        def load_pack(name):
+        def load_pack(name, readonly=False):
             return {"ok-pack": pack_ok, "fail-pack": pack_fail}[name]
 
-        def load_lock(name):
+        def load_lock(name, readonly=False):
             return {"ok-pack": lock_ok, "fail-pack": lock_fail}[name]
 
         mock_layout.load_pack.side_effect = load_pack
@@ -267,6 +267,161 @@ class TestViewBuilder:
             # Check content is accessible
             assert expected_link.read_bytes() == content
     
+    def test_incremental_rebuild_applies_only_changes(self):
+        """Rebuilding an existing view adds/removes/retargets only what changed."""
+        from src.store import StoreLayout, BlobStore, ViewBuilder, Profile, ProfilePackEntry
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            layout = StoreLayout(Path(tmpdir))
+            layout.init_store()
+            blob_store = BlobStore(layout)
+            builder = ViewBuilder(layout, blob_store)
+            
+            packs = {
+                "Keep": _lora_pack(blob_store, "Keep", b"kept lora", "keep.safetensors"),
+                "Drop": _lora_pack(blob_store, "Drop", b"dropped lora", "drop.safetensors"),
+            }
+            profile = Profile(
+                name="test",
+                packs=[ProfilePackEntry(name="Keep"), ProfilePackEntry(name="Drop")],
+            )
+            first = builder.build("comfyui", profile, packs)
+            assert first.incremental is False
+            
+            view = layout.view_profile_path("comfyui", "test") / "models" / "loras"
+            
+            # Drop one pack, add another, and change the kept file's content
+            packs["Keep"] = _lora_pack(blob_store, "Keep", b"kept lora v2", "keep.safetensors")
+            packs["New"] = _lora_pack(blob_store, "New", b"new lora", "new.safetensors")
+            profile = Profile(
+                name="test",
+                packs=[ProfilePackEntry(name="Keep"), ProfilePackEntry(name="New")],
+            )
+            report = builder.build("comfyui", profile, packs)
+            
+            assert report.incremental is True
+            assert (report.entries_added, report.entries_removed, report.entries_retargeted) == (1, 1, 1)
+            assert report.entries_created == 2
+            assert report.errors == []
+            assert not (view / "drop.safetensors").exists()
+            assert (view / "new.safetensors").read_bytes() == b"new lora"
+            assert (view / "keep.safetensors").read_bytes() == b"kept lora v2"
+            
+            # Nothing changed: no link is touched
+            kept_inode = os.lstat(view / "keep.safetensors").st_ino
+            again = builder.build("comfyui", profile, packs)
+            assert (again.entries_added, again.entries_removed, again.entries_retargeted) == (0, 0, 0)
+            assert os.lstat(view / "keep.safetensors").st_ino == kept_inode
+    
+    def test_plan_cached_across_uis_and_invalidated_per_pack(self):
+        """Plans are reused until a pack's files or blobs change."""
+        from unittest.mock import patch
+        from src.store import StoreLayout, BlobStore, ViewBuilder, Profile, ProfilePackEntry
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            layout = StoreLayout(Path(tmpdir))
+            layout.init_store()
+            blob_store = BlobStore(layout)
+            builder = ViewBuilder(layout, blob_store)
+            
+            packs = {}
+            for name in ("A", "B"):
+                pack, lock = _lora_pack(blob_store, name, name.encode() * 8, f"{name}.safetensors")
+                layout.save_pack(pack)
+                layout.save_pack_lock(lock)
+                packs[name] = (pack, lock)
+            profile = Profile(name="test", packs=[ProfilePackEntry(name="A"), ProfilePackEntry(name="B")])
+            
+            checked = []
+            existing_blobs = blob_store.existing_blobs
+            
+            def record(hashes):
+                hashes = list(hashes)
+                checked.extend(hashes)
+                return existing_blobs(hashes)
+            
+            first = builder.build("comfyui", profile, packs)
+            with patch.object(blob_store, "existing_blobs", side_effect=record):
+                second = builder.build("forge", profile, packs)
+            
+            assert first.plan_cached is False
+            assert second.plan_cached is True
+            assert checked == []
+            
+            # Re-saving B's lock replans only B
+            pack_b, lock_b = _lora_pack(blob_store, "B", b"B v2" * 8, "B.safetensors")
+            layout.save_pack_lock(lock_b)
+            packs["B"] = (pack_b, lock_b)
+            with patch.object(blob_store, "existing_blobs", side_effect=record):
+                third = builder.build("comfyui", profile, packs)
+            
+            assert third.plan_cached is False
+            assert checked == [lock_b.resolved[0].artifact.sha256]
+            
+            # A blob removed through BlobStore drops the plans that use it
+            blob_store.remove_blob(lock_b.resolved[0].artifact.sha256)
+            fourth = builder.build("comfyui", profile, packs)
+            assert len(fourth.missing_blobs) == 1
+    
+    def test_plan_not_reused_for_other_objects_with_same_files(self):
+        """Models changed in memory are planned, not served from the disk-keyed cache."""
+        from src.store import StoreLayout, BlobStore, ViewBuilder, Profile, ProfilePackEntry
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            layout = StoreLayout(Path(tmpdir))
+            layout.init_store()
+            blob_store = BlobStore(layout)
+            builder = ViewBuilder(layout, blob_store)
+            
+            pack, lock = _lora_pack(blob_store, "A", b"A" * 8, "A.safetensors")
+            layout.save_pack(pack)
+            layout.save_pack_lock(lock)
+            profile = Profile(name="test", packs=[ProfilePackEntry(name="A")])
+            first = builder.compute_plan("comfyui", profile, {"A": (pack, lock)})
+            
+            edited = lock.model_copy(deep=True)
+            edited.resolved = []
+            second = builder.compute_plan("comfyui", profile, {"A": (pack, edited)})
+            
+            assert len(first.entries) == 1
+            assert second.entries == []
+    
+    def test_build_many_builds_each_ui_and_aggregates_failures(self):
+        """Multi-UI builds run for every target and report failing UIs together."""
+        from unittest.mock import patch
+        from src.store import StoreLayout, BlobStore, ViewBuilder, Profile, ProfilePackEntry
+        from src.store.view_builder import MultiViewBuildError
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            layout = StoreLayout(Path(tmpdir))
+            layout.init_store()
+            blob_store = BlobStore(layout)
+            builder = ViewBuilder(layout, blob_store)
+            packs = {"A": _lora_pack(blob_store, "A", b"shared lora", "a.safetensors")}
+            profile = Profile(name="multi", packs=[ProfilePackEntry(name="A")])
+            uis = ["comfyui", "forge", "a1111", "sdnext"]
+            
+            reports = builder.build_many(uis, profile, packs, activate=True)
+            
+            assert list(reports) == uis
+            for ui in uis:
+                assert reports[ui].entries_created == 1
+                assert builder.get_active_profile(ui) == "multi"
+            
+            real_build = builder.build
+            
+            def flaky_build(ui, *args, **kwargs):
+                if ui in ("forge", "sdnext"):
+                    raise OSError(f"{ui} disk full")
+                return real_build(ui, *args, **kwargs)
+            
+            with patch.object(builder, "build", side_effect=flaky_build):
+                with pytest.raises(MultiViewBuildError) as exc_info:
+                    builder.build_many(uis, profile, packs)
+            
+            assert set(exc_info.value.failures) == {"forge", "sdnext"}
+            assert set(exc_info.value.reports) == {"comfyui", "a1111"}
+    
     def test_activate_profile(self):
         """Test activating a profile."""
         from src.store import (
@@ -516,3 +671,44 @@ class TestStoreHighLevelAPI:
             
             assert result["tmp"] > 0
             assert not tmp_file.exists()
+
+
+def _lora_pack(blob_store, name: str, content: bytes, filename: str):
+    """Write a blob and return a (pack, lock) exposing it as a LoRA."""
+    from src.store import (
+        Pack, PackLock, PackSource, PackDependency, DependencySelector, ExposeConfig,
+        ResolvedDependency, ResolvedArtifact, ArtifactProvider,
+        AssetKind, ProviderName, SelectorStrategy,
+    )
+    
+    sha256 = hashlib.sha256(content).hexdigest()
+    blob_path = blob_store.blob_path(sha256)
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+    blob_path.write_bytes(content)
+    pack = Pack(
+        name=name,
+        pack_type=AssetKind.LORA,
+        source=PackSource(provider=ProviderName.CIVITAI),
+        dependencies=[
+            PackDependency(
+                id="main",
+                kind=AssetKind.LORA,
+                selector=DependencySelector(strategy=SelectorStrategy.CIVITAI_FILE),
+                expose=ExposeConfig(filename=filename),
+            )
+        ],
+    )
+    lock = PackLock(
+        pack=name,
+        resolved=[
+            ResolvedDependency(
+                dependency_id="main",
+                artifact=ResolvedArtifact(
+                    kind=AssetKind.LORA,
+                    sha256=sha256,
+                    provider=ArtifactProvider(name=ProviderName.CIVITAI),
+                ),
+            )
+        ],
+    )
+    return pack, lock
@@ -0,0 +1,82 @@
+"""Tests for the async Civitai client used by the browse endpoints."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.clients.async_civitai_client import AsyncCivitaiClient
+
+
+def _response(status_code, body=None, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def http_client():
+    http_client = MagicMock()
+    http_client.request = AsyncMock()
+    return http_client
+
+
+class TestAsyncCivitaiClient:
+    def test_search_sends_params_and_auth(self, http_client):
+        http_client.request.return_value = _response(200, {"items": []})
+        client = AsyncCivitaiClient(http_client, api_key="k", requests_per_minute=6000)
+
+        assert asyncio.run(client.search_models(query="x", types=["LORA"])) == {"items": []}
+
+        args, kwargs = http_client.request.call_args
+        assert args == ("GET", "https://civitai.com/api/v1/models")
+        assert kwargs["params"] == {"limit": 20, "query": "x", "types": "LORA"}
+        assert kwargs["headers"]["Authorization"] == "Bearer k"
+
+    def test_retries_after_429_without_blocking(self, http_client):
+        http_client.request.side_effect = [
+            _response(429, headers={"Retry-After": "0"}),
+            _response(200, {"id": 1}),
+        ]
+        client = AsyncCivitaiClient(http_client, requests_per_minute=6000)
+
+        with patch("src.clients.rate_limit.time.sleep") as blocking_sleep:
+            assert asyncio.run(client.get_model(1)) == {"id": 1}
+        blocking_sleep.assert_not_called()
+        assert http_client.request.call_count == 2
+
+    def test_shares_response_cache_and_revalidates(self, http_client, tmp_path):
+        http_client.request.return_value = _response(200, {"id": 1}, {"ETag": '"a"'})
+        client = AsyncCivitaiClient(http_client, requests_per_minute=6000, cache_dir=tmp_path)
+
+        async def lookups():
+            first = await client.get_model(1)
+            cached = await client.get_model(1)
+            client.response_cache.expire("models/")
+            http_client.request.return_value = _response(304)
+            revalidated = await client.get_model(1)
+            return first, cached, revalidated
+
+        assert asyncio.run(lookups()) == ({"id": 1},) * 3
+        assert http_client.request.call_count == 2
+        assert http_client.request.call_args.kwargs["headers"]["If-None-Match"] == '"a"'
+
+    def test_requests_run_concurrently(self, http_client):
+        in_flight = []
+        peak = []
+
+        async def slow_request(*args, **kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.pop()
+            return _response(200, {"items": []})
+
+        http_client.request.side_effect = slow_request
+        client = AsyncCivitaiClient(http_client, requests_per_minute=6000, burst=5)
+
+        async def searches():
+            await asyncio.gather(*(client.search_models(query=str(i)) for i in range(3)))
+
+        asyncio.run(searches())
+        assert max(peak) == 3
@@ -1,6 +1,8 @@
 
+import asyncio
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from apps.api.src.routers.browse import (
     _extract_civitai_id_from_civarchive,
     _fetch_civitai_model_for_civarchive,
@@ -79,7 +81,7 @@ def test_fetch_civitai_model_video_detection():
     client = MagicMock()
     
     # Mock Civitai model response with a video
-    client.get_model.return_value = {
+    client.get_model = AsyncMock(return_value={
         "id": 123,
         "name": "Video Model",
         "type": "Checkpoint",
@@ -106,7 +108,7 @@ def test_fetch_civitai_model_video_detection():
             ]
         }],
         "stats": {"downloadCount": 100}
-    }
+    })
     
     # Mock media detection
     with patch("apps.api.src.routers.browse.detect_media_type") as mock_detect:
@@ -122,7 +124,7 @@ def test_fetch_civitai_model_video_detection():
         with patch("apps.api.src.routers.browse.get_video_thumbnail_url") as mock_thumb:
             mock_thumb.return_value = "http://thumb.jpg"
             
-            result = _fetch_civitai_model_for_civarchive(123, "http://civarchive", client)
+            result = asyncio.run(_fetch_civitai_model_for_civarchive(123, "http://civarchive", client))
             
             assert result is not None
             assert len(result.previews) == 2
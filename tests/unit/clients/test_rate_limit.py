@@ -0,0 +1,98 @@
+"""Tests for the shared API rate limiter."""
+
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.clients.rate_limit import (
+    MAX_PAUSE_SECONDS,
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+
+
+class TestHeaderParsing:
+    def test_retry_after_seconds_and_date(self):
+        assert parse_retry_after("7") == 7.0
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 < parse_retry_after(format_datetime(when)) <= 30
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_reset_delta_or_timestamp(self):
+        assert parse_rate_limit_reset("12", now=1_000_000.0) == 12.0
+        assert parse_rate_limit_reset("1000060", now=1_000_000.0) == 60.0
+
+
+class TestTokenBucket:
+    def test_burst_then_steady_rate(self):
+        bucket = TokenBucket(rate_per_minute=60, burst=3)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert 0.9 < waits[3] <= 1.0
+        assert 1.9 < waits[4] <= 2.0
+
+    def test_429_pauses_for_retry_after(self):
+        bucket = TokenBucket(rate_per_minute=600, burst=10)
+
+        assert bucket.observe(429, {"Retry-After": "5"}) == 5.0
+        assert 4.9 < bucket.reserve() <= 5.0
+
+    def test_exhausted_remaining_pauses_until_reset(self):
+        bucket = TokenBucket(rate_per_minute=600, burst=10)
+
+        assert bucket.observe(200, {"X-RateLimit-Remaining": "3"}) is None
+        assert bucket.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}) == 2.0
+        assert 1.9 < bucket.reserve() <= 2.0
+
+    def test_requests_queued_during_pause_are_spaced_after_it(self):
+        bucket = TokenBucket(rate_per_minute=30, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        bucket.pause(60)
+
+        waits = [bucket.reserve() for _ in range(10)]
+
+        assert 59.9 < waits[0] <= 60.0
+        for earlier, later in zip(waits, waits[1:], strict=False):
+            assert later - earlier == pytest.approx(2.0, abs=0.01)
+
+    def test_pause_is_capped(self):
+        bucket = TokenBucket(rate_per_minute=600)
+        bucket.observe(429, {"Retry-After": "86400"})
+        assert bucket.reserve() <= MAX_PAUSE_SECONDS
+
+    def test_acquire_async_waits_on_the_event_loop(self):
+        bucket = TokenBucket(rate_per_minute=600, burst=1)
+
+        async def two_acquires():
+            with patch("src.clients.rate_limit.time.sleep") as blocking_sleep:
+                waits = [await bucket.acquire_async(), await bucket.acquire_async()]
+            blocking_sleep.assert_not_called()
+            return waits
+
+        first, second = asyncio.run(two_acquires())
+        assert first == 0.0
+        assert 0.0 < second <= 0.1
+
+
+class TestCivitaiClientRetries:
+    def test_retries_after_429(self):
+        from src.clients.civitai_client import CivitaiClient
+
+        client = CivitaiClient(api_key="k", requests_per_minute=6000)
+        limited = MagicMock(status_code=429, headers={"Retry-After": "0"})
+        ok = MagicMock(status_code=200, headers={})
+        ok.json.return_value = {"id": 1}
+        client.session.request = MagicMock(side_effect=[limited, ok])
+
+        with patch("src.clients.rate_limit.time.sleep"):
+            assert client.get_model(1) == {"id": 1}
+        assert client.session.request.call_count == 2
+
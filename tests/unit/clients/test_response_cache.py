@@ -0,0 +1,136 @@
+"""Tests for the on-disk API response cache."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.clients.response_cache import (
+    EXPIRED,
+    FRESH,
+    STALE,
+    CachePolicy,
+    ResponseCache,
+    lookup,
+    request_headers,
+    shared_cache,
+    store_response,
+)
+
+
+class TestResponseCache:
+    def test_roundtrip_and_states(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        assert cache.get("models/1") is None
+
+        entry = cache.put("models/1", {"id": 1}, etag='"v1"')
+        loaded = cache.get("models/1")
+        assert loaded.body == {"id": 1}
+        assert loaded.conditional_headers() == {"If-None-Match": '"v1"'}
+
+        policy = CachePolicy(ttl=10, stale=20)
+        assert cache.state(loaded, policy, now=entry.stored_at + 5) == FRESH
+        assert cache.state(loaded, policy, now=entry.stored_at + 15) == STALE
+        assert cache.state(loaded, policy, now=entry.stored_at + 31) == EXPIRED
+
+    def test_expire_forces_revalidation_of_prefix(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        model = cache.put("models/1", {"id": 1})
+        version = cache.put("model-versions/2", {"id": 2})
+        cache.expire("models/")
+
+        policy = CachePolicy(ttl=3600)
+        assert cache.state(model, policy) == EXPIRED
+        assert cache.state(version, policy) == FRESH
+        assert cache.state(cache.put("models/1", {"id": 1}), policy) == FRESH
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1500)
+        payload = "x" * 300
+        for i in range(3):
+            cache.put(f"models/{i}", payload)
+            path = cache._path(f"models/{i}")
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        cache.get("models/0")  # Most recently used now
+
+        cache.put("models/3", payload)
+
+        assert cache.get("models/0") is not None
+        assert cache.get("models/1") is None
+        assert cache.get("models/3") is not None
+        assert sum(f.stat().st_size for f in tmp_path.iterdir()) <= 1500
+
+    def test_not_modified_keeps_cached_body(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put("models/1", {"id": 1}, etag='"v1"')
+        entry, state = lookup(cache, "models/1", CachePolicy(ttl=0))
+        assert state == EXPIRED
+        assert request_headers(entry) == {"If-None-Match": '"v1"'}
+
+        read_json = MagicMock()
+        stored = store_response(cache, "models/1", entry, 304, {}, read_json)
+
+        read_json.assert_not_called()
+        assert stored.body == {"id": 1}
+        assert stored.etag == '"v1"'
+        assert lookup(cache, "missing", CachePolicy(ttl=60)) == (None, EXPIRED)
+
+
+    def test_shared_cache_is_one_instance_per_directory(self, tmp_path):
+        cache = shared_cache(tmp_path / "a")
+        assert shared_cache(tmp_path / "b" / ".." / "a") is cache
+        assert shared_cache(tmp_path / "b") is not cache
+
+
+class TestCivitaiClientCache:
+    @pytest.fixture
+    def client(self, tmp_path):
+        from src.clients.civitai_client import CivitaiClient
+
+        client = CivitaiClient(requests_per_minute=6000, cache_dir=tmp_path)
+        client.session.request = MagicMock()
+        return client
+
+    @staticmethod
+    def _response(status_code, body=None, headers=None):
+        response = MagicMock(status_code=status_code, headers=headers or {})
+        response.json.return_value = body
+        return response
+
+    def test_fresh_entry_skips_network(self, client):
+        client.session.request.return_value = self._response(200, {"id": 1}, {"ETag": '"a"'})
+
+        assert client.get_model(1) == {"id": 1}
+        assert client.get_model(1) == {"id": 1}
+        assert client.session.request.call_count == 1
+
+    def test_expired_entry_revalidates_with_etag(self, client):
+        client.session.request.return_value = self._response(200, {"id": 1}, {"ETag": '"a"'})
+        client.get_model(1)
+        client.expire_cached_models()
+
+        client.session.request.return_value = self._response(304)
+        assert client.get_model(1) == {"id": 1}
+        headers = client.session.request.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"a"'}
+
+        # Revalidated entry is fresh again
+        assert client.get_model(1) == {"id": 1}
+        assert client.session.request.call_count == 2
+
+    def test_unreachable_server_serves_cached_body(self, client):
+        import requests
+
+        client.session.request.return_value = self._response(200, {"id": 1})
+        client.get_model(1)
+        client.expire_cached_models()
+
+        client.session.request.side_effect = requests.ConnectionError("offline")
+        assert client.get_model(1) == {"id": 1}
+
+    def test_uncached_endpoints_always_hit_network(self, client):
+        client.session.request.return_value = self._response(200, {"items": []})
+
+        client.search_models(query="x")
+        client.search_models(query="x")
+        assert client.session.request.call_count == 2
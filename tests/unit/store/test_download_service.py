@@ -978,3 +978,237 @@ class TestBlobStoreDownloadServiceIntegration:
 
         store = BlobStore(layout=MagicMock(), api_key="test-key")
         assert len(store._download_service._auth_providers) > 0
+
+
+# =============================================================================
+# Segmented Downloads
+# =============================================================================
+
+class _RangeServer:
+    """Fake session factory serving a payload with optional Range support."""
+
+    def __init__(
+        self, payload: bytes, accept_ranges: bool = True, fail_range_start=None, ignore_range=False,
+    ):
+        self.payload = payload
+        self.accept_ranges = accept_ranges
+        self.fail_range_start = fail_range_start
+        self.ignore_range = ignore_range
+        self.ranges = []
+        self.get_count = 0
+        self.lock = threading.Lock()
+
+    def session(self):
+        session = MagicMock()
+        session.get.side_effect = self.get
+        return session
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        response = MagicMock()
+        response.url = url
+        response.raise_for_status.return_value = None
+        rng = (headers or {}).get("Range")
+        with self.lock:
+            self.get_count += 1
+        if rng:
+            start, end = (int(x) for x in rng[len("bytes="):].split("-"))
+            with self.lock:
+                self.ranges.append((start, end))
+        if rng and not self.ignore_range:
+            body = self.payload[start:end + 1]
+            response.status_code = 206
+            response.headers = {"content-length": str(len(body))}
+            if start == self.fail_range_start:
+                half = body[: len(body) // 2]
+
+                def broken(chunk_size):
+                    yield half
+                    raise requests.ConnectionError("reset")
+
+                response.iter_content.side_effect = broken
+                return response
+        else:
+            body = self.payload
+            response.status_code = 200
+            response.headers = {
+                "content-length": str(len(body)),
+                "content-type": "application/octet-stream",
+            }
+            if self.accept_ranges:
+                response.headers["accept-ranges"] = "bytes"
+        response.iter_content.side_effect = lambda chunk_size: (
+            body[i:i + 64] for i in range(0, len(body), 64)
+        )
+        return response
+
+
+class TestSegmentedDownload:
+    """Parallel byte-range downloads with per-segment resume."""
+
+    URL = "https://example.com/model.safetensors"
+    PAYLOAD = bytes(range(256)) * 8  # 2048 bytes
+
+    def _service(self):
+        return DownloadService(segments=4, min_segment_size=256)
+
+    def test_downloads_ranges_in_parallel(self, tmp_path):
+        server = _RangeServer(self.PAYLOAD)
+        dest = tmp_path / "blob.part"
+        progress = []
+
+        with patch("src.store.download_service.requests.Session", side_effect=server.session):
+            result = self._service().download_to_file(
+                self.URL, dest,
+                expected_sha256=hashlib.sha256(self.PAYLOAD).hexdigest(),
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+
+        assert dest.read_bytes() == self.PAYLOAD
+        assert result.size == len(self.PAYLOAD)
+        assert not result.resumed
+        # First connection keeps segment 0, the others are ranged requests
+        assert sorted(server.ranges) == [(512, 1023), (1024, 1535), (1536, 2047)]
+        assert progress[-1] == (2048, 2048)
+        assert not (tmp_path / "blob.part.segments").exists()
+
+    def test_falls_back_without_range_support(self, tmp_path):
+        server = _RangeServer(self.PAYLOAD, accept_ranges=False)
+        dest = tmp_path / "blob.part"
+
+        with patch("src.store.download_service.requests.Session", side_effect=server.session):
+            result = self._service().download_to_file(self.URL, dest)
+
+        assert server.ranges == []
+        assert result.sha256 == hashlib.sha256(self.PAYLOAD).hexdigest()
+
+    def test_small_file_uses_single_stream(self, tmp_path):
+        server = _RangeServer(self.PAYLOAD[:300])
+        dest = tmp_path / "blob.part"
+
+        with patch("src.store.download_service.requests.Session", side_effect=server.session):
+            self._service().download_to_file(self.URL, dest)
+
+        assert server.ranges == []
+        assert dest.read_bytes() == self.PAYLOAD[:300]
+
+    def test_resume_refetches_only_incomplete_segments(self, tmp_path):
+        dest = tmp_path / "blob.part"
+        broken = _RangeServer(self.PAYLOAD, fail_range_start=1024)
+
+        with patch("src.store.download_service.requests.Session", side_effect=broken.session):
+            with pytest.raises(DownloadError):
+                self._service().download_to_file(self.URL, dest)
+
+        state = tmp_path / "blob.part.segments"
+        assert state.exists()
+        assert dest.stat().st_size == len(self.PAYLOAD)  # Preallocated, kept for resume
+
+        server = _RangeServer(self.PAYLOAD)
+        with patch("src.store.download_service.requests.Session", side_effect=server.session):
+            result = self._service().download_to_file(
+                self.URL, dest, expected_sha256=hashlib.sha256(self.PAYLOAD).hexdigest(),
+            )
+
+        assert result.resumed
+        assert dest.read_bytes() == self.PAYLOAD
+        # Segment 1024-1535 resumes after the 256 bytes that arrived before the reset
+        assert (1280, 1535) in server.ranges
+        assert all(start >= 1024 or end < 1024 for start, end in server.ranges)
+        assert not state.exists()
+
+    def test_resume_restarts_when_server_ignores_range(self, tmp_path):
+        dest = tmp_path / "blob.part"
+        broken = _RangeServer(self.PAYLOAD, fail_range_start=1024)
+        with patch("src.store.download_service.requests.Session", side_effect=broken.session):
+            with pytest.raises(DownloadError):
+                self._service().download_to_file(self.URL, dest)
+        state = tmp_path / "blob.part.segments"
+        assert state.exists()
+
+        server = _RangeServer(self.PAYLOAD, ignore_range=True)
+        with patch("src.store.download_service.requests.Session", side_effect=server.session):
+            result = self._service().download_to_file(
+                self.URL, dest, expected_sha256=hashlib.sha256(self.PAYLOAD).hexdigest(),
+            )
+
+        assert not result.resumed
+        assert dest.read_bytes() == self.PAYLOAD
+        assert not state.exists()
+        # Range requests of the resume, then one plain request for the whole file
+        assert server.ranges
+        assert server.get_count == len(server.ranges) + 1
+
+    def test_stale_state_is_discarded(self, tmp_path):
+        dest = tmp_path / "blob.part"
+        dest.write_bytes(b"\0" * len(self.PAYLOAD))
+        (tmp_path / "blob.part.segments").write_text(
+            '{"url": "https://other.example/x", "size": 2048, "segments": [[0, 2047, 100]]}'
+        )
+        server = _RangeServer(self.PAYLOAD)
+
+        with patch("src.store.download_service.requests.Session", side_effect=server.session):
+            result = self._service().download_to_file(self.URL, dest)
+
+        assert not result.resumed
+        assert dest.read_bytes() == self.PAYLOAD
+
+
+# =============================================================================
+# Pooled Sessions
+# =============================================================================
+
+class TestPooledSessions:
+    """DownloadService on a shared HttpPool."""
+
+    def test_calls_share_one_session(self, tmp_path):
+        from src.store.http_pool import HttpPool
+
+        svc = DownloadService(http_pool=HttpPool())
+        sessions_created = []
+
+        def mock_session_factory():
+            session = MagicMock()
+            session.get.return_value = _make_mock_response(b"data")
+            sessions_created.append(session)
+            return session
+
+        with patch("src.store.download_service.requests.Session", side_effect=mock_session_factory):
+            svc.download_to_file("https://example.com/a", tmp_path / "a.bin")
+            svc.download_to_file("https://example.com/b", tmp_path / "b.bin")
+
+            assert len(sessions_created) == 1
+            sessions_created[0].close.assert_not_called()
+
+            svc.http_pool.close()
+            sessions_created[0].close.assert_called_once()
+
+    def test_unread_response_is_released(self, tmp_path):
+        from src.store.http_pool import HttpPool
+
+        svc = DownloadService(http_pool=HttpPool())
+        html = _make_mock_response(b"<html>", content_type="text/html")
+
+        with patch("src.store.download_service.requests.Session") as MockSession:
+            MockSession.return_value.get.return_value = html
+            with pytest.raises(DownloadError):
+                svc.download_to_file("https://example.com/a", tmp_path / "a.bin")
+
+        html.close.assert_called()
+
+    def test_pool_is_shared_with_client_sessions(self):
+        from src.clients.civitai_client import CivitaiClient
+        from src.store.http_pool import HttpPool
+
+        pool = HttpPool()
+        # Real sessions, whatever other tests left patched
+        with patch("src.store.http_pool.requests.Session", requests.sessions.Session):
+            client = CivitaiClient(api_key="key", http_pool=pool)
+
+            shared = pool.session()
+            assert shared is pool.session()
+            assert client.session.get_adapter("https://civitai.com") is shared.get_adapter("https://civitai.com")
+            # The client keeps its own default headers
+            assert "Authorization" not in shared.headers
+
+            pool.close()
+            assert pool.session() is not shared
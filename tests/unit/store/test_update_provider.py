@@ -903,3 +903,109 @@ class TestCivitaiProviderBuildDownloadUrl:
         provider = CivitaiUpdateProvider(MagicMock())
         url = provider.build_download_url(300, 3000)
         assert url == "https://civitai.com/api/download/models/300?id=3000"
+
+
+class TestConcurrentCheckAll:
+    """Tests for concurrent UpdateService.check_all_updates()."""
+
+    @staticmethod
+    def _pack_and_lock(name: str, model_id: int):
+        pack = Pack(
+            name=name,
+            pack_type=AssetKind.LORA,
+            source=PackSource(provider=ProviderName.CIVITAI, model_id=model_id),
+            dependencies=[
+                PackDependency(
+                    id="lora",
+                    kind=AssetKind.LORA,
+                    selector=DependencySelector(
+                        strategy=SelectorStrategy.CIVITAI_MODEL_LATEST,
+                        civitai={"model_id": model_id},
+                    ),
+                    update_policy=UpdatePolicy(mode=UpdatePolicyMode.FOLLOW_LATEST),
+                    expose=ExposeConfig(filename=f"{name}.safetensors"),
+                ),
+            ],
+        )
+        lock = PackLock(
+            pack=name,
+            resolved=[
+                ResolvedDependency(
+                    dependency_id="lora",
+                    artifact=ResolvedArtifact(
+                        kind=AssetKind.LORA,
+                        sha256=f"{name}-sha",
+                        provider=ArtifactProvider(
+                            name=ProviderName.CIVITAI,
+                            model_id=model_id,
+                            version_id=100,
+                            file_id=1000,
+                            filename=f"{name}.safetensors",
+                        ),
+                    ),
+                ),
+            ],
+        )
+        return pack, lock
+
+    def test_groups_by_model_and_returns_every_plan(self):
+        packs = {
+            "a1": self._pack_and_lock("a1", 1),
+            "a2": self._pack_and_lock("a2", 1),
+            "b": self._pack_and_lock("b", 2),
+        }
+        mock_layout = MagicMock()
+        mock_layout.list_packs.return_value = sorted(packs)
+        mock_layout.load_pack.side_effect = lambda name, **kw: packs[name][0]
+        mock_layout.load_pack_lock.side_effect = lambda name, **kw: packs[name][1]
+
+        mock_civitai = MagicMock()
+        mock_civitai.get_model.side_effect = lambda model_id: {
+            "modelVersions": [{"id": 100, "files": []}],
+        }
+        mock_blob = MagicMock()
+        mock_blob.blob_exists.return_value = True
+
+        provider = CivitaiUpdateProvider(mock_civitai)
+        service = UpdateService(
+            layout=mock_layout, blob_store=mock_blob, view_builder=MagicMock(),
+            providers={SelectorStrategy.CIVITAI_MODEL_LATEST: provider},
+        )
+
+        assert sorted(service._group_updatable_packs()) == [["a1", "a2"], ["b"]]
+
+        streamed = dict(service.iter_check_all_updates(workers=2))
+        plans = service.check_all_updates(workers=2)
+
+        assert set(streamed) == {"a1", "a2", "b"}
+        assert list(plans) == ["a1", "a2", "b"]
+        assert all(plan.already_up_to_date for plan in plans.values())
+        # One lookup per model per session
+        assert mock_civitai.get_model.call_count == 4
+
+    def test_concurrent_lookups_share_one_request(self):
+        import threading
+
+        release = threading.Event()
+        mock_civitai = MagicMock()
+
+        def slow_get_model(model_id):
+            release.wait(5)
+            return {"id": model_id}
+
+        mock_civitai.get_model.side_effect = slow_get_model
+        provider = CivitaiUpdateProvider(mock_civitai)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(provider.get_model_cached(7)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert mock_civitai.get_model.call_count == 1
+        assert len(results) == 4 and all(r is results[0] for r in results)
@@ -6,7 +6,7 @@ correctly without truncation or corruption.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import re
 
 
@@ -355,17 +355,17 @@ def test_get_model_endpoint_url_integrity():
         sys.path.insert(0, str(project_root))
 
     mock_client = MagicMock()
-    mock_client.get_model.return_value = MOCK_MODEL_DATA
+    mock_client.get_model = AsyncMock(return_value=MOCK_MODEL_DATA)
 
     mock_config = MagicMock()
     mock_config.api.civitai_token = "test_token"
 
     with patch("apps.api.src.routers.browse.get_config", return_value=mock_config), \
-         patch("apps.api.src.routers.browse.CivitaiClient", return_value=mock_client):
+         patch("apps.api.src.routers.browse.AsyncCivitaiClient", return_value=mock_client):
 
         from apps.api.src.routers.browse import get_model
 
-        result = asyncio.get_event_loop().run_until_complete(get_model(model_id=12345))
+        result = asyncio.run(get_model(model_id=12345, request=MagicMock()))
 
         assert len(result.previews) > 0, "Should have previews"
 
@@ -435,5 +435,34 @@ def test_empty_url_handled_gracefully():
     assert preview.url == ""
 
 
+def test_browse_clients_share_response_cache(tmp_path):
+    """Per-request clients reuse one ResponseCache per cache directory."""
+    import sys
+    from pathlib import Path
+
+    project_root = Path(__file__).parent.parent.parent
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+
+    from apps.api.src.routers.browse import _civitai_client
+
+    mock_config = MagicMock()
+    mock_config.api.civitai_token = None
+    mock_config.store.root = tmp_path
+
+    first = _civitai_client(MagicMock(), mock_config)
+    second = _civitai_client(MagicMock(), mock_config)
+
+    assert first.response_cache is not None
+    assert first.response_cache is second.response_cache
+
+    # The store's client uses the same instance, so its expiry reaches browse
+    from src.clients.civitai_client import CivitaiClient
+    from src.store.layout import StoreLayout
+
+    store_client = CivitaiClient(cache_dir=StoreLayout(tmp_path).civitai_cache_path)
+    assert store_client.response_cache is first.response_cache
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])